@@ -0,0 +1,2 @@
+# DESCRIPTION Convert developer modules into a developer database
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mDeveloper.developerCmd;mDeveloper.developerCmd.convert()" $args
\ No newline at end of file
@@ -0,0 +1,2 @@
+# DESCRIPTION Import developers from a CSV or LDIF export
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mDeveloper.developerCmd;mDeveloper.developerCmd.importDevelopers()" $args
\ No newline at end of file
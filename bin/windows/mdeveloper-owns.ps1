@@ -0,0 +1,2 @@
+# DESCRIPTION List packages owned by a developer
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mDeveloper.developerCmd;mDeveloper.developerCmd.owns()" $args
\ No newline at end of file
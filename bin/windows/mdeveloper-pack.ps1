@@ -0,0 +1,2 @@
+# DESCRIPTION Compile developer modules into a pack file for fast lookups
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mDeveloper.developerCmd;mDeveloper.developerCmd.pack()" $args
\ No newline at end of file
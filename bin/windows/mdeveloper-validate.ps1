@@ -0,0 +1,2 @@
+# DESCRIPTION Validate developer modules
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mDeveloper.developerCmd;mDeveloper.developerCmd.validate()" $args
\ No newline at end of file
@@ -0,0 +1,224 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/developerLibBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.developerLibBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Measures memory of developer records with tracemalloc. Previous representation, records loaded from the
+#  registry cache kept as dict instances and a Developer instance with a __dict__ for each one of them, is
+#  compared against mDeveloper.developerLib.DeveloperTable alone and with a Developer view for each row.
+#
+#  Usage: python -m mDeveloper.benchmarks.developerLibBenchmark [--counts 10000 100000]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import gc
+import json
+import argparse
+import tracemalloc
+
+import mDeveloper.developerLib
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class which has the previous memory layout of mDeveloper.developerLib.Developer.
+class _LegacyDeveloper(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param record [ dict | None | in  ] - Record.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, record):
+
+        self._userName = record['USERNAME']
+        self._name     = record['NAME']
+        self._position = record['POSITION']
+        self._email    = record['EMAIL']
+        self._site     = record['SITE']
+        self._url      = record['URL']
+
+#
+## @brief Get registry cache content of given number of synthetic developers.
+#
+#  @param count [ int | None | in  ] - Number of developers.
+#
+#  @exception N/A
+#
+#  @return str - JSON content, developer module names as keys and records as values.
+def getCacheContent(count):
+
+    records = {}
+
+    for index in range(count):
+
+        record = mDeveloper.benchmarks.generatorLib.getDeveloperAttributes(index)
+        record['INFO'] = {'userName' : record['USERNAME'],
+                          'name'     : record['NAME'],
+                          'position' : record['POSITION'],
+                          'email'    : record['EMAIL'],
+                          'url'      : record['URL']}
+
+        records['{}Lib'.format(record['USERNAME'])] = record
+
+    return json.dumps(records)
+
+#
+## @brief Build the previous representation.
+#
+#  @param content [ str | None | in  ] - Registry cache content.
+#
+#  @exception N/A
+#
+#  @return tuple - Records and developers.
+def buildLegacy(content):
+
+    records = json.loads(content)
+
+    return records, [_LegacyDeveloper(records[x]) for x in sorted(records.keys())]
+
+#
+## @brief Build a table.
+#
+#  @param content [ str | None | in  ] - Registry cache content.
+#
+#  @exception N/A
+#
+#  @return mDeveloper.developerLib.DeveloperTable - Table.
+def buildTable(content):
+
+    records = json.loads(content)
+    table   = mDeveloper.developerLib.DeveloperTable()
+
+    for moduleName in sorted(records.keys()):
+        table.addRecord(moduleName, records[moduleName])
+
+    return table
+
+#
+## @brief Build a table and a developer view for each one of its rows.
+#
+#  @param content [ str | None | in  ] - Registry cache content.
+#
+#  @exception N/A
+#
+#  @return tuple - Table and developers.
+def buildViews(content):
+
+    table = buildTable(content)
+
+    return table, [mDeveloper.developerLib.Developer(table.getRecord(x)) for x in range(len(table))]
+
+#
+## @brief Measure memory retained by the result of given function.
+#
+#  @param function [ function | None | in  ] - Function to call.
+#  @param content  [ str      | None | in  ] - Registry cache content to pass to the function.
+#
+#  @exception N/A
+#
+#  @return int - Retained memory in bytes.
+def measure(function, content):
+
+    gc.collect()
+
+    tracemalloc.start()
+
+    result = function(content)
+
+    gc.collect()
+
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del result
+
+    return size
+
+#
+## @brief Run the benchmark for given developer count.
+#
+#  @param count [ int | None | in  ] - Number of developers.
+#
+#  @exception N/A
+#
+#  @return dict - Retained memory in bytes with keys: legacy, table, views.
+def run(count):
+
+    content = getCacheContent(count)
+
+    return {'legacy' : measure(buildLegacy, content),
+            'table'  : measure(buildTable, content),
+            'views'  : measure(buildViews, content)}
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Measure memory of developer records with tracemalloc')
+
+    parser.add_argument('--counts',
+                        type=int,
+                        nargs='+',
+                        default=[10000, 100000],
+                        help='Developer counts to benchmark')
+
+    _args = parser.parse_args()
+
+    print('{:>8} {:>12} {:>12} {:>12} {:>10} {:>10}'.format('records', 'legacy (MB)', 'table (MB)', 'views (MB)', 'table', 'views'))
+
+    for count in _args.counts:
+
+        result = run(count)
+
+        print('{:>8} {:>12.1f} {:>12.1f} {:>12.1f} {:>9.1f}x {:>9.1f}x'.format(count,
+                                                                               result['legacy'] / 1048576.0,
+                                                                               result['table'] / 1048576.0,
+                                                                               result['views'] / 1048576.0,
+                                                                               float(result['legacy']) / result['table'],
+                                                                               float(result['legacy']) / result['views']))
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
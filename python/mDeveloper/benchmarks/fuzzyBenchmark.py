@@ -0,0 +1,180 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/fuzzyBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.fuzzyBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Compares queries of mDeveloper.fuzzyLib.FuzzyIndex with a full scan, which computes the edit distance
+#  between the query and every term of the index, for a growing number of synthetic developers. Queries are
+#  user names with a typo. Number of distances computed by each query is reported as well as the time, so
+#  that the share of the index visited by a query can be seen to drop as the index grows.
+#
+#  Usage: python -m mDeveloper.benchmarks.fuzzyBenchmark [--counts 1000 10000 100000] [--distance 1] [--queries 100]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import time
+import random
+import argparse
+
+import mDeveloper.fuzzyLib
+import mDeveloper.developerLib
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Get user names with a typo, which are used as queries.
+#
+#  @param count   [ int | None | in  ] - Number of developers.
+#  @param queries [ int | None | in  ] - Number of queries.
+#
+#  @exception N/A
+#
+#  @return list of str - Queries.
+def getQueries(count, queries):
+
+    _random = random.Random(count)
+    result  = []
+
+    for _ in range(queries):
+
+        userName = mDeveloper.benchmarks.generatorLib.getUserName(_random.randrange(count))
+        index    = _random.randrange(len(userName))
+
+        # Drop a character, which is the most common typo
+        result.append(userName[:index] + userName[index + 1:])
+
+    return result
+
+#
+## @brief Find the terms within given edit distance of given query by computing the distance to every term.
+#
+#  @param terms       [ list of str | None | in  ] - Terms.
+#  @param query       [ str         | None | in  ] - Query.
+#  @param maxDistance [ int         | None | in  ] - Maximum edit distance.
+#
+#  @exception N/A
+#
+#  @return list of str - Terms.
+def scan(terms, query, maxDistance):
+
+    masks = mDeveloper.fuzzyLib.BKTree.getMasks(query)
+
+    return [x for x in terms if mDeveloper.fuzzyLib.BKTree.getDistance(query, x, masks) <= maxDistance]
+
+#
+## @brief Run the benchmark for given number of developers.
+#
+#  @param count       [ int | None | in  ] - Number of developers.
+#  @param maxDistance [ int | None | in  ] - Maximum edit distance.
+#  @param queries     [ int | None | in  ] - Number of queries.
+#
+#  @exception N/A
+#
+#  @return dict - Results with keys: terms, buildTime, comparisons, indexTime, scanTime.
+def run(count, maxDistance, queries):
+
+    records = ((mDeveloper.benchmarks.generatorLib.getUserName(x),
+                mDeveloper.developerLib.DeveloperRecord.fromAttributes(mDeveloper.benchmarks.generatorLib.getDeveloperAttributes(x))) for x in range(count))
+
+    startTime   = time.perf_counter()
+    _fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex(records)
+    buildTime   = time.perf_counter() - startTime
+
+    _tree       = _fuzzyIndex.tree()
+    terms       = _tree.terms()
+    queryList   = getQueries(count, queries)
+    comparisons = 0
+
+    startTime = time.perf_counter()
+    for query in queryList:
+        _tree.find(query, maxDistance)
+        comparisons += _tree.comparisons()
+    indexTime = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    for query in queryList:
+        scan(terms, query, maxDistance)
+    scanTime = time.perf_counter() - startTime
+
+    return {'terms'       : len(terms),
+            'buildTime'   : buildTime,
+            'comparisons' : comparisons / float(len(queryList)),
+            'indexTime'   : indexTime / len(queryList),
+            'scanTime'    : scanTime / len(queryList)}
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Compare fuzzy index queries with a full scan')
+
+    parser.add_argument('--counts',
+                        type=int,
+                        nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='Developer counts to benchmark')
+
+    parser.add_argument('--distance',
+                        type=int,
+                        default=1,
+                        help='Maximum edit distance')
+
+    parser.add_argument('--queries',
+                        type=int,
+                        default=100,
+                        help='Number of queries for each developer count')
+
+    _args = parser.parse_args()
+
+    print('{:>8} {:>8} {:>10} {:>12} {:>9} {:>12} {:>12} {:>9}'.format('count', 'terms', 'build (s)', 'comparisons', 'visited', 'index (ms)', 'scan (ms)', 'speed-up'))
+
+    for count in _args.counts:
+
+        result = run(count, _args.distance, _args.queries)
+
+        print('{:>8} {:>8} {:>10.2f} {:>12.0f} {:>8.1f}% {:>12.3f} {:>12.3f} {:>8.1f}x'.format(count,
+                                                                                             result['terms'],
+                                                                                             result['buildTime'],
+                                                                                             result['comparisons'],
+                                                                                             100.0 * result['comparisons'] / result['terms'],
+                                                                                             result['indexTime'] * 1000.0,
+                                                                                             result['scanTime'] * 1000.0,
+                                                                                             result['scanTime'] / result['indexTime']))
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
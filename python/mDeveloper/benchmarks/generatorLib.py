@@ -0,0 +1,150 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/generatorLib.py @brief [ FILE   ] - Synthetic developers directory generator module.
+## @package mDeveloper.benchmarks.generatorLib    @brief [ MODULE ] - Synthetic developers directory generator module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ tuple of str ] - Sites assigned to the generated developers in turn.
+SITES                     = ('Headquarter', 'London', 'Montreal', 'Vancouver', 'Sydney')
+
+## [ tuple of str ] - Positions assigned to the generated developers in turn.
+POSITIONS                 = ('Software Engineer', 'Senior Software Engineer', 'Lead Software Engineer', 'Pipeline TD', 'Technical Artist')
+
+## [ str ] - Template of the generated developer modules, which follows the layout of the real developer modules.
+DEVELOPER_MODULE_TEMPLATE = """#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/developers/{userName}Lib.py @brief [ FILE   ] - Developer module.
+## @package mDeveloper.developers.{userName}Lib    @brief [ MODULE ] - Developer module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - User name of the developer.
+USERNAME        = '{userName}'
+
+## [ str ] - Name of the developer.
+NAME            = '{name}'
+
+## [ str ] - Position of the developer.
+POSITION        = '{position}'
+
+## [ str ] - E-mail address of the developer.
+EMAIL           = '{email}'
+
+## [ str ] - Site where the developer is located at.
+SITE            = '{site}'
+
+## [ str ] - Web page of the developer.
+URL             = '{url}'
+
+## [ dict ] - Developer info as a dict instance.
+INFO            = {{'userName':USERNAME,
+                   'name'    :NAME,
+                   'position':POSITION,
+                   'email'   :EMAIL,
+                   'site'    :SITE,
+                   'url'     :URL
+                   }}
+"""
+
+#
+## @brief Get user name of the synthetic developer with given index.
+#
+#  @param index [ int | None | in  ] - Index of the developer.
+#
+#  @exception N/A
+#
+#  @return str - User name.
+def getUserName(index):
+
+    return 'developer{:06d}'.format(index)
+
+#
+## @brief Get developer module attributes of the synthetic developer with given index.
+#
+#  @param index [ int | None | in  ] - Index of the developer.
+#
+#  @exception N/A
+#
+#  @return dict - Developer module attributes, such as USERNAME, as keys and their values as values.
+def getDeveloperAttributes(index):
+
+    userName = getUserName(index)
+
+    return {'USERNAME' : userName,
+            'NAME'     : 'Developer {}'.format(index),
+            'POSITION' : POSITIONS[index % len(POSITIONS)],
+            'EMAIL'    : '{}@example.com'.format(userName),
+            'SITE'     : SITES[index % len(SITES)],
+            'URL'      : 'https://www.example.com/{}'.format(userName) if index % 2 else ''}
+
+#
+## @brief Generate a synthetic developers directory with valid developer modules.
+#
+#  @param directory [ str  | None | in  ] - Directory to generate developer modules in, it is created if it doesn't exist.
+#  @param count     [ int  | None | in  ] - Number of developer modules to generate.
+#  @param package   [ bool | True | in  ] - Whether to create an __init__.py file so that the directory is a Python package.
+#
+#  @exception N/A
+#
+#  @return list of str - Names of the generated developer modules.
+def generateDevelopersDirectory(directory, count, package=True):
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    if package:
+        open(os.path.join(directory, '__init__.py'), 'w').close()
+
+    moduleNameList = []
+
+    for index in range(count):
+
+        attributes = getDeveloperAttributes(index)
+        moduleName = '{}Lib'.format(attributes['USERNAME'])
+
+        content = DEVELOPER_MODULE_TEMPLATE.format(userName=attributes['USERNAME'],
+                                                   name=attributes['NAME'],
+                                                   position=attributes['POSITION'],
+                                                   email=attributes['EMAIL'],
+                                                   site=attributes['SITE'],
+                                                   url=attributes['URL'])
+
+        with open(os.path.join(directory, '{}.py'.format(moduleName)), 'w') as moduleFile:
+            moduleFile.write(content)
+
+        moduleNameList.append(moduleName)
+
+    return moduleNameList
@@ -0,0 +1,186 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/matcherBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.matcherBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Compares mDeveloper.matcherLib.BatchMatcher with a pure Python loop, which tests every query against the
+#  normalized values of every record, for a growing number of synthetic developers. Queries are user name
+#  prefixes, full e-mail addresses and names of developers as well as unknown names, like a timesheet export.
+#
+#  Usage: python -m mDeveloper.benchmarks.matcherBenchmark [--counts 1000 10000 100000] [--queries 1000]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import time
+import random
+import argparse
+
+import mDeveloper.fuzzyLib
+import mDeveloper.matcherLib
+import mDeveloper.developerLib
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Get queries.
+#
+#  @param count   [ int | None | in  ] - Number of developers.
+#  @param queries [ int | None | in  ] - Number of queries.
+#
+#  @exception N/A
+#
+#  @return list of str - Queries.
+def getQueries(count, queries):
+
+    _random = random.Random(count)
+    result  = []
+
+    for index in range(queries):
+
+        attributes = mDeveloper.benchmarks.generatorLib.getDeveloperAttributes(_random.randrange(count))
+
+        kind = index % 4
+        if kind == 0:
+            result.append(attributes['USERNAME'][:-1])
+        elif kind == 1:
+            result.append(attributes['EMAIL'].upper())
+        elif kind == 2:
+            result.append(attributes['NAME'])
+        else:
+            result.append('Unknown {}'.format(index))
+
+    return result
+
+#
+## @brief Match given queries by testing each one of them against every value.
+#
+#  @param columns [ list of list | None | in  ] - Normalized values of each field.
+#  @param queries [ list of str  | None | in  ] - Queries.
+#
+#  @exception N/A
+#
+#  @return list of list - Record ids of each query.
+def loop(columns, queries):
+
+    result = []
+
+    for query in queries:
+
+        query = mDeveloper.fuzzyLib.FuzzyIndex.normalize(query)
+
+        recordIds = set()
+        for column in columns:
+            recordIds.update(x for x, value in enumerate(column) if value.startswith(query))
+
+        result.append(sorted(recordIds))
+
+    return result
+
+#
+## @brief Run the benchmark for given number of developers.
+#
+#  @param count   [ int | None | in  ] - Number of developers.
+#  @param queries [ int | None | in  ] - Number of queries.
+#
+#  @exception AssertionError - If results of the matcher and the loop differ.
+#
+#  @return dict - Results with keys: buildTime, matchTime, loopTime.
+def run(count, queries):
+
+    records   = [(mDeveloper.benchmarks.generatorLib.getUserName(x) + 'Lib',
+                  mDeveloper.developerLib.DeveloperRecord.fromAttributes(mDeveloper.benchmarks.generatorLib.getDeveloperAttributes(x))) for x in range(count)]
+    queryList = getQueries(count, queries)
+
+    startTime     = time.perf_counter()
+    _batchMatcher = mDeveloper.matcherLib.BatchMatcher(records)
+    buildTime     = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    result    = _batchMatcher.match(queryList)
+    pairs     = result.getPairs()
+    matchTime = time.perf_counter() - startTime
+
+    columns = [[mDeveloper.fuzzyLib.FuzzyIndex.normalize(record.get(x)) for moduleName, record in records] for x in mDeveloper.matcherLib.FIELDS]
+
+    startTime = time.perf_counter()
+    expected  = loop(columns, queryList)
+    loopTime  = time.perf_counter() - startTime
+
+    assert sum(len(x) for x in expected) == len(pairs[0]), 'Results of the matcher and the loop differ.'
+
+    return {'buildTime' : buildTime,
+            'matchTime' : matchTime,
+            'loopTime'  : loopTime}
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Compare batch matching with a pure Python loop')
+
+    parser.add_argument('--counts',
+                        type=int,
+                        nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='Developer counts to benchmark')
+
+    parser.add_argument('--queries',
+                        type=int,
+                        default=1000,
+                        help='Number of queries for each developer count')
+
+    _args = parser.parse_args()
+
+    if not mDeveloper.matcherLib.BatchMatcher.isAvailable():
+        parser.error('NumPy is required to run this benchmark')
+
+    print('{:>8} {:>8} {:>10} {:>12} {:>12} {:>9}'.format('count', 'queries', 'build (s)', 'match (ms)', 'loop (ms)', 'speed-up'))
+
+    for count in _args.counts:
+
+        result = run(count, _args.queries)
+
+        print('{:>8} {:>8} {:>10.2f} {:>12.3f} {:>12.3f} {:>8.1f}x'.format(count,
+                                                                         _args.queries,
+                                                                         result['buildTime'],
+                                                                         result['matchTime'] * 1000.0,
+                                                                         result['loopTime'] * 1000.0,
+                                                                         result['loopTime'] / result['matchTime']))
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
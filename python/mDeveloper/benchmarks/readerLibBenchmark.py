@@ -0,0 +1,166 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/readerLibBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.readerLibBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Compares reading developer modules statically with mDeveloper.readerLib against importing them
+#  with importlib.import_module, as mDeveloper.developerLib.Developer.listDeveloperModules does.
+#
+#  Usage: python -m mDeveloper.benchmarks.readerLibBenchmark [--counts 1000 10000]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import importlib
+
+import mDeveloper.readerLib
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the temporary Python package the developer modules are generated in.
+PACKAGE_NAME = 'mDeveloperReaderBenchmark'
+
+#
+## @brief Import given developer modules and measure the time.
+#
+#  @param packageName    [ str         | None | in  ] - Name of the package which contains the developer modules.
+#  @param moduleNameList [ list of str | None | in  ] - Developer module names.
+#
+#  @exception N/A
+#
+#  @return float - Elapsed time in seconds.
+def benchmarkImport(packageName, moduleNameList):
+
+    importlib.invalidate_caches()
+
+    startTime = time.perf_counter()
+
+    for moduleName in moduleNameList:
+        importlib.import_module('{}.{}'.format(packageName, moduleName))
+
+    elapsedTime = time.perf_counter() - startTime
+
+    for moduleName in list(sys.modules.keys()):
+        if moduleName == packageName or moduleName.startswith('{}.'.format(packageName)):
+            del sys.modules[moduleName]
+
+    return elapsedTime
+
+#
+## @brief Read given developer modules statically and measure the time.
+#
+#  @param directory      [ str         | None | in  ] - Directory of the developer modules.
+#  @param moduleNameList [ list of str | None | in  ] - Developer module names.
+#
+#  @exception N/A
+#
+#  @return float - Elapsed time in seconds.
+def benchmarkReader(directory, moduleNameList):
+
+    startTime = time.perf_counter()
+
+    for moduleName in moduleNameList:
+        mDeveloper.readerLib.DeveloperModuleReader.readFile(os.path.join(directory, '{}.py'.format(moduleName)))
+
+    return time.perf_counter() - startTime
+
+#
+## @brief Run the benchmark for given developer module count.
+#
+#  Importing is measured twice, without byte code files (cold) and with the byte code files written by
+#  the first import (warm).
+#
+#  @param count [ int | None | in  ] - Number of developer modules.
+#
+#  @exception N/A
+#
+#  @return dict - Elapsed times in seconds with keys: importCold, importWarm, reader.
+def run(count):
+
+    rootDirectory = tempfile.mkdtemp()
+    directory     = os.path.join(rootDirectory, PACKAGE_NAME)
+
+    sys.path.insert(0, rootDirectory)
+
+    try:
+        moduleNameList = mDeveloper.benchmarks.generatorLib.generateDevelopersDirectory(directory, count)
+
+        result = {'reader'     : benchmarkReader(directory, moduleNameList),
+                  'importCold' : benchmarkImport(PACKAGE_NAME, moduleNameList),
+                  'importWarm' : benchmarkImport(PACKAGE_NAME, moduleNameList)}
+
+    finally:
+        sys.path.remove(rootDirectory)
+        shutil.rmtree(rootDirectory)
+
+    return result
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark static developer module reader against importlib')
+
+    parser.add_argument('--counts',
+                        type=int,
+                        nargs='+',
+                        default=[1000, 10000],
+                        help='Developer module counts to benchmark')
+
+    _args = parser.parse_args()
+
+    print('{:>8} {:>12} {:>12} {:>12} {:>10} {:>10}'.format('modules', 'reader (s)', 'import (s)', 'import pyc', 'speedup', 'pyc speedup'))
+
+    for count in _args.counts:
+
+        result = run(count)
+
+        print('{:>8} {:>12.3f} {:>12.3f} {:>12.3f} {:>9.1f}x {:>9.1f}x'.format(count,
+                                                                               result['reader'],
+                                                                               result['importCold'],
+                                                                               result['importWarm'],
+                                                                               result['importCold'] / result['reader'],
+                                                                               result['importWarm'] / result['reader']))
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,212 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/snapshotBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.snapshotBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Measures read throughput of mDeveloper.developerLib.DeveloperRegistry with a growing number of reader
+#  threads while another thread keeps changing a developer module and updating the registry, so that the
+#  snapshot the readers use is replaced continuously. Readers look developers up by user name, e-mail
+#  address and module name without locking, see mDeveloper.developerLib.RegistrySnapshot.
+#
+#  Throughput is bound by the global interpreter lock on the builds of CPython which have one, in which case
+#  it is expected to stay flat rather than drop as threads are added.
+#
+#  Usage: python -m mDeveloper.benchmarks.snapshotBenchmark [--count 10000] [--threads 1 2 4 8] [--duration 2.0]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+import mDeveloper.developerLib
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Look developers up until given event is set.
+#
+#  @param registry [ mDeveloper.developerLib.DeveloperRegistry | None | in  ] - Registry.
+#  @param count    [ int                                       | None | in  ] - Number of developers.
+#  @param offset   [ int                                       | None | in  ] - Index of the first developer to look up.
+#  @param done     [ threading.Event                           | None | in  ] - Event which stops the lookups.
+#  @param result   [ list                                      | None | out ] - Number of lookups is appended to given list.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def read(registry, count, offset, done, result):
+
+    lookups = 0
+    index   = offset
+
+    while not done.is_set():
+
+        userName   = mDeveloper.benchmarks.generatorLib.getUserName(index % count)
+        moduleName = registry.getModuleByUserName(userName)
+
+        registry.getModuleByEmail('{}@example.com'.format(userName))
+        registry.getRecord(moduleName)
+
+        lookups += 3
+        index   += 1
+
+    result.append(lookups)
+
+#
+## @brief Change a developer module and update the registry until given event is set.
+#
+#  @param registry [ mDeveloper.developerLib.DeveloperRegistry | None | in  ] - Registry.
+#  @param filePath [ str                                       | None | in  ] - Absolute path of the developer module to change.
+#  @param done     [ threading.Event                           | None | in  ] - Event which stops the updates.
+#  @param result   [ list                                      | None | out ] - Number of updates is appended to given list.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def reload(registry, filePath, done, result):
+
+    updates = 0
+
+    with open(filePath, 'r') as moduleFile:
+        content = moduleFile.read()
+
+    while not done.is_set():
+
+        # Size changes as well, so that the change is seen regardless of the modification time resolution
+        with open(filePath, 'w') as moduleFile:
+            moduleFile.write(content + '\n' * (updates % 2))
+
+        if any(registry.update()):
+            updates += 1
+
+    result.append(updates)
+
+#
+## @brief Run the benchmark for given number of reader threads.
+#
+#  @param registry [ mDeveloper.developerLib.DeveloperRegistry | None | in  ] - Loaded registry.
+#  @param count    [ int                                       | None | in  ] - Number of developers.
+#  @param filePath [ str                                       | None | in  ] - Absolute path of the developer module to change.
+#  @param threads  [ int                                       | None | in  ] - Number of reader threads.
+#  @param duration [ float                                     | None | in  ] - Duration in seconds.
+#
+#  @exception N/A
+#
+#  @return dict - Results with keys: lookups, lookupsPerSecond, updates.
+def run(registry, count, filePath, threads, duration):
+
+    done    = threading.Event()
+    lookups = []
+    updates = []
+
+    threadList = [threading.Thread(target=read, args=(registry, count, x * count // threads, done, lookups)) for x in range(threads)]
+    threadList.append(threading.Thread(target=reload, args=(registry, filePath, done, updates)))
+
+    startTime = time.perf_counter()
+
+    for thread in threadList:
+        thread.start()
+
+    time.sleep(duration)
+    done.set()
+
+    for thread in threadList:
+        thread.join()
+
+    elapsedTime = time.perf_counter() - startTime
+
+    return {'lookups'          : sum(lookups),
+            'lookupsPerSecond' : sum(lookups) / elapsedTime,
+            'updates'          : updates[0]}
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Measure read throughput of the registry with many threads during updates')
+
+    parser.add_argument('--count',
+                        type=int,
+                        default=10000,
+                        help='Developer module count')
+
+    parser.add_argument('--threads',
+                        type=int,
+                        nargs='+',
+                        default=[1, 2, 4, 8],
+                        help='Reader thread counts to benchmark')
+
+    parser.add_argument('--duration',
+                        type=float,
+                        default=2.0,
+                        help='Duration of each run in seconds')
+
+    _args = parser.parse_args()
+
+    rootDirectory = tempfile.mkdtemp()
+    directory     = os.path.join(rootDirectory, 'developers')
+
+    try:
+        moduleNameList = mDeveloper.benchmarks.generatorLib.generateDevelopersDirectory(directory, _args.count, package=False)
+
+        _registry = mDeveloper.developerLib.DeveloperRegistry(directory=directory, cacheDirectory=rootDirectory)
+        _registry.listModules()
+
+        print('{:>8} {:>14} {:>10} {:>9}'.format('threads', 'lookups/s', 'scaling', 'updates'))
+
+        baseline = None
+
+        for threads in _args.threads:
+
+            result   = run(_registry, _args.count, os.path.join(directory, '{}.py'.format(moduleNameList[0])), threads, _args.duration)
+            baseline = baseline if baseline else result['lookupsPerSecond']
+
+            print('{:>8} {:>14.0f} {:>9.2f}x {:>9}'.format(threads,
+                                                          result['lookupsPerSecond'],
+                                                          result['lookupsPerSecond'] / baseline,
+                                                          result['updates']))
+
+    finally:
+        shutil.rmtree(rootDirectory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
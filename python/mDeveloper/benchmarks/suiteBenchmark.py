@@ -0,0 +1,368 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/benchmarks/suiteBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mDeveloper.benchmarks.suiteBenchmark    @brief [ MODULE ] - Benchmark module.
+#
+#  Measures how the public operations of mDeveloper.developerLib and the commands of mDeveloper.developerCmd
+#  scale with the number of developer modules. A synthetic developers directory is generated for each count
+#  and each operation is timed cold, with an empty registry cache and no developer module imported, and warm,
+#  right after the cold run in the same process.
+#
+#  Results are written as JSON and can be compared against a baseline results file, the process exits with
+#  status 1 if an operation is slower than its baseline by more than the regression threshold.
+#
+#  Usage: python -m mDeveloper.benchmarks.suiteBenchmark [--counts 100 1000 10000 100000] [--output results.json]
+#                                                         [--baseline baseline.json] [--threshold 0.25]
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import importlib
+import contextlib
+
+import mDeveloper.developers
+import mDeveloper.developerLib
+import mDeveloper.developerCmd
+
+import mDeveloper.benchmarks.generatorLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the results file format.
+RESULTS_VERSION = 1
+
+## [ list of int ] - Default developer module counts.
+COUNTS          = [100, 1000, 10000, 100000]
+
+## [ int ] - Number of user names looked up by isDeveloper and setDeveloper operations.
+SAMPLE_SIZE     = 100
+
+## [ float ] - Default regression threshold, 0.25 means 25% slower than the baseline.
+THRESHOLD       = 0.25
+
+## [ float ] - Timings faster than this in both results, in seconds, are not compared as they are dominated by noise.
+MINIMUM_TIME    = 0.005
+
+#
+## @brief Call given command function with given command line arguments, output is discarded.
+#
+#  @param function [ function    | None | in  ] - Command function, such as mDeveloper.developerCmd.listDevelopers.
+#  @param argv     [ list of str | None | in  ] - Command line arguments, including the program name.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def runCommand(function, argv):
+
+    _argv = sys.argv
+
+    sys.argv = argv
+
+    try:
+        with open(os.devnull, 'w') as nullFile:
+            with contextlib.redirect_stdout(nullFile):
+                function()
+    finally:
+        sys.argv = _argv
+
+#
+## @brief Get operations to benchmark for given developers.
+#
+#  @param count [ int | None | in  ] - Number of developer modules.
+#
+#  @exception N/A
+#
+#  @return dict - Operation names as keys and functions, which take no arguments, as values.
+def getOperations(count):
+
+    step      = max(count // SAMPLE_SIZE, 1)
+    userNames = [mDeveloper.benchmarks.generatorLib.getUserName(x) for x in range(0, count, step)]
+    keyword   = mDeveloper.benchmarks.generatorLib.getUserName(count // 2)
+
+    def isDeveloper():
+        for userName in userNames:
+            mDeveloper.developerLib.Developer.isDeveloper(userName)
+
+    def resolveMany():
+        mDeveloper.developerLib.Developer.resolveMany(['{}@example.com'.format(x) for x in userNames])
+
+    def setDeveloper():
+        _developer = mDeveloper.developerLib.Developer('')
+        for userName in userNames:
+            _developer.setDeveloper(userName)
+
+    return {'listDevelopersAsStr'  : mDeveloper.developerLib.Developer.listDevelopersAsStr,
+            'isDeveloper'          : isDeveloper,
+            'setDeveloper'         : setDeveloper,
+            'resolveMany'          : resolveMany,
+            'listDeveloperModules' : mDeveloper.developerLib.Developer.listDeveloperModules,
+            'listDevelopersCmd'    : lambda: runCommand(mDeveloper.developerCmd.listDevelopers, ['mdeveloper-list']),
+            'searchCmd'            : lambda: runCommand(mDeveloper.developerCmd.search, ['mdeveloper-search', keyword])}
+
+#
+## @brief Reset the process, so that next operation runs cold.
+#
+#  Registry is replaced with one which uses an empty cache directory and generated developer modules are removed from sys.modules.
+#
+#  @param directory      [ str | None | in  ] - Developers directory.
+#  @param cacheDirectory [ str | None | in  ] - Cache directory, it is emptied.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def resetCold(directory, cacheDirectory):
+
+    shutil.rmtree(cacheDirectory, ignore_errors=True)
+    os.makedirs(cacheDirectory)
+
+    for moduleName in list(sys.modules.keys()):
+        if moduleName.startswith('mDeveloper.developers.developer'):
+            del sys.modules[moduleName]
+
+    importlib.invalidate_caches()
+
+    mDeveloper.developerLib.DeveloperRegistry.setInstance(mDeveloper.developerLib.DeveloperRegistry(directory=directory,
+                                                                                                    cacheDirectory=cacheDirectory))
+
+#
+## @brief Run the benchmark for given developer module count.
+#
+#  @param count      [ int         | None | in  ] - Number of developer modules.
+#  @param operations [ list of str | None | in  ] - Operations to run, all of them are run if None given.
+#  @param repeat     [ int         | 3    | in  ] - Number of warm runs, the fastest one is reported.
+#
+#  @exception N/A
+#
+#  @return dict - Operation names as keys and dict instances with cold and warm keys, elapsed times in seconds, as values.
+def run(count, operations=None, repeat=3):
+
+    rootDirectory  = tempfile.mkdtemp()
+    directory      = os.path.join(rootDirectory, 'developers')
+    cacheDirectory = os.path.join(rootDirectory, 'cache')
+
+    mDeveloper.benchmarks.generatorLib.generateDevelopersDirectory(directory, count, package=False)
+
+    # Generated developer modules are imported as mDeveloper.developers submodules by listDeveloperModules
+    mDeveloper.developers.__path__.insert(0, directory)
+
+    _registry = mDeveloper.developerLib.DeveloperRegistry.getInstance()
+
+    result = {}
+
+    try:
+        for name, function in getOperations(count).items():
+
+            if operations and name not in operations:
+                continue
+
+            resetCold(directory, cacheDirectory)
+
+            startTime = time.perf_counter()
+            function()
+            coldTime  = time.perf_counter() - startTime
+
+            warmTimes = []
+            for _ in range(max(repeat, 1)):
+                startTime = time.perf_counter()
+                function()
+                warmTimes.append(time.perf_counter() - startTime)
+
+            result[name] = {'cold':coldTime, 'warm':min(warmTimes)}
+
+    finally:
+        mDeveloper.developers.__path__.remove(directory)
+        resetCold(directory, cacheDirectory)
+        mDeveloper.developerLib.DeveloperRegistry.setInstance(_registry)
+        shutil.rmtree(rootDirectory)
+
+    return result
+
+#
+## @brief Compare given results against given baseline.
+#
+#  @param results     [ dict  | None         | in  ] - Results, see run function, with developer module counts as string keys.
+#  @param baseline    [ dict  | None         | in  ] - Baseline results in the same format.
+#  @param threshold   [ float | THRESHOLD    | in  ] - Regression threshold, 0.25 means 25% slower than the baseline.
+#  @param minimumTime [ float | MINIMUM_TIME | in  ] - Timings faster than this in both results are not compared.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Regressions as count, operation, cold or warm, baseline time and time tuples.
+def compareResults(results, baseline, threshold=THRESHOLD, minimumTime=MINIMUM_TIME):
+
+    regressions = []
+
+    for count in sorted(results.keys(), key=int):
+
+        for operation, timings in sorted(results[count].items()):
+
+            baselineTimings = baseline.get(count, {}).get(operation)
+            if not baselineTimings:
+                continue
+
+            for phase in ['cold', 'warm']:
+
+                baselineTime = baselineTimings.get(phase)
+                elapsedTime  = timings.get(phase)
+
+                if baselineTime is None or elapsedTime is None or max(baselineTime, elapsedTime) < minimumTime:
+                    continue
+
+                if elapsedTime > baselineTime * (1.0 + threshold):
+                    regressions.append((int(count), operation, phase, baselineTime, elapsedTime))
+
+    return regressions
+
+#
+## @brief Read results file.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the results file.
+#
+#  @exception IOError    - If file can't be read.
+#  @exception ValueError - If file is not a results file of this version.
+#
+#  @return dict - Results, see compareResults function.
+def readResults(filePath):
+
+    with open(filePath, 'r') as resultsFile:
+        data = json.load(resultsFile)
+
+    if not isinstance(data, dict) or data.get('version') != RESULTS_VERSION:
+        raise ValueError('{} is not a benchmark results file of version {}.'.format(filePath, RESULTS_VERSION))
+
+    return data['results']
+
+#
+## @brief Write results file.
+#
+#  @param filePath [ str  | None | in  ] - Absolute path of the results file.
+#  @param results  [ dict | None | in  ] - Results, see compareResults function.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeResults(filePath, results):
+
+    data = {'version'  : RESULTS_VERSION,
+            'python'   : platform.python_version(),
+            'platform' : platform.platform(),
+            'time'     : time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'results'  : results}
+
+    with open(filePath, 'w') as resultsFile:
+        json.dump(data, resultsFile, indent=4, sort_keys=True)
+
+#
+## @brief Run the benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark developer operations and commands for growing developers directories')
+
+    parser.add_argument('--counts',
+                        type=int,
+                        nargs='+',
+                        default=COUNTS,
+                        help='Developer module counts to benchmark')
+
+    parser.add_argument('--operations',
+                        nargs='+',
+                        default=None,
+                        choices=sorted(getOperations(1).keys()),
+                        help='Operations to benchmark, all of them are benchmarked by default')
+
+    parser.add_argument('--repeat',
+                        type=int,
+                        default=3,
+                        help='Number of warm runs, the fastest one is reported')
+
+    parser.add_argument('--output',
+                        type=str,
+                        default=None,
+                        help='JSON file to write the results to')
+
+    parser.add_argument('--baseline',
+                        type=str,
+                        default=None,
+                        help='JSON results file to compare the results against')
+
+    parser.add_argument('--threshold',
+                        type=float,
+                        default=THRESHOLD,
+                        help='Regression threshold, 0.25 fails the benchmark if an operation is 25%% slower than the baseline')
+
+    _args = parser.parse_args()
+
+    results = {}
+
+    print('{:>8} {:<22} {:>10} {:>10}'.format('modules', 'operation', 'cold (s)', 'warm (s)'))
+
+    for count in _args.counts:
+
+        result = run(count, operations=_args.operations, repeat=_args.repeat)
+
+        for operation, timings in sorted(result.items()):
+            print('{:>8} {:<22} {:>10.4f} {:>10.4f}'.format(count, operation, timings['cold'], timings['warm']))
+
+        results[str(count)] = result
+
+    if _args.output:
+        writeResults(_args.output, results)
+
+    if not _args.baseline:
+        return
+
+    regressions = compareResults(results, readResults(_args.baseline), threshold=_args.threshold)
+
+    print('')
+
+    for count, operation, phase, baselineTime, elapsedTime in regressions:
+        print('Regression: {} {} {} {:.4f}s -> {:.4f}s ({:+.0f}%)'.format(count, operation, phase, baselineTime, elapsedTime,
+                                                                          (elapsedTime / baselineTime - 1.0) * 100.0))
+
+    if regressions:
+        sys.exit(1)
+
+    print('No regressions above {:.0f}% threshold.'.format(_args.threshold * 100.0))
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,746 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/cacheLib.py @brief [ FILE   ] - Developer registry cache module.
+## @package mDeveloper.cacheLib    @brief [ MODULE ] - Developer registry cache module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import array
+import struct
+import hashlib
+
+import mDeveloper.statsLib
+import mDeveloper.readerLib
+
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the cache file format, cache files with a different version are rebuilt.
+CACHE_VERSION                        = 2
+
+## [ str ] - Environment variable to override the directory where the cache files are stored.
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = 'MDEVELOPER_CACHE_PATH'
+
+## [ str ] - Name of the developer module attribute which contains the developer info as a dict instance.
+INFO_ATTRIBUTE                       = 'INFO'
+
+## [ struct.Struct ] - Header of the binary cache files, see joinSections method, magic, version and number of the sections.
+SECTION_HEADER                       = struct.Struct('<8sII')
+
+#
+## @brief [ CLASS ] - Class to cache developer module names and records of a developers directory on disk.
+#
+#  Cache is keyed on the modification time of the developers directory as well as the modification
+#  time and size of each developer module in it. Only the records of the developer modules
+#  which have changed are extracted again when the cache is rebuilt.
+class RegistryCache(object):
+
+    ## [ int ] - Permission bits of the files written by writeFileAtomically method, see getFileMode method.
+    _fileMode = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory      [ str | None | in  ] - Absolute path of the developers directory.
+    #  @param cacheDirectory [ str | None | in  ] - Directory where the cache file is stored, default one is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory, cacheDirectory=None):
+
+        ## [ str ] - Developers directory.
+        self._directory      = os.path.abspath(directory)
+
+        ## [ str ] - Cache directory.
+        self._cacheDirectory = cacheDirectory if cacheDirectory else RegistryCache.getDefaultCacheDirectory()
+
+        ## [ str ] - Cache file name without extension.
+        self._cacheName      = 'developers-{}'.format(hashlib.sha1(self._directory.encode('utf-8')).hexdigest()[:16])
+
+        ## [ str ] - Cache file.
+        self._cacheFile      = os.path.join(self._cacheDirectory, '{}.json'.format(self._cacheName))
+
+        ## [ int ] - Number of the developer modules extracted during the last load.
+        self._extractCount   = 0
+
+    #
+    ## @brief Read the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Cache data, None if cache file doesn't exist, it is corrupt or it was written by another version.
+    def _read(self):
+
+        try:
+            with open(self._cacheFile, 'r') as cacheFile:
+                data = json.load(cacheFile)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION or data.get('directory') != self._directory:
+            return None
+
+        return data
+
+    #
+    ## @brief Write the cache file atomically.
+    #
+    #  @param data [ dict | None | in  ] - Cache data.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _write(self, data):
+
+        return RegistryCache.writeFileAtomically(self._cacheFile, json.dumps(data, sort_keys=True).encode('utf-8'))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def cacheFile(self):
+
+        return self._cacheFile
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def extractCount(self):
+
+        return self._extractCount
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Load cache data, rebuild the cache if the developers directory has changed.
+    #
+    #  Returned dict instance has the following keys: version, directory, mtime, files, records, valid.
+    #  Records are stored with developer module names as keys, value of a record is None
+    #  if its developer module couldn't be read. Valid is the sorted list of the developer module names whose
+    #  records have passed given validation, so that unchanged records aren't validated again on each load.
+    #
+    #  Developer modules which have changed are read by a pool of workers if more than one worker is requested.
+    #  Threads suit network storage where reading is I/O bound, processes suit developer modules which need
+    #  to be executed because their attributes are not literals.
+    #
+    #  @param workers   [ int      | None  | in  ] - Number of workers to extract records with, records are extracted serially if None given.
+    #  @param processes [ bool     | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #  @param validate  [ callable | None  | in  ] - Function which gets a developer module name and its record and returns whether the record is valid.
+    #                                                Records which have changed are not marked as valid if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Cache data.
+    def load(self, workers=None, processes=False, validate=None):
+
+        self._extractCount = 0
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+
+        with _stats.span('scan'):
+            directoryMTime, files = RegistryCache.scanDirectory(self._directory)
+
+        with _stats.span('read'):
+            data = self._read()
+
+        if data and data['mtime'] == directoryMTime and data['files'] == files:
+            _stats.increment('cache.hit', len(files))
+            return data
+
+        cachedFiles   = data['files']        if data else {}
+        cachedRecords = data['records']      if data else {}
+        cachedValid   = set(data['valid'])   if data else set()
+
+        records         = {}
+        valid           = []
+        changedFileList = []
+
+        for fileName, fileStat in sorted(files.items()):
+
+            moduleName = os.path.splitext(fileName)[0]
+
+            if cachedFiles.get(fileName) == fileStat and moduleName in cachedRecords:
+                records[moduleName] = cachedRecords[moduleName]
+                if moduleName in cachedValid:
+                    valid.append(moduleName)
+            else:
+                changedFileList.append(fileName)
+
+        _stats.increment('cache.hit', len(files) - len(changedFileList))
+        _stats.increment('cache.miss', len(changedFileList))
+
+        with _stats.span('import'):
+            extractedRecords = RegistryCache.extractRecords([os.path.join(self._directory, x) for x in changedFileList],
+                                                            workers=workers,
+                                                            processes=processes)
+
+        for fileName, record in zip(changedFileList, extractedRecords):
+
+            moduleName          = os.path.splitext(fileName)[0]
+            records[moduleName] = record
+
+            if record is not None and validate is not None and validate(moduleName, record):
+                valid.append(moduleName)
+
+        self._extractCount = len(changedFileList)
+
+        data = {'version'   : CACHE_VERSION,
+                'directory' : self._directory,
+                'mtime'     : directoryMTime,
+                'files'     : files,
+                'records'   : records,
+                'valid'     : sorted(valid)}
+
+        self._write(data)
+
+        return data
+
+    #
+    ## @brief Get path of a file, such as an index, which is stored next to the cache file.
+    #
+    #  @param name [ str | None | in  ] - Name of the file, such as search.idx.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    def getCacheFileOf(self, name):
+
+        return os.path.join(self._cacheDirectory, '{}-{}'.format(self._cacheName, name))
+
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names.
+    def listModules(self):
+
+        return sorted(self.load()['records'].keys())
+
+    #
+    ## @brief Get records of all developer modules.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Developer module names as keys and records as values.
+    def getRecords(self):
+
+        return self.load()['records']
+
+    #
+    ## @brief Delete the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def invalidate(self):
+
+        try:
+            os.remove(self._cacheFile)
+        except OSError:
+            return False
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get default cache directory.
+    #
+    #  Value of MDEVELOPER_CACHE_PATH environment variable is used if it is set.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the cache directory.
+    @staticmethod
+    def getDefaultCacheDirectory():
+
+        cacheDirectory = os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE)
+        if cacheDirectory:
+            return cacheDirectory
+
+        return os.path.join(os.path.expanduser('~'), '.cache', 'mDeveloper')
+
+    #
+    ## @brief Get signature of given cache data.
+    #
+    #  Signature changes whenever the developers directory or a developer module in it changes,
+    #  therefore it can be used to key the files derived from the cache data, such as indexes.
+    #
+    #  @param data [ dict | None | in  ] - Cache data, which can be obtained from load method.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Signature.
+    @staticmethod
+    def getSignature(data):
+
+        return hashlib.sha1(json.dumps([data['directory'], data['mtime'], data['files']], sort_keys=True).encode('utf-8')).hexdigest()
+
+    #
+    ## @brief Get stamp of given developers directory, which is a signature of the directory itself only.
+    #
+    #  Stamp is the hash of the modification time, size and inode of the directory, which change once a developer
+    #  module is added, removed or renamed, or replaced atomically like mDeveloper.importerLib.DeveloperImporter does.
+    #  Unlike getSignature method, developer modules aren't stat'ed one by one, so that checking whether a file derived
+    #  from the directory, such as a pack file, is up to date costs a single stat on network storage. Developer modules
+    #  edited in place don't change the stamp, such files must be rebuilt explicitly once they are.
+    #
+    #  @param directory [ str | None | in  ] - Developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Stamp, 40 characters.
+    @staticmethod
+    def getDirectoryStamp(directory):
+
+        directory = os.path.abspath(directory)
+
+        try:
+            directoryStat = os.stat(directory)
+        except OSError:
+            stamp = [directory]
+        else:
+            stamp = [directory, directoryStat.st_mtime_ns, directoryStat.st_size, directoryStat.st_ino]
+
+        return hashlib.sha1(json.dumps(stamp).encode('utf-8')).hexdigest()
+
+    #
+    ## @brief Get permission bits of the files written by writeFileAtomically method.
+    #
+    #  Files are created with 0666 masked by the umask of the process like the ones created by open function,
+    #  so that cache directories shared by the users of a studio remain readable by all of them.
+    #  Umask is read once since it can only be read by setting it.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Permission bits.
+    @staticmethod
+    def getFileMode():
+
+        if RegistryCache._fileMode is None:
+            umask = os.umask(0o022)
+            os.umask(umask)
+            RegistryCache._fileMode = 0o666 & ~umask
+
+        return RegistryCache._fileMode
+
+    #
+    ## @brief Write given content into given file atomically.
+    #
+    #  Content is written into a temporary file in the same directory first, which then replaces the file.
+    #  Therefore concurrent processes either read the previous or the new file, never a partial one.
+    #  Temporary file is created with 0600 permissions, they are set to the ones of getFileMode method before it replaces the file.
+    #  Failing to write is not an error since cache files are only an optimization.
+    #
+    #  @param filePath [ str   | None | in  ] - Absolute path of the file.
+    #  @param content  [ bytes | None | in  ] - Content.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def writeFileAtomically(filePath, content):
+
+        # Imported on demand to keep start-up time of the commands low
+        import tempfile
+
+        directory = os.path.dirname(filePath)
+        tempFile  = None
+
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            fileDescriptor, tempFile = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(filePath)),
+                                                        suffix='.tmp',
+                                                        dir=directory)
+
+            os.chmod(tempFile, RegistryCache.getFileMode())
+
+            with os.fdopen(fileDescriptor, 'wb') as _file:
+                _file.write(content)
+                _file.flush()
+                os.fsync(_file.fileno())
+
+            os.replace(tempFile, filePath)
+
+        except (IOError, OSError):
+            if tempFile and os.path.isfile(tempFile):
+                try:
+                    os.remove(tempFile)
+                except OSError:
+                    pass
+            return False
+
+        return True
+
+    #
+    ## @brief Join given sections into the content of a binary cache file, such as an index file.
+    #
+    #  Content is the header, see SECTION_HEADER, length of each section and the sections. Binary files load
+    #  much faster than JSON and unlike pickle, reading them can't execute code.
+    #
+    #  @param magic    [ bytes         | None | in  ] - Magic bytes which identify the file, 8 bytes.
+    #  @param version  [ int           | None | in  ] - Version of the file format.
+    #  @param sections [ list of bytes | None | in  ] - Sections.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - Content.
+    @staticmethod
+    def joinSections(magic, version, sections):
+
+        lengths = array.array('Q', [len(x) for x in sections])
+        if sys.byteorder != 'little':
+            lengths.byteswap()
+
+        return b''.join([SECTION_HEADER.pack(magic, version, len(sections)), lengths.tobytes()] + [bytes(x) for x in sections])
+
+    #
+    ## @brief Split given content of a binary cache file into its sections, see joinSections method.
+    #
+    #  @param content [ bytes-like object | None | in  ] - Content.
+    #  @param magic   [ bytes             | None | in  ] - Magic bytes which identify the file.
+    #  @param version [ int               | None | in  ] - Version of the file format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of memoryview - Sections, None if content is not a file of given magic and version or it is truncated.
+    @staticmethod
+    def splitSections(content, magic, version):
+
+        content = memoryview(content)
+
+        if len(content) < SECTION_HEADER.size:
+            return None
+
+        fileMagic, fileVersion, count = SECTION_HEADER.unpack_from(content, 0)
+        if fileMagic != magic or fileVersion != version:
+            return None
+
+        offset = SECTION_HEADER.size + count * 8
+        if len(content) < offset:
+            return None
+
+        lengths = array.array('Q')
+        lengths.frombytes(content[SECTION_HEADER.size:offset])
+        if sys.byteorder != 'little':
+            lengths.byteswap()
+
+        if offset + sum(lengths) != len(content):
+            return None
+
+        sections = []
+
+        for length in lengths:
+            sections.append(content[offset:offset + length])
+            offset += length
+
+        return sections
+
+    #
+    ## @brief Get array of unsigned integers from given section, see joinSections method.
+    #
+    #  @param section [ bytes-like object | None | in  ] - Section, which is written from an array of type I.
+    #
+    #  @exception ValueError - If section is not an array of unsigned integers.
+    #
+    #  @return array.array - Array.
+    @staticmethod
+    def getArrayOf(section):
+
+        _array = array.array('I')
+        _array.frombytes(section)
+
+        if sys.byteorder != 'little':
+            _array.byteswap()
+
+        return _array
+
+    #
+    ## @brief Get section of given array of unsigned integers, see getArrayOf method.
+    #
+    #  @param _array [ array.array | None | in  ] - Array of type I.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - Section.
+    @staticmethod
+    def getSectionOf(_array):
+
+        if sys.byteorder == 'little':
+            return _array.tobytes()
+
+        _array = array.array('I', _array)
+        _array.byteswap()
+
+        return _array.tobytes()
+
+    #
+    ## @brief Join given strings by null characters, see splitStrings method.
+    #
+    #  @param strings [ iterable of str | None | in  ] - Strings.
+    #
+    #  @exception ValueError - If a string contains a null character.
+    #
+    #  @return bytes - UTF-8 encoded strings.
+    @staticmethod
+    def joinStrings(strings):
+
+        strings = list(strings)
+        content = '\0'.join(strings)
+
+        # Each null character is a separator unless a string contains one
+        if strings and content.count('\0') != len(strings) - 1:
+            raise ValueError('Strings which contain a null character cannot be saved.')
+
+        return content.encode('utf-8')
+
+    #
+    ## @brief Split given strings which are joined by joinStrings method.
+    #
+    #  @param section [ bytes-like object | None | in  ] - UTF-8 encoded strings.
+    #  @param count   [ int               | None | in  ] - Number of the strings.
+    #
+    #  @exception ValueError - If section doesn't contain given number of strings.
+    #
+    #  @return list of str - Strings.
+    @staticmethod
+    def splitStrings(section, count):
+
+        strings = str(section, 'utf-8').split('\0') if count else []
+
+        if len(strings) != count:
+            raise ValueError('Section contains {} strings instead of {}.'.format(len(strings), count))
+
+        return strings
+
+    #
+    ## @brief Check whether given file name is a developer module file name.
+    #
+    #  @param fileName [ str | None | in  ] - File name.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def isDeveloperModuleFileName(fileName):
+
+        if not fileName.endswith('.py') or fileName == '__init__.py':
+            return False
+
+        return not fileName.endswith('{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kTest))
+
+    #
+    ## @brief Scan given developers directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return int  - Modification time of the directory in nanoseconds.
+    #  @return dict - Developer module file names as keys, list of modification time in nanoseconds and size as values.
+    @staticmethod
+    def scanDirectory(directory):
+
+        files = {}
+
+        try:
+            directoryMTime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return 0, files
+
+        for entry in os.scandir(directory):
+
+            if not RegistryCache.isDeveloperModuleFileName(entry.name) or not entry.is_file():
+                continue
+
+            entryStat = entry.stat()
+            files[entry.name] = [entryStat.st_mtime_ns, entryStat.st_size]
+
+        return directoryMTime, files
+
+    #
+    ## @brief Get record of given developer module.
+    #
+    #  @param developerModule [ module | None | in  ] - Developer module.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Attribute names as keys and their values as values, only existing attributes are included.
+    @staticmethod
+    def getModuleRecord(developerModule):
+
+        record = {}
+
+        for attr in mDeveloper.readerLib.DeveloperModuleReader.listAttributes():
+            if hasattr(developerModule, attr):
+                record[attr] = getattr(developerModule, attr)
+
+        return record
+
+    #
+    ## @brief Extract record of given developer module file.
+    #
+    #  Developer module is read statically by using mDeveloper.readerLib.DeveloperModuleReader, so that it isn't
+    #  imported. It is executed only if its attributes are not literals, see importModule method.
+    #  Only the developer module attributes and INFO are extracted.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the developer module file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Record, None if the developer module couldn't be executed or its values can't be cached.
+    @staticmethod
+    def extractRecord(filePath):
+
+        try:
+            record = mDeveloper.readerLib.DeveloperModuleReader.readFile(filePath)
+        except (IOError, OSError, SyntaxError, ValueError):
+            return None
+
+        if record is None:
+            record = RegistryCache.importRecord(filePath)
+            if record is None:
+                return None
+
+        try:
+            json.dumps(record)
+        except (TypeError, ValueError):
+            return None
+
+        return record
+
+    #
+    ## @brief Extract records of given developer module files.
+    #
+    #  @param filePathList [ list of str | None  | in  ] - Absolute paths of the developer module files.
+    #  @param workers      [ int         | None  | in  ] - Number of workers, records are extracted serially if None given.
+    #  @param processes    [ bool        | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Records in the order of given files, see extractRecord method.
+    @staticmethod
+    def extractRecords(filePathList, workers=None, processes=False):
+
+        if not workers or workers < 2 or len(filePathList) < 2:
+            return [RegistryCache.extractRecord(x) for x in filePathList]
+
+        # Imported on demand to keep start-up time of the commands low
+        import concurrent.futures
+
+        executorClass = concurrent.futures.ProcessPoolExecutor if processes else concurrent.futures.ThreadPoolExecutor
+
+        with executorClass(max_workers=workers) as executor:
+            return list(executor.map(RegistryCache.extractRecord,
+                                     filePathList,
+                                     chunksize=max(1, len(filePathList) // (workers * 4))))
+
+    #
+    ## @brief Import given developer module file and get its record.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the developer module file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Record, None if the developer module couldn't be executed.
+    @staticmethod
+    def importRecord(filePath):
+
+        try:
+            _module = RegistryCache.importModule(filePath)
+        except Exception:
+            return None
+
+        return RegistryCache.getModuleRecord(_module)
+
+    #
+    ## @brief Import given developer module file.
+    #
+    #  Developer module is executed without being added into sys.modules, so that changes on disk are always picked up.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the developer module file.
+    #
+    #  @exception ImportError - If file doesn't exist.
+    #  @exception Exception   - Any exception raised by the developer module.
+    #
+    #  @return module - Developer module.
+    @staticmethod
+    def importModule(filePath):
+
+        if not os.path.isfile(filePath):
+            raise ImportError('Developer module file does not exist: {}'.format(filePath))
+
+        # Imported on demand to keep start-up time of the commands low
+        import importlib.util
+
+        moduleName = os.path.splitext(os.path.basename(filePath))[0]
+
+        spec    = importlib.util.spec_from_file_location('mDeveloper.developers.{}'.format(moduleName), filePath)
+        _module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_module)
+
+        return _module
@@ -0,0 +1,365 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/clientLib.py @brief [ FILE   ] - Developer server client module.
+## @package mDeveloper.clientLib    @brief [ MODULE ] - Developer server client module.
+#
+#  Client only depends on the standard library, so that commands can query a running developer server,
+#  see mDeveloper.serverLib, without importing the registry.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import stat
+import socket
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the request/response protocol, requests with a different version are rejected.
+PROTOCOL_VERSION              = 2
+
+## [ str ] - Environment variable to override the socket path of the developer server.
+SOCKET_ENVIRONMENT_VARIABLE   = 'MDEVELOPER_SOCKET_PATH'
+
+## [ float ] - Default timeout of the requests in seconds.
+TIMEOUT                       = 5.0
+
+## [ int ] - Size of the chunks the responses are read in.
+BUFFER_SIZE                   = 65536
+
+## [ str ] - Environment variable of the developer database, same as mDeveloper.developerLib.DATABASE_ENVIRONMENT_VARIABLE, which isn't imported to keep start-up time of the commands low.
+DATABASE_ENVIRONMENT_VARIABLE = 'MDEVELOPER_DATABASE_PATH'
+
+## [ str ] - Environment variable of the developers search path, same as mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE.
+PATH_ENVIRONMENT_VARIABLE     = 'MDEVELOPER_PATH'
+
+#
+## @brief [ CLASS ] - Class to send requests to a developer server over a Unix domain socket.
+#
+#  Each request is a single line JSON object with version, command, arguments and source keys, the response is a
+#  single line JSON object with either result or error and type keys. Connection is closed after each response.
+#
+#  Server refuses a request whose source is not the one it serves, so that checking the source doesn't cost
+#  another round trip. Socket is connected to only if it is owned by the current user and its directory is not
+#  writable by the other users, so that another user can't answer the requests by replacing the socket.
+class DeveloperClient(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param socketPath [ str   | None    | in  ] - Socket path of the server, default one is used if None given.
+    #  @param timeout    [ float | TIMEOUT | in  ] - Timeout of the requests in seconds.
+    #  @param source     [ dict  | None    | in  ] - Source the server must serve, see getLocalSource method, server serves any source if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, socketPath=None, timeout=TIMEOUT, source=None):
+
+        ## [ str ] - Socket path.
+        self._socketPath = socketPath if socketPath else DeveloperClient.getDefaultSocketPath()
+
+        ## [ float ] - Timeout in seconds.
+        self._timeout    = timeout
+
+        ## [ dict ] - Source the server must serve.
+        self._source     = source
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def socketPath(self):
+
+        return self._socketPath
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether a server seems to be running, socket file is checked without connecting.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isRunning(self):
+
+        return hasattr(socket, 'AF_UNIX') and os.path.exists(self._socketPath)
+
+    #
+    ## @brief Send a request and get its result.
+    #
+    #  @param command   [ str  | None | in  ] - Command, such as search.
+    #  @param arguments [ dict | None | in  ] - Arguments of the command.
+    #
+    #  @exception OSError      - If server is not running, its socket is not safe, see checkSocket method, or it doesn't respond in time.
+    #  @exception ValueError   - If server rejects the request, such as a search in an unknown field or a request of another source.
+    #  @exception RuntimeError - If server fails to run the command.
+    #
+    #  @return variant - Result of the command.
+    def request(self, command, **arguments):
+
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError('Unix domain sockets are not supported on this platform.')
+
+        DeveloperClient.checkSocket(self._socketPath)
+
+        content = json.dumps({'version'   : PROTOCOL_VERSION,
+                              'command'   : command,
+                              'arguments' : arguments,
+                              'source'    : self._source}).encode('utf-8')
+
+        chunkList = []
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+
+            _socket.settimeout(self._timeout)
+            _socket.connect(self._socketPath)
+            _socket.sendall(content + b'\n')
+
+            while True:
+
+                chunk = _socket.recv(BUFFER_SIZE)
+                if not chunk:
+                    break
+
+                chunkList.append(chunk)
+
+                if chunk.endswith(b'\n'):
+                    break
+
+        try:
+            response = json.loads(b''.join(chunkList).decode('utf-8'))
+        except ValueError:
+            raise OSError('Invalid response received from the developer server at {}.'.format(self._socketPath))
+
+        if not isinstance(response, dict) or ('result' not in response and 'error' not in response):
+            raise OSError('Invalid response received from the developer server at {}.'.format(self._socketPath))
+
+        if 'error' in response:
+            if response.get('type') == 'ValueError':
+                raise ValueError(response['error'])
+            raise RuntimeError(response['error'])
+
+        return response['result']
+
+    #
+    ## @brief Check whether the server serves developers from given source.
+    #
+    #  @param source [ dict | None | in  ] - Source, see getLocalSource method.
+    #
+    #  @exception OSError    - If server is not running or it doesn't respond in time.
+    #  @exception ValueError - If server doesn't support ping command.
+    #
+    #  @return bool - Result.
+    def servesSource(self, source):
+
+        result = self.request('ping')
+
+        return isinstance(result, dict) and DeveloperClient.isSameSource(result, source)
+
+    #
+    ## @brief List developers.
+    #
+    #  @param detail [ bool | False | in  ] - Whether to include text representations of the developers.
+    #  @param limit  [ int  | None  | in  ] - Maximum number of developers, all of them are listed if None given.
+    #
+    #  @exception OSError - If server is not running or it doesn't respond in time.
+    #
+    #  @return dict - Records key has list of records as dict instances, errors key has developer module names as keys and error messages as values.
+    def listDevelopers(self, detail=False, limit=None):
+
+        return self.request('list', detail=detail, limit=limit)
+
+    #
+    ## @brief Search developers.
+    #
+    #  @param keyword [ str         | None  | in  ] - Keyword, search is case insensitive, it can contain field terms such as site:Headquarter.
+    #  @param fields  [ list of str | None  | in  ] - Fields to search in, such as USERNAME, all of them are searched if None given.
+    #  @param detail  [ bool        | False | in  ] - Whether to include text representations of the developers.
+    #  @param limit   [ int         | None  | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception OSError    - If server is not running or it doesn't respond in time.
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return dict - Records key has list of records as dict instances, most relevant ones first.
+    def search(self, keyword, fields=None, detail=False, limit=None):
+
+        return self.request('search', keyword=keyword, fields=fields, detail=detail, limit=limit)
+
+    #
+    ## @brief Count developers by site and position, see mDeveloper.developerLib.Developer.getFacetCounts.
+    #
+    #  @param query  [ str         | None | in  ] - Query to count the developers of, all developers are counted if None given.
+    #  @param fields [ list of str | None | in  ] - Fields to search the keyword of the query in, all of them are searched if None given.
+    #
+    #  @exception OSError    - If server is not running or it doesn't respond in time.
+    #  @exception ValueError - If a field is not searchable or a field term has no value.
+    #
+    #  @return dict - Facets key has fields as keys and list of value and count pairs as values.
+    def getFacetCounts(self, query=None, fields=None):
+
+        return self.request('facets', query=query, fields=fields)
+
+    #
+    ## @brief Check whether given user is a developer, see mDeveloper.developerLib.Developer.isDeveloper.
+    #
+    #  @param user [ str | None | in  ] - User name, e-mail address or developer module name.
+    #
+    #  @exception OSError - If server is not running or it doesn't respond in time.
+    #
+    #  @return str - Developer module name, None if user is not a developer.
+    def isDeveloper(self, user):
+
+        return self.request('isDeveloper', user=user)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get source of the developers of the process-wide storage of this process, see mDeveloper.developerLib.DeveloperRegistry.getInstance.
+    #
+    #  Pack files and shared memory snapshots are not told apart from the default developers directory, since
+    #  they are only used while they are up to date with it.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Storage key has either directory or database, layers key has absolute paths of the developers directories or the database.
+    @staticmethod
+    def getLocalSource():
+
+        databasePath = os.environ.get(DATABASE_ENVIRONMENT_VARIABLE)
+        if databasePath:
+            return {'storage':'database', 'layers':[os.path.abspath(databasePath)]}
+
+        layers = []
+
+        for directory in os.environ.get(PATH_ENVIRONMENT_VARIABLE, '').split(os.pathsep):
+            directory = os.path.abspath(directory) if directory.strip() else None
+            if directory and os.path.normcase(directory) not in [os.path.normcase(x) for x in layers]:
+                layers.append(directory)
+
+        if not layers:
+            layers = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'developers')]
+
+        return {'storage':'directory', 'layers':layers}
+
+    #
+    ## @brief Check whether given sources are the same, see getLocalSource method.
+    #
+    #  @param source      [ dict | None | in  ] - Source.
+    #  @param otherSource [ dict | None | in  ] - Other source.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def isSameSource(source, otherSource):
+
+        if source.get('storage') != otherSource.get('storage'):
+            return False
+
+        return [os.path.normcase(x) for x in source.get('layers') or []] == [os.path.normcase(x) for x in otherSource.get('layers') or []]
+
+    #
+    ## @brief Check whether given directory is safe to create a socket in, it must not be writable by the other users.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the directory.
+    #
+    #  @exception OSError - If directory doesn't exist or it is writable by the other users.
+    #
+    #  @return None - None.
+    @staticmethod
+    def checkSocketDirectory(directory):
+
+        if os.stat(directory).st_mode & stat.S_IWOTH:
+            raise OSError('Socket directory {} is writable by other users.'.format(directory))
+
+    #
+    ## @brief Check whether given socket is safe to connect to.
+    #
+    #  Socket must be owned by the current user and it must not be in a directory which is writable by the other
+    #  users, otherwise another user could have created it, or replace it, to answer the requests.
+    #
+    #  @param socketPath [ str | None | in  ] - Socket path.
+    #
+    #  @exception OSError - If socket doesn't exist or it is not safe to connect to.
+    #
+    #  @return None - None.
+    @staticmethod
+    def checkSocket(socketPath):
+
+        socketStat = os.stat(socketPath)
+
+        if not stat.S_ISSOCK(socketStat.st_mode):
+            raise OSError('{} is not a socket.'.format(socketPath))
+
+        if hasattr(os, 'getuid') and socketStat.st_uid != os.getuid():
+            raise OSError('Socket {} is not owned by the current user.'.format(socketPath))
+
+        DeveloperClient.checkSocketDirectory(os.path.dirname(os.path.abspath(socketPath)))
+
+    #
+    ## @brief Get default socket path.
+    #
+    #  Socket is created in the runtime directory of the user, which is local to the host, instead of the
+    #  cache directory, which may be on a network file system. If there is no runtime directory, socket is
+    #  created in a directory of the user in /tmp instead of /tmp itself, which is writable by everyone.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the socket.
+    @staticmethod
+    def getDefaultSocketPath():
+
+        socketPath = os.environ.get(SOCKET_ENVIRONMENT_VARIABLE)
+        if socketPath:
+            return socketPath
+
+        userId = os.getuid() if hasattr(os, 'getuid') else 0
+
+        runtimeDirectory = os.environ.get('XDG_RUNTIME_DIR')
+        if not runtimeDirectory or not os.path.isdir(runtimeDirectory):
+            return os.path.join('/tmp', 'mdeveloper-{}'.format(userId), 'server.sock')
+
+        return os.path.join(runtimeDirectory, 'mdeveloper-{}.sock'.format(userId))
@@ -25,31 +25,350 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+#
+#  Only the modules needed to parse the arguments are imported here, the others are imported by the
+#  commands after the arguments are parsed, so that start-up, including --help, is fast.
+import sys
+import time
 import argparse
 
-import mCore.displayLib
-
-import mDeveloper.developerLib
-
 
 
 #
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Output formats, text and mDeveloper.formatterLib.FORMATS, which are listed here so that parsing the arguments doesn't import the formatter.
+OUTPUT_FORMATS = ['text', 'json', 'ndjson', 'csv']
+
+## [ list of str ] - Fields to search in, lower case mDeveloper.searchLib.FIELDS, which are listed here so that parsing the arguments doesn't import the search index.
+SEARCH_FIELDS  = ['username', 'name', 'email', 'position', 'site']
+
 #
-## @brief List all developers.
+## @brief Add profiling arguments to given parser.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def listDevelopers():
+def _addProfileArguments(parser):
 
-    developerModuleList = mDeveloper.developerLib.Developer.listDeveloperModules()
-    if not developerModuleList:
-        mCore.displayLib.Display.displayInfo('No developers found.')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        help='Display time spent in each phase and the cache counters')
+
+    parser.add_argument('--profile-file',
+                        type=str,
+                        default=None,
+                        help='Write cProfile statistics into given file, which can be read with pstats')
+
+#
+## @brief Start profiling if it is requested by given arguments.
+#
+#  @param _args [ argparse.Namespace | None | in  ] - Parsed arguments, see _addProfileArguments function.
+#
+#  @exception N/A
+#
+#  @return cProfile.Profile - Profile, None if cProfile statistics are not requested.
+#  @return float            - Start time.
+def _startProfile(_args):
+
+    import mDeveloper.statsLib
+
+    mDeveloper.statsLib.Stats.getInstance().reset()
+
+    _profile = None
+
+    if _args.profile_file:
+        import cProfile
+        _profile = cProfile.Profile()
+        _profile.enable()
+
+    return _profile, time.perf_counter()
+
+#
+## @brief Stop profiling and display the per-phase breakdown if it is requested by given arguments.
+#
+#  Spans are inclusive, render phase includes the developer modules read while developers are displayed.
+#
+#  @param _args     [ argparse.Namespace | None | in  ] - Parsed arguments, see _addProfileArguments function.
+#  @param _profile  [ cProfile.Profile   | None | in  ] - Profile returned by _startProfile function.
+#  @param startTime [ float              | None | in  ] - Start time returned by _startProfile function.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _stopProfile(_args, _profile, startTime):
+
+    totalTime = time.perf_counter() - startTime
+
+    if _profile:
+        _profile.disable()
+        _profile.dump_stats(_args.profile_file)
+
+    if not _args.profile:
+        return
+
+    import mCore.displayLib
+    import mDeveloper.statsLib
+
+    _stats = mDeveloper.statsLib.Stats.getInstance()
+
+    mCore.displayLib.Display.displayInfo('{:<20} {:>8} {:>12}'.format('Phase', 'Calls', 'Time (ms)'))
+
+    for name, span in _stats.getSpans().items():
+        mCore.displayLib.Display.displayInfo('{:<20} {:>8} {:>12.3f}'.format(name, span['count'], span['time'] * 1000.0))
+
+    mCore.displayLib.Display.displayInfo('{:<20} {:>8} {:>12.3f}'.format('total', '', totalTime * 1000.0))
+
+    for name, value in _stats.getCounters().items():
+        mCore.displayLib.Display.displayInfo('{:<20} {:>8}'.format(name, value))
+
+    if _profile:
+        mCore.displayLib.Display.displayInfo('cProfile statistics are written into {}'.format(_args.profile_file))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Add developer server arguments to given parser.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _addServerArguments(parser):
+
+    parser.add_argument('--no-server',
+                        action='store_true',
+                        help='Run in this process even if a developer server is running, see mdeveloper-server')
+
+#
+## @brief Send given request to the developer server if it is running and it serves the same developers.
+#
+#  Requests are not sent if in-process execution is requested by given arguments, such as profiling. Server
+#  refuses the request if it serves another developers directory, search path or database than this process
+#  would use, see mDeveloper.clientLib.DeveloperClient.getLocalSource, so that a single round trip is made.
+#
+#  @param _args     [ argparse.Namespace | None | in  ] - Parsed arguments, see _addServerArguments and _addProfileArguments functions.
+#  @param command   [ str                | None | in  ] - Command, see mDeveloper.clientLib.DeveloperClient.request.
+#  @param arguments [ dict               | None | in  ] - Arguments of the command.
+#
+#  @exception N/A
+#
+#  @return variant - Result of the command, None if server is not running or it fails.
+def _requestServer(_args, command, **arguments):
+
+    if _args.no_server or _args.profile or _args.profile_file:
+        return None
+
+    import mDeveloper.clientLib
+
+    _client = mDeveloper.clientLib.DeveloperClient(source=mDeveloper.clientLib.DeveloperClient.getLocalSource())
+
+    if not _client.isRunning():
+        return None
+
+    try:
+        return _client.request(command, **arguments)
+    except (OSError, RuntimeError, ValueError):
+        # Requests of another source, unsafe sockets, malformed or truncated responses and errors of the server are handled by running the command in this process.
+        return None
+
+#
+## @brief Display given developers as they are iterated.
+#
+#  Records received from the developer server, see mDeveloper.clientLib.DeveloperClient, can be given as well.
+#
+#  @param developers [ iterable of mDeveloper.developerLib.Developer, dict | None | in  ] - Developers or records.
+#  @param detail     [ bool                                          | None | in  ] - Whether to display details about the developers.
+#
+#  @exception N/A
+#
+#  @return int - Number of the developers displayed.
+def _displayDevelopers(developers, detail):
+
+    import mCore.displayLib
+    import mDeveloper.statsLib
+
+    developerCount = 0
+
+    with mDeveloper.statsLib.Stats.getInstance().span('render'):
+
+        if not detail:
+            mCore.displayLib.Display.displayBlankLine()
+
+        for _developer in developers:
+
+            developerCount += 1
+
+            if isinstance(_developer, dict):
+                mCore.displayLib.Display.displayInfo(_developer['text'] if detail else _developer['userName'])
+            elif detail:
+                mCore.displayLib.Display.displayInfo(_developer)
+            else:
+                mCore.displayLib.Display.displayInfo(_developer.userName())
+
+        if not detail:
+            mCore.displayLib.Display.displayBlankLine()
+
+    return developerCount
+
+#
+## @brief Add output format arguments to given parser.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _addFormatArguments(parser):
+
+    parser.add_argument('--format',
+                        choices=OUTPUT_FORMATS,
+                        default='text',
+                        help='Output format, machine-readable formats write the developers only and errors into stderr')
+
+    parser.add_argument('--fields',
+                        type=str,
+                        default=None,
+                        help='Comma separated fields to write in machine-readable formats, such as username,email, all fields by default')
+
+#
+## @brief Add search field arguments to given parser.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _addFieldArguments(parser):
+
+    parser.add_argument('-f',
+                        '--field',
+                        action='append',
+                        choices=SEARCH_FIELDS,
+                        help='Field to search in, can be used multiple times, all fields are searched by default')
+
+#
+## @brief Get fields of the output format arguments, see _addFormatArguments function.
+#
+#  Parser exits with an error message if a field is not valid.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#  @param _args  [ argparse.Namespace      | None | in  ] - Parsed arguments.
+#
+#  @exception N/A
+#
+#  @return list of str - Developer module attributes, such as USERNAME, None if all fields are requested.
+def _getFormatFields(parser, _args):
+
+    import mDeveloper.formatterLib
+
+    try:
+        return mDeveloper.formatterLib.RecordWriter.parseFields(_args.fields)
+    except ValueError as error:
+        parser.error(str(error))
+
+#
+## @brief Write given developers into stdout in given machine-readable format as they are iterated.
+#
+#  @param developers [ iterable of mDeveloper.developerLib.Developer, dict | None | in  ] - Developers or records of the developer server.
+#  @param formatName [ str                                          | None | in  ] - Format, see mDeveloper.formatterLib.FORMATS.
+#  @param fields     [ list of str                                  | None | in  ] - Developer module attributes to write, all of them are written if None given.
+#
+#  @exception N/A
+#
+#  @return int - Number of the developers written.
+def _writeDevelopers(developers, formatName, fields):
+
+    import os
+    import mDeveloper.statsLib
+    import mDeveloper.formatterLib
+
+    _writer = mDeveloper.formatterLib.RecordWriter(sys.stdout, formatName, fields=fields)
+
+    with mDeveloper.statsLib.Stats.getInstance().span('render'):
+
+        try:
+            _writer.writeAll(developers)
+            _writer.close()
+
+        except BrokenPipeError:
+            # Reader, such as head, has exited, remaining output is discarded
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+
+    return _writer.recordCount()
+
+#
+## @brief Write given invalid developer modules into stderr.
+#
+#  @param errors [ dict | None | in  ] - Developer module names as keys and validation exceptions as values.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _writeErrors(errors):
+
+    for moduleName, error in errors.items():
+        sys.stderr.write('Invalid developer module {}: {}\n'.format(moduleName, error))
+
+#
+## @brief Display or write number of developers per site and position, see search function.
+#
+#  @param _args   [ argparse.Namespace | None | in  ] - Parsed arguments of search function.
+#  @param keyword [ str                | None | in  ] - Query to count the developers of, all developers are counted if it is empty.
+#  @param fields  [ list of str        | None | in  ] - Developer module attributes to search the keyword in, all of them are searched if None given.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _facets(_args, keyword, fields):
+
+    import mCore.displayLib
+
+    result = _requestServer(_args, 'facets', query=keyword, fields=fields)
+
+    _profile, startTime = _startProfile(_args)
+
+    if result is not None:
+        counts = result['facets']
+    else:
+        import mDeveloper.developerLib
+        counts = mDeveloper.developerLib.Developer.getFacetCounts(query=keyword if keyword.strip() else None, fields=fields)
+
+    if _args.format != 'text':
+        import mDeveloper.formatterLib
+        mDeveloper.formatterLib.RecordWriter.writeCounts(sys.stdout, _args.format, counts)
+        _stopProfile(_args, _profile, startTime)
         return
 
+    mCore.displayLib.Display.displayBlankLine()
+
+    for field, valueCounts in counts.items():
+
+        mCore.displayLib.Display.displayInfo('{}:'.format(field.capitalize()))
+
+        for value, count in valueCounts:
+            mCore.displayLib.Display.displayInfo('    {:<40} {:>8}'.format(value, count))
+
+        if not valueCounts:
+            mCore.displayLib.Display.displayInfo('    No developers found.')
+
+        mCore.displayLib.Display.displayBlankLine()
+
+    _stopProfile(_args, _profile, startTime)
+
+#
+## @brief List all developers.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def listDevelopers():
+
     parser = argparse.ArgumentParser(description='List developers')
 
     parser.add_argument('-d',
@@ -57,29 +376,81 @@ def listDevelopers():
                         action='store_true',
                         help='Display details about the developers')
 
-    _args   = parser.parse_args()
+    parser.add_argument('-j',
+                        '--jobs',
+                        type=int,
+                        default=None,
+                        help='Number of workers to read developer modules with')
 
-    detail  = _args.detail
+    parser.add_argument('-l',
+                        '--limit',
+                        type=int,
+                        default=None,
+                        help='Maximum number of developers to display, developer modules are read only until the limit is reached')
 
-    if not detail:
-        mCore.displayLib.Display.displayBlankLine()
+    parser.add_argument('--first',
+                        action='store_true',
+                        help='Display the first developer only, same as --limit 1')
 
-    for module in developerModuleList:
+    _addFormatArguments(parser)
+    _addServerArguments(parser)
+    _addProfileArguments(parser)
 
-        _developer = mDeveloper.developerLib.Developer(module)
+    _args        = parser.parse_args()
+    outputFields = _getFormatFields(parser, _args)
 
-        if detail:
-            mCore.displayLib.Display.displayInfo(_developer)
-        else:
-            mCore.displayLib.Display.displayInfo(_developer.userName())
+    import mCore.displayLib
+
+    detail  = _args.detail and _args.format == 'text'
+    limit   = 1 if _args.first else _args.limit
+    limit   = None if limit is None else max(limit, 0)
+
+    result  = None if _args.jobs else _requestServer(_args, 'list', detail=detail, limit=limit)
+
+    _profile, startTime = _startProfile(_args)
+
+    if result is not None:
+        developers = result['records']
+        errors     = result['errors']
+
+    else:
+        import itertools
+        import collections
+        import mDeveloper.developerLib
 
-    if not detail:
+        if limit is None:
+            # All developers are listed, so that the storage is loaded up front through its cache, developers are still written one at a time
+            mDeveloper.developerLib.DeveloperRegistry.getInstance().refresh(workers=_args.jobs)
+
+        errors     = collections.OrderedDict()
+        developers = mDeveloper.developerLib.Developer.iterDevelopers(errors=errors)
+
+        if limit is not None:
+            developers = itertools.islice(developers, limit)
+
+    if _args.format != 'text':
+        _writeDevelopers(developers, _args.format, outputFields)
+        _writeErrors(errors)
+        _stopProfile(_args, _profile, startTime)
+        return
+
+    developerCount = _displayDevelopers(developers, detail)
+
+    for moduleName, error in errors.items():
+        mCore.displayLib.Display.displayInfo('Invalid developer module {}: {}'.format(moduleName, error))
+
+    if errors:
         mCore.displayLib.Display.displayBlankLine()
 
-    mCore.displayLib.Display.displayInfo(('{} developer(s) listed.'.format(len(developerModuleList))))
+    if developerCount:
+        mCore.displayLib.Display.displayInfo('{} developer(s) listed.'.format(developerCount))
+    else:
+        mCore.displayLib.Display.displayInfo('No developers found.')
 
     mCore.displayLib.Display.displayBlankLine()
 
+    _stopProfile(_args, _profile, startTime)
+
 #
 ## @brief Search developers.
 #
@@ -88,48 +459,104 @@ def listDevelopers():
 #  @return None - None.
 def search():
 
-    developerModuleList = mDeveloper.developerLib.Developer.listDeveloperModules()
-    if not developerModuleList:
-        mCore.displayLib.Display.displayInfo('No developers found.')
-        return
-
     parser = argparse.ArgumentParser(description='Search for developers')
 
     parser.add_argument('keyword',
                         type=str,
-                        help='Keyword to be searched')
+                        nargs='*',
+                        help='Keyword to be searched, it can contain field terms such as site:Headquarter or position:"Lead*", '
+                             'values are case insensitive and * and ? can be used as wildcards')
 
     parser.add_argument('-d',
                         '--detail',
                         action='store_true',
                         help='Display details about the developers')
 
-    _args   = parser.parse_args()
+    parser.add_argument('-l',
+                        '--limit',
+                        type=int,
+                        default=None,
+                        help='Maximum number of developers to display, most relevant ones are displayed first')
+
+    parser.add_argument('--first',
+                        action='store_true',
+                        help='Display the first developer found and stop, results are not ranked')
 
-    keyword = _args.keyword.lower()
-    detail  = _args.detail
+    _addFieldArguments(parser)
 
-    if not detail:
-        mCore.displayLib.Display.displayBlankLine()
+    parser.add_argument('--fuzzy',
+                        type=int,
+                        nargs='?',
+                        const=2,
+                        default=None,
+                        metavar='maxDistance',
+                        help='Match user names and names within given edit distance, 2 by default, instead of matching substrings')
 
-    developerCount = 0
+    parser.add_argument('--facets',
+                        action='store_true',
+                        help='Display number of developers per site and position instead of the developers, developers found by the keyword are counted if it is given')
 
-    for module in developerModuleList:
+    _addFormatArguments(parser)
+    _addServerArguments(parser)
+    _addProfileArguments(parser)
 
-        _developer = mDeveloper.developerLib.Developer(module)
+    _args        = parser.parse_args()
+    outputFields = _getFormatFields(parser, _args)
 
-        if keyword in _developer.userName().lower() or \
-           keyword in _developer.name().lower():
+    if _args.fuzzy is not None and (_args.field or _args.facets or _args.fuzzy < 0):
+        parser.error('--fuzzy takes a non-negative edit distance and it searches user names and names, it can\'t be used with --field or --facets')
 
-            developerCount += 1
+    import mDeveloper.facetLib
 
-            if detail:
-                mCore.displayLib.Display.displayInfo(_developer)
-            else:
-                mCore.displayLib.Display.displayInfo(_developer.userName())
+    keyword = mDeveloper.facetLib.FacetIndex.joinArguments(_args.keyword)
 
-    if not detail:
-        mCore.displayLib.Display.displayBlankLine()
+    if not keyword.strip() and not _args.facets:
+        parser.error('keyword is required unless --facets is given')
+
+    try:
+        terms = mDeveloper.facetLib.FacetIndex.parseQuery(keyword)[1]
+    except ValueError as error:
+        parser.error(str(error))
+
+    if terms and _args.fuzzy is not None:
+        parser.error('--fuzzy can\'t be used with field terms')
+
+    import mCore.displayLib
+
+    detail  = _args.detail and _args.format == 'text'
+    fields  = [x.upper() for x in _args.field] if _args.field else None
+
+    if _args.facets:
+        _facets(_args, keyword, fields)
+        return
+
+    # Server has the search index loaded already, so the first developer is the most relevant one instead of the first one found
+    result  = _requestServer(_args, 'search', keyword=keyword, fields=fields, detail=detail, limit=1 if _args.first else _args.limit, fuzzy=_args.fuzzy)
+
+    _profile, startTime = _startProfile(_args)
+
+    if result is not None:
+        developers = result['records']
+
+    elif _args.fuzzy is not None:
+        import mDeveloper.developerLib
+        developers = mDeveloper.developerLib.Developer.fuzzySearch(keyword, maxDistance=_args.fuzzy, limit=1 if _args.first else _args.limit)
+
+    elif _args.first and not terms:
+        import itertools
+        import mDeveloper.developerLib
+        developers = itertools.islice(mDeveloper.developerLib.Developer.iterSearch(keyword, fields=fields), 1)
+
+    else:
+        import mDeveloper.developerLib
+        developers = mDeveloper.developerLib.Developer.query(keyword, fields=fields, limit=1 if _args.first else _args.limit)
+
+    if _args.format != 'text':
+        _writeDevelopers(developers, _args.format, outputFields)
+        _stopProfile(_args, _profile, startTime)
+        return
+
+    developerCount = _displayDevelopers(developers, detail)
 
     if developerCount:
         mCore.displayLib.Display.displayInfo('{} developer(s) found.'.format(developerCount))
@@ -137,3 +564,409 @@ def search():
         mCore.displayLib.Display.displayInfo('No developers found.')
 
     mCore.displayLib.Display.displayBlankLine()
+
+    _stopProfile(_args, _profile, startTime)
+
+#
+## @brief Validate all developer modules.
+#
+#  Exits with status 1 if any developer module is invalid, so that it can be used in pre-commit hooks and CI.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def validate():
+
+    parser = argparse.ArgumentParser(description='Validate developer modules')
+
+    parser.add_argument('--directory',
+                        type=str,
+                        default=None,
+                        help='Developers directory to validate, developers directory of this package is validated by default')
+
+    parser.add_argument('--force',
+                        action='store_true',
+                        help='Validate all developer modules, including the ones which have not changed since the last validation')
+
+    _args = parser.parse_args()
+
+    import mCore.displayLib
+    import mDeveloper.validatorLib
+
+    _validator = mDeveloper.validatorLib.DeveloperModuleValidator(directory=_args.directory)
+
+    result = _validator.validate(force=_args.force)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for moduleName, error in _validator.errors().items():
+        mCore.displayLib.Display.displayInfo('Invalid developer module {}: {}'.format(moduleName, error))
+
+    if _validator.errors():
+        mCore.displayLib.Display.displayBlankLine()
+
+    mCore.displayLib.Display.displayInfo('{} developer module(s) validated, {} unchanged module(s) skipped, {} invalid.'.format(len(_validator.validated()),
+                                                                                                                           len(_validator.skipped()),
+                                                                                                                           len(_validator.errors())))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if not result:
+        sys.exit(1)
+
+#
+## @brief List packages owned by a developer, or developers of a package.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def owns():
+
+    parser = argparse.ArgumentParser(description='List packages owned by a developer')
+
+    parser.add_argument('user',
+                        type=str,
+                        nargs='?',
+                        default=None,
+                        help='User name, e-mail address or developer module name of the developer, current user by default')
+
+    parser.add_argument('-p',
+                        '--package',
+                        type=str,
+                        default=None,
+                        help='List developers of given package instead')
+
+    parser.add_argument('-r',
+                        '--root',
+                        action='append',
+                        help='Package root to scan, can be used multiple times, MDEVELOPER_PACKAGE_ROOTS environment variable is used by default')
+
+    _args = parser.parse_args()
+
+    import getpass
+    import mCore.displayLib
+    import mDeveloper.ownershipLib
+    import mDeveloper.developerLib
+
+    _ownershipIndex = mDeveloper.ownershipLib.OwnershipIndex(packageRoots=_args.root)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if _args.package:
+
+        developers = _ownershipIndex.getDevelopers(_args.package)
+        if developers is None:
+            mCore.displayLib.Display.displayInfo('Package {} is not found.'.format(_args.package))
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+        for developer in developers:
+            mCore.displayLib.Display.displayInfo(developer)
+
+        mCore.displayLib.Display.displayBlankLine()
+        mCore.displayLib.Display.displayInfo('{} developer(s) found.'.format(len(developers)))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    user = _args.user if _args.user else getpass.getuser()
+
+    if '@' in user:
+        email = user
+    else:
+        moduleName = mDeveloper.developerLib.Developer.resolveMany([user])[user]
+        record     = mDeveloper.developerLib.DeveloperRegistry.getInstance().getRecord(moduleName) if moduleName else None
+
+        if not record:
+
+            suggestions = mDeveloper.developerLib.Developer.getSuggestions(user)
+
+            mCore.displayLib.Display.displayInfo('{} is not a developer.'.format(user))
+            if suggestions:
+                mCore.displayLib.Display.displayInfo('Did you mean {}?'.format(', '.join(suggestions)))
+
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+        email = record.email
+
+    packageNameList = _ownershipIndex.getPackages(email)
+
+    for packageName in packageNameList:
+        mCore.displayLib.Display.displayInfo(packageName)
+
+    if packageNameList:
+        mCore.displayLib.Display.displayBlankLine()
+        mCore.displayLib.Display.displayInfo('{} package(s) owned by {}.'.format(len(packageNameList), email))
+    else:
+        mCore.displayLib.Display.displayInfo('No packages owned by {}.'.format(email))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Run a developer server, which keeps the registry in memory and answers the queries of the other commands.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def server():
+
+    parser = argparse.ArgumentParser(description='Serve developer queries from memory over a Unix domain socket')
+
+    parser.add_argument('--directory',
+                        type=str,
+                        default=None,
+                        help='Developers directory to serve, developers directory of this package is served by default')
+
+    parser.add_argument('--socket',
+                        type=str,
+                        default=None,
+                        help='Socket path, MDEVELOPER_SOCKET_PATH environment variable or a path in the runtime directory of the user is used by default')
+
+    parser.add_argument('--poll-interval',
+                        type=float,
+                        default=2.0,
+                        help='Interval in seconds the developers directory is checked for changes in')
+
+    _args = parser.parse_args()
+
+    import mCore.displayLib
+    import mDeveloper.serverLib
+
+    _server = mDeveloper.serverLib.DeveloperServer(directory=_args.directory,
+                                                   socketPath=_args.socket,
+                                                   pollInterval=_args.poll_interval)
+
+    mCore.displayLib.Display.displayBlankLine()
+    mCore.displayLib.Display.displayInfo('Serving {} on {}'.format(_server.registry().directory(), _server.socketPath()))
+    mCore.displayLib.Display.displayBlankLine()
+
+    try:
+        _server.serve()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as error:
+        mCore.displayLib.Display.displayInfo(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+
+#
+## @brief Convert a developers directory into a developer database in bulk.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def convert():
+
+    parser = argparse.ArgumentParser(description='Convert developer modules into a developer database')
+
+    parser.add_argument('database',
+                        type=str,
+                        help='Developer database file to write, it is created if it does not exist')
+
+    parser.add_argument('--directory',
+                        type=str,
+                        default=None,
+                        help='Developers directory to convert, developers directory of this package is converted by default')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        type=int,
+                        default=None,
+                        help='Number of workers to read developer modules with')
+
+    _args = parser.parse_args()
+
+    import os
+    import mCore.displayLib
+    import mDeveloper.sqliteStorageLib
+
+    _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.abspath(_args.database), create=True)
+
+    count, errors = _storage.importDirectory(directory=_args.directory, workers=_args.workers)
+
+    _storage.close()
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for moduleName, error in errors.items():
+        mCore.displayLib.Display.displayInfo('Invalid developer module {} is skipped: {}'.format(moduleName, error))
+
+    if errors:
+        mCore.displayLib.Display.displayBlankLine()
+
+    mCore.displayLib.Display.displayInfo('{} developer(s) written into {}, set MDEVELOPER_DATABASE_PATH to use it.'.format(count, _storage.databasePath()))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if errors:
+        sys.exit(1)
+
+#
+## @brief Compile a developers directory into a pack file, see mDeveloper.packLib.PackedRegistry.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def pack():
+
+    parser = argparse.ArgumentParser(description='Compile developer modules into a pack file for fast lookups')
+
+    parser.add_argument('--directory',
+                        type=str,
+                        default=None,
+                        help='Developers directory to compile, developers directory of this package is compiled by default')
+
+    parser.add_argument('-o',
+                        '--output',
+                        type=str,
+                        default=None,
+                        help='Pack file to write, it is written next to the developers directory by default')
+
+    parser.add_argument('-w',
+                        '--workers',
+                        type=int,
+                        default=None,
+                        help='Number of workers to read developer modules with')
+
+    _args = parser.parse_args()
+
+    import os
+    import mCore.displayLib
+    import mDeveloper.packLib
+
+    try:
+        count, errors = mDeveloper.packLib.PackedRegistry.write(directory=_args.directory,
+                                                                packPath=os.path.abspath(_args.output) if _args.output else None,
+                                                                workers=_args.workers)
+    except OSError as error:
+        mCore.displayLib.Display.displayInfo(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for moduleName, error in errors.items():
+        mCore.displayLib.Display.displayInfo('Invalid developer module {} is skipped: {}'.format(moduleName, error))
+
+    if errors:
+        mCore.displayLib.Display.displayBlankLine()
+
+    packPath = os.path.abspath(_args.output) if _args.output else mDeveloper.packLib.PackedRegistry.getPackPathOf(_args.directory)
+
+    mCore.displayLib.Display.displayInfo('{} developer(s) packed into {}.'.format(count, packPath))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if errors:
+        sys.exit(1)
+
+#
+## @brief Import developers from a CSV or LDIF export in bulk, see mDeveloper.importerLib.DeveloperImporter.
+#
+#  Developers are written into the developer database if one is given or MDEVELOPER_DATABASE_PATH is set,
+#  into the developers directory as developer modules otherwise.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def importDevelopers():
+
+    parser = argparse.ArgumentParser(description='Import developers from a CSV or LDIF export')
+
+    parser.add_argument('file',
+                        type=str,
+                        help='Export file to import, - reads the standard input')
+
+    parser.add_argument('--format',
+                        type=str,
+                        default=None,
+                        choices=['csv', 'ldif'],
+                        help='Format of the export, it is detected from the file extension by default')
+
+    parser.add_argument('--directory',
+                        type=str,
+                        default=None,
+                        help='Developers directory to write developer modules into, developers directory of this package is used by default')
+
+    parser.add_argument('--database',
+                        type=str,
+                        default=None,
+                        help='Developer database to write developers into instead of the developers directory, it is created if it does not exist, value of MDEVELOPER_DATABASE_PATH is used by default')
+
+    parser.add_argument('--site',
+                        type=str,
+                        default=None,
+                        help='Site of the developers whose rows have no site')
+
+    parser.add_argument('--overwrite',
+                        action='store_true',
+                        help='Replace existing developers instead of skipping them')
+
+    parser.add_argument('--dry-run',
+                        action='store_true',
+                        help='Validate the rows without writing anything')
+
+    _addProfileArguments(parser)
+
+    _args = parser.parse_args()
+
+    if _args.file == '-' and not _args.format:
+        parser.error('--format is required to import the standard input.')
+
+    if _args.database and _args.directory:
+        parser.error('--database and --directory cannot be used together.')
+
+    import os
+    import mCore.displayLib
+    import mDeveloper.enumLib
+    import mDeveloper.importerLib
+    import mDeveloper.developerLib
+
+    databasePath = _args.database if _args.database else (None if _args.directory else os.environ.get(mDeveloper.developerLib.DATABASE_ENVIRONMENT_VARIABLE))
+    _storage     = None
+
+    if databasePath:
+        import mDeveloper.sqliteStorageLib
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.abspath(databasePath), create=True)
+
+    _importer = mDeveloper.importerLib.DeveloperImporter(directory=os.path.abspath(_args.directory) if _args.directory else None,
+                                                         storage=_storage,
+                                                         overwrite=_args.overwrite,
+                                                         defaults={mDeveloper.enumLib.DeveloperModuleAttribute.kSite : _args.site} if _args.site else None)
+
+    _profile, startTime = _startProfile(_args)
+
+    try:
+        if _args.file == '-':
+            count, errors = _importer.importStream(sys.stdin, _args.format, dryRun=_args.dry_run)
+        else:
+            count, errors = _importer.importFile(_args.file, formatName=_args.format, dryRun=_args.dry_run)
+    except (IOError, OSError, ValueError) as error:
+        mCore.displayLib.Display.displayInfo(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+    finally:
+        if _storage is not None:
+            _storage.close()
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for lineNumber, error in errors.items():
+        mCore.displayLib.Display.displayInfo('Row at line {} is skipped: {}'.format(lineNumber, error))
+
+    if errors:
+        mCore.displayLib.Display.displayBlankLine()
+
+    target = _storage.databasePath() if _storage is not None else _importer.directory()
+
+    if _args.dry_run:
+        mCore.displayLib.Display.displayInfo('{} developer(s) are valid to be imported into {}.'.format(count, target))
+    else:
+        mCore.displayLib.Display.displayInfo('{} developer(s) imported into {}.'.format(count, target))
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    _stopProfile(_args, _profile, startTime)
+
+    if errors:
+        sys.exit(1)
@@ -26,25 +26,1589 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import sys
+import time
+import bisect
+import hashlib
 import importlib
+import threading
+import collections
 
 from   getpass import getuser
 from   types   import ModuleType
 
 import mDeveloper.enumLib
+import mDeveloper.cacheLib
+import mDeveloper.readerLib
+import mDeveloper.statsLib
+import mDeveloper.searchLib
+import mDeveloper.storageAbs
 
-import mFileSystem.directoryLib
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Environment variable of the developer database, mDeveloper.sqliteStorageLib.SQLiteStorage is used as process-wide storage if it is set.
+DATABASE_ENVIRONMENT_VARIABLE      = 'MDEVELOPER_DATABASE_PATH'
+
+## [ str ] - Environment variable to share the default developers directory in shared memory, mDeveloper.sharedLib.SharedRegistry is used as process-wide storage if it is set to 1.
+SHARED_MEMORY_ENVIRONMENT_VARIABLE = 'MDEVELOPER_SHARED_MEMORY'
+
+## [ str ] - Environment variable of the developers search path, mDeveloper.layerLib.LayeredRegistry is used as process-wide storage if it is set.
+PATH_ENVIRONMENT_VARIABLE          = 'MDEVELOPER_PATH'
+
+## [ list of str ] - Developer module attributes in the order of the fields of mDeveloper.developerLib.DeveloperRecord.
+RECORD_ATTRIBUTES                  = [mDeveloper.enumLib.DeveloperModuleAttribute.kUserName,
+                                      mDeveloper.enumLib.DeveloperModuleAttribute.kName,
+                                      mDeveloper.enumLib.DeveloperModuleAttribute.kPosition,
+                                      mDeveloper.enumLib.DeveloperModuleAttribute.kEmail,
+                                      mDeveloper.enumLib.DeveloperModuleAttribute.kSite,
+                                      mDeveloper.enumLib.DeveloperModuleAttribute.kURL]
+
+## [ list of str ] - Keys of INFO attribute of the developer modules, developer modules written before site was added may leave site out.
+INFO_KEYS                          = ['userName', 'name', 'position', 'email', 'site', 'url']
+
+## [ str ] - Template of the text representation of a developer, fields are in the order of mDeveloper.developerLib.DeveloperRecord.
+STR_TEMPLATE                       = '\nUser Name: {}\nName     : {}\nPosition : {}\nE-mail   : {}\nSite     : {}\nURL      : {}\n'
+
+#
+## @brief [ CLASS ] - Class to hold validated attributes of a developer.
+#
+#  Records are immutable tuples without a __dict__. Records created by mDeveloper.developerLib.DeveloperTable
+#  share their string values with the columns of the table.
+class DeveloperRecord(collections.namedtuple('DeveloperRecord', ['userName', 'name', 'position', 'email', 'site', 'url'])):
+
+    __slots__ = ()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get value of given developer module attribute.
+    #
+    #  @param attribute [ str | None | in  ] - Developer module attribute, such as USERNAME.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def get(self, attribute):
+
+        return self[RECORD_ATTRIBUTES.index(attribute)]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a record from given developer module attributes.
+    #
+    #  @param attributes [ dict | None | in  ] - Developer module attributes as keys and their values as values.
+    #
+    #  @exception KeyError - If an attribute is missing.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    @staticmethod
+    def fromAttributes(attributes):
+
+        return DeveloperRecord(*[attributes[x] for x in RECORD_ATTRIBUTES])
+
+#
+## @brief [ CLASS ] - Class to store developer records as columns.
+#
+#  Each developer module attribute is stored in its own column, a list of interned strings, and records are
+#  addressed by integer row ids. Records are only materialized on demand, see getRecord method.
+#  Row ids are stable, removed rows are left empty and they are not reused.
+class DeveloperTable(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of str ] - Developer module names, index of a module name is its row id, None for removed rows.
+        self._moduleNames = []
+
+        ## [ dict ] - Developer module attributes as keys and list of values as values.
+        self._columns     = dict((x, []) for x in RECORD_ATTRIBUTES)
+
+        ## [ dict ] - Developer module names as keys and row ids as values.
+        self._rows        = {}
+
+    #
+    ## @brief Number of the rows, removed rows are not counted.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of the rows.
+    def __len__(self):
+
+        return len(self._rows)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def moduleNames(self):
+
+        return self._moduleNames
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add a row.
+    #
+    #  Row of the developer module is overwritten if it already exists.
+    #
+    #  @param moduleName [ str  | None | in  ] - Developer module name, such as sonerLib.
+    #  @param attributes [ dict | None | in  ] - Validated developer module attributes as keys and their values as values.
+    #
+    #  @exception KeyError - If an attribute is missing.
+    #
+    #  @return int - Row id.
+    def addRecord(self, moduleName, attributes):
+
+        rowId = self._rows.get(moduleName)
+
+        if rowId is None:
+            rowId = len(self._moduleNames)
+            self._moduleNames.append(sys.intern(moduleName))
+            self._rows[moduleName] = rowId
+            for attr in RECORD_ATTRIBUTES:
+                self._columns[attr].append(None)
+
+        for attr in RECORD_ATTRIBUTES:
+            value = attributes[attr]
+            self._columns[attr][rowId] = sys.intern(value) if isinstance(value, str) else value
+
+        return rowId
+
+    #
+    ## @brief Remove row of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Row id of the removed row, None if developer module is not in the table.
+    def removeRecord(self, moduleName):
+
+        rowId = self._rows.pop(moduleName, None)
+        if rowId is None:
+            return None
+
+        self._moduleNames[rowId] = None
+        for attr in RECORD_ATTRIBUTES:
+            self._columns[attr][rowId] = None
+
+        return rowId
+
+    #
+    ## @brief Get row id of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Row id, None if developer module is not in the table.
+    def getRow(self, moduleName):
+
+        return self._rows.get(moduleName)
+
+    #
+    ## @brief Get column of given developer module attribute.
+    #
+    #  @param attribute [ str | None | in  ] - Developer module attribute, such as USERNAME.
+    #
+    #  @exception KeyError - If attribute is not a column.
+    #
+    #  @return list - Values, indexes are the row ids.
+    def getColumn(self, attribute):
+
+        return self._columns[attribute]
+
+    #
+    ## @brief Get value of given developer module attribute of given row.
+    #
+    #  @param rowId     [ int | None | in  ] - Row id.
+    #  @param attribute [ str | None | in  ] - Developer module attribute, such as USERNAME.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def getValue(self, rowId, attribute):
+
+        return self._columns[attribute][rowId]
+
+    #
+    ## @brief Get record of given row.
+    #
+    #  @param rowId [ int | None | in  ] - Row id.
+    #
+    #  @exception IndexError - If row doesn't exist.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getRecord(self, rowId):
+
+        return DeveloperRecord(*[self._columns[x][rowId] for x in RECORD_ATTRIBUTES])
+
+    #
+    ## @brief Copy the table, so that the copy can be changed without changing this table.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperTable - Table.
+    def copy(self):
+
+        _table = DeveloperTable()
+
+        _table._moduleNames = list(self._moduleNames)
+        _table._columns     = dict((x, list(y)) for x, y in self._columns.items())
+        _table._rows        = dict(self._rows)
+
+        return _table
+
+#
+## @brief [ CLASS ] - Class to hold the state of a registry at a point in time.
+#
+#  Snapshots are not changed once they are published by mDeveloper.developerLib.DeveloperRegistry, so that
+#  they can be read from any number of threads without locking. Changes are made to a copy of the current
+#  snapshot, which then replaces it. Only the search index is set after publishing, since it is built on demand.
+class RegistrySnapshot(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param files     [ dict | None | in  ] - Files of the developers directory the snapshot is made of.
+    #  @param signature [ str  | None | in  ] - Signature of the registry cache data the snapshot is made of.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, files=None, signature=None):
+
+        ## [ dict ] - Files of the developers directory, which are used to find out whether it has changed.
+        self._files         = files
+
+        ## [ str ] - Signature of the registry cache data.
+        self._signature     = signature
+
+        ## [ list of str ] - Developer module names whose validation results are memoized after the snapshot is made, sorted.
+        self._memoizedNames = []
+
+        ## [ list of str ] - Developer module names.
+        self._moduleNames   = []
+
+        ## [ mDeveloper.developerLib.DeveloperTable ] - Valid records.
+        self._table         = DeveloperTable()
+
+        ## [ dict ] - Developer module names as keys and their row ids in the table as values, None if developer module is not valid.
+        self._rows          = {}
+
+        ## [ dict ] - Developer module names as keys and exceptions raised by validation as values.
+        self._errors        = {}
+
+        ## [ dict ] - User names as keys and developer module names as values.
+        self._userNameIndex = {}
+
+        ## [ dict ] - Lower case e-mail addresses as keys and developer module names as values.
+        self._emailIndex    = {}
+
+        ## [ mDeveloper.searchLib.SearchIndex ] - Search index, which is created on demand.
+        self._searchIndex   = None
+
+        ## [ mDeveloper.fuzzyLib.FuzzyIndex ] - Fuzzy index, which is created on demand.
+        self._fuzzyIndex    = None
+
+        ## [ mDeveloper.facetLib.FacetIndex ] - Facet index, which is created on demand.
+        self._facetIndex    = None
+
+        ## [ mDeveloper.matcherLib.BatchMatcher ] - Batch matcher, which is created on demand.
+        self._batchMatcher  = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def files(self):
+
+        return self._files
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def signature(self):
+
+        return self._signature
+
+    #
+    ## @brief Get version of the snapshot, which the index files built from the snapshot are keyed by.
+    #
+    #  Version is the signature of the registry cache data along with the developer modules memoized since, see
+    #  setMemoized method, so that indexes built before a validation result is memoized are not used afterwards.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Version.
+    def version(self):
+
+        if not self._memoizedNames:
+            return self._signature
+
+        return '{}:{}'.format(self._signature, hashlib.sha1(','.join(self._memoizedNames).encode('utf-8')).hexdigest())
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def moduleNames(self):
+
+        return self._moduleNames
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def table(self):
+
+        return self._table
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def rows(self):
+
+        return self._rows
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def errors(self):
+
+        return self._errors
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def userNameIndex(self):
+
+        return self._userNameIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def emailIndex(self):
+
+        return self._emailIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def searchIndex(self):
+
+        return self._searchIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @param searchIndex [ mDeveloper.searchLib.SearchIndex | None | in  ] - Search index built from the table of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setSearchIndex(self, searchIndex):
+
+        self._searchIndex = searchIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def fuzzyIndex(self):
+
+        return self._fuzzyIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @param fuzzyIndex [ mDeveloper.fuzzyLib.FuzzyIndex | None | in  ] - Fuzzy index built from the records of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setFuzzyIndex(self, fuzzyIndex):
+
+        self._fuzzyIndex = fuzzyIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def facetIndex(self):
+
+        return self._facetIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @param facetIndex [ mDeveloper.facetLib.FacetIndex | None | in  ] - Facet index built from the records of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setFacetIndex(self, facetIndex):
+
+        self._facetIndex = facetIndex
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def batchMatcher(self):
+
+        return self._batchMatcher
+
+    #
+    ## @brief Property.
+    #
+    #  @param batchMatcher [ mDeveloper.matcherLib.BatchMatcher | None | in  ] - Batch matcher built from the records of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setBatchMatcher(self, batchMatcher):
+
+        self._batchMatcher = batchMatcher
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Copy the snapshot, so that changes can be made to the copy before it is published.
+    #
+    #  Fuzzy and facet indexes and the batch matcher are not copied, since they can't be updated, they are built for the copy on demand.
+    #
+    #  @param files     [ dict | None | in  ] - Files of the copy, files of this snapshot are used if None given.
+    #  @param signature [ str  | None | in  ] - Signature of the copy, signature of this snapshot is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.RegistrySnapshot - Snapshot.
+    def copy(self, files=None, signature=None):
+
+        _snapshot = RegistrySnapshot(files=self._files if files is None else files,
+                                     signature=self._signature if signature is None else signature)
+
+        _snapshot._moduleNames   = list(self._moduleNames)
+        _snapshot._table         = self._table.copy()
+        _snapshot._rows          = dict(self._rows)
+        _snapshot._errors        = dict(self._errors)
+        _snapshot._userNameIndex = dict(self._userNameIndex)
+        _snapshot._emailIndex    = dict(self._emailIndex)
+        _snapshot._searchIndex   = self._searchIndex.copy() if self._searchIndex is not None else None
+        _snapshot._memoizedNames = list(self._memoizedNames)
+
+        return _snapshot
+
+    #
+    ## @brief Record that validation result of given developer module is memoized into the snapshot, see version method.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setMemoized(self, moduleName):
+
+        index = bisect.bisect_left(self._memoizedNames, moduleName)
+
+        if index == len(self._memoizedNames) or self._memoizedNames[index] != moduleName:
+            self._memoizedNames.insert(index, moduleName)
+
+    #
+    ## @brief Add given developer module, which is not valid unless a record is added for it.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addModule(self, moduleName):
+
+        if moduleName not in self._rows:
+            bisect.insort(self._moduleNames, moduleName)
+            self._rows[moduleName] = None
+
+    #
+    ## @brief Remove given developer module along with its record and error.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def removeModule(self, moduleName):
+
+        self.removeRecord(moduleName)
+        self._errors.pop(moduleName, None)
+
+        if self._rows.pop(moduleName, False) is not False:
+            del self._moduleNames[bisect.bisect_left(self._moduleNames, moduleName)]
+
+    #
+    ## @brief Add given validated record into the table and the indexes.
+    #
+    #  @param moduleName [ str  | None | in  ] - Developer module name, such as sonerLib.
+    #  @param attributes [ dict | None | in  ] - Validated developer module attributes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addRecord(self, moduleName, attributes):
+
+        rowId = self._table.addRecord(moduleName, attributes)
+
+        self._rows[moduleName] = rowId
+
+        # Developer module with the smallest name wins when more than one has the same user name or e-mail address
+        userName = self._table.getValue(rowId, mDeveloper.enumLib.DeveloperModuleAttribute.kUserName)
+        if isinstance(userName, str) and (userName not in self._userNameIndex or moduleName < self._userNameIndex[userName]):
+            self._userNameIndex[userName] = moduleName
+
+        email = self._table.getValue(rowId, mDeveloper.enumLib.DeveloperModuleAttribute.kEmail)
+        if isinstance(email, str) and (email.lower() not in self._emailIndex or moduleName < self._emailIndex[email.lower()]):
+            self._emailIndex[email.lower()] = moduleName
+
+        if self._searchIndex is not None:
+            self._searchIndex.updateRecord(rowId, moduleName, self._table.getRecord(rowId))
+
+    #
+    ## @brief Remove record of given developer module from the table and the indexes.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def removeRecord(self, moduleName):
+
+        rowId = self._table.getRow(moduleName)
+        if rowId is None:
+            return
+
+        record = self._table.getRecord(rowId)
+
+        self._table.removeRecord(moduleName)
+
+        if self._searchIndex is not None:
+            self._searchIndex.updateRecord(rowId, None, None)
+
+        for index, attribute, key in [(self._userNameIndex, mDeveloper.enumLib.DeveloperModuleAttribute.kUserName, record.userName),
+                                      (self._emailIndex,    mDeveloper.enumLib.DeveloperModuleAttribute.kEmail,    record.email)]:
+
+            if not isinstance(key, str):
+                continue
+
+            if index is self._emailIndex:
+                key = key.lower()
+
+            if index.get(key) != moduleName:
+                continue
+
+            del index[key]
+
+            # Another developer module may have the same value
+            moduleNames = self._table.moduleNames()
+            for otherRowId, value in enumerate(self._table.getColumn(attribute)):
+
+                if not isinstance(value, str) or (value.lower() if index is self._emailIndex else value) != key:
+                    continue
+
+                if key not in index or moduleNames[otherRowId] < index[key]:
+                    index[key] = moduleNames[otherRowId]
+
+    #
+    ## @brief Set validation error of given developer module.
+    #
+    #  @param moduleName [ str       | None | in  ] - Developer module name, such as sonerLib.
+    #  @param error      [ Exception | None | in  ] - Exception raised by validation.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setError(self, moduleName, error):
+
+        self._errors[moduleName] = error
+
+#
+## @brief [ CLASS ] - Class to keep developer module names and records of a developers directory in memory.
+#
+#  Records are loaded from mDeveloper.cacheLib.RegistryCache, validated once and stored in a
+#  mDeveloper.developerLib.DeveloperTable.
+#  Developer module names which aren't found are kept in a bounded LRU cache, so that repeated lookups
+#  for them don't check the developers directory again until the registry is refreshed.
+#
+#  Registry is safe to use from many threads. State of the registry is kept in an immutable
+#  mDeveloper.developerLib.RegistrySnapshot, which readers take without locking. Refreshes and updates
+#  build a new snapshot and replace the current one with a single assignment, only one of them is in flight
+#  at a time. Once the registry expires, the thread which gets to refresh it refreshes it while the others
+#  keep reading the current snapshot.
+#
+#  Registry is the default mDeveloper.storageAbs.Storage, process-wide storage can be obtained from getInstance method.
+class DeveloperRegistry(mDeveloper.storageAbs.Storage):
+
+    ## [ mDeveloper.developerLib.DeveloperRegistry ] - Process-wide instance.
+    _instance     = None
+
+    ## [ threading.Lock ] - Lock to create the process-wide instance once.
+    _instanceLock = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory         [ str   | None | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory    [ str   | None | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param ttl               [ float | None | in  ] - Time to live in seconds, registry is refreshed on access once it expires. Never expires if None given.
+    #  @param negativeCacheSize [ int   | 1024 | in  ] - Maximum number of developer module names which aren't found to remember.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory=None, cacheDirectory=None, ttl=None, negativeCacheSize=1024):
+
+        ## [ mDeveloper.cacheLib.RegistryCache ] - Registry cache.
+        self._registryCache     = mDeveloper.cacheLib.RegistryCache(directory if directory else Developer.getDevelopersDirectory(),
+                                                                    cacheDirectory=cacheDirectory)
+
+        ## [ float ] - Time to live in seconds.
+        self._ttl               = ttl
+
+        ## [ int ] - Maximum size of the negative cache.
+        self._negativeCacheSize = negativeCacheSize
+
+        ## [ float ] - Time of the last load.
+        self._loadTime          = None
+
+        ## [ mDeveloper.developerLib.RegistrySnapshot ] - Current snapshot.
+        self._snapshot          = RegistrySnapshot()
+
+        ## [ threading.Lock ] - Lock of the changes, only one snapshot is built at a time.
+        self._writeLock         = threading.Lock()
+
+        ## [ collections.OrderedDict ] - Developer module names which aren't found.
+        self._negativeCache     = collections.OrderedDict()
+
+        ## [ threading.Lock ] - Lock of the negative cache.
+        self._negativeCacheLock = threading.Lock()
+
+    #
+    ## @brief Refresh the registry from the registry cache, write lock must be acquired.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the developers directory has changed.
+    def _refresh(self, workers=None, processes=False):
+
+        data = self._registryCache.load(workers=workers, processes=processes, validate=DeveloperRegistry.isValidRecord)
+
+        if data['files'] == self._snapshot.files():
+            self._loadTime = time.monotonic()
+            return False
+
+        _snapshot = RegistrySnapshot(files=data['files'], signature=mDeveloper.cacheLib.RegistryCache.getSignature(data))
+
+        # Records which have passed the validation when they were cached aren't validated again
+        valid = set(data['valid'])
+
+        with mDeveloper.statsLib.Stats.getInstance().span('validate'):
+
+            for moduleName in sorted(data['records'].keys()):
+
+                _snapshot.addModule(moduleName)
+
+                # Developer module couldn't be read, it is executed on demand to get the actual error, see getValidatedRecord
+                record = data['records'][moduleName]
+                if record is None:
+                    continue
+
+                if moduleName not in valid:
+                    try:
+                        Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+                    except Exception as error:
+                        _snapshot.setError(moduleName, error)
+                        continue
+
+                _snapshot.addRecord(moduleName, record)
+
+        self._publish(_snapshot)
+
+        return True
+
+    #
+    ## @brief Replace the current snapshot with given one, write lock must be acquired.
+    #
+    #  @param snapshot    [ mDeveloper.developerLib.RegistrySnapshot | None | in  ] - Snapshot.
+    #  @param moduleNames [ list of str                              | None | in  ] - Developer module names to remove from the negative cache, all of them are removed if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _publish(self, snapshot, moduleNames=None):
+
+        # Load time is set after the snapshot, so that the readers which see the registry loaded see the snapshot too
+        self._snapshot = snapshot
+        self._loadTime = time.monotonic()
+
+        with self._negativeCacheLock:
+            if moduleNames is None:
+                self._negativeCache.clear()
+            else:
+                for moduleName in moduleNames:
+                    self._negativeCache.pop(moduleName, None)
+
+    #
+    ## @brief Memoize validation result of given developer module into a new snapshot.
+    #
+    #  Result is dropped if the snapshot it is obtained from has been replaced meanwhile.
+    #
+    #  @param snapshot   [ mDeveloper.developerLib.RegistrySnapshot | None | in  ] - Snapshot the developer module is validated for.
+    #  @param moduleName [ str                                      | None | in  ] - Developer module name, such as sonerLib.
+    #  @param record     [ dict                                     | None | in  ] - Validated developer module attributes, None if developer module is not valid.
+    #  @param error      [ Exception                                | None | in  ] - Exception raised by validation, None if developer module is valid.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _memoize(self, snapshot, moduleName, record=None, error=None):
+
+        with self._writeLock:
+
+            if self._snapshot is not snapshot:
+                return
+
+            _snapshot = snapshot.copy()
+
+            if error is None:
+                _snapshot.addRecord(moduleName, record)
+            else:
+                _snapshot.setError(moduleName, error)
+
+            _snapshot.setMemoized(moduleName)
+
+            self._snapshot = _snapshot
+
+    #
+    ## @brief Get the current snapshot, refresh the registry first if it hasn't been loaded yet or it has expired.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.RegistrySnapshot - Snapshot.
+    def _ensureLoaded(self):
+
+        if self._loadTime is None:
+
+            with self._writeLock:
+                if self._loadTime is None:
+                    self._refresh()
+
+        elif self._ttl is not None and time.monotonic() - self._loadTime >= self._ttl:
+
+            # Only one thread refreshes the expired registry, the others keep reading the current snapshot
+            if self._writeLock.acquire(False):
+                try:
+                    if time.monotonic() - self._loadTime >= self._ttl:
+                        self._refresh()
+                finally:
+                    self._writeLock.release()
+
+        return self._snapshot
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def directory(self):
+
+        return self._registryCache.directory()
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def ttl(self):
+
+        return self._ttl
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Refresh the registry from the registry cache.
+    #
+    #  Indexes, validated records and the negative cache are only rebuilt if the developers directory has changed.
+    #  Refresh waits for the refresh or the update in flight, if there is any.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the developers directory has changed.
+    def refresh(self, workers=None, processes=False):
+
+        with self._writeLock:
+            return self._refresh(workers=workers, processes=processes)
+
+    #
+    ## @brief Refresh the registry in a background thread, readers keep reading the current snapshot meanwhile.
+    #
+    #  @exception N/A
+    #
+    #  @return threading.Thread - Thread, None if a refresh or an update is already in flight.
+    def refreshInBackground(self):
+
+        if not self._writeLock.acquire(False):
+            return None
+
+        def _refresh():
+
+            try:
+                self._refresh()
+            finally:
+                self._writeLock.release()
+
+        thread = threading.Thread(target=_refresh, name='mDeveloper.refresh')
+        thread.daemon = True
+
+        try:
+            thread.start()
+        except Exception:
+            self._writeLock.release()
+            raise
+
+        return thread
+
+    #
+    ## @brief Apply changes of the developers directory since the last load incrementally.
+    #
+    #  Developers directory is scanned and only the developer modules which have been added, modified or
+    #  removed are read, validated and applied to a copy of the current snapshot, which then replaces it.
+    #  Registry is refreshed if it hasn't been loaded yet, in which case no changes are reported.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names which have been added.
+    #  @return list of str - Developer module names which have been modified.
+    #  @return list of str - Developer module names which have been removed.
+    def update(self):
+
+        with self._writeLock:
+
+            if self._loadTime is None:
+                self._refresh()
+                return [], [], []
+
+            directory = self.directory()
+            _stats    = mDeveloper.statsLib.Stats.getInstance()
+
+            with _stats.span('scan'):
+                directoryMTime, files = mDeveloper.cacheLib.RegistryCache.scanDirectory(directory)
+
+            previousFiles = self._snapshot.files() or {}
+
+            if files == previousFiles:
+                self._loadTime = time.monotonic()
+                return [], [], []
+
+            added    = []
+            modified = []
+            removed  = []
+
+            for fileName in sorted(set(previousFiles) | set(files)):
+
+                moduleName = os.path.splitext(fileName)[0]
+
+                if fileName not in files:
+                    removed.append(moduleName)
+                elif fileName not in previousFiles:
+                    added.append(moduleName)
+                elif files[fileName] != previousFiles[fileName]:
+                    modified.append(moduleName)
+
+            changed = added + modified
+
+            with _stats.span('import'):
+                records = mDeveloper.cacheLib.RegistryCache.extractRecords([os.path.join(directory, '{}.py'.format(x)) for x in changed])
+
+            _snapshot = self._snapshot.copy(files=files,
+                                            signature=mDeveloper.cacheLib.RegistryCache.getSignature({'directory' : directory,
+                                                                                                      'mtime'     : directoryMTime,
+                                                                                                      'files'     : files}))
+
+            with _stats.span('validate'):
+
+                for moduleName in removed:
+                    _snapshot.removeModule(moduleName)
+
+                for moduleName, record in zip(changed, records):
+
+                    _snapshot.removeModule(moduleName)
+                    _snapshot.addModule(moduleName)
+
+                    # Developer module couldn't be read, it is executed on demand to get the actual error, see getValidatedRecord
+                    if record is None:
+                        continue
+
+                    try:
+                        Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+                    except Exception as error:
+                        _snapshot.setError(moduleName, error)
+                        continue
+
+                    _snapshot.addRecord(moduleName, record)
+
+            self._publish(_snapshot, moduleNames=changed)
+
+        return added, modified, removed
+
+    #
+    ## @brief Get the current snapshot, so that more than one read can be made against the same state without locking.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.RegistrySnapshot - Snapshot.
+    def getSnapshot(self):
+
+        return self._ensureLoaded()
+
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names.
+    def listModules(self):
+
+        return list(self._ensureLoaded().moduleNames())
+
+    #
+    ## @brief Check whether developer module with given name exists.
+    #
+    #  Developers directory is checked for changes if the developer module isn't found and
+    #  the name isn't in the negative cache already.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasModule(self, moduleName):
+
+        if moduleName in self._ensureLoaded().rows():
+            return True
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+
+        with self._negativeCacheLock:
+            if moduleName in self._negativeCache:
+                self._negativeCache.move_to_end(moduleName)
+                _stats.increment('negativeCache.hit')
+                return False
+
+        _stats.increment('negativeCache.miss')
+
+        self.refresh()
+
+        if moduleName in self._snapshot.rows():
+            return True
+
+        with self._negativeCacheLock:
+            self._negativeCache[moduleName] = None
+            if len(self._negativeCache) > self._negativeCacheSize:
+                self._negativeCache.popitem(last=False)
+
+        return False
+
+    #
+    ## @brief Get record of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if developer module doesn't exist or it is not valid.
+    def getRecord(self, moduleName):
+
+        _snapshot = self._ensureLoaded()
+
+        rowId = _snapshot.rows().get(moduleName)
+
+        return None if rowId is None else _snapshot.table().getRecord(rowId)
+
+    #
+    ## @brief Get validated record of given developer module.
+    #
+    #  Developer module is executed if its record couldn't be read from the registry cache,
+    #  so that actual error is raised. Records are validated once and the result is memoized.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception ImportError    - If developer module doesn't exist.
+    #  @exception Exception      - Any exception raised by the developer module if it couldn't be read statically.
+    #  @exception NameError      - If developer module doesn't have all the attributes.
+    #  @exception ValueError     - If an attribute ID empty and this attribute is not person website URL.
+    #  @exception AttributeError - If INFO dictionary doesn't match with attributes in developer module.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getValidatedRecord(self, moduleName):
+
+        _snapshot = self._ensureLoaded()
+
+        rowId = _snapshot.rows().get(moduleName)
+        if rowId is not None:
+            return _snapshot.table().getRecord(rowId)
+
+        if moduleName in _snapshot.errors():
+            raise _snapshot.errors()[moduleName]
+
+        try:
+            with mDeveloper.statsLib.Stats.getInstance().span('import'):
+                developerModule = mDeveloper.cacheLib.RegistryCache.importModule(os.path.join(self.directory(), '{}.py'.format(moduleName)))
+                record          = mDeveloper.cacheLib.RegistryCache.getModuleRecord(developerModule)
+
+            Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+
+        except Exception as error:
+            if moduleName in _snapshot.rows():
+                self._memoize(_snapshot, moduleName, error=error)
+            raise
+
+        self._memoize(_snapshot, moduleName, record=record)
+
+        return DeveloperRecord.fromAttributes(record)
+
+    #
+    ## @brief Load and validate all developer modules.
+    #
+    #  Validation errors are collected instead of raised, so that one invalid developer module doesn't prevent
+    #  the others from being loaded.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Developer module names as keys and mDeveloper.developerLib.DeveloperRecord instances as values, sorted by module name.
+    #  @return collections.OrderedDict - Developer module names as keys and exceptions raised by validation as values, sorted by module name.
+    def loadRecords(self, workers=None, processes=False):
+
+        if self._loadTime is None or workers:
+            self.refresh(workers=workers, processes=processes)
+
+        records = collections.OrderedDict()
+        errors  = collections.OrderedDict()
+
+        for moduleName in self._ensureLoaded().moduleNames():
+
+            try:
+                records[moduleName] = self.getValidatedRecord(moduleName)
+            except Exception as error:
+                errors[moduleName] = error
+
+        return records, errors
+
+    #
+    ## @brief Iterate over the validated records of the developer modules lazily.
+    #
+    #  Records are yielded from memory if the registry has already been loaded. Otherwise developer modules
+    #  are read one by one from the developers directory as the generator is consumed, without loading the
+    #  registry, so that time to the first record and memory usage don't depend on the number of developers.
+    #  Invalid developer modules are skipped.
+    #
+    #  @param errors [ dict | None | out ] - Developer module names as keys and validation exceptions as values are stored in given dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs, sorted by developer module name.
+    def iterRecords(self, errors=None):
+
+        if self.isLoaded():
+
+            for moduleName in self._ensureLoaded().moduleNames():
+
+                try:
+                    record = self.getValidatedRecord(moduleName)
+                except Exception as error:
+                    if errors is not None:
+                        errors[moduleName] = error
+                    continue
+
+                yield moduleName, record
+
+            return
+
+        directory = self.directory()
+        _stats    = mDeveloper.statsLib.Stats.getInstance()
+
+        try:
+            with _stats.span('scan'):
+                fileNameList = sorted(x for x in os.listdir(directory) if mDeveloper.cacheLib.RegistryCache.isDeveloperModuleFileName(x))
+        except OSError:
+            return
+
+        for fileName in fileNameList:
+
+            moduleName = os.path.splitext(fileName)[0]
+            filePath   = os.path.join(directory, fileName)
+
+            if not os.path.isfile(filePath):
+                continue
+
+            try:
+                with _stats.span('import'):
+                    record = mDeveloper.readerLib.DeveloperModuleReader.readFile(filePath)
+                    if record is None:
+                        record = mDeveloper.cacheLib.RegistryCache.getModuleRecord(mDeveloper.cacheLib.RegistryCache.importModule(filePath))
+
+                with _stats.span('validate'):
+                    Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+
+            except Exception as error:
+                if errors is not None:
+                    errors[moduleName] = error
+                continue
+
+            yield moduleName, DeveloperRecord.fromAttributes(record)
+
+    #
+    ## @brief Get developer module name of given user name.
+    #
+    #  @param userName [ str | None | in  ] - Value of USERNAME attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given user name.
+    def getModuleByUserName(self, userName):
+
+        return self._ensureLoaded().userNameIndex().get(userName)
+
+    #
+    ## @brief Get developer module name of given e-mail address.
+    #
+    #  @param email [ str | None | in  ] - Value of EMAIL attribute of the developer, case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given e-mail address.
+    def getModuleByEmail(self, email):
+
+        return self._ensureLoaded().emailIndex().get(email.lower())
+
+    #
+    ## @brief Resolve given users to developer module names against the current state of the registry.
+    #
+    #  Registry is loaded once and it isn't refreshed for the users which can't be resolved, so resolving many
+    #  users costs one pass over them. A user is resolved as follows:
+    #
+    #  - Module, by its name.
+    #  - E-mail address, any string which contains @, by EMAIL attribute, case insensitive.
+    #  - Developer module name, such as sonerLib.
+    #  - User name, by the developer module named after it, such as soner for sonerLib, then by USERNAME attribute.
+    #
+    #  @param users [ iterable of str, module | None | in  ] - User names, e-mail addresses, developer module names or developer modules.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Given users as keys in the given order and developer module names as values, None for the ones which can't be resolved.
+    def resolveMany(self, users):
+
+        _snapshot = self._ensureLoaded()
+
+        rows          = _snapshot.rows()
+        userNameIndex = _snapshot.userNameIndex()
+        emailIndex    = _snapshot.emailIndex()
+        suffix        = mMecoPackage.enumLib.PackagePythonFileSuffix.kLib
+
+        result = collections.OrderedDict()
+
+        for user in users:
+
+            if user in result:
+                continue
+
+            moduleName = None
+
+            if isinstance(user, ModuleType):
+                moduleName = user.__name__.split('.')[-1]
+
+            elif not isinstance(user, str) or not user:
+                pass
+
+            elif '@' in user:
+                moduleName = emailIndex.get(user.lower())
+
+            elif user in rows:
+                moduleName = user
+
+            elif '{}{}'.format(user, suffix) in rows:
+                moduleName = '{}{}'.format(user, suffix)
+
+            else:
+                moduleName = userNameIndex.get(user)
+
+            result[user] = moduleName if moduleName in rows else None
+
+        return result
+
+    #
+    ## @brief Get table of the valid records.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperTable - Table.
+    def getTable(self):
+
+        return self._ensureLoaded().table()
+
+    #
+    ## @brief Check whether the registry has been loaded.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isLoaded(self):
+
+        return self._loadTime is not None
+
+    #
+    ## @brief Get search index of the registry.
+    #
+    #  Index is loaded from the index file stored next to the registry cache file if it is up to date,
+    #  otherwise it is built and saved.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.searchLib.SearchIndex - Search index.
+    def getSearchIndex(self):
+
+        _snapshot = self._ensureLoaded()
+
+        searchIndex = _snapshot.searchIndex()
+
+        if searchIndex is None:
+
+            _stats    = mDeveloper.statsLib.Stats.getInstance()
+            indexFile = self._registryCache.getCacheFileOf(mDeveloper.searchLib.INDEX_FILE)
+
+            with _stats.span('index'):
+
+                searchIndex = mDeveloper.searchLib.SearchIndex.load(indexFile, _snapshot.version())
+                if searchIndex is None:
+                    _stats.increment('index.miss')
+                    searchIndex = mDeveloper.searchLib.SearchIndex(_snapshot.table())
+                    searchIndex.save(indexFile, _snapshot.version())
+                else:
+                    _stats.increment('index.hit')
+
+            _snapshot.setSearchIndex(searchIndex)
+
+        return searchIndex
+
+    #
+    ## @brief Search developer records by using the search index, see mDeveloper.searchLib.SearchIndex.search.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        return self.getSearchIndex().search(keyword, fields=fields, limit=limit)
+
+    #
+    ## @brief Get fuzzy index of the registry, which is built once for each snapshot.
+    #
+    #  Index is loaded from the index file stored next to the registry cache file if it is up to date,
+    #  otherwise it is built and saved.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Fuzzy index.
+    def getFuzzyIndex(self):
 
-import mMecoPackage.enumLib
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.fuzzyLib
 
+        _snapshot = self._ensureLoaded()
+
+        fuzzyIndex = _snapshot.fuzzyIndex()
+
+        if fuzzyIndex is None:
+
+            _stats    = mDeveloper.statsLib.Stats.getInstance()
+            indexFile = self._registryCache.getCacheFileOf(mDeveloper.fuzzyLib.INDEX_FILE)
+
+            with _stats.span('fuzzyIndex'):
+
+                fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex.load(indexFile, _snapshot.version())
+                if fuzzyIndex is None:
+                    _stats.increment('fuzzyIndex.miss')
+                    table      = _snapshot.table()
+                    fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex((x, table.getRecord(y)) for x, y in _snapshot.rows().items() if y is not None)
+                    fuzzyIndex.save(indexFile, _snapshot.version())
+                else:
+                    _stats.increment('fuzzyIndex.hit')
+
+            _snapshot.setFuzzyIndex(fuzzyIndex)
+
+        return fuzzyIndex
+
+    #
+    ## @brief Get facet index of the registry, which is built once for each snapshot.
+    #
+    #  Index is loaded from the index file stored next to the registry cache file if it is up to date,
+    #  otherwise it is built and saved.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.facetLib.FacetIndex - Facet index.
+    def getFacetIndex(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.facetLib
+
+        _snapshot = self._ensureLoaded()
+
+        facetIndex = _snapshot.facetIndex()
+
+        if facetIndex is None:
+
+            _stats    = mDeveloper.statsLib.Stats.getInstance()
+            indexFile = self._registryCache.getCacheFileOf(mDeveloper.facetLib.INDEX_FILE)
+
+            with _stats.span('facetIndex'):
+
+                facetIndex = mDeveloper.facetLib.FacetIndex.load(indexFile, _snapshot.version())
+                if facetIndex is None:
+                    _stats.increment('facetIndex.miss')
+                    table      = _snapshot.table()
+                    facetIndex = mDeveloper.facetLib.FacetIndex((x, table.getRecord(y)) for x, y in sorted(_snapshot.rows().items()) if y is not None)
+                    facetIndex.save(indexFile, _snapshot.version())
+                else:
+                    _stats.increment('facetIndex.hit')
+
+            _snapshot.setFacetIndex(facetIndex)
+
+        return facetIndex
+
+    #
+    ## @brief Get batch matcher of the registry, which is built once for each snapshot.
+    #
+    #  Matcher is not saved, since it is built from the columns of the table with a few vectorized sorts.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #
+    #  @return mDeveloper.matcherLib.BatchMatcher - Batch matcher.
+    def getBatchMatcher(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.matcherLib
+
+        _snapshot = self._ensureLoaded()
+
+        batchMatcher = _snapshot.batchMatcher()
+
+        if batchMatcher is None:
+
+            table = _snapshot.table()
+
+            with mDeveloper.statsLib.Stats.getInstance().span('batchMatcher'):
+                batchMatcher = mDeveloper.matcherLib.BatchMatcher((x, table.getRecord(y)) for x, y in sorted(_snapshot.rows().items()) if y is not None)
+
+            _snapshot.setBatchMatcher(batchMatcher)
+
+        return batchMatcher
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get process-wide storage.
+    #
+    #  Developer database given by DATABASE_ENVIRONMENT_VARIABLE is used if it is set. Otherwise developers
+    #  directories given by PATH_ENVIRONMENT_VARIABLE are layered if it is set, see mDeveloper.layerLib.LayeredRegistry.
+    #  Otherwise snapshot of the default developers directory in shared memory is used if SHARED_MEMORY_ENVIRONMENT_VARIABLE is set to 1,
+    #  see mDeveloper.sharedLib.SharedRegistry. Otherwise pack file of the default developers directory is used
+    #  if it is up to date, see mDeveloper.packLib.PackedRegistry, and a registry of the default developers
+    #  directory is created if it isn't.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.storageAbs.Storage - Storage.
+    @staticmethod
+    def getInstance():
+
+        # Lookups don't lock once the instance is created
+        if DeveloperRegistry._instance is None:
+
+            with DeveloperRegistry._instanceLock:
+
+                if DeveloperRegistry._instance is None:
+
+                    databasePath = os.environ.get(DATABASE_ENVIRONMENT_VARIABLE)
+
+                    # Imported on demand to keep start-up time of the commands low
+                    if databasePath:
+                        import mDeveloper.sqliteStorageLib
+                        DeveloperRegistry._instance = mDeveloper.sqliteStorageLib.SQLiteStorage(databasePath)
+                    elif os.environ.get(PATH_ENVIRONMENT_VARIABLE, '').strip(os.pathsep + ' '):
+                        import mDeveloper.layerLib
+                        DeveloperRegistry._instance = mDeveloper.layerLib.LayeredRegistry(mDeveloper.layerLib.LayeredRegistry.getSearchPath())
+                    elif os.environ.get(SHARED_MEMORY_ENVIRONMENT_VARIABLE, '0') not in ('', '0'):
+                        import mDeveloper.packLib
+                        import mDeveloper.sharedLib
+                        DeveloperRegistry._instance = mDeveloper.sharedLib.SharedRegistry.attach() or \
+                                                      mDeveloper.packLib.PackedRegistry.load() or \
+                                                      DeveloperRegistry()
+                    else:
+                        import mDeveloper.packLib
+                        DeveloperRegistry._instance = mDeveloper.packLib.PackedRegistry.load() or DeveloperRegistry()
+
+        return DeveloperRegistry._instance
+
+    #
+    ## @brief Check whether given record of a developer module is valid, see Developer.validateDeveloperAttributes.
+    #
+    #  @param moduleName [ str  | None | in  ] - Developer module name, such as sonerLib.
+    #  @param record     [ dict | None | in  ] - Developer module attributes.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def isValidRecord(moduleName, record):
+
+        try:
+            Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+        except Exception:
+            return False
+
+        return True
+
+    #
+    ## @brief Set process-wide storage.
+    #
+    #  @param registry [ mDeveloper.storageAbs.Storage | None | in  ] - Storage, such as a registry, a new default storage is created on access if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def setInstance(registry):
+
+        DeveloperRegistry._instance = registry
 
-#
-# ----------------------------------------------------------------------------------------------------
-# CODE
-# ----------------------------------------------------------------------------------------------------
 #
 ## @brief [ CLASS ] - Class to operate on developers.
+#
+#  Developer is a view over a mDeveloper.developerLib.DeveloperRecord.
 class Developer(object):
+
+    __slots__ = ('_record',)
+
     #
     # ------------------------------------------------------------------------------------------------
     # PRIVATE METHODS
@@ -56,30 +1620,20 @@ class Developer(object):
     #
     #  Developer module can be obtained from mDeveloper.developerLib.Developer.getDeveloperModule method.
     #
-    #  @param developer [ str, module | getpass.getuser | in  ] - User name or the module of the developer.
+    #  Current user is resolved when the instance is created, not when this module is imported.
+    #
+    #  @param developer [ str, module, DeveloperRecord, dict | None | in  ] - User name, the module or the record of the developer, current user is used if None given.
     #
     #  @exception N/A
     #
     #  @return None - None.
-    def __init__(self, developer=getuser()):
-
-        ## [ str ] - User name.
-        self._userName = None
-
-        ## [ str ] - Name.
-        self._name     = None
-
-        ## [ str ] - Position.
-        self._position = None
+    def __init__(self, developer=None):
 
-        ## [ str ] - E-mail address.
-        self._email    = None
+        ## [ mDeveloper.developerLib.DeveloperRecord ] - Record.
+        self._record = DeveloperRecord(None, None, None, None, None, None)
 
-        ## [ str ] - Site.
-        self._site     = None
-
-        ## [ str ] - URL.
-        self._url      = None
+        if developer is None:
+            developer = getuser()
 
         if developer:
             self.setDeveloper(developer)
@@ -92,16 +1646,7 @@ class Developer(object):
     #  @return str - String representation.
     def __str__(self):
 
-        info = '\n'
-
-        info = '{}User Name: {}\n'.format(info, self._userName)
-        info = '{}Name     : {}\n'.format(info, self._name)
-        info = '{}Position : {}\n'.format(info, self._position)
-        info = '{}E-mail   : {}\n'.format(info, self._email)
-        info = '{}Site     : {}\n'.format(info, self._site)
-        info = '{}URL      : {}\n'.format(info, self._url)
-
-        return info
+        return STR_TEMPLATE.format(*self._record)
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -110,6 +1655,16 @@ class Developer(object):
     ## @name PROPERTIES
 
     ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def record(self):
+
+        return self._record
+
     #
     ## @brief Property.
     #
@@ -118,7 +1673,7 @@ class Developer(object):
     #  @return variant - Value.
     def userName(self):
 
-        return self._userName
+        return self._record.userName
 
     #
     ## @brief Property.
@@ -128,7 +1683,7 @@ class Developer(object):
     #  @return variant - Value.
     def name(self):
 
-        return self._name
+        return self._record.name
 
     #
     ## @brief Property.
@@ -138,7 +1693,7 @@ class Developer(object):
     #  @return variant - Value.
     def position(self):
 
-        return self._position
+        return self._record.position
 
     #
     ## @brief Property.
@@ -148,7 +1703,7 @@ class Developer(object):
     #  @return variant - Value.
     def email(self):
 
-        return self._email
+        return self._record.email
 
     #
     ## @brief Property.
@@ -158,7 +1713,7 @@ class Developer(object):
     #  @return variant - Value.
     def site(self):
 
-        return self._site
+        return self._record.site
 
     #
     ## @brief Property.
@@ -168,7 +1723,7 @@ class Developer(object):
     #  @return variant - Value.
     def url(self):
 
-        return self._url
+        return self._record.url
 
     #
     ## @}
@@ -181,10 +1736,11 @@ class Developer(object):
     ## @brief Set developer.
     #
     #  Developer module instance can be provided for `developer` argument as well as user name of the developer as a string.
+    #  Record of the developer, mDeveloper.developerLib.DeveloperRecord, or its developer module attributes as a dict can be provided too.
     #
-    #  @param developer [ str, module | None | in  ] - Developer user name or the module of the developer.
+    #  @param developer [ str, module, DeveloperRecord, dict | None | in  ] - Developer user name, the module or the record of the developer.
     #
-    #  @exception ValueError     - If given developer doesn't exist.
+    #  @exception ValueError     - If given developer doesn't exist, message suggests the developers with a similar user name or name.
     #  @exception NameError      - If developer module doesn't have all the attributes.
     #  @exception ValueError     - If an attribute ID empty and this attribute is not person website URL.
     #  @exception AttributeError - If INFO dictionary doesn't match with attributes in developer module.
@@ -192,39 +1748,32 @@ class Developer(object):
     #  @return bool - Result.
     def setDeveloper(self, developer):
 
-        _developerModule = None
+        if isinstance(developer, DeveloperRecord):
+            self._record = developer
+
+        elif isinstance(developer, ModuleType):
+            attributes = mDeveloper.cacheLib.RegistryCache.getModuleRecord(developer)
+            Developer.validateDeveloperAttributes(attributes, getattr(developer, '__name__'))
+            self._record = DeveloperRecord.fromAttributes(attributes)
 
-        if isinstance(developer, ModuleType):
-            _developerModule = developer
+        elif isinstance(developer, dict):
+            Developer.validateDeveloperAttributes(developer, developer.get(mDeveloper.enumLib.DeveloperModuleAttribute.kUserName))
+            self._record = DeveloperRecord.fromAttributes(developer)
 
         else:
 
             developerLibName = Developer.isDeveloper(developer)
             if not developerLibName:
-                raise ValueError('{} is not a valid developer.'.format(developer))
-
-            _developerModule = Developer.getDeveloperModule(developerLibName)
-
-
-        for attr in mDeveloper.enumLib.DeveloperModuleAttribute.listAttributes():
 
-            if not hasattr(_developerModule, attr):
-                raise NameError("Attribute {0} doesn't exist in the developer module: {1}".format(attr, getattr(_developerModule, '__name__')))
+                message     = '{} is not a valid developer.'.format(developer)
+                suggestions = Developer.getSuggestions(developer)
 
-            if not getattr(_developerModule, attr) and attr is not mDeveloper.enumLib.DeveloperModuleAttribute.kURL:
-                raise ValueError('Attribute {} cannot be empty in the module: {}'.format(attr, getattr(_developerModule, '__name__')))
+                if suggestions:
+                    message = '{} Did you mean {}?'.format(message, ', '.join(suggestions))
 
-        infoItems = sorted(['userName', 'position', 'url', 'name', 'email'])
-        if sorted(_developerModule.__dict__['INFO'].keys()) != infoItems:
-            errorMessage = 'INFO attribute should contain all the other static attributes in the developer module: {}'.format(getattr(_developerModule, '__name__'))
-            raise AttributeError(errorMessage)
+                raise ValueError(message)
 
-        self._userName = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kUserName)
-        self._name     = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kName)
-        self._position = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kPosition)
-        self._email    = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kEmail)
-        self._site     = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kSite)
-        self._url      = getattr(_developerModule, mDeveloper.enumLib.DeveloperModuleAttribute.kURL)
+            self._record = DeveloperRegistry.getInstance().getValidatedRecord(developerLibName)
 
         return True
 
@@ -235,6 +1784,9 @@ class Developer(object):
     #
     ## @brief Get developer module for given user.
     #
+    #  Developer modules of the developers directories other than the default one, see getSearchPath method,
+    #  are executed from their files.
+    #
     #  @param developerLib [ str | None | in  ] - Developer module name.
     #
     #  @return module - Developer module.
@@ -244,10 +1796,98 @@ class Developer(object):
         if not developerLib.endswith(mMecoPackage.enumLib.PackagePythonFileSuffix.kLib):
             developerLib = '{}{}'.format(developerLib, mMecoPackage.enumLib.PackagePythonFileSuffix.kLib)
 
+        getDirectoryOf = getattr(DeveloperRegistry.getInstance(), 'getDirectoryOf', None)
+        directory      = getDirectoryOf(developerLib) if getDirectoryOf else None
+
+        if directory and os.path.normcase(directory) != os.path.normcase(Developer.getDevelopersDirectory()):
+            return mDeveloper.cacheLib.RegistryCache.importModule(os.path.join(directory, '{}.py'.format(developerLib)))
+
         _developerModule = importlib.import_module('mDeveloper.developers.{}'.format(developerLib))
 
         return _developerModule
 
+    #
+    ## @brief Get developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the developers directory.
+    @staticmethod
+    def getDevelopersDirectory():
+
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'developers')
+
+    #
+    ## @brief Get developers search path of the process-wide storage.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the developers directories, from the highest precedence to the lowest one.
+    @staticmethod
+    def getSearchPath():
+
+        _storage = DeveloperRegistry.getInstance()
+
+        if isinstance(_storage, DeveloperRegistry):
+            return [_storage.directory()]
+
+        directories = getattr(_storage, 'directories', None)
+        if directories:
+            return directories()
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.layerLib
+
+        return mDeveloper.layerLib.LayeredRegistry.getSearchPath() or [Developer.getDevelopersDirectory()]
+
+    #
+    ## @brief Set developers search path of the process-wide storage, see mDeveloper.layerLib.LayeredRegistry.
+    #
+    #  @param directories    [ list of str | None | in  ] - Developers directories, from the highest precedence to the lowest one, default storage is used on access if None given.
+    #  @param cacheDirectory [ str         | None | in  ] - Directory of the registry cache files, default one is used if None given.
+    #
+    #  @exception ValueError - If an empty list is given.
+    #
+    #  @return None - None.
+    @staticmethod
+    def setSearchPath(directories, cacheDirectory=None):
+
+        if directories is None:
+            DeveloperRegistry.setInstance(None)
+            return
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.layerLib
+
+        DeveloperRegistry.setInstance(mDeveloper.layerLib.LayeredRegistry(directories, cacheDirectory=cacheDirectory))
+
+    #
+    ## @brief Validate developer module attributes.
+    #
+    #  @param attributes [ dict | None | in  ] - Attributes, which can be obtained from mDeveloper.cacheLib.RegistryCache.getModuleRecord method.
+    #  @param moduleName [ str  | None | in  ] - Name of the developer module, which is used in error messages.
+    #
+    #  @exception NameError      - If developer module doesn't have all the attributes.
+    #  @exception ValueError     - If an attribute ID empty and this attribute is not person website URL.
+    #  @exception AttributeError - If INFO dictionary doesn't match with attributes in developer module.
+    #
+    #  @return None - None.
+    @staticmethod
+    def validateDeveloperAttributes(attributes, moduleName):
+
+        for attr in mDeveloper.enumLib.DeveloperModuleAttribute.listAttributes():
+
+            if attr not in attributes:
+                raise NameError("Attribute {0} doesn't exist in the developer module: {1}".format(attr, moduleName))
+
+            if not attributes[attr] and attr != mDeveloper.enumLib.DeveloperModuleAttribute.kURL:
+                raise ValueError('Attribute {} cannot be empty in the module: {}'.format(attr, moduleName))
+
+        info = attributes.get(mDeveloper.cacheLib.INFO_ATTRIBUTE)
+        if not isinstance(info, dict) or sorted(info.keys()) not in (sorted(INFO_KEYS), sorted(x for x in INFO_KEYS if x != 'site')):
+            errorMessage = 'INFO attribute should contain all the other static attributes in the developer module: {}'.format(moduleName)
+            raise AttributeError(errorMessage)
+
     #
     ## @brief List developer user names.
     #
@@ -260,42 +1900,72 @@ class Developer(object):
     @staticmethod
     def listDevelopersAsStr():
 
-        filesToIgnoreList = ['__init__.py']
-
-        _directory = mFileSystem.directoryLib.Directory(directory=os.path.join(os.path.dirname(__file__), 'developers'))
-        developerModuleList = _directory.listFiles(extension='py')
-        developerModuleList = [x for x in developerModuleList if x not in filesToIgnoreList]
-        developerModuleList = [x for x in developerModuleList if not x.endswith('{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kTest))]
-        developerModuleList = [os.path.splitext(x)[0] for x in developerModuleList]
-
-        return developerModuleList
+        return DeveloperRegistry.getInstance().listModules()
 
     #
     ## @brief Check whether given user is valid developer with a developer module.
     #
-    #  @param user [ str, module | getpass.getuser | in  ] - User name of the user.
+    #  Name of the developer module, such as sonerLib, or e-mail address of the developer can be provided as well.
+    #  E-mail addresses are resolved by EMAIL attribute of the developers. See resolveMany method for resolving many users.
+    #
+    #  @param user [ str, module | None | in  ] - User name of the user, current user is used if None given.
     #
     #  @exception N/A
     #
     #  @return None - If user is not a valid developer.
     #  @return str  - Developer module name if user is a developer.
     @staticmethod
-    def isDeveloper(user=getuser()):
+    def isDeveloper(user=None):
 
         userLib = None
 
+        if user is None:
+            user = getuser()
+
         if isinstance(user, ModuleType):
-            userLib = user.__name__.split('.')[1]
+            userLib = user.__name__.split('.')[-1]
+
+        elif user.endswith(mMecoPackage.enumLib.PackagePythonFileSuffix.kLib) and DeveloperRegistry.getInstance().hasModule(user):
+            userLib = user
 
-        elif not user.endswith(mMecoPackage.enumLib.PackagePythonFileSuffix.kLib):
-            user = user.split('@')[0] if '@' in user else user
+        elif '@' in user:
+            userLib = DeveloperRegistry.getInstance().getModuleByEmail(user)
+
+        else:
             userLib = '{}{}'.format(user, mMecoPackage.enumLib.PackagePythonFileSuffix.kLib)
 
-        if userLib not in Developer.listDevelopersAsStr():
+        if not userLib or not DeveloperRegistry.getInstance().hasModule(userLib):
             return None
 
         return userLib
 
+    #
+    ## @brief Get user names of the developers close to given user, see mDeveloper.storageAbs.Storage.getSuggestions.
+    #
+    #  @param user  [ str | None | in  ] - User name, e-mail address or developer module name.
+    #  @param limit [ int | None | in  ] - Maximum number of suggestions, mDeveloper.fuzzyLib.SUGGESTION_COUNT is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - User names, closest ones first.
+    @staticmethod
+    def getSuggestions(user, limit=None):
+
+        return DeveloperRegistry.getInstance().getSuggestions(user, limit=limit)
+
+    #
+    ## @brief Resolve given users to developer module names in one pass, see mDeveloper.developerLib.DeveloperRegistry.resolveMany.
+    #
+    #  @param users [ iterable of str, module | None | in  ] - User names, e-mail addresses, developer module names or developer modules.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Given users as keys and developer module names as values, None for the ones which can't be resolved.
+    @staticmethod
+    def resolveMany(users):
+
+        return DeveloperRegistry.getInstance().resolveMany(users)
+
     #
     ## @brief List developer modules.
     #
@@ -310,7 +1980,171 @@ class Developer(object):
         developerModuleList = []
 
         for i in developerModuleNameList:
-            devModule = importlib.import_module('mDeveloper.developers.{}'.format(i))
+            devModule = Developer.getDeveloperModule(i)
             developerModuleList.append(devModule)
 
         return developerModuleList
+
+    #
+    ## @brief List developers.
+    #
+    #  Developers are created from the records in the registry, developer modules are not imported.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mDeveloper.developerLib.Developer - Developers.
+    @staticmethod
+    def listDevelopers():
+
+        return [Developer(x) for x in Developer.listDevelopersAsStr()]
+
+    #
+    ## @brief Search developers.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Developer module attributes to search in, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of developers, all found developers are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of mDeveloper.developerLib.Developer - Developers, sorted by relevance.
+    @staticmethod
+    def search(keyword, fields=None, limit=None):
+
+        results = DeveloperRegistry.getInstance().search(keyword, fields=fields, limit=limit)
+
+        return [Developer(moduleName) for moduleName, score in results]
+
+    #
+    ## @brief Query developers with a keyword and field terms, such as soner site:Headquarter position:"Lead*".
+    #
+    #  See mDeveloper.storageAbs.Storage.query for the query syntax, query without field terms is the same as search method.
+    #
+    #  @param query  [ str         | None | in  ] - Query.
+    #  @param fields [ list of str | None | in  ] - Developer module attributes to search the keyword in, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit  [ int         | None | in  ] - Maximum number of developers, all found developers are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable or a field term has no value.
+    #
+    #  @return list of mDeveloper.developerLib.Developer - Developers, sorted by relevance, sorted by developer module name if query has field terms only.
+    @staticmethod
+    def query(query, fields=None, limit=None):
+
+        results = DeveloperRegistry.getInstance().query(query, fields=fields, limit=limit)
+
+        return [Developer(moduleName) for moduleName, score in results]
+
+    #
+    ## @brief Count developers by site and position without creating the developers, see mDeveloper.storageAbs.Storage.getFacetCounts.
+    #
+    #  @param query  [ str         | None | in  ] - Query to count the developers of, see query method, all developers are counted if None given.
+    #  @param fields [ list of str | None | in  ] - Developer module attributes to search the keyword of the query in, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #
+    #  @exception ValueError - If a field is not searchable or a field term has no value.
+    #
+    #  @return collections.OrderedDict - SITE and POSITION as keys and list of value and count pairs, sorted by count in descending order, as values.
+    @staticmethod
+    def getFacetCounts(query=None, fields=None):
+
+        return DeveloperRegistry.getInstance().getFacetCounts(query=query, fields=fields)
+
+    #
+    ## @brief Match many names, user names or e-mail addresses, such as the ones in a timesheet export, at once.
+    #
+    #  See mDeveloper.matcherLib.BatchMatcher for how they are matched, NumPy is required.
+    #
+    #  @param queries [ list of str | None  | in  ] - Queries.
+    #  @param exact   [ bool        | False | in  ] - Whether values must be equal to the queries instead of starting with them.
+    #  @param fields  [ list of str | None  | in  ] - Developer module attributes to match, all mDeveloper.matcherLib.FIELDS are matched if None given.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #  @exception ValueError  - If a field is not matched.
+    #
+    #  @return mDeveloper.matcherLib.MatchResult - Result, see its getMatrix and getModuleNames methods.
+    @staticmethod
+    def matchMany(queries, exact=False, fields=None):
+
+        return DeveloperRegistry.getInstance().matchMany(queries, exact=exact, fields=fields)
+
+    #
+    ## @brief Search developers by edit distance of their user names and names, so that typos are tolerated.
+    #
+    #  @param keyword     [ str | None | in  ] - Keyword, search is case and accent insensitive.
+    #  @param maxDistance [ int | None | in  ] - Maximum edit distance, mDeveloper.fuzzyLib.DEFAULT_MAX_DISTANCE is used if None given.
+    #  @param limit       [ int | None | in  ] - Maximum number of developers, all found developers are returned if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mDeveloper.developerLib.Developer - Developers, closest ones first.
+    @staticmethod
+    def fuzzySearch(keyword, maxDistance=None, limit=None):
+
+        results = DeveloperRegistry.getInstance().fuzzySearch(keyword, maxDistance=maxDistance, limit=limit)
+
+        return [Developer(moduleName) for moduleName, distance in results]
+
+    #
+    ## @brief Load and validate all developers.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mDeveloper.developerLib.Developer - Valid developers, sorted by developer module name.
+    #  @return collections.OrderedDict                   - Developer module names as keys and validation exceptions as values.
+    @staticmethod
+    def loadDevelopers(workers=None, processes=False):
+
+        records, errors = DeveloperRegistry.getInstance().loadRecords(workers=workers, processes=processes)
+
+        return [Developer(x) for x in records.values()], errors
+
+    #
+    ## @brief Iterate over developers lazily.
+    #
+    #  See mDeveloper.developerLib.DeveloperRegistry.iterRecords for how developer modules are read.
+    #
+    #  @param errors [ dict | None | out ] - Developer module names as keys and validation exceptions as values are stored in given dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developers, sorted by developer module name.
+    @staticmethod
+    def iterDevelopers(errors=None):
+
+        for moduleName, record in DeveloperRegistry.getInstance().iterRecords(errors=errors):
+            yield Developer(record)
+
+    #
+    ## @brief Search developers lazily.
+    #
+    #  Developers are yielded in the order of relevance from the storage if it has already been loaded.
+    #  Otherwise developer modules are read one by one as the generator is consumed and developers are yielded as
+    #  soon as they are found, sorted by developer module name.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Developer module attributes to search in, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return generator - Developers.
+    @staticmethod
+    def iterSearch(keyword, fields=None):
+
+        fields = fields if fields else mDeveloper.searchLib.FIELDS
+
+        mDeveloper.searchLib.SearchIndex.checkFields(fields)
+
+        _registry = DeveloperRegistry.getInstance()
+
+        if _registry.isLoaded():
+            for moduleName, score in _registry.search(keyword, fields=fields):
+                yield Developer(moduleName)
+            return
+
+        keyword = keyword.lower()
+
+        for moduleName, record in _registry.iterRecords():
+            if any(isinstance(record.get(x), str) and keyword in record.get(x).lower() for x in fields):
+                yield Developer(record)
@@ -54,5 +54,6 @@ INFO            = {'userName':USERNAME,
                    'name'    :NAME,
                    'position':POSITION,
                    'email'   :EMAIL,
+                   'site'    :SITE,
                    'url'     :URL
                    }
@@ -0,0 +1,364 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/facetLib.py @brief [ FILE   ] - Developer facet module.
+## @package mDeveloper.facetLib    @brief [ MODULE ] - Developer facet module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import re
+import array
+import fnmatch
+import collections
+
+import mDeveloper.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the facet index file format, index files with a different version are rebuilt.
+INDEX_VERSION = 2
+
+## [ str ] - Name of the facet index file, which is stored next to the registry cache file.
+INDEX_FILE    = 'facet.json'
+
+## [ list of str ] - Developer module attributes, which can be queried with field terms, such as site:Headquarter.
+FIELDS        = [mDeveloper.enumLib.DeveloperModuleAttribute.kSite,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kPosition,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kEmail]
+
+## [ list of str ] - Developer module attributes, which developers are counted by.
+COUNT_FIELDS  = [mDeveloper.enumLib.DeveloperModuleAttribute.kSite,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kPosition]
+
+## [ str ] - Characters, which make a field term a pattern, see fnmatch module.
+WILDCARDS     = '*?['
+
+## [ re.Pattern ] - Expression of a field term, value can be double quoted to contain white space.
+TERM_PATTERN  = re.compile(r'(?<!\S)({}):(?:"([^"]*)"|(\S*))'.format('|'.join(x.lower() for x in FIELDS)), re.IGNORECASE)
+
+#
+## @brief [ CLASS ] - Class to query developer records by exact field values and to count them by field values.
+#
+#  Each field of FIELDS has its own posting lists which map lower case field values to the ids of the
+#  records having them. Field terms are answered by looking their values up, or by matching the distinct
+#  values of the field for patterns, and intersecting the posting lists of the fields. Terms of the same
+#  field are OR'ed, terms of different fields are AND'ed, so that site:London site:Paris position:Lead*
+#  finds the leads at either site.
+class FacetIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param records [ iterable of tuple | None | in  ] - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, records):
+
+        ## [ list of str ] - Developer module names, index of a module name is the id of its record.
+        self._moduleNames = []
+
+        ## [ dict ] - Fields as keys and list of lower case field values of the records as values.
+        self._values      = dict((x, []) for x in FIELDS)
+
+        ## [ dict ] - Fields as keys and dict instances, which have lower case values as keys and sorted array of record ids as values, as values.
+        self._postings    = {}
+
+        ## [ dict ] - Fields as keys and dict instances, which have lower case values as keys and the values as they are first seen as values.
+        self._labels      = dict((x, {}) for x in FIELDS)
+
+        postingsOfFields = dict((x, {}) for x in FIELDS)
+
+        for recordId, (moduleName, record) in enumerate(records):
+
+            self._moduleNames.append(moduleName)
+
+            for field in FIELDS:
+
+                label = record.get(field)
+                label = label if isinstance(label, str) else ''
+                value = label.lower()
+
+                self._values[field].append(value)
+                self._labels[field].setdefault(value, label)
+
+                postingsOfFields[field].setdefault(value, []).append(recordId)
+
+        for field, postings in postingsOfFields.items():
+            self._postings[field] = dict((value, array.array('I', x)) for value, x in postings.items())
+
+    #
+    ## @brief Find ids of the records matching any of given patterns in given field.
+    #
+    #  @param field    [ str         | None | in  ] - Field.
+    #  @param patterns [ list of str | None | in  ] - Lower case values or patterns, see WILDCARDS.
+    #
+    #  @exception N/A
+    #
+    #  @return set of int - Record ids.
+    def _matchField(self, field, patterns):
+
+        postings = self._postings[field]
+        result   = set()
+
+        for pattern in patterns:
+
+            if any(x in pattern for x in WILDCARDS):
+                # Distinct values are far fewer than the records for sites and positions
+                for value, posting in postings.items():
+                    if fnmatch.fnmatchcase(value, pattern):
+                        result.update(posting)
+
+            elif pattern in postings:
+                result.update(postings[pattern])
+
+        return result
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def moduleNames(self):
+
+        return self._moduleNames
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find developer records matching given field terms.
+    #
+    #  @param terms [ list of tuple | None | in  ] - Field and value pairs, see parseQuery method, values are case insensitive and they can be patterns.
+    #
+    #  @exception ValueError - If a field is not one of FIELDS.
+    #
+    #  @return list of str - Developer module names, sorted.
+    def match(self, terms):
+
+        patterns = collections.OrderedDict()
+        for field, value in terms:
+            patterns.setdefault(field, []).append(value.lower())
+
+        FacetIndex.checkFields(patterns)
+
+        recordIdSets = sorted((self._matchField(x, y) for x, y in patterns.items()), key=len)
+        if not recordIdSets:
+            return []
+
+        recordIds = recordIdSets[0]
+        for recordIdSet in recordIdSets[1:]:
+            recordIds = recordIds.intersection(recordIdSet)
+
+        return sorted(self._moduleNames[x] for x in recordIds)
+
+    #
+    ## @brief Count developer records by the values of given fields in one pass over the index.
+    #
+    #  @param fields      [ list of str | None | in  ] - Fields, such as SITE, COUNT_FIELDS are used if None given.
+    #  @param moduleNames [ list of str | None | in  ] - Developer module names of the records to count, all records are counted if None given.
+    #
+    #  @exception ValueError - If a field is not one of FIELDS.
+    #
+    #  @return collections.OrderedDict - Fields as keys and list of value and count pairs, sorted by count in descending and value in ascending order, as values.
+    def getCounts(self, fields=None, moduleNames=None):
+
+        fields = fields if fields else COUNT_FIELDS
+
+        FacetIndex.checkFields(fields)
+
+        recordIds = None
+        if moduleNames is not None:
+            wanted    = set(moduleNames)
+            recordIds = [x for x, moduleName in enumerate(self._moduleNames) if moduleName in wanted]
+
+        result = collections.OrderedDict()
+
+        for field in fields:
+
+            labels = self._labels[field]
+
+            if recordIds is None:
+                # Posting lists hold the counts already
+                counts = dict((x, len(y)) for x, y in self._postings[field].items())
+            else:
+                values = self._values[field]
+                counts = collections.Counter(values[x] for x in recordIds)
+
+            result[field] = sorted(((labels[x], y) for x, y in counts.items() if x), key=lambda x: (-x[1], x[0]))
+
+        return result
+
+    #
+    ## @brief Save the index into given file atomically.
+    #
+    #  Index is saved as JSON, since the cache directory may be shared and loading a pickle could execute code.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is built from, see mDeveloper.developerLib.RegistrySnapshot.version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def save(self, filePath, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import json
+        import mDeveloper.cacheLib
+
+        content = json.dumps({'version'     : INDEX_VERSION,
+                              'signature'   : signature,
+                              'moduleNames' : self._moduleNames,
+                              'values'      : self._values,
+                              'postings'    : dict((x, dict((v, y.tolist()) for v, y in postings.items())) for x, postings in self._postings.items()),
+                              'labels'      : self._labels})
+
+        return mDeveloper.cacheLib.RegistryCache.writeFileAtomically(filePath, content.encode('utf-8'))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given fields can be queried.
+    #
+    #  @param fields [ list of str | None | in  ] - Fields, such as SITE.
+    #
+    #  @exception ValueError - If a field is not one of FIELDS.
+    #
+    #  @return None - None.
+    @staticmethod
+    def checkFields(fields):
+
+        for field in fields:
+            if field not in FIELDS:
+                raise ValueError('{} is not a facet field, use one of: {}'.format(field, ', '.join(FIELDS)))
+
+    #
+    ## @brief Split given query into a keyword and field terms.
+    #
+    #  Field terms are the lower case names of FIELDS followed by a colon and a value, such as
+    #  site:Headquarter or position:"Lead*", the rest of the query is the keyword.
+    #
+    #  @param query [ str | None | in  ] - Query, such as soner site:Headquarter.
+    #
+    #  @exception ValueError - If a field term has no value.
+    #
+    #  @return str           - Keyword, query itself if it has no field terms, empty if it has field terms only.
+    #  @return list of tuple - Field, such as SITE, and value pairs.
+    @staticmethod
+    def parseQuery(query):
+
+        terms = []
+
+        for match in TERM_PATTERN.finditer(query):
+
+            value = match.group(2) if match.group(2) is not None else match.group(3)
+            if not value:
+                raise ValueError('{}: has no value.'.format(match.group(1).lower()))
+
+            terms.append((match.group(1).upper(), value))
+
+        keyword = ' '.join(TERM_PATTERN.sub(' ', query).split()) if terms else query
+
+        return keyword, terms
+
+    #
+    ## @brief Join given command line arguments into a query.
+    #
+    #  Shell removes the quotes of field terms, such as position:"Lead TD", so that values of the field terms
+    #  which contain white space are quoted again.
+    #
+    #  @param arguments [ list of str | None | in  ] - Arguments.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Query.
+    @staticmethod
+    def joinArguments(arguments):
+
+        result = []
+
+        for argument in arguments:
+
+            match = TERM_PATTERN.match(argument)
+            if match and match.group(3) is not None and match.end() < len(argument) and '"' not in argument:
+                argument = '{}"{}"'.format(argument[:match.end(1) + 1], argument[match.end(1) + 1:])
+
+            result.append(argument)
+
+        return ' '.join(result)
+
+    #
+    ## @brief Load index from given file.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is expected to be built from.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.facetLib.FacetIndex - Index, None if file doesn't exist, it is corrupt or it is out of date.
+    @staticmethod
+    def load(filePath, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import json
+
+        try:
+            with open(filePath, 'r', encoding='utf-8') as indexFile:
+                data = json.load(indexFile)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION or data.get('signature') != signature:
+            return None
+
+        _facetIndex = FacetIndex.__new__(FacetIndex)
+
+        try:
+            _facetIndex._moduleNames = list(data['moduleNames'])
+            _facetIndex._values      = dict((x, list(data['values'][x])) for x in FIELDS)
+            _facetIndex._postings    = dict((x, dict((v, array.array('I', y)) for v, y in data['postings'][x].items())) for x in FIELDS)
+            _facetIndex._labels      = dict((x, dict(data['labels'][x])) for x in FIELDS)
+        except (AttributeError, KeyError, TypeError, ValueError, OverflowError):
+            return None
+
+        return _facetIndex
@@ -0,0 +1,308 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/formatterLib.py @brief [ FILE   ] - Developer record formatter module.
+## @package mDeveloper.formatterLib    @brief [ MODULE ] - Developer record formatter module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+#
+#  Modules needed to write the records are imported on demand, so that the commands can import this
+#  module to parse their arguments without slowing down start-up.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Machine-readable output formats.
+FORMATS     = ['json', 'ndjson', 'csv']
+
+## [ int ] - Number of characters buffered before they are written into the stream.
+BUFFER_SIZE = 65536
+
+#
+## @brief [ CLASS ] - Class to write developer records into a stream in a machine-readable format.
+#
+#  Records are serialized as they are given and the output is written into the stream in chunks of
+#  BUFFER_SIZE characters, so that many records can be written without keeping them in memory.
+#
+#  - json   : A single array of objects.
+#  - ndjson : One object per line.
+#  - csv    : A header line followed by one line per record.
+#
+#  Keys of the objects and the header of the CSV output are the field names of mDeveloper.developerLib.DeveloperRecord,
+#  such as userName, so that the output is the same as the records of the developer server.
+class RecordWriter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param stream     [ file        | None        | in  ] - Text stream to write into, such as sys.stdout.
+    #  @param formatName [ str         | None        | in  ] - Format, one of FORMATS.
+    #  @param fields     [ list of str | None        | in  ] - Developer module attributes to write, such as USERNAME, all of them are written if None given.
+    #  @param bufferSize [ int         | BUFFER_SIZE | in  ] - Number of characters buffered before they are written into the stream.
+    #
+    #  @exception ValueError - If format is not supported or a field is not a developer module attribute.
+    #
+    #  @return None - None.
+    def __init__(self, stream, formatName, fields=None, bufferSize=BUFFER_SIZE):
+
+        # Imported on demand to keep start-up time of the commands low
+        import io
+        import csv
+        import json
+        import mDeveloper.developerLib
+
+        if formatName not in FORMATS:
+            raise ValueError('{} is not a supported format, use one of: {}'.format(formatName, ', '.join(FORMATS)))
+
+        fields = fields if fields else mDeveloper.developerLib.RECORD_ATTRIBUTES
+
+        for field in fields:
+            if field not in mDeveloper.developerLib.RECORD_ATTRIBUTES:
+                raise ValueError('{} is not a field, use one of: {}'.format(field, ', '.join(mDeveloper.developerLib.RECORD_ATTRIBUTES)))
+
+        ## [ file ] - Stream.
+        self._stream      = stream
+
+        ## [ str ] - Format.
+        self._formatName  = formatName
+
+        ## [ list of int ] - Indexes of the fields in mDeveloper.developerLib.DeveloperRecord.
+        self._indexes     = [mDeveloper.developerLib.RECORD_ATTRIBUTES.index(x) for x in fields]
+
+        ## [ list of str ] - Keys of the fields, such as userName.
+        self._keys        = [mDeveloper.developerLib.DeveloperRecord._fields[x] for x in self._indexes]
+
+        ## [ int ] - Buffer size.
+        self._bufferSize  = bufferSize
+
+        ## [ function ] - JSON encoder.
+        self._dumps       = json.dumps
+
+        ## [ io.StringIO ] - Buffer.
+        self._buffer      = io.StringIO()
+
+        ## [ csv.writer ] - CSV writer, which writes into the buffer.
+        self._csvWriter   = csv.writer(self._buffer, lineterminator='\n') if formatName == 'csv' else None
+
+        ## [ int ] - Number of records written.
+        self._recordCount = 0
+
+        if self._csvWriter:
+            self._csvWriter.writerow(self._keys)
+        elif formatName == 'json':
+            self._buffer.write('[')
+
+    #
+    ## @brief Get values of the fields of given record.
+    #
+    #  @param record [ mDeveloper.developerLib.Developer, mDeveloper.developerLib.DeveloperRecord, dict | None | in  ] - Record.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Values.
+    def _getValues(self, record):
+
+        if isinstance(record, dict):
+            return [record.get(x) for x in self._keys]
+
+        # Developer instances are not tuples, their records are
+        if not isinstance(record, tuple):
+            record = record.record()
+
+        return [record[x] for x in self._indexes]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def recordCount(self):
+
+        return self._recordCount
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given record.
+    #
+    #  Records received from the developer server, see mDeveloper.clientLib.DeveloperClient, can be given as well.
+    #
+    #  @param record [ mDeveloper.developerLib.Developer, mDeveloper.developerLib.DeveloperRecord, dict | None | in  ] - Record.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, record):
+
+        values = self._getValues(record)
+
+        if self._csvWriter:
+            self._csvWriter.writerow(values)
+        elif self._formatName == 'ndjson':
+            self._buffer.write(self._dumps(dict(zip(self._keys, values))))
+            self._buffer.write('\n')
+        else:
+            self._buffer.write(',\n' if self._recordCount else '\n')
+            self._buffer.write(self._dumps(dict(zip(self._keys, values))))
+
+        self._recordCount += 1
+
+        if self._buffer.tell() >= self._bufferSize:
+            self.flush()
+
+    #
+    ## @brief Write given records.
+    #
+    #  @param records [ iterable | None | in  ] - Records, see write method.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of records written.
+    def writeAll(self, records):
+
+        recordCount = self._recordCount
+
+        for record in records:
+            self.write(record)
+
+        return self._recordCount - recordCount
+
+    #
+    ## @brief Write the buffered output into the stream.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        self._stream.write(self._buffer.getvalue())
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    #
+    ## @brief Finish the output and write it into the stream, no records can be written afterwards.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._formatName == 'json':
+            self._buffer.write('\n]\n' if self._recordCount else ']\n')
+
+        self.flush()
+
+        self._stream.flush()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given developer counts, see mDeveloper.storageAbs.Storage.getFacetCounts, into given stream.
+    #
+    #  - json   : A single object with lower case fields as keys and objects, which have values as keys and counts as values, as values.
+    #  - ndjson : One object with field, value and count keys per line.
+    #  - csv    : A header line followed by one field, value and count line per value.
+    #
+    #  @param stream     [ file | None | in  ] - Text stream to write into, such as sys.stdout.
+    #  @param formatName [ str  | None | in  ] - Format, one of FORMATS.
+    #  @param counts     [ dict | None | in  ] - Fields, such as SITE, as keys and list of value and count pairs as values.
+    #
+    #  @exception ValueError - If format is not supported.
+    #
+    #  @return None - None.
+    @staticmethod
+    def writeCounts(stream, formatName, counts):
+
+        # Imported on demand to keep start-up time of the commands low
+        import csv
+        import json
+        import collections
+
+        if formatName not in FORMATS:
+            raise ValueError('{} is not a supported format, use one of: {}'.format(formatName, ', '.join(FORMATS)))
+
+        rows = [(x.lower(), value, count) for x, y in counts.items() for value, count in y]
+
+        if formatName == 'json':
+            content = collections.OrderedDict((x.lower(), collections.OrderedDict(tuple(z) for z in y)) for x, y in counts.items())
+            stream.write(json.dumps(content))
+            stream.write('\n')
+
+        elif formatName == 'ndjson':
+            for field, value, count in rows:
+                stream.write(json.dumps({'field':field, 'value':value, 'count':count}))
+                stream.write('\n')
+
+        else:
+            csvWriter = csv.writer(stream, lineterminator='\n')
+            csvWriter.writerow(['field', 'value', 'count'])
+            csvWriter.writerows(rows)
+
+        stream.flush()
+
+    #
+    ## @brief Get developer module attributes of given comma separated field names.
+    #
+    #  @param fields [ str | None | in  ] - Comma separated field names, case insensitive, such as username,email.
+    #
+    #  @exception ValueError - If a field is not a developer module attribute.
+    #
+    #  @return list of str - Developer module attributes, such as USERNAME, None if no fields given.
+    @staticmethod
+    def parseFields(fields):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.developerLib
+
+        if not fields:
+            return None
+
+        attributes = [x.strip().upper() for x in fields.split(',') if x.strip()]
+
+        for attribute in attributes:
+            if attribute not in mDeveloper.developerLib.RECORD_ATTRIBUTES:
+                raise ValueError('{} is not a field, use one of: {}'.format(attribute.lower(),
+                                                                            ', '.join(x.lower() for x in mDeveloper.developerLib.RECORD_ATTRIBUTES)))
+
+        return attributes
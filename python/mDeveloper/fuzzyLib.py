@@ -0,0 +1,634 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/fuzzyLib.py @brief [ FILE   ] - Developer fuzzy search module.
+## @package mDeveloper.fuzzyLib    @brief [ MODULE ] - Developer fuzzy search module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import array
+import unicodedata
+
+import mDeveloper.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the fuzzy index file format, index files with a different version are rebuilt.
+INDEX_VERSION        = 3
+
+## [ str ] - Name of the fuzzy index file, which is stored next to the registry cache file.
+INDEX_FILE           = 'fuzzy.idx'
+
+## [ bytes ] - Magic bytes at the beginning of fuzzy index files.
+INDEX_MAGIC          = b'MDEVFUZZ'
+
+## [ int ] - Default maximum edit distance of the fuzzy search.
+DEFAULT_MAX_DISTANCE = 2
+
+## [ int ] - Default number of suggestions.
+SUGGESTION_COUNT     = 3
+
+## [ list of str ] - Developer module attributes the fuzzy index is built over.
+FIELDS               = [mDeveloper.enumLib.DeveloperModuleAttribute.kUserName,
+                        mDeveloper.enumLib.DeveloperModuleAttribute.kName]
+
+#
+## @brief [ CLASS ] - Class to find terms within an edit distance of a query by using a BK-tree.
+#
+#  Each node of the tree holds a term and its children are keyed by their edit distance to that term. Since
+#  edit distance is a metric, only the children whose key is within the maximum distance of the distance
+#  between the query and the node can contain a match, so most of the tree is skipped by a query.
+#
+#  Edit distance is the Levenshtein distance computed with the bit-parallel algorithm of Myers.
+class BKTree(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of str ] - Terms in the order they are added, index of a term is the index of its node and the first node is the root.
+        self._terms       = []
+
+        ## [ list of list ] - Values added with each term, which is created on demand for loaded trees.
+        self._values      = []
+
+        ## [ dict ] - Terms as keys and indexes of their nodes as values, which is created on demand for loaded trees.
+        self._indexes     = {}
+
+        ## [ list of dict ] - Distances as keys and indexes of the child nodes as values for each node, which is created on demand for loaded trees.
+        self._children    = []
+
+        ## [ tuple ] - Children and values of the nodes in flat arrays, which are created on demand, see _getArrays method.
+        self._arrays      = None
+
+        ## [ int ] - Number of distances computed by the last query.
+        self._comparisons = 0
+
+    #
+    ## @brief Number of the terms.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of the terms.
+    def __len__(self):
+
+        return len(self._terms)
+
+    #
+    ## @brief Get children and values of the nodes in flat arrays, which are what find method walks and getSections method saves.
+    #
+    #  Children of node i are at the positions from childOffsets[i] to childOffsets[i + 1] of child distances and
+    #  child indexes arrays and its values are at the positions from valueOffsets[i] to valueOffsets[i + 1] of values.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Child offsets, child distances, child indexes and value offsets arrays and list of the values.
+    def _getArrays(self):
+
+        if self._arrays is None:
+
+            childOffsets   = array.array('I', [0])
+            childDistances = array.array('I')
+            childIndexes   = array.array('I')
+            valueOffsets   = array.array('I', [0])
+            values         = []
+
+            for children, nodeValues in zip(self._children, self._values):
+
+                for distance in sorted(children):
+                    childDistances.append(distance)
+                    childIndexes.append(children[distance])
+
+                childOffsets.append(len(childIndexes))
+
+                values.extend(nodeValues)
+                valueOffsets.append(len(values))
+
+            self._arrays = (childOffsets, childDistances, childIndexes, valueOffsets, values)
+
+        return self._arrays
+
+    #
+    ## @brief Create term indexes, children and values of the nodes of a loaded tree, so that terms can be added into it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _expand(self):
+
+        if self._children is not None:
+            return
+
+        childOffsets, childDistances, childIndexes, valueOffsets, values = self._arrays
+
+        self._indexes  = dict((x, index) for index, x in enumerate(self._terms))
+        self._children = [dict(zip(childDistances[childOffsets[x]:childOffsets[x + 1]], childIndexes[childOffsets[x]:childOffsets[x + 1]])) for x in range(len(self._terms))]
+        self._values   = [values[valueOffsets[x]:valueOffsets[x + 1]] for x in range(len(self._terms))]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def comparisons(self):
+
+        return self._comparisons
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the terms.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Terms in the order they are added.
+    def terms(self):
+
+        return list(self._terms)
+
+    #
+    ## @brief Add given term.
+    #
+    #  @param term  [ str     | None | in  ] - Term.
+    #  @param value [ variant | None | in  ] - Value to return with the term, such as a developer module name.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def add(self, term, value):
+
+        self._expand()
+
+        index = self._indexes.get(term)
+        if index is not None:
+            self._values[index].append(value)
+            return
+
+        index = self._indexes[term] = len(self._terms)
+
+        self._terms.append(term)
+        self._values.append([value])
+        self._children.append({})
+
+        self._arrays = None
+
+        if not index:
+            return
+
+        masks = BKTree.getMasks(term)
+        node  = 0
+
+        while True:
+
+            distance = BKTree.getDistance(term, self._terms[node], masks)
+            child    = self._children[node].get(distance)
+
+            if child is None:
+                self._children[node][distance] = index
+                return
+
+            node = child
+
+    #
+    ## @brief Find the terms within given edit distance of given query.
+    #
+    #  @param query       [ str | None | in  ] - Query.
+    #  @param maxDistance [ int | None | in  ] - Maximum edit distance.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Distance, term and list of values tuples, sorted by distance and term.
+    def find(self, query, maxDistance):
+
+        self._comparisons = 0
+
+        if not self._terms:
+            return []
+
+        childOffsets, childDistances, childIndexes, valueOffsets, values = self._getArrays()
+
+        masks   = BKTree.getMasks(query)
+        results = []
+        nodes   = [0]
+
+        while nodes:
+
+            index = nodes.pop()
+            term  = self._terms[index]
+
+            distance           = BKTree.getDistance(query, term, masks)
+            self._comparisons += 1
+
+            if distance <= maxDistance:
+                results.append((distance, term, values[valueOffsets[index]:valueOffsets[index + 1]]))
+
+            for position in range(childOffsets[index], childOffsets[index + 1]):
+                if distance - maxDistance <= childDistances[position] <= distance + maxDistance:
+                    nodes.append(childIndexes[position])
+
+        results.sort(key=lambda x: (x[0], x[1]))
+
+        return results
+
+    #
+    ## @brief Get sections of the tree, so that the tree can be saved into a binary file, see fromSections method.
+    #
+    #  Sections are the terms, values and the arrays of _getArrays method, see mDeveloper.cacheLib.RegistryCache.joinSections
+    #  method, values must be strings.
+    #
+    #  @exception ValueError - If a term or a value contains a null character.
+    #
+    #  @return list of bytes - Sections.
+    def getSections(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache
+
+        childOffsets, childDistances, childIndexes, valueOffsets, values = self._getArrays()
+
+        return [_registryCache.joinStrings(self._terms),
+                _registryCache.joinStrings(values),
+                _registryCache.getSectionOf(childOffsets),
+                _registryCache.getSectionOf(childDistances),
+                _registryCache.getSectionOf(childIndexes),
+                _registryCache.getSectionOf(valueOffsets)]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a tree from given sections, see getSections method.
+    #
+    #  Arrays are used as they are, so that loading a tree doesn't create a dict and a list for each node.
+    #
+    #  @param sections [ list of bytes-like object | None | in  ] - Sections.
+    #
+    #  @exception ValueError - If sections don't make a tree.
+    #
+    #  @return mDeveloper.fuzzyLib.BKTree - Tree.
+    @staticmethod
+    def fromSections(sections):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache
+
+        if len(sections) != 6:
+            raise ValueError('Tree has {} sections instead of 6.'.format(len(sections)))
+
+        childOffsets, childDistances, childIndexes, valueOffsets = [_registryCache.getArrayOf(x) for x in sections[2:]]
+
+        terms  = _registryCache.splitStrings(sections[0], len(childOffsets) - 1)
+        values = _registryCache.splitStrings(sections[1], valueOffsets[-1] if valueOffsets else 0)
+
+        if len(valueOffsets) != len(childOffsets) or childOffsets[-1] != len(childIndexes) or len(childDistances) != len(childIndexes):
+            raise ValueError('Nodes of the tree are not valid.')
+
+        # Offsets and indexes are checked once here instead of each time a node is visited
+        if max(childOffsets) > len(childIndexes) or max(valueOffsets) > len(values) or (childIndexes and max(childIndexes) >= len(terms)):
+            raise ValueError('Nodes of the tree are not valid.')
+
+        _bkTree = BKTree()
+
+        _bkTree._terms    = terms
+        _bkTree._values   = None
+        _bkTree._indexes  = None
+        _bkTree._children = None
+        _bkTree._arrays   = (childOffsets, childDistances, childIndexes, valueOffsets, values)
+
+        return _bkTree
+
+    #
+    ## @brief Get match masks of given value, which are used by getDistance method.
+    #
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Characters as keys and bit masks of their positions in the value as values.
+    @staticmethod
+    def getMasks(value):
+
+        masks = {}
+
+        for index, character in enumerate(value):
+            masks[character] = masks.get(character, 0) | (1 << index)
+
+        return masks
+
+    #
+    ## @brief Get edit distance between given values.
+    #
+    #  @param value      [ str  | None | in  ] - Value.
+    #  @param otherValue [ str  | None | in  ] - Other value.
+    #  @param masks      [ dict | None | in  ] - Match masks of value, see getMasks method, they are computed if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Levenshtein distance.
+    @staticmethod
+    def getDistance(value, otherValue, masks=None):
+
+        length = len(value)
+
+        if not length:
+            return len(otherValue)
+
+        if not otherValue:
+            return length
+
+        masks    = masks if masks is not None else BKTree.getMasks(value)
+        lastBit  = 1 << (length - 1)
+        fullMask = (1 << length) - 1
+
+        positiveVector = fullMask
+        negativeVector = 0
+        distance       = length
+
+        for character in otherValue:
+
+            match = masks.get(character, 0)
+
+            verticalMatch     = match | negativeVector
+            horizontalMatch   = (((match & positiveVector) + positiveVector) ^ positiveVector) | match
+            positiveHorizontal = negativeVector | ~(horizontalMatch | positiveVector)
+            negativeHorizontal = positiveVector & horizontalMatch
+
+            if positiveHorizontal & lastBit:
+                distance += 1
+            elif negativeHorizontal & lastBit:
+                distance -= 1
+
+            positiveHorizontal = (positiveHorizontal << 1) | 1
+            negativeHorizontal = negativeHorizontal << 1
+
+            positiveVector = (negativeHorizontal | ~(verticalMatch | positiveHorizontal)) & fullMask
+            negativeVector = positiveHorizontal & verticalMatch
+
+        return distance
+
+#
+## @brief [ CLASS ] - Class to search developer records by edit distance over their user names and names.
+#
+#  Values of FIELDS are normalized, see normalize method, and each one of them as well as each word of the
+#  names is added into a mDeveloper.fuzzyLib.BKTree, so that typos in a user name, a full name or a single
+#  name, such as a first name, are tolerated.
+class FuzzyIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param records [ iterable of tuple | None | in  ] - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, records):
+
+        ## [ mDeveloper.fuzzyLib.BKTree ] - Tree of the terms, values are developer module names.
+        self._tree = BKTree()
+
+        for moduleName, record in records:
+
+            terms = set()
+
+            for field in FIELDS:
+
+                value = FuzzyIndex.normalize(record.get(field))
+                if not value:
+                    continue
+
+                terms.add(value)
+                terms.update(value.split(' '))
+
+            for term in sorted(terms):
+                self._tree.add(term, moduleName)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def tree(self):
+
+        return self._tree
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Search developer records whose user name, name or a word of their name is within given edit distance of given keyword.
+    #
+    #  @param keyword     [ str | None                 | in  ] - Keyword, it is normalized the same way as the values.
+    #  @param maxDistance [ int | DEFAULT_MAX_DISTANCE | in  ] - Maximum edit distance.
+    #  @param limit       [ int | None                 | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Developer module name and distance pairs, sorted by distance and module name in ascending order.
+    def search(self, keyword, maxDistance=DEFAULT_MAX_DISTANCE, limit=None):
+
+        keyword = FuzzyIndex.normalize(keyword)
+        if not keyword:
+            return []
+
+        distances = {}
+
+        for distance, term, moduleNames in self._tree.find(keyword, maxDistance):
+            for moduleName in moduleNames:
+                if moduleName not in distances:
+                    distances[moduleName] = distance
+
+        results = sorted(distances.items(), key=lambda x: (x[1], x[0]))
+
+        return results if limit is None else results[:limit]
+
+    #
+    ## @brief Get the index as the content of an index file, see fromBytes method.
+    #
+    #  Content is the signature followed by the sections of the tree, see mDeveloper.fuzzyLib.BKTree.getSections,
+    #  so that loading the index neither parses a document nor creates a dict for each node of the tree.
+    #
+    #  @param signature [ str | None | in  ] - Version of the records the index is built from, such as mDeveloper.developerLib.RegistrySnapshot.version.
+    #
+    #  @exception ValueError - If a term or a developer module name contains a null character.
+    #
+    #  @return bytes - Content.
+    def toBytes(self, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        return mDeveloper.cacheLib.RegistryCache.joinSections(INDEX_MAGIC, INDEX_VERSION, [signature.encode('utf-8')] + self._tree.getSections())
+
+    #
+    ## @brief Save the index into given file atomically, see toBytes method.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is built from, see mDeveloper.developerLib.RegistrySnapshot.version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, False if the index can't be saved.
+    def save(self, filePath, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        try:
+            content = self.toBytes(signature)
+        except ValueError:
+            return False
+
+        return mDeveloper.cacheLib.RegistryCache.writeFileAtomically(filePath, content)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Normalize given value for fuzzy matching.
+    #
+    #  Value is lower cased, accents are removed and white space is collapsed, so that Şafak Öner becomes safak oner.
+    #
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Normalized value, empty if value is not a string.
+    @staticmethod
+    def normalize(value):
+
+        if not isinstance(value, str):
+            return ''
+
+        value = unicodedata.normalize('NFKD', value.lower())
+        value = ''.join(x for x in value if not unicodedata.combining(x))
+
+        return ' '.join(value.split())
+
+    #
+    ## @brief Get maximum edit distance of the suggestions for given keyword, so that short keywords don't match everything.
+    #
+    #  @param keyword [ str | None | in  ] - Keyword.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Maximum edit distance.
+    @staticmethod
+    def getSuggestionDistance(keyword):
+
+        return min(DEFAULT_MAX_DISTANCE, max(1, len(keyword) // 4))
+
+    #
+    ## @brief Create an index from the content of an index file, see toBytes method.
+    #
+    #  @param content   [ bytes-like object | None | in  ] - Content.
+    #  @param signature [ str               | None | in  ] - Version of the records the index is expected to be built from, it isn't checked if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Index, None if content is not valid or it is out of date.
+    @staticmethod
+    def fromBytes(content, signature=None):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        sections = mDeveloper.cacheLib.RegistryCache.splitSections(content, INDEX_MAGIC, INDEX_VERSION)
+        if not sections:
+            return None
+
+        _fuzzyIndex = FuzzyIndex.__new__(FuzzyIndex)
+
+        try:
+            if signature is not None and str(sections[0], 'utf-8') != signature:
+                return None
+
+            _fuzzyIndex._tree = BKTree.fromSections(sections[1:])
+
+        except (UnicodeDecodeError, ValueError):
+            return None
+
+        return _fuzzyIndex
+
+    #
+    ## @brief Load index from given file, see fromBytes method.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is expected to be built from.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Index, None if file doesn't exist, it is corrupt or it is out of date.
+    @staticmethod
+    def load(filePath, signature):
+
+        try:
+            with open(filePath, 'rb') as indexFile:
+                content = indexFile.read()
+        except (IOError, OSError):
+            return None
+
+        return FuzzyIndex.fromBytes(content, signature)
@@ -0,0 +1,549 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/importerLib.py @brief [ FILE   ] - Developer import module.
+## @package mDeveloper.importerLib    @brief [ MODULE ] - Developer import module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import csv
+import base64
+import collections
+
+import mDeveloper.enumLib
+import mDeveloper.statsLib
+import mDeveloper.cacheLib
+import mDeveloper.developerLib
+
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Supported formats of the exports.
+FORMATS    = ['csv', 'ldif']
+
+## [ dict ] - File extensions as keys and formats as values, which are used to detect the format of an export.
+EXTENSIONS = {'.csv'  : 'csv',
+              '.ldif' : 'ldif',
+              '.ldf'  : 'ldif'}
+
+## [ int ] - Number of records written into a storage in one transaction.
+BATCH_SIZE = 500
+
+## [ collections.OrderedDict ] - Developer module attributes as keys and lower case column names of the exports, in order of precedence, as values.
+#
+#  Field names of mDeveloper.developerLib.DeveloperRecord come first, so that the output of mdeveloper-list --format csv
+#  can be imported, followed by the common LDAP attributes.
+COLUMNS    = collections.OrderedDict([(mDeveloper.enumLib.DeveloperModuleAttribute.kUserName, ['username', 'uid', 'samaccountname']),
+                                      (mDeveloper.enumLib.DeveloperModuleAttribute.kName,     ['name', 'displayname', 'cn']),
+                                      (mDeveloper.enumLib.DeveloperModuleAttribute.kPosition, ['position', 'title']),
+                                      (mDeveloper.enumLib.DeveloperModuleAttribute.kEmail,    ['email', 'mail']),
+                                      (mDeveloper.enumLib.DeveloperModuleAttribute.kSite,     ['site', 'l', 'physicaldeliveryofficename']),
+                                      (mDeveloper.enumLib.DeveloperModuleAttribute.kURL,      ['url', 'labeleduri'])])
+
+## [ str ] - Template of the developer modules, values are Python literals.
+DEVELOPER_MODULE_TEMPLATE = """#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/developers/{moduleName}.py @brief [ FILE   ] - Developer module.
+## @package mDeveloper.developers.{moduleName}    @brief [ MODULE ] - Developer module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - User name of the developer.
+USERNAME        = {userName}
+
+## [ str ] - Name of the developer.
+NAME            = {name}
+
+## [ str ] - Position of the developer.
+POSITION        = {position}
+
+## [ str ] - E-mail address of the developer.
+EMAIL           = {email}
+
+## [ str ] - Site where the developer is located at.
+SITE            = {site}
+
+## [ str ] - Web page of the developer.
+URL             = {url}
+
+## [ dict ] - Developer info as a dict instance.
+INFO            = {{'userName':USERNAME,
+                   'name'    :NAME,
+                   'position':POSITION,
+                   'email'   :EMAIL,
+                   'site'    :SITE,
+                   'url'     :URL
+                   }}
+"""
+
+#
+## @brief [ CLASS ] - Class to import developers from CSV and LDIF exports in bulk.
+#
+#  Exports are read row by row and every row is validated and written as soon as it is read, so that memory
+#  use doesn't grow with the size of the export, except for the user names seen so far, which are kept to
+#  report duplicates. Rows are written either as developer modules into a developers directory or into a
+#  storage, such as mDeveloper.sqliteStorageLib.SQLiteStorage, in batches of BATCH_SIZE records.
+#
+#  Registry cache and pack file of the developers directory are updated once all rows are written, instead
+#  of once per developer module.
+class DeveloperImporter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory      [ str                           | None       | in  ] - Developers directory to write developer modules into, default one is used if None given.
+    #  @param storage        [ mDeveloper.storageAbs.Storage | None       | in  ] - Storage to write records into instead of the developers directory, it must have addRecords method.
+    #  @param cacheDirectory [ str                           | None       | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param overwrite      [ bool                          | False      | in  ] - Whether to replace existing developers instead of reporting them as errors.
+    #  @param defaults       [ dict                          | None       | in  ] - Developer module attributes as keys and values used for the rows which don't have them as values, such as {'SITE': 'London'}.
+    #  @param batchSize      [ int                           | BATCH_SIZE | in  ] - Number of records written into the storage in one transaction.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory=None, storage=None, cacheDirectory=None, overwrite=False, defaults=None, batchSize=BATCH_SIZE):
+
+        ## [ str ] - Developers directory.
+        self._directory      = directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory()
+
+        ## [ mDeveloper.storageAbs.Storage ] - Storage.
+        self._storage        = storage
+
+        ## [ str ] - Directory of the registry cache file.
+        self._cacheDirectory = cacheDirectory
+
+        ## [ bool ] - Whether to replace existing developers.
+        self._overwrite      = overwrite
+
+        ## [ dict ] - Default values.
+        self._defaults       = dict(defaults) if defaults else {}
+
+        ## [ int ] - Batch size.
+        self._batchSize      = batchSize
+
+    #
+    ## @brief Write given batch of records into the storage.
+    #
+    #  @param batch [ list of tuple | None | in  ] - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _writeBatch(self, batch):
+
+        if batch:
+            self._storage.addRecords(batch)
+            del batch[:]
+
+    #
+    ## @brief Update registry cache of the developers directory once, after developer modules are written into it.
+    #
+    #  Process-wide registry is updated incrementally if it is the registry of the developers directory, or if
+    #  the developers directory is on its search path, so that its indexes are rebuilt once. Pack file is
+    #  compiled again only if there is one.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _updateRegistry(self):
+
+        # Imported on demand, pack files and search paths are optional
+        import mDeveloper.packLib
+        import mDeveloper.layerLib
+
+        instance = mDeveloper.developerLib.DeveloperRegistry._instance
+
+        if isinstance(instance, mDeveloper.layerLib.LayeredRegistry):
+            instance = instance.getRegistry(self._directory)
+
+        if isinstance(instance, mDeveloper.developerLib.DeveloperRegistry) and \
+           os.path.normcase(os.path.abspath(instance.directory())) == os.path.normcase(os.path.abspath(self._directory)):
+            instance.update()
+        else:
+            mDeveloper.developerLib.DeveloperRegistry(directory=self._directory, cacheDirectory=self._cacheDirectory).refresh()
+
+        if self._directory == mDeveloper.developerLib.Developer.getDevelopersDirectory():
+            packPath = mDeveloper.packLib.PackedRegistry.getPackPathOf()
+        else:
+            packPath = mDeveloper.packLib.PackedRegistry.getPackPathOf(self._directory)
+
+        if os.path.isfile(packPath):
+            mDeveloper.packLib.PackedRegistry.write(directory=self._directory, packPath=packPath, cacheDirectory=self._cacheDirectory)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def storage(self):
+
+        return self._storage
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Import given export file.
+    #
+    #  @param filePath   [ str  | None  | in  ] - Path of the export file.
+    #  @param formatName [ str  | None  | in  ] - Format, one of FORMATS, it is detected from the file extension if None given.
+    #  @param dryRun     [ bool | False | in  ] - Whether to validate the rows only, nothing is written.
+    #
+    #  @exception ValueError - If format is not supported or it can't be detected, or CSV export has no user name column.
+    #  @exception IOError    - If export file can't be read.
+    #
+    #  @return int                     - Number of developers imported.
+    #  @return collections.OrderedDict - Line numbers of the rows as keys and exceptions as values of the rows which are not imported.
+    def importFile(self, filePath, formatName=None, dryRun=False):
+
+        formatName = formatName if formatName else DeveloperImporter.getFormatOf(filePath)
+
+        # Rows of CSV files can contain line breaks, which must not be translated
+        with open(filePath, 'r', encoding='utf-8-sig', newline='') as exportFile:
+            return self.importStream(exportFile, formatName, dryRun=dryRun)
+
+    #
+    ## @brief Import given export stream.
+    #
+    #  @param stream     [ file | None  | in  ] - Text stream, such as sys.stdin.
+    #  @param formatName [ str  | None  | in  ] - Format, one of FORMATS.
+    #  @param dryRun     [ bool | False | in  ] - Whether to validate the rows only, nothing is written.
+    #
+    #  @exception ValueError - If format is not supported or CSV export has no user name column.
+    #
+    #  @return int                     - Number of developers imported.
+    #  @return collections.OrderedDict - Line numbers of the rows as keys and exceptions as values of the rows which are not imported.
+    def importStream(self, stream, formatName, dryRun=False):
+
+        if formatName not in FORMATS:
+            raise ValueError('{} is not a supported format, use one of: {}'.format(formatName, ', '.join(FORMATS)))
+
+        rows      = DeveloperImporter.readCSV(stream) if formatName == 'csv' else DeveloperImporter.readLDIF(stream)
+        _stats    = mDeveloper.statsLib.Stats.getInstance()
+        count     = 0
+        errors    = collections.OrderedDict()
+        userNames = set()
+        batch     = []
+
+        with _stats.span('write'):
+
+            for lineNumber, columns, error in rows:
+
+                try:
+                    if error is not None:
+                        raise error
+
+                    attributes = self.getAttributes(columns)
+                    userName   = attributes[mDeveloper.enumLib.DeveloperModuleAttribute.kUserName]
+                    moduleName = DeveloperImporter.getModuleNameOf(userName)
+
+                    mDeveloper.developerLib.Developer.validateDeveloperAttributes(attributes, 'mDeveloper.developers.{}'.format(moduleName))
+
+                    if userName in userNames:
+                        raise ValueError('Developer {} is already imported from an earlier row.'.format(userName))
+
+                    userNames.add(userName)
+
+                    if self._storage is not None:
+
+                        if not self._overwrite and self._storage.hasModule(moduleName):
+                            raise ValueError('Developer module {} already exists.'.format(moduleName))
+
+                        if not dryRun:
+                            batch.append((moduleName, mDeveloper.developerLib.DeveloperRecord.fromAttributes(attributes)))
+
+                            if len(batch) >= self._batchSize:
+                                self._writeBatch(batch)
+
+                    else:
+
+                        filePath = os.path.join(self._directory, '{}.py'.format(moduleName))
+
+                        if not self._overwrite and os.path.isfile(filePath):
+                            raise ValueError('Developer module {} already exists.'.format(moduleName))
+
+                        if not dryRun and not mDeveloper.cacheLib.RegistryCache.writeFileAtomically(filePath, DeveloperImporter.getModuleContent(attributes)):
+                            raise IOError('Developer module could not be written: {}'.format(filePath))
+
+                except Exception as exception:
+                    errors[lineNumber] = exception
+                    continue
+
+                count += 1
+
+            if not dryRun and self._storage is not None:
+                self._writeBatch(batch)
+
+        if not dryRun and count and self._storage is None:
+            with _stats.span('update'):
+                self._updateRegistry()
+
+        _stats.increment('import.row', count + len(errors))
+        _stats.increment('import.error', len(errors))
+
+        return count, errors
+
+    #
+    ## @brief Get developer module attributes of given row.
+    #
+    #  @param columns [ dict | None | in  ] - Lower case column names as keys and values as values.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Developer module attributes, including INFO, which can be validated by mDeveloper.developerLib.Developer.validateDeveloperAttributes.
+    def getAttributes(self, columns):
+
+        attributes = {}
+
+        for attribute, names in COLUMNS.items():
+
+            value = next((columns[x].strip() for x in names if columns.get(x) and columns[x].strip()), '')
+
+            if attribute == mDeveloper.enumLib.DeveloperModuleAttribute.kURL:
+                # labeledURI values are a URI optionally followed by a label
+                value = value.split(' ', 1)[0] if value else value
+
+            attributes[attribute] = value if value else self._defaults.get(attribute, '')
+
+        attributes[mDeveloper.cacheLib.INFO_ATTRIBUTE] = dict(zip(mDeveloper.developerLib.INFO_KEYS,
+                                                                  [attributes[x] for x in COLUMNS.keys()]))
+
+        return attributes
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get format of given export file from its extension.
+    #
+    #  @param filePath [ str | None | in  ] - Path of the export file.
+    #
+    #  @exception ValueError - If format can't be detected.
+    #
+    #  @return str - Format, one of FORMATS.
+    @staticmethod
+    def getFormatOf(filePath):
+
+        formatName = EXTENSIONS.get(os.path.splitext(filePath)[1].lower())
+        if not formatName:
+            raise ValueError('Format of {} could not be detected, use one of: {}'.format(filePath, ', '.join(FORMATS)))
+
+        return formatName
+
+    #
+    ## @brief Get developer module name of given user name.
+    #
+    #  @param userName [ str | None | in  ] - User name.
+    #
+    #  @exception ValueError - If user name can't be a module name.
+    #
+    #  @return str - Developer module name, such as sonerLib.
+    @staticmethod
+    def getModuleNameOf(userName):
+
+        moduleName = '{}{}'.format(userName, mMecoPackage.enumLib.PackagePythonFileSuffix.kLib)
+
+        if not moduleName.isidentifier():
+            raise ValueError('User name {} cannot be used as a developer module name.'.format(userName))
+
+        return moduleName
+
+    #
+    ## @brief Get content of the developer module of given attributes.
+    #
+    #  @param attributes [ dict | None | in  ] - Developer module attributes.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - Content.
+    @staticmethod
+    def getModuleContent(attributes):
+
+        values = dict((x, repr(attributes[y])) for x, y in zip(mDeveloper.developerLib.INFO_KEYS, COLUMNS.keys()))
+
+        content = DEVELOPER_MODULE_TEMPLATE.format(moduleName=DeveloperImporter.getModuleNameOf(attributes[mDeveloper.enumLib.DeveloperModuleAttribute.kUserName]),
+                                                   **values)
+
+        # Developer modules use Windows line endings
+        return content.replace('\n', '\r\n').encode('utf-8')
+
+    #
+    ## @brief Read rows of given CSV stream.
+    #
+    #  First line is the header, column names are case insensitive, see COLUMNS.
+    #
+    #  @param stream [ file | None | in  ] - Text stream.
+    #
+    #  @exception ValueError - If header has no user name column.
+    #
+    #  @return generator - Line number of the row, lower case column names and values as a dict instance, and None.
+    @staticmethod
+    def readCSV(stream):
+
+        reader = csv.reader(stream)
+        header = next(reader, None)
+
+        if not header or not set(x.strip().lower() for x in header).intersection(COLUMNS[mDeveloper.enumLib.DeveloperModuleAttribute.kUserName]):
+            raise ValueError('CSV header has no user name column, use one of: {}'.format(', '.join(COLUMNS[mDeveloper.enumLib.DeveloperModuleAttribute.kUserName])))
+
+        header     = [x.strip().lower() for x in header]
+        lineNumber = reader.line_num + 1
+
+        for row in reader:
+
+            if any(row):
+                yield lineNumber, dict(zip(header, row)), None
+
+            lineNumber = reader.line_num + 1
+
+    #
+    ## @brief Read entries of given LDIF stream, see RFC 2849.
+    #
+    #  Folded lines are unfolded and base64 encoded values are decoded. Only the first value of the attributes
+    #  with more than one value is used and attribute options, such as cn;lang-en, are ignored. Change records
+    #  and values given by URL can't be imported, they are reported as errors of their entries.
+    #
+    #  @param stream [ file | None | in  ] - Text stream.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Line number of the entry, lower case attribute names and values as a dict instance, and exception of the entry or None.
+    @staticmethod
+    def readLDIF(stream):
+
+        lines = []
+        start = None
+
+        for lineNumber, line in enumerate(stream, 1):
+
+            line = line.rstrip('\r\n')
+
+            if line.startswith(' ') and lines:
+                lines[-1] += line[1:]
+                continue
+
+            if line.startswith('#'):
+                continue
+
+            if line.strip():
+                if not lines:
+                    start = lineNumber
+                lines.append(line)
+                continue
+
+            if lines:
+                entry = DeveloperImporter.parseLDIFEntry(lines)
+                if entry:
+                    yield (start,) + entry
+                lines = []
+
+        if lines:
+            entry = DeveloperImporter.parseLDIFEntry(lines)
+            if entry:
+                yield (start,) + entry
+
+    #
+    ## @brief Parse given unfolded lines of an LDIF entry.
+    #
+    #  @param lines [ list of str | None | in  ] - Lines.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Lower case attribute names and values as a dict instance and exception of the entry or None, None if lines are only a version line.
+    @staticmethod
+    def parseLDIFEntry(lines):
+
+        attributes = {}
+
+        for index, line in enumerate(lines):
+
+            name, separator, value = line.partition(':')
+            name = name.split(';', 1)[0].strip().lower()
+
+            if not separator:
+                return attributes, ValueError('Line is not an attribute: {}'.format(line))
+
+            if value.startswith(':'):
+                try:
+                    value = base64.b64decode(value[1:].strip()).decode('utf-8')
+                except (ValueError, UnicodeDecodeError):
+                    return attributes, ValueError('Value of {} is not valid base64 encoded UTF-8.'.format(name))
+            elif value.startswith('<'):
+                return attributes, ValueError('Value of {} is given by URL, which is not supported.'.format(name))
+            else:
+                value = value.strip()
+
+            # Version line can be followed by the first entry without an empty line
+            if index == 0 and name == 'version':
+                continue
+
+            if name == 'changetype':
+                return attributes, ValueError('Change records are not supported.')
+
+            attributes.setdefault(name, value)
+
+        if not attributes:
+            return None
+
+        return attributes, None
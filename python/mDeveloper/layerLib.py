@@ -0,0 +1,596 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/layerLib.py @brief [ FILE   ] - Developer search path module.
+## @package mDeveloper.layerLib    @brief [ MODULE ] - Developer search path module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import heapq
+import threading
+import collections
+
+import mDeveloper.cacheLib
+import mDeveloper.statsLib
+import mDeveloper.searchLib
+import mDeveloper.storageAbs
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class to layer more than one developers directory, such as studio, site and project ones.
+#
+#  Developers directories form a search path, which is ordered from the highest precedence to the lowest one
+#  like PATH, so that a project root listed first overrides a site root, which overrides the studio root.
+#  A developer module shadows the developer modules with the same name in the roots after its own one, even
+#  if it isn't valid, so that a broken override is reported instead of silently falling back. When user
+#  names or e-mail addresses of developer modules with different names collide, the one in the root listed
+#  first is resolved.
+#
+#  Each root is a mDeveloper.developerLib.DeveloperRegistry with its own registry cache, snapshot and index
+#  files, so that changing a root rescans and reindexes that root only. Searches and fuzzy searches are run
+#  against the search and fuzzy index files of each root and the results are merged. Facet index and batch
+#  matcher are built from the records of the roots in memory and they are built again once any root changes.
+class LayeredRegistry(mDeveloper.storageAbs.Storage):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directories    [ list of str | None | in  ] - Developers directories, from the highest precedence to the lowest one, duplicates are ignored.
+    #  @param cacheDirectory [ str         | None | in  ] - Directory of the registry cache files, default one is used if None given.
+    #  @param ttl            [ float       | None | in  ] - Time to live in seconds of each root, see mDeveloper.developerLib.DeveloperRegistry.
+    #
+    #  @exception ValueError - If no directory is given.
+    #
+    #  @return None - None.
+    def __init__(self, directories, cacheDirectory=None, ttl=None):
+
+        directoryList = []
+
+        for directory in directories:
+            directory = os.path.abspath(directory)
+            if os.path.normcase(directory) not in [os.path.normcase(x) for x in directoryList]:
+                directoryList.append(directory)
+
+        if not directoryList:
+            raise ValueError('At least one developers directory is required.')
+
+        ## [ list of mDeveloper.developerLib.DeveloperRegistry ] - Registries of the roots, from the highest precedence to the lowest one.
+        self._registries   = [mDeveloper.developerLib.DeveloperRegistry(directory=x, cacheDirectory=cacheDirectory, ttl=ttl) for x in directoryList]
+
+        ## [ tuple ] - Snapshots of the roots the owners are computed from.
+        self._snapshots    = None
+
+        ## [ dict ] - Developer module names as keys and indexes of the registries which provide them as values.
+        self._owners       = {}
+
+        ## [ threading.Lock ] - Lock of the owners.
+        self._lock         = threading.Lock()
+
+        ## [ mDeveloper.fuzzyLib.FuzzyIndex ] - Fuzzy index, which is built on demand.
+        self._fuzzyIndex   = None
+
+        ## [ mDeveloper.facetLib.FacetIndex ] - Facet index, which is built on demand.
+        self._facetIndex   = None
+
+        ## [ mDeveloper.matcherLib.BatchMatcher ] - Batch matcher, which is built on demand.
+        self._batchMatcher = None
+
+    #
+    ## @brief Get the registries which provide the developer modules.
+    #
+    #  Owners are computed again only if the snapshot of a root has been replaced, indexes built from all the
+    #  roots are reset then.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Developer module names as keys and indexes of the registries which provide them as values.
+    def _getOwners(self):
+
+        snapshots = tuple(x.getSnapshot() for x in self._registries)
+
+        # Snapshots are immutable, identity of each of them tells whether its root has changed
+        if self._snapshots is not None and all(x is y for x, y in zip(snapshots, self._snapshots)):
+            return self._owners
+
+        with self._lock:
+
+            if self._snapshots is None or not all(x is y for x, y in zip(snapshots, self._snapshots)):
+
+                owners = {}
+
+                with mDeveloper.statsLib.Stats.getInstance().span('layer'):
+                    for index, _snapshot in enumerate(snapshots):
+                        for moduleName in _snapshot.moduleNames():
+                            owners.setdefault(moduleName, index)
+
+                self._owners       = owners
+                self._fuzzyIndex   = None
+                self._facetIndex   = None
+                self._batchMatcher = None
+                self._snapshots    = snapshots
+
+        return self._owners
+
+    #
+    ## @brief Get the registry which provides given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRegistry - Registry, None if no root has the developer module.
+    def _getOwner(self, moduleName):
+
+        index = self._getOwners().get(moduleName)
+
+        return None if index is None else self._registries[index]
+
+    #
+    ## @brief Get developer module name of given user name or e-mail address from the first root which resolves it.
+    #
+    #  @param methodName [ str | None | in  ] - Name of the lookup method of the registries, such as getModuleByUserName.
+    #  @param value      [ str | None | in  ] - User name or e-mail address.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if no root resolves given value.
+    def _getModuleBy(self, methodName, value):
+
+        owners = self._getOwners()
+
+        for index, _registry in enumerate(self._registries):
+
+            moduleName = getattr(_registry, methodName)(value)
+
+            # Developer modules shadowed by a root listed before can't be resolved
+            if moduleName is not None and owners.get(moduleName) == index:
+                return moduleName
+
+        return None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def directories(self):
+
+        return [x.directory() for x in self._registries]
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def registries(self):
+
+        return list(self._registries)
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get registry of given developers directory.
+    #
+    #  @param directory [ str | None | in  ] - Developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRegistry - Registry, None if given directory is not on the search path.
+    def getRegistry(self, directory):
+
+        directory = os.path.normcase(os.path.abspath(directory))
+
+        for _registry in self._registries:
+            if os.path.normcase(_registry.directory()) == directory:
+                return _registry
+
+        return None
+
+    #
+    ## @brief Get developers directory which provides given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the developers directory, None if no root has the developer module.
+    def getDirectoryOf(self, moduleName):
+
+        _registry = self._getOwner(moduleName)
+
+        return None if _registry is None else _registry.directory()
+
+    #
+    ## @brief Refresh every root, see mDeveloper.developerLib.DeveloperRegistry.refresh.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether any developers directory has changed.
+    def refresh(self, workers=None, processes=False):
+
+        # Every root is refreshed, not only the ones before the first changed root
+        return any([x.refresh(workers=workers, processes=processes) for x in self._registries])
+
+    #
+    ## @brief Apply changes of every root incrementally, see mDeveloper.developerLib.DeveloperRegistry.update.
+    #
+    #  Changes of the developer modules shadowed by a root listed before are not reported, developer modules
+    #  which are provided by another root after the update are reported as modified.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names which have been added.
+    #  @return list of str - Developer module names which have been modified.
+    #  @return list of str - Developer module names which have been removed.
+    def update(self):
+
+        previousOwners = dict(self._getOwners())
+        changes        = [x.update() for x in self._registries]
+        owners         = self._getOwners()
+
+        added    = []
+        modified = []
+        removed  = []
+
+        for moduleName in sorted(set(x for change in changes for names in change for x in names)):
+
+            if moduleName not in owners:
+                if moduleName in previousOwners:
+                    removed.append(moduleName)
+            elif moduleName not in previousOwners:
+                added.append(moduleName)
+            elif owners[moduleName] != previousOwners[moduleName] or any(moduleName in x for x in changes[owners[moduleName]]):
+                # Developer module of the root which provides it has changed, or it is provided by another root now
+                modified.append(moduleName)
+
+        return added, modified, removed
+
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names, sorted.
+    def listModules(self):
+
+        return sorted(self._getOwners().keys())
+
+    #
+    ## @brief Check whether developer module with given name exists in any root.
+    #
+    #  Roots are checked for changes if the developer module isn't found, see mDeveloper.developerLib.DeveloperRegistry.hasModule.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasModule(self, moduleName):
+
+        if moduleName in self._getOwners():
+            return True
+
+        return any([x.hasModule(moduleName) for x in self._registries])
+
+    #
+    ## @brief Get record of given developer module from the root which provides it.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if developer module doesn't exist or it is not valid.
+    def getRecord(self, moduleName):
+
+        _registry = self._getOwner(moduleName)
+
+        return None if _registry is None else _registry.getRecord(moduleName)
+
+    #
+    ## @brief Get validated record of given developer module from the root which provides it.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception ImportError - If developer module doesn't exist.
+    #  @exception Exception   - Validation error of the developer module.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getValidatedRecord(self, moduleName):
+
+        _registry = self._getOwner(moduleName)
+
+        if _registry is None:
+            raise ImportError('Developer module {} does not exist in any of: {}'.format(moduleName, os.pathsep.join(self.directories())))
+
+        return _registry.getValidatedRecord(moduleName)
+
+    #
+    ## @brief Load and validate the developer modules of every root.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Developer module names as keys and mDeveloper.developerLib.DeveloperRecord instances as values, sorted by module name.
+    #  @return collections.OrderedDict - Developer module names as keys and exceptions raised by validation as values, sorted by module name.
+    def loadRecords(self, workers=None, processes=False):
+
+        results = [x.loadRecords(workers=workers, processes=processes) for x in self._registries]
+        owners  = self._getOwners()
+
+        records = collections.OrderedDict()
+        errors  = collections.OrderedDict()
+
+        for moduleName in sorted(owners.keys()):
+
+            _records, _errors = results[owners[moduleName]]
+
+            if moduleName in _records:
+                records[moduleName] = _records[moduleName]
+            elif moduleName in _errors:
+                errors[moduleName] = _errors[moduleName]
+
+        return records, errors
+
+    #
+    ## @brief Iterate over the validated records of every root lazily.
+    #
+    #  Records of the roots are merged in the order of developer module names. Roots which haven't been loaded
+    #  are read one by one as the generator is consumed, see mDeveloper.developerLib.DeveloperRegistry.iterRecords,
+    #  only the names of the developer modules are listed up front to know which ones are shadowed.
+    #
+    #  @param errors [ dict | None | out ] - Developer module names as keys and validation exceptions as values are stored in given dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs, sorted by developer module name.
+    def iterRecords(self, errors=None):
+
+        shadowed  = set()
+        iterators = []
+
+        for index, _registry in enumerate(self._registries):
+
+            iterators.append(LayeredRegistry.iterRootRecords(_registry, index, frozenset(shadowed), errors))
+
+            if _registry.isLoaded():
+                shadowed.update(_registry.listModules())
+            else:
+                try:
+                    shadowed.update(os.path.splitext(x)[0] for x in os.listdir(_registry.directory()) if mDeveloper.cacheLib.RegistryCache.isDeveloperModuleFileName(x))
+                except OSError:
+                    pass
+
+        for moduleName, index, record in heapq.merge(*iterators, key=lambda x: (x[0], x[1])):
+            yield moduleName, record
+
+    #
+    ## @brief Get developer module name of given user name, the root listed first wins if user names collide.
+    #
+    #  @param userName [ str | None | in  ] - Value of USERNAME attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given user name.
+    def getModuleByUserName(self, userName):
+
+        return self._getModuleBy('getModuleByUserName', userName)
+
+    #
+    ## @brief Get developer module name of given e-mail address, the root listed first wins if e-mail addresses collide.
+    #
+    #  @param email [ str | None | in  ] - Value of EMAIL attribute of the developer, case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given e-mail address.
+    def getModuleByEmail(self, email):
+
+        return self._getModuleBy('getModuleByEmail', email)
+
+    #
+    ## @brief Search developer records by using the search index of each root, see mDeveloper.searchLib.SearchIndex.search.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        owners = self._getOwners()
+        scores = {}
+
+        for index, _registry in enumerate(self._registries):
+            for moduleName, score in _registry.search(keyword, fields=fields):
+                if owners.get(moduleName) == index:
+                    scores[moduleName] = score
+
+        return mDeveloper.searchLib.SearchIndex.rankResults(scores, limit)
+
+    #
+    ## @brief Search developer records by edit distance, see mDeveloper.fuzzyLib.FuzzyIndex.search.
+    #
+    #  Fuzzy index of each root is loaded from its index file, see mDeveloper.developerLib.DeveloperRegistry.getFuzzyIndex,
+    #  and results of the developer modules which are not provided by the root are dropped.
+    #
+    #  @param keyword     [ str | None | in  ] - Keyword.
+    #  @param maxDistance [ int | None | in  ] - Maximum edit distance, mDeveloper.fuzzyLib.DEFAULT_MAX_DISTANCE is used if None given.
+    #  @param limit       [ int | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Developer module name and distance pairs, sorted by distance and module name in ascending order.
+    def fuzzySearch(self, keyword, maxDistance=None, limit=None):
+
+        owners    = self._getOwners()
+        distances = {}
+
+        for index, _registry in enumerate(self._registries):
+            for moduleName, distance in _registry.fuzzySearch(keyword, maxDistance=maxDistance):
+                if owners.get(moduleName) == index:
+                    distances[moduleName] = distance
+
+        results = sorted(distances.items(), key=lambda x: (x[1], x[0]))
+
+        return results if limit is None else results[:limit]
+
+    #
+    ## @brief Get fuzzy index of the records of all roots, it is built again once any root changes.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Fuzzy index.
+    def getFuzzyIndex(self):
+
+        self._getOwners()
+
+        return mDeveloper.storageAbs.Storage.getFuzzyIndex(self)
+
+    #
+    ## @brief Get facet index of the records of all roots, it is built again once any root changes.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.facetLib.FacetIndex - Facet index.
+    def getFacetIndex(self):
+
+        self._getOwners()
+
+        return mDeveloper.storageAbs.Storage.getFacetIndex(self)
+
+    #
+    ## @brief Get batch matcher of the records of all roots, it is built again once any root changes.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #
+    #  @return mDeveloper.matcherLib.BatchMatcher - Batch matcher.
+    def getBatchMatcher(self):
+
+        self._getOwners()
+
+        return mDeveloper.storageAbs.Storage.getBatchMatcher(self)
+
+    #
+    ## @brief Check whether every root has been loaded.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isLoaded(self):
+
+        return all(x.isLoaded() for x in self._registries)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Iterate over the validated records of given root which are not shadowed.
+    #
+    #  @param registry [ mDeveloper.developerLib.DeveloperRegistry | None | in  ] - Registry of the root.
+    #  @param index    [ int                                       | None | in  ] - Index of the root in the search path.
+    #  @param shadowed [ frozenset of str                          | None | in  ] - Developer module names of the roots listed before.
+    #  @param errors   [ dict                                      | None | out ] - Developer module names as keys and validation exceptions as values are stored in given dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name, index of the root and mDeveloper.developerLib.DeveloperRecord.
+    @staticmethod
+    def iterRootRecords(registry, index, shadowed, errors=None):
+
+        _errors = {}
+
+        for moduleName, record in registry.iterRecords(errors=_errors):
+
+            if _errors:
+                LayeredRegistry.moveErrors(_errors, shadowed, errors)
+
+            if moduleName not in shadowed:
+                yield moduleName, index, record
+
+        LayeredRegistry.moveErrors(_errors, shadowed, errors)
+
+    #
+    ## @brief Move given errors of a root into given errors, except the ones of the shadowed developer modules.
+    #
+    #  @param rootErrors [ dict             | None | in  ] - Errors of the root, it is cleared.
+    #  @param shadowed   [ frozenset of str | None | in  ] - Developer module names of the roots listed before.
+    #  @param errors     [ dict             | None | out ] - Errors, nothing is stored if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def moveErrors(rootErrors, shadowed, errors):
+
+        if errors is not None:
+            for moduleName, error in rootErrors.items():
+                if moduleName not in shadowed:
+                    errors.setdefault(moduleName, error)
+
+        rootErrors.clear()
+
+    #
+    ## @brief Get developers search path from MDEVELOPER_PATH environment variable.
+    #
+    #  Value is a list of developers directories separated by os.pathsep, from the highest precedence to the
+    #  lowest one, such as /project/developers:/site/developers:/studio/developers.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the developers directories, empty if environment variable is not set.
+    @staticmethod
+    def getSearchPath():
+
+        value = os.environ.get(mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE, '')
+
+        return [os.path.abspath(x) for x in value.split(os.pathsep) if x.strip()]
@@ -0,0 +1,364 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/matcherLib.py @brief [ FILE   ] - Developer batch matching module.
+## @package mDeveloper.matcherLib    @brief [ MODULE ] - Developer batch matching module.
+#
+#  NumPy is optional, it is needed only to match in batches, see BatchMatcher.isAvailable.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mDeveloper.enumLib
+import mDeveloper.fuzzyLib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Developer module attributes, which are matched by default.
+FIELDS = [mDeveloper.enumLib.DeveloperModuleAttribute.kUserName,
+          mDeveloper.enumLib.DeveloperModuleAttribute.kName,
+          mDeveloper.enumLib.DeveloperModuleAttribute.kEmail]
+
+#
+## @brief [ CLASS ] - Class to match many queries against developer records at once.
+#
+#  Values of each field are normalized, see mDeveloper.fuzzyLib.FuzzyIndex.normalize, encoded as UTF-8 and
+#  kept sorted in a fixed-width byte array, together with the ids of their records. All queries are looked up
+#  with a single numpy.searchsorted call per field, which gives the range of the sorted values matching each
+#  query. Upper bound of a prefix query is the query followed by 0xFF, which never occurs in UTF-8, so that
+#  the range covers every value starting with the query.
+#
+#  Values are matched as a whole, so that a prefix query matches the beginning of a user name, a full name
+#  or an e-mail address. Empty queries match nothing.
+class BatchMatcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param records [ iterable of tuple | None | in  ] - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs.
+    #  @param fields  [ list of str       | None | in  ] - Developer module attributes to match, FIELDS are used if None given.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #
+    #  @return None - None.
+    def __init__(self, records, fields=None):
+
+        if not BatchMatcher.isAvailable():
+            raise ImportError('NumPy is required to match developers in batches.')
+
+        ## [ list of str ] - Fields.
+        self._fields      = list(fields) if fields else list(FIELDS)
+
+        ## [ list of str ] - Developer module names, index of a module name is the id of its record.
+        self._moduleNames = []
+
+        ## [ dict ] - Fields as keys and sorted fixed-width byte arrays of the normalized values as values.
+        self._values      = {}
+
+        ## [ dict ] - Fields as keys and arrays of the record ids of the sorted values as values.
+        self._recordIds   = {}
+
+        columns = dict((x, []) for x in self._fields)
+
+        for moduleName, record in records:
+
+            self._moduleNames.append(moduleName)
+
+            for field in self._fields:
+                columns[field].append(mDeveloper.fuzzyLib.FuzzyIndex.normalize(record.get(field)).encode('utf-8'))
+
+        for field, column in columns.items():
+
+            # One more byte than the longest value, so that upper bounds of the prefix queries fit
+            values = numpy.array(column, dtype='S{}'.format(max([len(x) for x in column] + [0]) + 1))
+            order  = numpy.argsort(values, kind='stable')
+
+            self._values[field]    = values[order]
+            self._recordIds[field] = order.astype(numpy.int64)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def fields(self):
+
+        return self._fields
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def moduleNames(self):
+
+        return self._moduleNames
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Match given queries.
+    #
+    #  @param queries [ list of str | None  | in  ] - Queries, they are normalized the same way as the values.
+    #  @param exact   [ bool        | False | in  ] - Whether values must be equal to the queries instead of starting with them.
+    #  @param fields  [ list of str | None  | in  ] - Fields to match, all fields of the matcher are matched if None given.
+    #
+    #  @exception ValueError - If a field is not one of the fields of the matcher.
+    #
+    #  @return mDeveloper.matcherLib.MatchResult - Result.
+    def match(self, queries, exact=False, fields=None):
+
+        fields = fields if fields else self._fields
+
+        for field in fields:
+            if field not in self._fields:
+                raise ValueError('{} is not matched, use one of: {}'.format(field, ', '.join(self._fields)))
+
+        encoded = [mDeveloper.fuzzyLib.FuzzyIndex.normalize(x).encode('utf-8') for x in queries]
+        lengths = numpy.array([len(x) for x in encoded], dtype=numpy.int64)
+
+        lower = numpy.zeros((len(encoded), len(fields)), dtype=numpy.int64)
+        upper = numpy.zeros((len(encoded), len(fields)), dtype=numpy.int64)
+
+        for column, field in enumerate(fields):
+
+            values = self._values[field]
+
+            # Queries longer than the values are truncated by the cast, they can't match anything
+            valid = (lengths > 0) & (lengths < values.dtype.itemsize)
+
+            queryArray = numpy.array(encoded, dtype=values.dtype)
+
+            lower[:, column] = numpy.searchsorted(values, queryArray, side='left')
+
+            if exact:
+                upper[:, column] = numpy.searchsorted(values, queryArray, side='right')
+            else:
+                upper[:, column] = numpy.searchsorted(values, numpy.array([x + b'\xff' for x in encoded], dtype=values.dtype), side='left')
+
+            upper[:, column] = numpy.where(valid, upper[:, column], lower[:, column])
+
+        return MatchResult(self, queries, fields, lower, upper)
+
+    #
+    ## @brief Get ids of the records of given range of the sorted values of given field.
+    #
+    #  @param field [ str     | None | in  ] - Field.
+    #  @param start [ ndarray | None | in  ] - Start positions of the ranges.
+    #  @param stop  [ ndarray | None | in  ] - Stop positions of the ranges.
+    #
+    #  @exception N/A
+    #
+    #  @return ndarray - Indexes of the ranges and record ids, all ranges are concatenated.
+    def getRecordIds(self, field, start, stop):
+
+        lengths = stop - start
+        offsets = numpy.cumsum(lengths) - lengths
+
+        rangeIndexes = numpy.repeat(numpy.arange(len(lengths)), lengths)
+        positions    = numpy.arange(lengths.sum()) - numpy.repeat(offsets, lengths) + numpy.repeat(start, lengths)
+
+        return rangeIndexes, self._recordIds[field][positions]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether NumPy is installed.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def isAvailable():
+
+        return numpy is not None
+
+#
+## @brief [ CLASS ] - Class to hold result of a mDeveloper.matcherLib.BatchMatcher.match call.
+#
+#  Result is kept as the ranges of the sorted values matching each query, records are looked up only when
+#  the pairs, the matrix or the developer module names are requested.
+class MatchResult(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param matcher [ mDeveloper.matcherLib.BatchMatcher | None | in  ] - Matcher.
+    #  @param queries [ list of str                        | None | in  ] - Queries.
+    #  @param fields  [ list of str                        | None | in  ] - Matched fields.
+    #  @param lower   [ ndarray                            | None | in  ] - Start positions of the ranges, one row per query and one column per field.
+    #  @param upper   [ ndarray                            | None | in  ] - Stop positions of the ranges, one row per query and one column per field.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, matcher, queries, fields, lower, upper):
+
+        ## [ mDeveloper.matcherLib.BatchMatcher ] - Matcher.
+        self._matcher = matcher
+
+        ## [ list of str ] - Queries.
+        self._queries = queries
+
+        ## [ list of str ] - Matched fields.
+        self._fields  = fields
+
+        ## [ ndarray ] - Start positions of the ranges.
+        self._lower   = lower
+
+        ## [ ndarray ] - Stop positions of the ranges.
+        self._upper   = upper
+
+        ## [ tuple ] - Query indexes and record ids of the matches, which are computed on demand.
+        self._pairs   = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def queries(self):
+
+        return self._queries
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def fields(self):
+
+        return self._fields
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get number of matching values.
+    #
+    #  @exception N/A
+    #
+    #  @return ndarray - Counts, one row per query and one column per field.
+    def getCounts(self):
+
+        return self._upper - self._lower
+
+    #
+    ## @brief Get matches as pairs, a record is paired with a query once even if more than one of its fields match.
+    #
+    #  @exception N/A
+    #
+    #  @return ndarray - Query indexes.
+    #  @return ndarray - Record ids, see mDeveloper.matcherLib.BatchMatcher.moduleNames, sorted for each query.
+    def getPairs(self):
+
+        if self._pairs is None:
+
+            queryIndexList = []
+            recordIdList   = []
+
+            for column, field in enumerate(self._fields):
+                queryIndexes, recordIds = self._matcher.getRecordIds(field, self._lower[:, column], self._upper[:, column])
+                queryIndexList.append(queryIndexes)
+                recordIdList.append(recordIds)
+
+            recordCount = max(len(self._matcher.moduleNames()), 1)
+            keys        = numpy.unique(numpy.concatenate(queryIndexList) * recordCount + numpy.concatenate(recordIdList))
+
+            self._pairs = (keys // recordCount, keys % recordCount)
+
+        return self._pairs
+
+    #
+    ## @brief Get matches as a matrix.
+    #
+    #  @exception N/A
+    #
+    #  @return ndarray - Boolean matrix, one row per query and one column per record, see mDeveloper.matcherLib.BatchMatcher.moduleNames.
+    def getMatrix(self):
+
+        queryIndexes, recordIds = self.getPairs()
+
+        matrix = numpy.zeros((len(self._queries), len(self._matcher.moduleNames())), dtype=bool)
+        matrix[queryIndexes, recordIds] = True
+
+        return matrix
+
+    #
+    ## @brief Get developer module names matching each query.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Developer module names of each query, in the order of the queries.
+    def getModuleNames(self):
+
+        queryIndexes, recordIds = self.getPairs()
+
+        moduleNames = self._matcher.moduleNames()
+        result      = [[] for _ in self._queries]
+
+        for queryIndex, recordId in zip(queryIndexes.tolist(), recordIds.tolist()):
+            result[queryIndex].append(moduleNames[recordId])
+
+        return result
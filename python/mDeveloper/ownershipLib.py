@@ -0,0 +1,380 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/ownershipLib.py @brief [ FILE   ] - Package ownership module.
+## @package mDeveloper.ownershipLib    @brief [ MODULE ] - Package ownership module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import hashlib
+
+import mDeveloper.cacheLib
+import mDeveloper.readerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the ownership cache file format, cache files with a different version are ignored.
+OWNERSHIP_VERSION                  = 1
+
+## [ str ] - Environment variable to provide the package roots, paths are separated by os.pathsep.
+PACKAGE_ROOTS_ENVIRONMENT_VARIABLE = 'MDEVELOPER_PACKAGE_ROOTS'
+
+## [ str ] - Name of the package info module file.
+PACKAGE_INFO_FILE                  = 'packageInfoLib.py'
+
+## [ str ] - Name of the Python directory of the packages.
+PYTHON_DIRECTORY                   = 'python'
+
+## [ str ] - Package info attribute which contains name of the package.
+NAME_ATTRIBUTE                     = 'NAME'
+
+## [ str ] - Package info attribute which contains e-mail addresses of the developers of the package.
+DEVELOPERS_ATTRIBUTE               = 'DEVELOPERS'
+
+#
+## @brief [ CLASS ] - Class to index which developers own which packages.
+#
+#  Package info modules, PYTHON_DIRECTORY/<package>/packageInfoLib.py, of the packages in the package roots
+#  are read statically. A package root is either a package or a directory which contains packages.
+#  Package info of each package is cached with the modification time and size of its file, so that only the
+#  changed ones are read again when the index is updated.
+class OwnershipIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packageRoots   [ list of str | None | in  ] - Package roots, default ones are used if None given, see getDefaultPackageRoots method.
+    #  @param cacheDirectory [ str         | None | in  ] - Directory of the cache file, default cache directory is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, packageRoots=None, cacheDirectory=None):
+
+        packageRoots = [os.path.abspath(x) for x in (packageRoots if packageRoots else OwnershipIndex.getDefaultPackageRoots())]
+
+        cacheDirectory = cacheDirectory if cacheDirectory else mDeveloper.cacheLib.RegistryCache.getDefaultCacheDirectory()
+        cacheName      = hashlib.sha1(os.pathsep.join(packageRoots).encode('utf-8')).hexdigest()[:16]
+
+        ## [ list of str ] - Package roots.
+        self._packageRoots = packageRoots
+
+        ## [ str ] - Cache file.
+        self._cacheFile    = os.path.join(cacheDirectory, 'ownership-{}.json'.format(cacheName))
+
+        ## [ dict ] - Package info file paths as keys and dict instances with mtime, size, name and developers keys as values.
+        self._files        = None
+
+        ## [ dict ] - Package names as keys and sorted list of developers as values.
+        self._packages     = {}
+
+        ## [ dict ] - Lower case developers as keys and sorted list of package names as values.
+        self._developers   = {}
+
+        ## [ int ] - Number of the package info files read during the last update.
+        self._readCount    = 0
+
+    #
+    ## @brief Read the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Package info file paths as keys and dict instances with mtime, size, name and developers keys as values.
+    def _read(self):
+
+        try:
+            with open(self._cacheFile, 'r') as cacheFile:
+                data = json.load(cacheFile)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != OWNERSHIP_VERSION or data.get('packageRoots') != self._packageRoots:
+            return {}
+
+        return data.get('files', {})
+
+    #
+    ## @brief Build package and developer mappings from the package info files.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _build(self):
+
+        packages   = {}
+        developers = {}
+
+        for filePath in sorted(self._files.keys()):
+
+            entry = self._files[filePath]
+
+            # First package found in the package roots wins if a package exists in more than one of them
+            if not entry['name'] or entry['name'] in packages:
+                continue
+
+            packages[entry['name']] = sorted(set(entry['developers']))
+
+            for developer in packages[entry['name']]:
+                developers.setdefault(developer.lower(), []).append(entry['name'])
+
+        for packageNameList in developers.values():
+            packageNameList.sort()
+
+        self._packages   = packages
+        self._developers = developers
+
+    #
+    ## @brief Update the index if it hasn't been updated yet.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _ensureUpdated(self):
+
+        if self._files is None:
+            self.update()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def packageRoots(self):
+
+        return self._packageRoots
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def readCount(self):
+
+        return self._readCount
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Update the index, only the package info files which have changed are read.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether any package info file has been added, changed or removed.
+    def update(self):
+
+        previousFiles = self._read() if self._files is None else self._files
+
+        files = {}
+
+        self._readCount = 0
+
+        for filePath, (mTime, size) in OwnershipIndex.findPackageInfoFiles(self._packageRoots).items():
+
+            entry = previousFiles.get(filePath)
+
+            if not entry or entry['mtime'] != mTime or entry['size'] != size:
+
+                self._readCount += 1
+
+                name, developers = OwnershipIndex.readPackageInfo(filePath)
+
+                entry = {'mtime':mTime, 'size':size, 'name':name, 'developers':developers}
+
+            files[filePath] = entry
+
+        changed = files != previousFiles
+
+        if changed:
+            content = json.dumps({'version'      : OWNERSHIP_VERSION,
+                                  'packageRoots' : self._packageRoots,
+                                  'files'        : files}, sort_keys=True).encode('utf-8')
+
+            mDeveloper.cacheLib.RegistryCache.writeFileAtomically(self._cacheFile, content)
+
+        if changed or self._files is None:
+            self._files = files
+            self._build()
+
+        return changed
+
+    #
+    ## @brief List names of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Package names, sorted.
+    def listPackages(self):
+
+        self._ensureUpdated()
+
+        return sorted(self._packages.keys())
+
+    #
+    ## @brief Get developers of given package.
+    #
+    #  @param packageName [ str | None | in  ] - Name of the package, such as mDeveloper.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developers, e-mail addresses in general, sorted. None if package doesn't exist.
+    def getDevelopers(self, packageName):
+
+        self._ensureUpdated()
+
+        developers = self._packages.get(packageName)
+
+        return list(developers) if developers is not None else None
+
+    #
+    ## @brief Get packages of given developer.
+    #
+    #  @param developer [ str | None | in  ] - Developer as it is in DEVELOPERS attribute of the package info modules, e-mail address in general. Case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Package names, sorted.
+    def getPackages(self, developer):
+
+        self._ensureUpdated()
+
+        return list(self._developers.get(developer.lower(), []))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get default package roots.
+    #
+    #  Package roots are taken from PACKAGE_ROOTS_ENVIRONMENT_VARIABLE environment variable if it is set,
+    #  otherwise the directory which contains this package is used.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Package roots.
+    @staticmethod
+    def getDefaultPackageRoots():
+
+        packageRoots = os.environ.get(PACKAGE_ROOTS_ENVIRONMENT_VARIABLE)
+        if packageRoots:
+            return [x for x in packageRoots.split(os.pathsep) if x]
+
+        # <root>/<package>/python/mDeveloper/ownershipLib.py
+        return [os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))]
+
+    #
+    ## @brief Find package info files in given package roots.
+    #
+    #  @param packageRoots [ list of str | None | in  ] - Package roots.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Package info file paths as keys, list of modification time in nanoseconds and size as values.
+    @staticmethod
+    def findPackageInfoFiles(packageRoots):
+
+        files = {}
+
+        for packageRoot in packageRoots:
+
+            packageDirectoryList = [packageRoot]
+
+            try:
+                with os.scandir(packageRoot) as entries:
+                    packageDirectoryList.extend(x.path for x in entries if x.is_dir() and not x.name.startswith('.'))
+            except OSError:
+                continue
+
+            for packageDirectory in packageDirectoryList:
+
+                pythonDirectory = os.path.join(packageDirectory, PYTHON_DIRECTORY)
+
+                try:
+                    with os.scandir(pythonDirectory) as entries:
+                        pythonPackageList = [x.path for x in entries if x.is_dir()]
+                except OSError:
+                    continue
+
+                for pythonPackage in pythonPackageList:
+
+                    filePath = os.path.join(pythonPackage, PACKAGE_INFO_FILE)
+
+                    try:
+                        stat = os.stat(filePath)
+                    except OSError:
+                        continue
+
+                    files[filePath] = [stat.st_mtime_ns, stat.st_size]
+
+        return files
+
+    #
+    ## @brief Read given package info file statically.
+    #
+    #  Statements which can't be read statically are ignored.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the package info file.
+    #
+    #  @exception N/A
+    #
+    #  @return str         - Name of the package, name of the Python package is used if NAME attribute doesn't exist. None if file can't be read.
+    #  @return list of str - Developers.
+    @staticmethod
+    def readPackageInfo(filePath):
+
+        try:
+            with open(filePath, 'rb') as packageInfoFile:
+                constants = mDeveloper.readerLib.DeveloperModuleReader.readConstants(packageInfoFile.read(), filePath, strict=False)
+        except (IOError, OSError, SyntaxError, ValueError):
+            return None, []
+
+        name = constants.get(NAME_ATTRIBUTE)
+        if not isinstance(name, str) or not name:
+            name = os.path.basename(os.path.dirname(filePath))
+
+        developers = constants.get(DEVELOPERS_ATTRIBUTE)
+        if not isinstance(developers, (list, tuple)):
+            developers = []
+
+        return name, [x for x in developers if isinstance(x, str) and x]
@@ -0,0 +1,659 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/packLib.py @brief [ FILE   ] - Packed developer registry module.
+## @package mDeveloper.packLib    @brief [ MODULE ] - Packed developer registry module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import mmap
+import struct
+import collections
+
+import mDeveloper.fuzzyLib
+import mDeveloper.cacheLib
+import mDeveloper.statsLib
+import mDeveloper.searchLib
+import mDeveloper.storageAbs
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ bytes ] - Magic bytes at the beginning of pack files.
+PACK_MAGIC                = b'MDEVPACK'
+
+## [ int ] - Version of the pack file format, pack files with a different version are ignored.
+PACK_VERSION              = 4
+
+## [ str ] - Environment variable to override the pack file of the default developers directory.
+PACK_ENVIRONMENT_VARIABLE = 'MDEVELOPER_PACK_PATH'
+
+## [ struct.Struct ] - Header, magic, version, record count, stamp of the developers directory, see mDeveloper.cacheLib.RegistryCache.getDirectoryStamp,
+#  offsets of the record table, user name table, e-mail table and string blob, and offsets and lengths of the search and fuzzy indexes.
+HEADER                    = struct.Struct('<8sII40sQQQQQQQQ')
+
+## [ struct.Struct ] - Record, offset and length of each string in RECORD_STRINGS order, offsets are relative to the string blob.
+RECORD                    = struct.Struct('<16I')
+
+## [ struct.Struct ] - Entry of the user name and e-mail tables, a record index.
+INDEX_ENTRY               = struct.Struct('<I')
+
+## [ list of str ] - Strings of a record, developer module name, mDeveloper.developerLib.RECORD_ATTRIBUTES and lower case e-mail address.
+RECORD_STRINGS            = ['moduleName'] + list(mDeveloper.developerLib.DeveloperRecord._fields) + ['emailKey']
+
+#
+## @brief [ CLASS ] - Class to look developers up in a pack file, which is a developers directory compiled into one binary file.
+#
+#  Pack file is read through mmap and lookups are answered by binary search, records are decoded on demand.
+#
+#  - Header, see HEADER.
+#  - Record table, one RECORD per developer sorted by developer module name.
+#  - User name table, record indexes sorted by user name and developer module name.
+#  - E-mail table, record indexes sorted by lower case e-mail address and developer module name.
+#  - String blob, UTF-8 encoded strings of the records.
+#  - Search index, see mDeveloper.searchLib.SearchIndex.toBytes, record indexes are its record ids.
+#  - Fuzzy index, see mDeveloper.fuzzyLib.FuzzyIndex.toBytes.
+#
+#  Strings are compared as UTF-8 bytes, which sort the same as Python strings. Pack files are written by
+#  write method, see mdeveloper-pack command, and they are stale once a developer module is added, removed
+#  or renamed, which is found out by the stamp of the developers directory, see load method. Checking the stamp
+#  costs a single stat, therefore pack files must be written again once a developer module is edited in place.
+class PackedRegistry(mDeveloper.storageAbs.Storage):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packPath [ str                | None | in  ] - Absolute path of the pack file, or name of given buffer.
+    #  @param buffer   [ bytes-like object  | None | in  ] - Content of a pack file, such as shared memory, pack file is mapped if None given.
+    #
+    #  @exception OSError    - If pack file couldn't be read.
+    #  @exception ValueError - If content is not a pack file or its version is not supported.
+    #
+    #  @return None - None.
+    def __init__(self, packPath, buffer=None):
+
+        if buffer is None:
+            with open(packPath, 'rb') as packFile:
+                _mmap = mmap.mmap(packFile.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            _mmap = None
+
+        content = buffer if _mmap is None else _mmap
+
+        if len(content) < HEADER.size:
+            if _mmap is not None:
+                _mmap.close()
+            raise ValueError('{} is not a pack file.'.format(packPath))
+
+        (magic, version, recordCount, stamp, recordTable, userNameTable, emailTable, blob,
+         searchIndex, searchIndexSize, fuzzyIndex, fuzzyIndexSize) = HEADER.unpack_from(content, 0)
+
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            if _mmap is not None:
+                _mmap.close()
+            raise ValueError('{} is not a pack file of version {}.'.format(packPath, PACK_VERSION))
+
+        ## [ str ] - Absolute path of the pack file.
+        self._packPath       = packPath
+
+        ## [ mmap.mmap ] - Mapped pack file, None if a buffer is given.
+        self._mmap           = _mmap
+
+        ## [ bytes-like object ] - Content of the pack file.
+        self._buffer         = content
+
+        ## [ int ] - Number of the records.
+        self._recordCount    = recordCount
+
+        ## [ str ] - Stamp of the developers directory the pack file is written from.
+        self._stamp          = stamp.decode('ascii', 'ignore')
+
+        ## [ int ] - Offset of the record table.
+        self._recordTable    = recordTable
+
+        ## [ int ] - Offset of the user name table.
+        self._userNameTable  = userNameTable
+
+        ## [ int ] - Offset of the e-mail table.
+        self._emailTable     = emailTable
+
+        ## [ int ] - Offset of the string blob.
+        self._blob           = blob
+
+        ## [ int ] - Offset of the search index.
+        self._indexOffset    = searchIndex
+
+        ## [ int ] - Size of the search index, 0 if records are searched by scanning the pack file.
+        self._indexSize      = searchIndexSize
+
+        ## [ int ] - Offset of the fuzzy index.
+        self._fuzzyOffset    = fuzzyIndex
+
+        ## [ int ] - Size of the fuzzy index, 0 if fuzzy index is built from the records.
+        self._fuzzySize      = fuzzyIndexSize
+
+        ## [ mDeveloper.searchLib.SearchIndex ] - Search index, which is loaded on demand.
+        self._searchIndex    = None
+
+        ## [ mDeveloper.fuzzyLib.FuzzyIndex ] - Fuzzy index, which is loaded on demand.
+        self._fuzzyIndex     = None
+
+        ## [ mDeveloper.facetLib.FacetIndex ] - Facet index, which is created on demand.
+        self._facetIndex     = None
+
+        ## [ mDeveloper.matcherLib.BatchMatcher ] - Batch matcher, which is created on demand.
+        self._batchMatcher   = None
+
+    #
+    ## @brief Get encoded string of given record.
+    #
+    #  @param recordIndex [ int | None | in  ] - Record index.
+    #  @param stringIndex [ int | None | in  ] - Index of the string in RECORD_STRINGS.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - UTF-8 encoded string.
+    def _getBytes(self, recordIndex, stringIndex):
+
+        offset, length = struct.unpack_from('<II', self._buffer, self._recordTable + recordIndex * RECORD.size + stringIndex * 8)
+        offset        += self._blob
+
+        # Slices of a mmap are bytes already, slices of other buffers, such as shared memory, are copied into bytes
+        return bytes(self._buffer[offset:offset + length])
+
+    #
+    ## @brief Get record of given record index.
+    #
+    #  @param recordIndex [ int | None | in  ] - Record index.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def _getRecord(self, recordIndex):
+
+        return mDeveloper.developerLib.DeveloperRecord(*[self._getBytes(recordIndex, x).decode('utf-8') for x in range(1, 7)])
+
+    #
+    ## @brief Find the first record whose given string is given key.
+    #
+    #  @param key         [ str | None | in  ] - Key.
+    #  @param stringIndex [ int | None | in  ] - Index of the string in RECORD_STRINGS.
+    #  @param table       [ int | None | in  ] - Offset of the table sorted by the string, records are searched in order if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Record index, None if not found.
+    def _find(self, key, stringIndex, table=None):
+
+        key = key.encode('utf-8')
+
+        low  = 0
+        high = self._recordCount
+
+        while low < high:
+
+            middle      = (low + high) // 2
+            recordIndex = middle if table is None else INDEX_ENTRY.unpack_from(self._buffer, table + middle * INDEX_ENTRY.size)[0]
+
+            if self._getBytes(recordIndex, stringIndex) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self._recordCount:
+            return None
+
+        recordIndex = low if table is None else INDEX_ENTRY.unpack_from(self._buffer, table + low * INDEX_ENTRY.size)[0]
+
+        return recordIndex if self._getBytes(recordIndex, stringIndex) == key else None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def packPath(self):
+
+        return self._packPath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def stamp(self):
+
+        return self._stamp
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names, sorted.
+    def listModules(self):
+
+        return [self._getBytes(x, 0).decode('utf-8') for x in range(self._recordCount)]
+
+    #
+    ## @brief Check whether developer module with given name exists.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasModule(self, moduleName):
+
+        return self._find(moduleName, 0) is not None
+
+    #
+    ## @brief Get record of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if developer module doesn't exist.
+    def getRecord(self, moduleName):
+
+        recordIndex = self._find(moduleName, 0)
+
+        return None if recordIndex is None else self._getRecord(recordIndex)
+
+    #
+    ## @brief Get validated record of given developer module, records are validated before they are packed.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception ImportError - If developer module doesn't exist.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getValidatedRecord(self, moduleName):
+
+        record = self.getRecord(moduleName)
+        if record is None:
+            raise ImportError('No developer module named {} in {}'.format(moduleName, self._packPath))
+
+        return record
+
+    #
+    ## @brief Load all records.
+    #
+    #  @param workers   [ int  | None  | in  ] - Not used, records are decoded from the pack file.
+    #  @param processes [ bool | False | in  ] - Not used, records are decoded from the pack file.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Developer module names as keys and mDeveloper.developerLib.DeveloperRecord instances as values, sorted by module name.
+    #  @return collections.OrderedDict - Always empty, invalid developer modules are not packed.
+    def loadRecords(self, workers=None, processes=False):
+
+        return collections.OrderedDict(self.iterRecords()), collections.OrderedDict()
+
+    #
+    ## @brief Iterate over the records lazily, records are decoded as the generator is consumed.
+    #
+    #  @param errors [ dict | None | out ] - Not used, invalid developer modules are not packed.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs, sorted by developer module name.
+    def iterRecords(self, errors=None):
+
+        for recordIndex in range(self._recordCount):
+            yield self._getBytes(recordIndex, 0).decode('utf-8'), self._getRecord(recordIndex)
+
+    #
+    ## @brief Get developer module name of given user name.
+    #
+    #  @param userName [ str | None | in  ] - Value of USERNAME attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given user name.
+    def getModuleByUserName(self, userName):
+
+        recordIndex = self._find(userName, RECORD_STRINGS.index('userName'), self._userNameTable)
+
+        return None if recordIndex is None else self._getBytes(recordIndex, 0).decode('utf-8')
+
+    #
+    ## @brief Get developer module name of given e-mail address.
+    #
+    #  @param email [ str | None | in  ] - Value of EMAIL attribute of the developer, case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given e-mail address.
+    def getModuleByEmail(self, email):
+
+        recordIndex = self._find(email.lower(), RECORD_STRINGS.index('emailKey'), self._emailTable)
+
+        return None if recordIndex is None else self._getBytes(recordIndex, 0).decode('utf-8')
+
+    #
+    ## @brief Get search index of the pack file, which is loaded once.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.searchLib.SearchIndex - Search index, None if pack file doesn't have one.
+    def getSearchIndex(self):
+
+        if self._searchIndex is None and self._indexSize:
+
+            with mDeveloper.statsLib.Stats.getInstance().span('index'):
+                self._searchIndex = mDeveloper.searchLib.SearchIndex.fromBytes(memoryview(self._buffer)[self._indexOffset:self._indexOffset + self._indexSize])
+
+            # Index can't be read, records are searched by scanning the pack file
+            if self._searchIndex is None:
+                self._indexSize = 0
+
+        return self._searchIndex
+
+    #
+    ## @brief Get fuzzy index of the pack file, which is loaded once.
+    #
+    #  Fuzzy index is built from the records if the pack file doesn't have one, see mDeveloper.storageAbs.Storage.getFuzzyIndex.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Fuzzy index.
+    def getFuzzyIndex(self):
+
+        if self._fuzzyIndex is None and self._fuzzySize:
+
+            with mDeveloper.statsLib.Stats.getInstance().span('fuzzyIndex'):
+                self._fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex.fromBytes(memoryview(self._buffer)[self._fuzzyOffset:self._fuzzyOffset + self._fuzzySize])
+
+            if self._fuzzyIndex is None:
+                self._fuzzySize = 0
+
+        return mDeveloper.storageAbs.Storage.getFuzzyIndex(self)
+
+    #
+    ## @brief Search developer records by using the search index of the pack file, see mDeveloper.searchLib.SearchIndex.search.
+    #
+    #  Records are searched by scanning the pack file if it doesn't have a search index, results are the same.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        searchIndex = self.getSearchIndex()
+        if searchIndex is not None:
+            return searchIndex.search(keyword, fields=fields, limit=limit)
+
+        keyword = keyword.lower()
+        fields  = fields if fields else mDeveloper.searchLib.FIELDS
+
+        mDeveloper.searchLib.SearchIndex.checkFields(fields)
+
+        stringIndexes = [mDeveloper.developerLib.RECORD_ATTRIBUTES.index(x) + 1 for x in fields]
+
+        scores = {}
+
+        for recordIndex in range(self._recordCount):
+
+            score = mDeveloper.searchLib.SearchIndex.getRecordScore([self._getBytes(recordIndex, x).decode('utf-8') for x in stringIndexes],
+                                                                     keyword,
+                                                                     fields)
+            if score:
+                scores[self._getBytes(recordIndex, 0).decode('utf-8')] = score
+
+        return mDeveloper.searchLib.SearchIndex.rankResults(scores, limit)
+
+    #
+    ## @brief Close the pack file, no lookups can be done afterwards.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        self._buffer      = None
+        self._searchIndex = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get pack file of given developers directory.
+    #
+    #  Pack file is stored next to the developers directory, such as developers.pack, so that writing it
+    #  doesn't change the modification time of the directory. PACK_ENVIRONMENT_VARIABLE overrides the pack
+    #  file of the default developers directory.
+    #
+    #  @param directory [ str | None | in  ] - Developers directory, default one is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the pack file.
+    @staticmethod
+    def getPackPathOf(directory=None):
+
+        if not directory:
+            directory = mDeveloper.developerLib.Developer.getDevelopersDirectory()
+            if os.environ.get(PACK_ENVIRONMENT_VARIABLE):
+                return os.path.abspath(os.environ[PACK_ENVIRONMENT_VARIABLE])
+
+        directory = os.path.abspath(directory).rstrip(os.sep)
+
+        return '{}.pack'.format(directory)
+
+    #
+    ## @brief Load pack file of given developers directory if it is up to date.
+    #
+    #  Pack file is up to date if the stamp of the developers directory is the same as the one it is written with,
+    #  see mDeveloper.cacheLib.RegistryCache.getDirectoryStamp, so that loading it costs a single stat of the directory.
+    #
+    #  @param directory [ str | None | in  ] - Developers directory, default one is used if None given.
+    #  @param packPath  [ str | None | in  ] - Absolute path of the pack file, see getPackPathOf method if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.packLib.PackedRegistry - Packed registry, None if pack file doesn't exist, it is not valid or it is stale.
+    @staticmethod
+    def load(directory=None, packPath=None):
+
+        directory = directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory()
+        packPath  = packPath if packPath else PackedRegistry.getPackPathOf(directory)
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+
+        try:
+            _packedRegistry = PackedRegistry(packPath)
+        except (OSError, ValueError):
+            _stats.increment('pack.miss')
+            return None
+
+        if mDeveloper.cacheLib.RegistryCache.getDirectoryStamp(directory) != _packedRegistry.stamp():
+            _packedRegistry.close()
+            _stats.increment('pack.stale')
+            return None
+
+        _stats.increment('pack.hit')
+
+        return _packedRegistry
+
+    #
+    ## @brief Compile given developers directory into a pack file, which is written atomically.
+    #
+    #  @param directory      [ str | None | in  ] - Developers directory, default one is used if None given.
+    #  @param packPath       [ str | None | in  ] - Absolute path of the pack file, see getPackPathOf method if None given.
+    #  @param cacheDirectory [ str | None | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param workers        [ int | None | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #
+    #  @exception OSError - If developers directory doesn't exist or pack file couldn't be written.
+    #
+    #  @return int                     - Number of records packed.
+    #  @return collections.OrderedDict - Developer module names as keys and exceptions as values of the developer modules which are not packed.
+    @staticmethod
+    def write(directory=None, packPath=None, cacheDirectory=None, workers=None):
+
+        directory = directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory()
+        packPath  = packPath if packPath else PackedRegistry.getPackPathOf(directory)
+
+        content, count, errors = PackedRegistry.build(directory=directory, cacheDirectory=cacheDirectory, workers=workers)
+
+        if not mDeveloper.cacheLib.RegistryCache.writeFileAtomically(packPath, content):
+            raise OSError('Pack file could not be written: {}'.format(packPath))
+
+        return count, errors
+
+    #
+    ## @brief Compile given developers directory into the content of a pack file.
+    #
+    #  Developer modules are loaded and validated by mDeveloper.developerLib.DeveloperRegistry. Stamp of the
+    #  directory is taken before they are loaded, so that the pack is stale if the directory changes meanwhile.
+    #  Search index is built from the packed records, it is left out if it can't be saved, see mDeveloper.searchLib.SearchIndex.toBytes.
+    #
+    #  @param directory      [ str | None | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str | None | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param workers        [ int | None | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #
+    #  @exception OSError - If developers directory doesn't exist.
+    #
+    #  @return bytes                   - Content of the pack file.
+    #  @return int                     - Number of records packed.
+    #  @return collections.OrderedDict - Developer module names as keys and exceptions as values of the developer modules which are not packed.
+    @staticmethod
+    def build(directory=None, cacheDirectory=None, workers=None):
+
+        directory = directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory()
+
+        if not os.path.isdir(directory):
+            raise OSError('Developers directory does not exist: {}'.format(directory))
+
+        stamp = mDeveloper.cacheLib.RegistryCache.getDirectoryStamp(directory)
+
+        _registry = mDeveloper.developerLib.DeveloperRegistry(directory=directory, cacheDirectory=cacheDirectory)
+
+        records, errors = _registry.loadRecords(workers=workers)
+
+        rows          = []
+        table         = mDeveloper.developerLib.DeveloperTable()
+        packedRecords = []
+
+        for moduleName, record in records.items():
+
+            if not all(isinstance(x, str) or (x is None and field == 'url') for field, x in zip(record._fields, record)):
+                errors[moduleName] = ValueError('Attributes of the developer module {} must be strings to be packed.'.format(moduleName))
+                continue
+
+            strings = [moduleName] + [x if x is not None else '' for x in record] + [record.email.lower()]
+            rows.append([x.encode('utf-8') for x in strings])
+
+            # Row ids of the table are the record indexes
+            table.addRecord(moduleName, dict(zip(mDeveloper.developerLib.RECORD_ATTRIBUTES, record)))
+            packedRecords.append((moduleName, record))
+
+        try:
+            searchIndex = mDeveloper.searchLib.SearchIndex(table).toBytes(stamp)
+        except ValueError:
+            searchIndex = b''
+
+        try:
+            fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex(packedRecords).toBytes(stamp)
+        except ValueError:
+            fuzzyIndex = b''
+
+        blob        = bytearray()
+        offsets     = {}
+        recordTable = bytearray()
+
+        for row in rows:
+
+            values = []
+
+            for value in row:
+
+                # Equal strings, such as site names, are stored once
+                offset = offsets.get(value)
+                if offset is None:
+                    offset = offsets[value] = len(blob)
+                    blob  += value
+
+                values.extend([offset, len(value)])
+
+            recordTable += RECORD.pack(*values)
+
+        userNameIndex = RECORD_STRINGS.index('userName')
+        emailIndex    = RECORD_STRINGS.index('emailKey')
+
+        userNameTable = b''.join(INDEX_ENTRY.pack(x) for x in sorted(range(len(rows)), key=lambda x: (rows[x][userNameIndex], rows[x][0])))
+        emailTable    = b''.join(INDEX_ENTRY.pack(x) for x in sorted(range(len(rows)), key=lambda x: (rows[x][emailIndex], rows[x][0])))
+
+        recordTableOffset   = HEADER.size
+        userNameTableOffset = recordTableOffset + len(recordTable)
+        emailTableOffset    = userNameTableOffset + len(userNameTable)
+        blobOffset          = emailTableOffset + len(emailTable)
+        searchIndexOffset   = blobOffset + len(blob)
+        fuzzyIndexOffset    = searchIndexOffset + len(searchIndex)
+
+        header = HEADER.pack(PACK_MAGIC,
+                             PACK_VERSION,
+                             len(rows),
+                             stamp.encode('ascii'),
+                             recordTableOffset,
+                             userNameTableOffset,
+                             emailTableOffset,
+                             blobOffset,
+                             searchIndexOffset,
+                             len(searchIndex),
+                             fuzzyIndexOffset,
+                             len(fuzzyIndex))
+
+        return b''.join([header, bytes(recordTable), userNameTable, emailTable, bytes(blob), searchIndex, fuzzyIndex]), len(rows), errors
@@ -22,6 +22,8 @@
 ## @dir     mDeveloper/python/mDeveloper            @brief [ DIRECTORY ] - Python package.
 ## @dir     mDeveloper/python/mDeveloper/developers @brief [ DIRECTORY ] - Python package.
 ## @package mDeveloper.developers                   @brief [ PACKAGE   ] - Python package.
+## @dir     mDeveloper/python/mDeveloper/benchmarks @brief [ DIRECTORY ] - Python package.
+## @package mDeveloper.benchmarks                   @brief [ PACKAGE   ] - Python package.
 ## @file    mDeveloper/packageInfoLib.py            @brief [ FILE      ] - Package info module.
 ## @package mDeveloper.packageInfoLib               @brief [ MODULE    ] - Package info module.
 
@@ -0,0 +1,192 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/readerLib.py @brief [ FILE   ] - Developer module reader module.
+## @package mDeveloper.readerLib    @brief [ MODULE ] - Developer module reader module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import ast
+import copy
+
+import mDeveloper.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class to read developer modules statically without importing them.
+#
+#  Module level constants are evaluated the same way as ast.literal_eval does, names of the constants
+#  assigned before, such as the ones in INFO dict, are resolved. Developer modules which contain any
+#  other statement, or whose attributes are not literals, can't be read statically.
+class DeveloperModuleReader(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Evaluate given literal node.
+    #
+    #  @param node      [ ast.AST | None | in  ] - Node.
+    #  @param constants [ dict    | None | in  ] - Names of the constants assigned before as keys and their values as values.
+    #
+    #  @exception ValueError - If node is not a literal or a name of a constant assigned before.
+    #
+    #  @return variant - Value.
+    @staticmethod
+    def evaluate(node, constants):
+
+        nodeType = type(node)
+
+        if nodeType is ast.Constant:
+            return node.value
+
+        if nodeType is ast.Name:
+
+            if node.id not in constants:
+                raise ValueError('Name {} is not a literal constant.'.format(node.id))
+
+            value = constants[node.id]
+
+            return value if isinstance(value, (str, int, float, bool, type(None))) else copy.deepcopy(value)
+
+        if nodeType is ast.Dict:
+
+            if None in node.keys:
+                raise ValueError('Dict unpacking is not a literal.')
+
+            return dict((DeveloperModuleReader.evaluate(key, constants),
+                         DeveloperModuleReader.evaluate(value, constants)) for key, value in zip(node.keys, node.values))
+
+        if nodeType is ast.List:
+            return [DeveloperModuleReader.evaluate(x, constants) for x in node.elts]
+
+        if nodeType is ast.Tuple:
+            return tuple(DeveloperModuleReader.evaluate(x, constants) for x in node.elts)
+
+        if nodeType is ast.Set:
+            return set(DeveloperModuleReader.evaluate(x, constants) for x in node.elts)
+
+        if nodeType is ast.UnaryOp and isinstance(node.op, (ast.USub, ast.UAdd)):
+
+            value = DeveloperModuleReader.evaluate(node.operand, constants)
+            if isinstance(value, bool) or not isinstance(value, (int, float, complex)):
+                raise ValueError('Unary operator is only supported for numbers.')
+
+            return -value if isinstance(node.op, ast.USub) else value
+
+        raise ValueError('Node {} is not a literal.'.format(nodeType.__name__))
+
+    #
+    ## @brief List names of the attributes read from developer modules.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Attribute names.
+    @staticmethod
+    def listAttributes():
+
+        return list(mDeveloper.enumLib.DeveloperModuleAttribute.listAttributes()) + ['INFO']
+
+    #
+    ## @brief Read module level constants of given source code.
+    #
+    #  In strict mode source code can only contain docstrings and assignments of literals to names. Otherwise
+    #  other statements and the assignments which can't be evaluated statically are skipped.
+    #
+    #  @param source   [ str  | None        | in  ] - Source code.
+    #  @param filePath [ str  | '<unknown>' | in  ] - File path, which is used in syntax error messages.
+    #  @param strict   [ bool | True        | in  ] - Whether to fail if a statement can't be read statically.
+    #
+    #  @exception SyntaxError - If source code is not valid.
+    #
+    #  @return dict - Names of the constants as keys and their values as values. None if source code can't be read statically in strict mode.
+    @staticmethod
+    def readConstants(source, filePath='<unknown>', strict=True):
+
+        tree = ast.parse(source, filePath)
+
+        constants = {}
+
+        for node in tree.body:
+
+            # Docstrings
+            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                continue
+
+            if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+                if strict:
+                    return None
+                continue
+
+            try:
+                constants[node.targets[0].id] = DeveloperModuleReader.evaluate(node.value, constants)
+            except (ValueError, TypeError):
+                if strict:
+                    return None
+                constants.pop(node.targets[0].id, None)
+
+        return constants
+
+    #
+    ## @brief Read given developer module source code.
+    #
+    #  @param source   [ str | None        | in  ] - Source code of the developer module.
+    #  @param filePath [ str | '<unknown>' | in  ] - File path, which is used in syntax error messages.
+    #
+    #  @exception SyntaxError - If source code is not valid.
+    #
+    #  @return dict - Record, only existing attributes are included. None if source code can't be read statically.
+    @staticmethod
+    def readSource(source, filePath='<unknown>'):
+
+        constants = DeveloperModuleReader.readConstants(source, filePath)
+        if constants is None:
+            return None
+
+        record = {}
+
+        for attr in DeveloperModuleReader.listAttributes():
+            if attr in constants:
+                record[attr] = constants[attr]
+
+        return record
+
+    #
+    ## @brief Read given developer module file.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the developer module file.
+    #
+    #  @exception IOError     - If file can't be read.
+    #  @exception SyntaxError - If source code is not valid.
+    #
+    #  @return dict - Record, only existing attributes are included. None if developer module can't be read statically.
+    @staticmethod
+    def readFile(filePath):
+
+        with open(filePath, 'rb') as moduleFile:
+            source = moduleFile.read()
+
+        return DeveloperModuleReader.readSource(source, filePath)
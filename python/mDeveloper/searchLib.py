@@ -0,0 +1,493 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/searchLib.py @brief [ FILE   ] - Developer search module.
+## @package mDeveloper.searchLib    @brief [ MODULE ] - Developer search module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import array
+import heapq
+
+import mDeveloper.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the search index file format, index files with a different version are rebuilt.
+INDEX_VERSION = 3
+
+## [ str ] - Name of the search index file, which is stored next to the registry cache file.
+INDEX_FILE    = 'search.idx'
+
+## [ bytes ] - Magic bytes at the beginning of search index files.
+INDEX_MAGIC   = b'MDEVSRCH'
+
+## [ dict ] - Searchable developer module attributes as keys and their score weights as values.
+FIELD_WEIGHTS = {mDeveloper.enumLib.DeveloperModuleAttribute.kUserName : 5,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kName     : 4,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kEmail    : 3,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kPosition : 1,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kSite     : 1}
+
+## [ list of str ] - Searchable developer module attributes.
+FIELDS        = [mDeveloper.enumLib.DeveloperModuleAttribute.kUserName,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kName,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kEmail,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kPosition,
+                 mDeveloper.enumLib.DeveloperModuleAttribute.kSite]
+
+#
+## @brief [ CLASS ] - Class to search developer records by using a trigram inverted index.
+#
+#  Each searchable field has its own posting lists which map trigrams of the lower case field values
+#  to the ids of the records containing them. Candidates of a query are found by intersecting the posting
+#  lists of its trigrams and then verified with a substring test, so results are the same as a linear
+#  `keyword in value.lower()` scan. Queries shorter than a trigram are answered by scanning the field values.
+#
+#  Matches are scored by field weight, see FIELD_WEIGHTS, multiplied by 3 for an exact match,
+#  2 for a prefix match and 1 for any other substring match.
+class SearchIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param table [ mDeveloper.developerLib.DeveloperTable | None | in  ] - Table of the records, row ids are used as record ids.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, table):
+
+        ## [ list of str ] - Developer module names, index of a module name is the id of its record, None for removed records.
+        self._moduleNames = list(table.moduleNames())
+
+        ## [ dict ] - Fields as keys and list of lower case field values of the records as values.
+        self._values      = {}
+
+        ## [ dict ] - Fields as keys and dict instances, which have trigrams as keys and sorted array of record ids as values, as values.
+        self._postings    = {}
+
+        for field in FIELDS:
+
+            values   = []
+            postings = {}
+
+            for recordId, value in enumerate(table.getColumn(field)):
+
+                value = value.lower() if isinstance(value, str) else ''
+
+                values.append(value)
+
+                for trigram in SearchIndex.getTrigrams(value):
+                    postings.setdefault(trigram, []).append(recordId)
+
+            # Arrays are compact in memory and load quickly from the index file
+            self._values[field]   = values
+            self._postings[field] = dict((trigram, array.array('I', x)) for trigram, x in postings.items())
+
+    #
+    ## @brief Find ids of the records whose given field contains given keyword.
+    #
+    #  @param keyword [ str | None | in  ] - Lower case keyword.
+    #  @param field   [ str | None | in  ] - Field.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Record ids.
+    def _match(self, keyword, field):
+
+        values   = self._values[field]
+        trigrams = SearchIndex.getTrigrams(keyword)
+
+        if not trigrams:
+            return [x for x, value in enumerate(values) if keyword in value]
+
+        postings = self._postings[field]
+
+        postingList = []
+        for trigram in trigrams:
+
+            if trigram not in postings:
+                return []
+
+            postingList.append(postings[trigram])
+
+        postingList.sort(key=len)
+
+        candidates = set(postingList[0])
+        for posting in postingList[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        return [x for x in candidates if keyword in values[x]]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def moduleNames(self):
+
+        return self._moduleNames
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Search developer records.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        keyword = keyword.lower()
+        fields  = fields if fields else FIELDS
+
+        SearchIndex.checkFields(fields)
+
+        scores = {}
+
+        for field in fields:
+
+            values = self._values[field]
+
+            for recordId in self._match(keyword, field):
+                scores[recordId] = scores.get(recordId, 0) + SearchIndex.getScore(values[recordId], keyword, field)
+
+        return SearchIndex.rankResults(dict((self._moduleNames[x], y) for x, y in scores.items() if self._moduleNames[x] is not None), limit)
+
+    #
+    ## @brief Add, update or remove record of given id.
+    #
+    #  Trigrams of the new values are added into the posting lists. Trigrams of the previous values are left
+    #  in place since candidates are verified with a substring test anyway, so that updates don't rebuild
+    #  the posting lists. Posting lists are replaced instead of being appended to, so that copies of the
+    #  index, see copy method, don't share the changes.
+    #
+    #  @param recordId   [ int                                     | None | in  ] - Record id, row id of the record in the table.
+    #  @param moduleName [ str                                     | None | in  ] - Developer module name, None to remove the record.
+    #  @param record     [ mDeveloper.developerLib.DeveloperRecord | None | in  ] - Record, None to remove the record.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def updateRecord(self, recordId, moduleName, record):
+
+        while len(self._moduleNames) <= recordId:
+            self._moduleNames.append(None)
+            for field in FIELDS:
+                self._values[field].append('')
+
+        self._moduleNames[recordId] = moduleName
+
+        for field in FIELDS:
+
+            value = record.get(field) if record is not None else None
+            value = value.lower() if isinstance(value, str) else ''
+
+            values   = self._values[field]
+            postings = self._postings[field]
+
+            for trigram in SearchIndex.getTrigrams(value) - SearchIndex.getTrigrams(values[recordId]):
+                postings[trigram] = postings[trigram] + array.array('I', [recordId]) if trigram in postings else array.array('I', [recordId])
+
+            values[recordId] = value
+
+    #
+    ## @brief Copy the index, so that the copy can be updated without changing this index.
+    #
+    #  Posting lists are shared between the copies, since they are replaced on update instead of being changed.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.searchLib.SearchIndex - Search index.
+    def copy(self):
+
+        _searchIndex = SearchIndex.__new__(SearchIndex)
+
+        _searchIndex._moduleNames = list(self._moduleNames)
+        _searchIndex._values      = dict((x, list(y)) for x, y in self._values.items())
+        _searchIndex._postings    = dict((x, dict(y)) for x, y in self._postings.items())
+
+        return _searchIndex
+
+    #
+    ## @brief Get the index as the content of an index file, see fromBytes method.
+    #
+    #  Content is made of the sections of mDeveloper.cacheLib.RegistryCache.joinSections. Strings are joined by
+    #  null characters and posting lists of each field are concatenated into one array, so that loading the
+    #  index decodes a few large buffers instead of parsing a document. Loading a pickle instead could execute code,
+    #  since the cache directory may be shared.
+    #
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is built from, see mDeveloper.developerLib.RegistrySnapshot.version.
+    #
+    #  @exception ValueError - If a value contains a null character.
+    #
+    #  @return bytes - Content.
+    def toBytes(self, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache
+
+        sections = [signature.encode('utf-8'),
+                    _registryCache.getSectionOf(array.array('I', [len(self._moduleNames)])),
+                    _registryCache.joinStrings(x if x is not None else '' for x in self._moduleNames)]
+
+        for field in FIELDS:
+
+            postings = self._postings[field]
+            trigrams = sorted(postings)
+
+            ids = array.array('I')
+            for trigram in trigrams:
+                ids.extend(postings[trigram])
+
+            sections.extend([_registryCache.joinStrings(self._values[field]),
+                             _registryCache.joinStrings(trigrams),
+                             _registryCache.getSectionOf(array.array('I', [len(postings[x]) for x in trigrams])),
+                             _registryCache.getSectionOf(ids)])
+
+        return _registryCache.joinSections(INDEX_MAGIC, INDEX_VERSION, sections)
+
+    #
+    ## @brief Save the index into given file atomically, see toBytes method.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is built from, see mDeveloper.developerLib.RegistrySnapshot.version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, False if the index can't be saved.
+    def save(self, filePath, signature):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        try:
+            content = self.toBytes(signature)
+        except ValueError:
+            return False
+
+        return mDeveloper.cacheLib.RegistryCache.writeFileAtomically(filePath, content)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given fields are searchable.
+    #
+    #  @param fields [ list of str | None | in  ] - Fields, such as USERNAME.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return None - None.
+    @staticmethod
+    def checkFields(fields):
+
+        for field in fields:
+            if field not in FIELD_WEIGHTS:
+                raise ValueError('{} is not a searchable field, use one of: {}'.format(field, ', '.join(FIELDS)))
+
+    #
+    ## @brief Get score of given matching field value.
+    #
+    #  @param value   [ str | None | in  ] - Lower case field value, which contains given keyword.
+    #  @param keyword [ str | None | in  ] - Lower case keyword.
+    #  @param field   [ str | None | in  ] - Field, such as USERNAME.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Score.
+    @staticmethod
+    def getScore(value, keyword, field):
+
+        weight = FIELD_WEIGHTS[field]
+
+        if value == keyword:
+            return weight * 3
+
+        if value.startswith(keyword):
+            return weight * 2
+
+        return weight
+
+    #
+    ## @brief Get score of a record by given field values, so that records can be scored without an index.
+    #
+    #  @param values  [ list        | None | in  ] - Values of given fields.
+    #  @param keyword [ str         | None | in  ] - Lower case keyword.
+    #  @param fields  [ list of str | None | in  ] - Fields, such as USERNAME.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Score, 0 if keyword is not found in any of the values.
+    @staticmethod
+    def getRecordScore(values, keyword, fields):
+
+        score = 0
+
+        for field, value in zip(fields, values):
+
+            value = value.lower() if isinstance(value, str) else ''
+
+            if keyword in value:
+                score += SearchIndex.getScore(value, keyword, field)
+
+        return score
+
+    #
+    ## @brief Sort given scores into search results.
+    #
+    #  @param scores [ dict | None | in  ] - Developer module names as keys and scores as values.
+    #  @param limit  [ int  | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    @staticmethod
+    def rankResults(scores, limit=None):
+
+        sortKey = lambda x: (-x[1], x[0])
+
+        if limit is None:
+            return sorted(scores.items(), key=sortKey)
+
+        return heapq.nsmallest(limit, scores.items(), key=sortKey)
+
+    #
+    ## @brief Get trigrams of given value.
+    #
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Trigrams, empty if value is shorter than three characters.
+    @staticmethod
+    def getTrigrams(value):
+
+        return set(value[x:x + 3] for x in range(len(value) - 2))
+
+    #
+    ## @brief Create an index from the content of an index file, see toBytes method.
+    #
+    #  @param content   [ bytes-like object | None | in  ] - Content.
+    #  @param signature [ str               | None | in  ] - Version of the registry snapshot the index is expected to be built from, it isn't checked if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.searchLib.SearchIndex - Index, None if content is not valid or it is out of date.
+    @staticmethod
+    def fromBytes(content, signature=None):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.cacheLib
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache
+
+        sections = _registryCache.splitSections(content, INDEX_MAGIC, INDEX_VERSION)
+        if not sections or len(sections) != 3 + len(FIELDS) * 4:
+            return None
+
+        _searchIndex = SearchIndex.__new__(SearchIndex)
+
+        try:
+            if signature is not None and str(sections[0], 'utf-8') != signature:
+                return None
+
+            count = _registryCache.getArrayOf(sections[1])[0]
+
+            _searchIndex._moduleNames = [x if x else None for x in _registryCache.splitStrings(sections[2], count)]
+            _searchIndex._values      = {}
+            _searchIndex._postings    = {}
+
+            for index, field in enumerate(FIELDS):
+
+                valueSection, trigramSection, lengthSection, idSection = sections[3 + index * 4:7 + index * 4]
+
+                lengths  = _registryCache.getArrayOf(lengthSection)
+                trigrams = _registryCache.splitStrings(trigramSection, len(lengths))
+                ids      = _registryCache.getArrayOf(idSection)
+
+                if sum(lengths) != len(ids):
+                    return None
+
+                postings = {}
+                offset   = 0
+
+                for trigram, length in zip(trigrams, lengths):
+                    postings[trigram] = ids[offset:offset + length]
+                    offset           += length
+
+                _searchIndex._values[field]   = _registryCache.splitStrings(valueSection, count)
+                _searchIndex._postings[field] = postings
+
+        except (IndexError, UnicodeDecodeError, ValueError):
+            return None
+
+        return _searchIndex
+
+    #
+    ## @brief Load index from given file, see fromBytes method.
+    #
+    #  @param filePath  [ str | None | in  ] - Absolute path of the index file.
+    #  @param signature [ str | None | in  ] - Version of the registry snapshot the index is expected to be built from.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.searchLib.SearchIndex - Index, None if file doesn't exist, it is corrupt or it is out of date.
+    @staticmethod
+    def load(filePath, signature):
+
+        try:
+            with open(filePath, 'rb') as indexFile:
+                content = indexFile.read()
+        except (IOError, OSError):
+            return None
+
+        return SearchIndex.fromBytes(content, signature)
@@ -0,0 +1,373 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/serverLib.py @brief [ FILE   ] - Developer server module.
+## @package mDeveloper.serverLib    @brief [ MODULE ] - Developer server module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import stat
+import time
+import socket
+import socketserver
+
+import mDeveloper.clientLib
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ float ] - Default interval in seconds the developers directory is checked for changes in.
+POLL_INTERVAL      = 2.0
+
+## [ float ] - Timeout in seconds of the socket operations of a connection, so that a client can't block other clients.
+CONNECTION_TIMEOUT = 2.0
+
+#
+## @brief [ CLASS ] - Class to handle a single request, see mDeveloper.clientLib.DeveloperClient for the protocol.
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    ## [ float ] - Timeout of the connection, socketserver.StreamRequestHandler.setup method calls settimeout with it.
+    timeout = CONNECTION_TIMEOUT
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Handle the request.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def handle(self):
+
+        try:
+            line = self.rfile.readline()
+        except OSError:
+            # Client didn't send the request in time
+            return
+
+        try:
+            request = json.loads(line.decode('utf-8'))
+
+            if not isinstance(request, dict) or request.get('version') != mDeveloper.clientLib.PROTOCOL_VERSION:
+                raise ValueError('Unsupported request, protocol version {} is expected.'.format(mDeveloper.clientLib.PROTOCOL_VERSION))
+
+            response = {'result':self.server.developerServer.handleRequest(request.get('command'),
+                                                                           request.get('arguments') or {},
+                                                                           source=request.get('source'))}
+
+        except Exception as error:
+            response = {'error':str(error), 'type':type(error).__name__}
+
+        try:
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+        except OSError:
+            # Client is gone or it doesn't read the response in time
+            pass
+
+#
+## @brief [ CLASS ] - Class to serve developer queries from a registry kept in memory.
+#
+#  Server listens on a Unix domain socket and answers list, search and isDeveloper requests, see
+#  mDeveloper.clientLib.DeveloperClient. Requests are handled one at a time, connections time out after
+#  CONNECTION_TIMEOUT seconds. Developers directory is
+#  checked for changes between the requests and the changes are applied to the registry incrementally.
+class DeveloperServer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory      [ str   | None          | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str   | None          | in  ] - Cache directory, default one is used if None given.
+    #  @param socketPath     [ str   | None          | in  ] - Socket path, default one is used if None given.
+    #  @param pollInterval   [ float | POLL_INTERVAL | in  ] - Interval in seconds the developers directory is checked for changes in.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory=None, cacheDirectory=None, socketPath=None, pollInterval=POLL_INTERVAL):
+
+        ## [ mDeveloper.developerLib.DeveloperRegistry ] - Registry.
+        self._registry     = mDeveloper.developerLib.DeveloperRegistry(directory=directory, cacheDirectory=cacheDirectory)
+
+        ## [ str ] - Socket path.
+        self._socketPath   = socketPath if socketPath else mDeveloper.clientLib.DeveloperClient.getDefaultSocketPath()
+
+        ## [ float ] - Poll interval in seconds.
+        self._pollInterval = pollInterval
+
+        ## [ float ] - Time of the last check.
+        self._checkTime    = None
+
+        ## [ socketserver.UnixStreamServer ] - Socket server.
+        self._server       = None
+
+    #
+    ## @brief Update the registry if the developers directory has changed since the last check.
+    #
+    #  Registry is loaded on the first check, changes are applied incrementally afterwards, see
+    #  mDeveloper.developerLib.DeveloperRegistry.update.
+    #
+    #  @param force [ bool | False | in  ] - Whether to check regardless of the poll interval.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the registry has been updated.
+    def _checkDirectory(self, force=False):
+
+        if not force and self._checkTime is not None and time.monotonic() - self._checkTime < self._pollInterval:
+            return False
+
+        if self._registry.isLoaded():
+            changed = any(self._registry.update())
+        else:
+            changed = self._registry.refresh()
+
+        self._checkTime = time.monotonic()
+
+        if not changed:
+            return False
+
+        # Search index is built up front, so that the first search doesn't pay for it
+        self._registry.getSearchIndex()
+
+        return True
+
+    #
+    ## @brief Remove socket file if it is left by a server which is not running anymore.
+    #
+    #  @exception RuntimeError - If a server is already running on the socket or the path isn't a socket.
+    #
+    #  @return None - None.
+    def _removeStaleSocket(self):
+
+        try:
+            mode = os.lstat(self._socketPath).st_mode
+        except OSError:
+            return
+
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError('Socket path {} exists and it is not a socket.'.format(self._socketPath))
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+            try:
+                _socket.connect(self._socketPath)
+            except OSError:
+                os.remove(self._socketPath)
+                return
+
+        raise RuntimeError('A developer server is already running on {}.'.format(self._socketPath))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def socketPath(self):
+
+        return self._socketPath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def registry(self):
+
+        return self._registry
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get source of the developers the server serves, see mDeveloper.clientLib.DeveloperClient.getLocalSource.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Source.
+    def getSource(self):
+
+        return {'storage':'directory', 'layers':[self._registry.directory()]}
+
+    #
+    ## @brief Handle given request.
+    #
+    #  @param command   [ str  | None | in  ] - Command, one of ping, list, search, facets and isDeveloper.
+    #  @param arguments [ dict | None | in  ] - Arguments of the command.
+    #  @param source    [ dict | None | in  ] - Source the client expects, see getSource method, it isn't checked if None given.
+    #
+    #  @exception ValueError - If command or its arguments are not valid, or the server serves another source.
+    #
+    #  @return variant - Result of the command.
+    def handleRequest(self, command, arguments, source=None):
+
+        if source is not None and (not isinstance(source, dict) or not mDeveloper.clientLib.DeveloperClient.isSameSource(source, self.getSource())):
+            raise ValueError('Developer server serves another source: {}'.format(self.getSource()['layers']))
+
+        self._checkDirectory()
+
+        # Developer static methods use the process-wide registry
+        mDeveloper.developerLib.DeveloperRegistry.setInstance(self._registry)
+
+        detail = arguments.get('detail', False)
+        limit  = arguments.get('limit')
+
+        if command == 'ping':
+            return dict(self.getSource(), directory=self._registry.directory())
+
+        if command == 'list':
+
+            records, errors = self._registry.loadRecords()
+
+            developers = [mDeveloper.developerLib.Developer(x) for x in records.values()][:limit]
+
+            return {'records' : DeveloperServer.getRecords(developers, detail),
+                    'errors'  : dict((x, str(y)) for x, y in errors.items())}
+
+        if command == 'search':
+
+            if not arguments.get('keyword'):
+                raise ValueError('Keyword is not provided.')
+
+            if arguments.get('fuzzy') is not None:
+                developers = mDeveloper.developerLib.Developer.fuzzySearch(arguments['keyword'], maxDistance=arguments['fuzzy'], limit=limit)
+            else:
+                developers = mDeveloper.developerLib.Developer.query(arguments['keyword'], fields=arguments.get('fields'), limit=limit)
+
+            return {'records':DeveloperServer.getRecords(developers, detail)}
+
+        if command == 'facets':
+
+            counts = mDeveloper.developerLib.Developer.getFacetCounts(query=arguments.get('query') or None, fields=arguments.get('fields'))
+
+            return {'facets':counts}
+
+        if command == 'isDeveloper':
+
+            if not arguments.get('user'):
+                raise ValueError('User is not provided.')
+
+            return mDeveloper.developerLib.Developer.isDeveloper(arguments['user'])
+
+        raise ValueError('Unknown command: {}'.format(command))
+
+    #
+    ## @brief Serve requests until shutdown method is called or the process is interrupted.
+    #
+    #  @exception RuntimeError - If a server is already running on the socket.
+    #  @exception OSError      - If directory of the socket is writable by the other users, see mDeveloper.clientLib.DeveloperClient.checkSocketDirectory.
+    #
+    #  @return None - None.
+    def serve(self):
+
+        self._removeStaleSocket()
+
+        self._checkDirectory(force=True)
+
+        directory = os.path.dirname(os.path.abspath(self._socketPath))
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+
+        # Clients don't connect to a socket which the other users could replace
+        mDeveloper.clientLib.DeveloperClient.checkSocketDirectory(directory)
+
+        # Socket is created with owner-only permissions, other users can't connect to it in any moment
+        umask = os.umask(0o077)
+
+        try:
+            self._server = socketserver.UnixStreamServer(self._socketPath, _RequestHandler)
+        finally:
+            os.umask(umask)
+
+        self._server.developerServer = self
+
+        # Directory is checked between the requests as well, so that the first request after a change is fast
+        self._server.service_actions = self._checkDirectory
+
+        try:
+            self._server.serve_forever(poll_interval=min(self._pollInterval, 0.5))
+        finally:
+            self._server.server_close()
+            if os.path.exists(self._socketPath):
+                os.remove(self._socketPath)
+
+    #
+    ## @brief Stop serving, it must be called from another thread than the one serve method is called from.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def shutdown(self):
+
+        if self._server:
+            self._server.shutdown()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get records of given developers to send in a response.
+    #
+    #  @param developers [ list of mDeveloper.developerLib.Developer | None | in  ] - Developers.
+    #  @param detail     [ bool                                      | None | in  ] - Whether to include text representations of the developers.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Records, text key has text representation of the developer if detail is True.
+    @staticmethod
+    def getRecords(developers, detail):
+
+        records = []
+
+        for _developer in developers:
+
+            record = _developer.record()._asdict()
+
+            if detail:
+                record['text'] = str(_developer)
+
+            records.append(record)
+
+        return records
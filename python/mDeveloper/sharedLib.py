@@ -0,0 +1,590 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/sharedLib.py @brief [ FILE   ] - Shared memory developer registry module.
+## @package mDeveloper.sharedLib    @brief [ MODULE ] - Shared memory developer registry module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import zlib
+import struct
+import hashlib
+
+from   multiprocessing import shared_memory
+
+import mDeveloper.packLib
+import mDeveloper.cacheLib
+import mDeveloper.statsLib
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Prefix of the shared memory names, names are kept short since macOS allows 31 characters.
+NAME_PREFIX             = 'mdev_'
+
+## [ str ] - Prefix of the snapshot names, pointers are named with NAME_PREFIX and a hexadecimal digest, which never starts with s.
+SNAPSHOT_PREFIX         = 'mdev_s'
+
+## [ str ] - Layout of the pointer, which is the name of the latest snapshot padded with zeros and CRC-32 checksum of it.
+POINTER_FORMAT          = '<32sI'
+
+## [ int ] - Size of the shared memory which holds the pointer to the latest snapshot of a developers directory.
+POINTER_SIZE            = struct.calcsize(POINTER_FORMAT)
+
+## [ int ] - Number of times a pointer with a checksum mismatch is read again, since it may be being written.
+POINTER_RETRIES         = 10
+
+## [ float ] - Age in seconds after which a snapshot no pointer refers to is considered orphaned, see SharedRegistry.cleanup.
+ORPHAN_AGE              = 60.0
+
+## [ str ] - Directory POSIX shared memory is listed in on Linux.
+SHARED_MEMORY_DIRECTORY = '/dev/shm'
+
+#
+## @brief [ CLASS ] - Class to share a snapshot of a developers directory between the processes of a node.
+#
+#  Snapshot is the content of a pack file, see mDeveloper.packLib.PackedRegistry, published into
+#  multiprocessing.shared_memory. First process compiles the developers directory and publishes the snapshot,
+#  other processes attach to it and look developers up in place without reading the developers directory
+#  or building any objects, so that memory and warm-up time per process are close to zero.
+#
+#  Snapshots are published under unique names and a pointer named after the developers directory refers to the
+#  latest one, which is updated once the snapshot is complete. Snapshot is up to date as long as its stamp,
+#  see mDeveloper.cacheLib.RegistryCache.getDirectoryStamp, matches the developers directory, so that a newer
+#  snapshot is published once a developer module is added, removed or renamed. Publisher of a newer snapshot
+#  unlinks the previous one, processes which are attached to it keep using it until they attach again, since
+#  unlinking removes the name only. Snapshots no pointer refers to are unlinked as well, see cleanup method.
+#
+#  Pointer is written in place, therefore it holds a checksum and readers read it again until it matches.
+#  Publishers of a developers directory take a file lock next to the registry cache file and check the latest
+#  snapshot again once they hold it, so that only one of the processes which miss the snapshot at once builds it.
+#
+#  Snapshots are attached read-only and they outlive the processes, see remove method.
+class SharedRegistry(mDeveloper.packLib.PackedRegistry):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param sharedMemory [ multiprocessing.shared_memory.SharedMemory | None | in  ] - Shared memory of a complete snapshot.
+    #
+    #  @exception ValueError - If shared memory doesn't contain a snapshot.
+    #
+    #  @return None - None.
+    def __init__(self, sharedMemory):
+
+        buffer = sharedMemory.buf.toreadonly()
+
+        try:
+            mDeveloper.packLib.PackedRegistry.__init__(self, sharedMemory.name, buffer=buffer)
+        except ValueError:
+            buffer.release()
+            raise
+
+        ## [ multiprocessing.shared_memory.SharedMemory ] - Shared memory.
+        self._sharedMemory = sharedMemory
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def name(self):
+
+        return self._sharedMemory.name
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Detach from the snapshot, no lookups can be done afterwards.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._buffer is not None:
+            self._buffer.release()
+
+        mDeveloper.packLib.PackedRegistry.close(self)
+
+        self._sharedMemory.close()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get name of the pointer to the latest snapshot of given developers directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name.
+    @staticmethod
+    def getPointerName(directory):
+
+        return '{}{}'.format(NAME_PREFIX, hashlib.sha1(directory.encode('utf-8')).hexdigest()[:20])
+
+    #
+    ## @brief Get a unique name to publish a snapshot under.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name.
+    @staticmethod
+    def getSnapshotName():
+
+        return '{}{}'.format(SNAPSHOT_PREFIX, os.urandom(10).hex())
+
+    #
+    ## @brief Open shared memory with given name.
+    #
+    #  Shared memory is not tracked by the resource tracker of multiprocessing, which would unlink it when this process exits.
+    #
+    #  @param name   [ str  | None  | in  ] - Name.
+    #  @param create [ bool | False | in  ] - Whether to create the shared memory.
+    #  @param size   [ int  | 0     | in  ] - Size of the shared memory to create.
+    #
+    #  @exception FileNotFoundError - If shared memory doesn't exist.
+    #  @exception FileExistsError   - If shared memory to create exists already.
+    #
+    #  @return multiprocessing.shared_memory.SharedMemory - Shared memory.
+    @staticmethod
+    def openSharedMemory(name, create=False, size=0):
+
+        try:
+            return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        except TypeError:
+            pass
+
+        # Python versions before 3.13 track all shared memory
+        sharedMemory = shared_memory.SharedMemory(name=name, create=create, size=size)
+
+        if os.name == 'posix':
+            # Imported on demand, only POSIX shared memory is tracked
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(sharedMemory._name, 'shared_memory')
+
+        return sharedMemory
+
+    #
+    ## @brief Unlink given shared memory, which is opened by openSharedMemory method.
+    #
+    #  @param sharedMemory [ multiprocessing.shared_memory.SharedMemory | None | in  ] - Shared memory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def unlinkSharedMemory(sharedMemory):
+
+        # Python versions before 3.13 untrack shared memory on unlink, which is not tracked by openSharedMemory method
+        if os.name == 'posix' and not hasattr(sharedMemory, '_track'):
+            from multiprocessing import resource_tracker
+            resource_tracker.register(sharedMemory._name, 'shared_memory')
+
+        sharedMemory.unlink()
+
+    #
+    ## @brief Get content of the pointer to given snapshot.
+    #
+    #  @param name [ str | None | in  ] - Name of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - Content.
+    @staticmethod
+    def getPointerContent(name):
+
+        encodedName = name.encode('ascii')
+
+        return struct.pack(POINTER_FORMAT, encodedName, zlib.crc32(encodedName))
+
+    #
+    ## @brief Parse name of the snapshot given pointer content refers to.
+    #
+    #  @param content [ bytes | None | in  ] - Content of the pointer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name, empty string if pointer is not written yet, which is all zeros, None if content is truncated or its checksum doesn't match.
+    @staticmethod
+    def parsePointer(content):
+
+        if len(content) < POINTER_SIZE:
+            return None
+
+        paddedName, checksum = struct.unpack(POINTER_FORMAT, content[:POINTER_SIZE])
+        encodedName          = paddedName.rstrip(b'\0')
+
+        if zlib.crc32(encodedName) != checksum:
+            return None
+
+        return encodedName.decode('ascii', 'ignore')
+
+    #
+    ## @brief Read name of the latest snapshot of given developers directory.
+    #
+    #  Pointer is read again if its checksum doesn't match, since a publisher may be writing it.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name, None if no snapshot is published.
+    @staticmethod
+    def readPointer(directory):
+
+        try:
+            pointer = SharedRegistry.openSharedMemory(SharedRegistry.getPointerName(directory))
+        except OSError:
+            return None
+
+        for _ in range(POINTER_RETRIES):
+
+            name = SharedRegistry.parsePointer(bytes(pointer.buf[:POINTER_SIZE]))
+            if name is not None:
+                break
+
+            time.sleep(0.001)
+
+        pointer.close()
+
+        return name if name else None
+
+    #
+    ## @brief Attach to the snapshot with given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.sharedLib.SharedRegistry - Shared registry, None if snapshot doesn't exist or it is not valid.
+    @staticmethod
+    def open(name):
+
+        try:
+            sharedMemory = SharedRegistry.openSharedMemory(name)
+        except OSError:
+            return None
+
+        try:
+            return SharedRegistry(sharedMemory)
+        except ValueError:
+            sharedMemory.close()
+            return None
+
+    #
+    ## @brief Attach to the latest snapshot of given developers directory if it is up to date.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the developers directory.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.sharedLib.SharedRegistry - Shared registry, None if snapshot doesn't exist or it is stale.
+    @staticmethod
+    def openLatest(directory):
+
+        name = SharedRegistry.readPointer(directory)
+        if not name:
+            return None
+
+        _sharedRegistry = SharedRegistry.open(name)
+        if _sharedRegistry is None:
+            return None
+
+        if _sharedRegistry.stamp() == mDeveloper.cacheLib.RegistryCache.getDirectoryStamp(directory):
+            return _sharedRegistry
+
+        _sharedRegistry.close()
+
+        return None
+
+    #
+    ## @brief Lock publishing snapshots of given developers directory across processes.
+    #
+    #  Lock is a file lock on a file next to the registry cache file, which is released once the returned file is closed.
+    #
+    #  @param directory      [ str | None | in  ] - Absolute path of the developers directory.
+    #  @param cacheDirectory [ str | None | in  ] - Directory of the registry cache file, default one is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return file - Lock file, None if file locks are not available or lock file couldn't be opened.
+    @staticmethod
+    def lockPublishing(directory, cacheDirectory=None):
+
+        try:
+            # Imported on demand, file locks are available on POSIX only
+            import fcntl
+        except ImportError:
+            return None
+
+        lockPath = mDeveloper.cacheLib.RegistryCache(directory, cacheDirectory=cacheDirectory).getCacheFileOf('shared.lock')
+
+        try:
+            os.makedirs(os.path.dirname(lockPath), exist_ok=True)
+            lockFile = open(lockPath, 'a')
+        except (IOError, OSError):
+            # Snapshot is published without the lock, such as when cache directory is read-only
+            return None
+
+        try:
+            fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX)
+        except (IOError, OSError):
+            lockFile.close()
+            return None
+
+        return lockFile
+
+    #
+    ## @brief Attach to the latest snapshot of given developers directory, publish it if it doesn't exist or it is stale.
+    #
+    #  @param directory      [ str  | None | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str  | None | in  ] - Directory of the registry cache file to publish a snapshot with, default one is used if None given.
+    #  @param publish        [ bool | True | in  ] - Whether to publish the snapshot if it doesn't exist or it is stale.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.sharedLib.SharedRegistry - Shared registry, None if snapshot doesn't exist and it isn't published or shared memory is not available.
+    @staticmethod
+    def attach(directory=None, cacheDirectory=None, publish=True):
+
+        directory = os.path.abspath(directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory())
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+
+        if not os.path.isdir(directory):
+            return None
+
+        _sharedRegistry = SharedRegistry.openLatest(directory)
+
+        if _sharedRegistry is not None:
+            _stats.increment('sharedMemory.hit')
+            return _sharedRegistry
+
+        _stats.increment('sharedMemory.miss')
+
+        if not publish:
+            return None
+
+        try:
+            return SharedRegistry.publish(directory=directory, cacheDirectory=cacheDirectory, force=False)
+        except OSError:
+            return None
+
+    #
+    ## @brief Publish snapshot of given developers directory, unlink the previous one and the orphaned ones.
+    #
+    #  Snapshot is written under a unique name and the pointer is updated to refer to it once it is complete,
+    #  so that a publisher which crashes meanwhile leaves an orphaned snapshot behind only, see cleanup method.
+    #  Snapshot is built and published while holding the lock, see lockPublishing method.
+    #
+    #  @param directory      [ str  | None | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str  | None | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param force          [ bool | True | in  ] - Whether to publish the snapshot even if the latest one is up to date.
+    #
+    #  @exception OSError - If developers directory doesn't exist or shared memory couldn't be created.
+    #
+    #  @return mDeveloper.sharedLib.SharedRegistry - Shared registry.
+    @staticmethod
+    def publish(directory=None, cacheDirectory=None, force=True):
+
+        directory = os.path.abspath(directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory())
+
+        lockFile = SharedRegistry.lockPublishing(directory, cacheDirectory=cacheDirectory)
+
+        try:
+            if not force:
+                # Another process may have published the snapshot while this one was waiting for the lock
+                _sharedRegistry = SharedRegistry.openLatest(directory)
+                if _sharedRegistry is not None:
+                    return _sharedRegistry
+
+            content = mDeveloper.packLib.PackedRegistry.build(directory=directory, cacheDirectory=cacheDirectory)[0]
+            name    = SharedRegistry.getSnapshotName()
+
+            sharedMemory = SharedRegistry.openSharedMemory(name, create=True, size=len(content))
+            sharedMemory.buf[:len(content)] = content
+
+            SharedRegistry.replacePrevious(directory, name)
+            SharedRegistry.cleanup()
+
+            return SharedRegistry(sharedMemory)
+
+        finally:
+            if lockFile is not None:
+                lockFile.close()
+
+    #
+    ## @brief Record given snapshot as the latest one of given developers directory and unlink the previous one.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the developers directory.
+    #  @param name      [ str | None | in  ] - Name of the latest snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name of the previous snapshot, None if there isn't any.
+    @staticmethod
+    def replacePrevious(directory, name):
+
+        pointerName = SharedRegistry.getPointerName(directory)
+
+        try:
+            pointer = SharedRegistry.openSharedMemory(pointerName, create=True, size=POINTER_SIZE)
+        except FileExistsError:
+            try:
+                pointer = SharedRegistry.openSharedMemory(pointerName)
+            except OSError:
+                return None
+        except OSError:
+            return None
+
+        previousName = SharedRegistry.parsePointer(bytes(pointer.buf[:POINTER_SIZE]))
+
+        pointer.buf[:POINTER_SIZE] = SharedRegistry.getPointerContent(name)
+        pointer.close()
+
+        if not previousName or previousName == name:
+            return None
+
+        try:
+            previous = SharedRegistry.openSharedMemory(previousName)
+        except OSError:
+            return None
+
+        previous.close()
+        SharedRegistry.unlinkSharedMemory(previous)
+
+        return previousName
+
+    #
+    ## @brief Unlink the snapshots no pointer refers to, such as the ones of the publishers which crashed.
+    #
+    #  Shared memory is listed in SHARED_MEMORY_DIRECTORY, therefore orphaned snapshots are cleaned up only where it
+    #  exists, such as Linux. Snapshots younger than given age are kept, since their publishers may not have updated
+    #  the pointer yet. Processes attached to an unlinked snapshot are not affected.
+    #
+    #  @param age [ float | ORPHAN_AGE | in  ] - Age in seconds after which a snapshot no pointer refers to is unlinked.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the unlinked snapshots.
+    @staticmethod
+    def cleanup(age=ORPHAN_AGE):
+
+        try:
+            entries = [x for x in os.scandir(SHARED_MEMORY_DIRECTORY) if x.name.startswith(NAME_PREFIX)]
+        except OSError:
+            return []
+
+        referencedNames = set()
+
+        for entry in entries:
+
+            if entry.name.startswith(SNAPSHOT_PREFIX):
+                continue
+
+            try:
+                with open(entry.path, 'rb') as pointerFile:
+                    referencedNames.add(SharedRegistry.parsePointer(pointerFile.read(POINTER_SIZE)))
+            except (IOError, OSError):
+                continue
+
+        names = []
+        now   = time.time()
+
+        for entry in entries:
+
+            if not entry.name.startswith(SNAPSHOT_PREFIX) or entry.name in referencedNames:
+                continue
+
+            try:
+                if now - entry.stat().st_mtime < age:
+                    continue
+
+                os.remove(entry.path)
+            except OSError:
+                # Snapshots of other users can't be unlinked
+                continue
+
+            names.append(entry.name)
+
+        return names
+
+    #
+    ## @brief Unlink the latest snapshot of given developers directory, processes attached to it are not affected.
+    #
+    #  @param directory [ str | None | in  ] - Developers directory, default one is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether a snapshot has been unlinked.
+    @staticmethod
+    def remove(directory=None):
+
+        directory = os.path.abspath(directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory())
+
+        try:
+            pointer = SharedRegistry.openSharedMemory(SharedRegistry.getPointerName(directory))
+        except OSError:
+            return False
+
+        name = SharedRegistry.parsePointer(bytes(pointer.buf[:POINTER_SIZE]))
+
+        pointer.close()
+        SharedRegistry.unlinkSharedMemory(pointer)
+
+        if not name:
+            return False
+
+        try:
+            snapshot = SharedRegistry.openSharedMemory(name)
+        except OSError:
+            return False
+
+        snapshot.close()
+        SharedRegistry.unlinkSharedMemory(snapshot)
+
+        return True
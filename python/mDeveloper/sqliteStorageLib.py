@@ -0,0 +1,606 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/sqliteStorageLib.py @brief [ FILE   ] - SQLite developer storage module.
+## @package mDeveloper.sqliteStorageLib    @brief [ MODULE ] - SQLite developer storage module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sqlite3
+import collections
+
+import mDeveloper.statsLib
+import mDeveloper.searchLib
+import mDeveloper.storageAbs
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the database schema, databases of the first version are upgraded and the others are not opened.
+SCHEMA_VERSION = 2
+
+## [ dict ] - Developer module attributes as keys and column names of the developers table as values.
+COLUMNS        = dict(zip(mDeveloper.developerLib.RECORD_ATTRIBUTES, mDeveloper.developerLib.DeveloperRecord._fields))
+
+## [ str ] - Schema of the table of the indexes built from the records, triggers delete the indexes once any record changes.
+INDEX_SCHEMA   = ('CREATE TABLE developer_indexes (name TEXT PRIMARY KEY, content BLOB NOT NULL);'
+                  'CREATE TRIGGER developer_indexes_ai AFTER INSERT ON developers BEGIN DELETE FROM developer_indexes; END;'
+                  'CREATE TRIGGER developer_indexes_ad AFTER DELETE ON developers BEGIN DELETE FROM developer_indexes; END;'
+                  'CREATE TRIGGER developer_indexes_au AFTER UPDATE ON developers BEGIN DELETE FROM developer_indexes; END;')
+
+#
+## @brief [ CLASS ] - Class to store developer records in a SQLite database.
+#
+#  Records are stored in developers table, which has indexed user name and e-mail address columns, and
+#  searchable fields are indexed by a FTS5 table with trigram tokenizer. Search candidates are found by the
+#  FTS5 table and scored the same way as mDeveloper.searchLib.SearchIndex, so results of both storages are
+#  the same. Keywords shorter than a trigram and SQLite builds without FTS5 fall back to scanning the table.
+#
+#  Records are written by importDirectory method, which converts a developers directory in bulk, or by
+#  addRecords and removeRecords methods. Only validated records are stored.
+#
+#  Fuzzy index is stored in developer_indexes table once it is built, so that it is built once for the records
+#  instead of once for each process. Triggers delete it in the same transaction that changes the records.
+#
+#  Database file is created only if it is requested, so that a mistyped path isn't silently replaced by an empty
+#  database, and databases of another schema version are never dropped, see _connect method.
+class SQLiteStorage(mDeveloper.storageAbs.Storage):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param databasePath [ str  | None  | in  ] - Absolute path of the database file.
+    #  @param create       [ bool | False | in  ] - Whether to create the database file if it doesn't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, databasePath, create=False):
+
+        ## [ str ] - Absolute path of the database file.
+        self._databasePath      = databasePath
+
+        ## [ bool ] - Whether to create the database file if it doesn't exist.
+        self._create            = create
+
+        ## [ sqlite3.Connection ] - Connection, which is opened on demand.
+        self._connection        = None
+
+        ## [ bool ] - Whether the database has the full text search table.
+        self._hasFullTextSearch = False
+
+        ## [ bool ] - Whether the database has the table of the indexes, see INDEX_SCHEMA.
+        self._hasIndexTable     = False
+
+        ## [ mDeveloper.fuzzyLib.FuzzyIndex ] - Fuzzy index, which is created on demand and reset when records change.
+        self._fuzzyIndex        = None
+
+        ## [ mDeveloper.facetLib.FacetIndex ] - Facet index, which is created on demand and reset when records change.
+        self._facetIndex        = None
+
+        ## [ mDeveloper.matcherLib.BatchMatcher ] - Batch matcher, which is created on demand and reset when records change.
+        self._batchMatcher      = None
+
+    #
+    ## @brief Get connection, open it if it isn't opened yet.
+    #
+    #  Schema is created if the database is empty and databases of the first schema version are upgraded. Databases
+    #  of another schema version, or files which are not developer databases, are refused instead of being dropped,
+    #  since their records can't be recovered otherwise.
+    #
+    #  @exception sqlite3.Error - If database doesn't exist and it isn't created, it couldn't be opened or its schema version is not supported.
+    #
+    #  @return sqlite3.Connection - Connection.
+    def _connect(self):
+
+        if self._connection is not None:
+            return self._connection
+
+        if not self._create and not os.path.isfile(self._databasePath):
+            raise sqlite3.OperationalError('Developer database does not exist: {}'.format(self._databasePath))
+
+        connection = sqlite3.connect(self._databasePath, check_same_thread=False)
+
+        try:
+            version = connection.execute('PRAGMA user_version').fetchone()[0]
+
+            if version == 1:
+
+                # Read-only databases can't be upgraded, their indexes are built in memory
+                try:
+                    SQLiteStorage.upgradeSchema(connection)
+                except sqlite3.OperationalError:
+                    pass
+
+            elif version != SCHEMA_VERSION:
+
+                if version or connection.execute('SELECT 1 FROM sqlite_master').fetchone() is not None:
+                    raise sqlite3.DatabaseError('{} is not a developer database of schema version {}.'.format(self._databasePath, SCHEMA_VERSION))
+
+                SQLiteStorage.createSchema(connection)
+
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        self._hasFullTextSearch = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'developers_fts'").fetchone() is not None
+        self._hasIndexTable     = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'developer_indexes'").fetchone() is not None
+        self._connection        = connection
+
+        return connection
+
+    #
+    ## @brief Get record of given row.
+    #
+    #  @param row [ tuple | None | in  ] - Row, which starts with the record columns.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if None given.
+    def _getRecordOf(self, row):
+
+        return None if row is None else mDeveloper.developerLib.DeveloperRecord(*row[:len(COLUMNS)])
+
+    #
+    ## @brief Insert given records in the transaction of given connection, existing records of the same developer modules are replaced.
+    #
+    #  @param connection [ sqlite3.Connection | None | in  ] - Connection.
+    #  @param records    [ iterable of tuple  | None | in  ] - Developer module name and validated mDeveloper.developerLib.DeveloperRecord pairs.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of records inserted.
+    def _insertRecords(self, connection, records):
+
+        rows = [(moduleName,) + tuple(record) + (record.email.lower() if isinstance(record.email, str) else None,) for moduleName, record in records]
+
+        # Upsert instead of INSERT OR REPLACE, which doesn't fire the delete trigger of the full text search table
+        connection.executemany('INSERT INTO developers (moduleName, {0}, emailKey) VALUES ({1}) '
+                               'ON CONFLICT (moduleName) DO UPDATE SET {2}'.format(', '.join(COLUMNS.values()),
+                                                                                   ', '.join(['?'] * (len(COLUMNS) + 2)),
+                                                                                   ', '.join('{0} = excluded.{0}'.format(x) for x in list(COLUMNS.values()) + ['emailKey'])),
+                               rows)
+
+        return len(rows)
+
+    #
+    ## @brief Store given index unless the records changed since given data version, errors are ignored.
+    #
+    #  Data version is checked in the write transaction, so that an index built from the previous records is
+    #  never stored after another connection commits new records.
+    #
+    #  @param connection  [ sqlite3.Connection | None | in  ] - Connection.
+    #  @param name        [ str                | None | in  ] - Name of the index, such as fuzzy.
+    #  @param content     [ bytes              | None | in  ] - Content of the index.
+    #  @param dataVersion [ int                | None | in  ] - Data version of the connection before the records are read, see PRAGMA data_version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _storeIndex(self, connection, name, content, dataVersion):
+
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                stored = connection.execute('PRAGMA data_version').fetchone()[0] == dataVersion
+                if stored:
+                    connection.execute('INSERT OR REPLACE INTO developer_indexes (name, content) VALUES (?, ?)', (name, content))
+                connection.commit()
+            except sqlite3.Error:
+                connection.rollback()
+                raise
+
+        # Database is read-only or it is locked by a writer
+        except sqlite3.OperationalError:
+            return False
+
+        return stored
+
+    #
+    ## @brief Reset the indexes built from the records, once the records change.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _resetIndexes(self):
+
+        self._fuzzyIndex   = None
+        self._facetIndex   = None
+        self._batchMatcher = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def databasePath(self):
+
+        return self._databasePath
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether the database has a full text search table, FTS5 with trigram tokenizer requires SQLite 3.34.0 or later.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasFullTextSearch(self):
+
+        self._connect()
+
+        return self._hasFullTextSearch
+
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names, sorted.
+    def listModules(self):
+
+        return [x[0] for x in self._connect().execute('SELECT moduleName FROM developers ORDER BY moduleName')]
+
+    #
+    ## @brief Check whether developer module with given name exists.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasModule(self, moduleName):
+
+        return self._connect().execute('SELECT 1 FROM developers WHERE moduleName = ?', (moduleName,)).fetchone() is not None
+
+    #
+    ## @brief Get record of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if developer module doesn't exist.
+    def getRecord(self, moduleName):
+
+        row = self._connect().execute('SELECT {} FROM developers WHERE moduleName = ?'.format(', '.join(COLUMNS.values())),
+                                      (moduleName,)).fetchone()
+
+        return self._getRecordOf(row)
+
+    #
+    ## @brief Get validated record of given developer module, records are validated before they are stored.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception ImportError - If developer module doesn't exist.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getValidatedRecord(self, moduleName):
+
+        record = self.getRecord(moduleName)
+        if record is None:
+            raise ImportError('No developer module named {} in {}'.format(moduleName, self._databasePath))
+
+        return record
+
+    #
+    ## @brief Load all records.
+    #
+    #  @param workers   [ int  | None  | in  ] - Not used, records are read with one query.
+    #  @param processes [ bool | False | in  ] - Not used, records are read with one query.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Developer module names as keys and mDeveloper.developerLib.DeveloperRecord instances as values, sorted by module name.
+    #  @return collections.OrderedDict - Always empty, invalid developer modules are not stored.
+    def loadRecords(self, workers=None, processes=False):
+
+        return collections.OrderedDict(self.iterRecords()), collections.OrderedDict()
+
+    #
+    ## @brief Iterate over the records lazily, rows are fetched as the generator is consumed.
+    #
+    #  @param errors [ dict | None | out ] - Not used, invalid developer modules are not stored.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs, sorted by developer module name.
+    def iterRecords(self, errors=None):
+
+        cursor = self._connect().execute('SELECT {}, moduleName FROM developers ORDER BY moduleName'.format(', '.join(COLUMNS.values())))
+
+        for row in cursor:
+            yield row[-1], self._getRecordOf(row)
+
+    #
+    ## @brief Get developer module name of given user name.
+    #
+    #  @param userName [ str | None | in  ] - Value of USERNAME attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given user name.
+    def getModuleByUserName(self, userName):
+
+        row = self._connect().execute('SELECT moduleName FROM developers WHERE userName = ? ORDER BY moduleName LIMIT 1', (userName,)).fetchone()
+
+        return None if row is None else row[0]
+
+    #
+    ## @brief Get developer module name of given e-mail address.
+    #
+    #  @param email [ str | None | in  ] - Value of EMAIL attribute of the developer, case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given e-mail address.
+    def getModuleByEmail(self, email):
+
+        row = self._connect().execute('SELECT moduleName FROM developers WHERE emailKey = ? ORDER BY moduleName LIMIT 1', (email.lower(),)).fetchone()
+
+        return None if row is None else row[0]
+
+    #
+    ## @brief Search developer records, results are the same as mDeveloper.searchLib.SearchIndex.search.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        keyword = keyword.lower()
+        fields  = fields if fields else mDeveloper.searchLib.FIELDS
+
+        mDeveloper.searchLib.SearchIndex.checkFields(fields)
+
+        connection = self._connect()
+        columns    = [COLUMNS[x] for x in fields]
+
+        if self._hasFullTextSearch and len(keyword) >= 3:
+            # Column filter limits the candidates to the given fields, trigram tokenizer is case insensitive
+            cursor = connection.execute('SELECT developers.moduleName, {} FROM developers_fts '
+                                        'JOIN developers ON developers.rowid = developers_fts.rowid '
+                                        'WHERE developers_fts MATCH ?'.format(', '.join('developers.{}'.format(x) for x in columns)),
+                                        ('{{{}}}: "{}"'.format(' '.join(columns), keyword.replace('"', '""')),))
+        else:
+            cursor = connection.execute('SELECT moduleName, {} FROM developers'.format(', '.join(columns)))
+
+        scores = {}
+
+        for row in cursor:
+
+            score = mDeveloper.searchLib.SearchIndex.getRecordScore(row[1:], keyword, fields)
+            if score:
+                scores[row[0]] = score
+
+        return mDeveloper.searchLib.SearchIndex.rankResults(scores, limit)
+
+    #
+    ## @brief Get fuzzy index of the records, which is loaded from the database once it is stored, see mDeveloper.fuzzyLib.FuzzyIndex.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Fuzzy index.
+    def getFuzzyIndex(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.fuzzyLib
+
+        connection = self._connect()
+
+        if self._fuzzyIndex is not None or not self._hasIndexTable:
+            return mDeveloper.storageAbs.Storage.getFuzzyIndex(self)
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+
+        with _stats.span('fuzzyIndex'):
+
+            row = connection.execute("SELECT content FROM developer_indexes WHERE name = 'fuzzy'").fetchone()
+            if row is not None:
+                self._fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex.fromBytes(row[0])
+
+            if self._fuzzyIndex is None:
+                _stats.increment('fuzzyIndex.miss')
+
+                dataVersion = connection.execute('PRAGMA data_version').fetchone()[0]
+                fuzzyIndex  = mDeveloper.storageAbs.Storage.getFuzzyIndex(self)
+
+                try:
+                    self._storeIndex(connection, 'fuzzy', fuzzyIndex.toBytes(''), dataVersion)
+                except ValueError:
+                    pass
+            else:
+                _stats.increment('fuzzyIndex.hit')
+
+        return self._fuzzyIndex
+
+    #
+    ## @brief Add given records, existing records of the same developer modules are replaced.
+    #
+    #  @param records [ iterable of tuple | None | in  ] - Developer module name and validated mDeveloper.developerLib.DeveloperRecord pairs.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of records added.
+    def addRecords(self, records):
+
+        connection = self._connect()
+
+        with connection:
+            count = self._insertRecords(connection, records)
+
+        self._resetIndexes()
+
+        return count
+
+    #
+    ## @brief Remove records of given developer modules.
+    #
+    #  @param moduleNames [ iterable of str | None | in  ] - Developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def removeRecords(self, moduleNames):
+
+        connection = self._connect()
+
+        with connection:
+            connection.executemany('DELETE FROM developers WHERE moduleName = ?', [(x,) for x in moduleNames])
+
+        self._resetIndexes()
+
+    #
+    ## @brief Convert given developers directory into the database in bulk, existing records are replaced.
+    #
+    #  Developer modules are loaded and validated by mDeveloper.developerLib.DeveloperRegistry, so that the
+    #  registry cache file is used. Existing records are deleted and all records are written in one transaction,
+    #  so that readers see either the previous or the new records and a failure leaves the previous ones in place.
+    #
+    #  @param directory      [ str  | None  | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str  | None  | in  ] - Directory of the registry cache file, default one is used if None given.
+    #  @param workers        [ int  | None  | in  ] - Number of workers to read changed developer modules with, see mDeveloper.cacheLib.RegistryCache.load.
+    #  @param processes      [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return int                     - Number of records imported.
+    #  @return collections.OrderedDict - Developer module names as keys and validation exceptions as values of the developer modules which are not imported.
+    def importDirectory(self, directory=None, cacheDirectory=None, workers=None, processes=False):
+
+        _registry = mDeveloper.developerLib.DeveloperRegistry(directory=directory, cacheDirectory=cacheDirectory)
+
+        records, errors = _registry.loadRecords(workers=workers, processes=processes)
+
+        connection = self._connect()
+
+        with mDeveloper.statsLib.Stats.getInstance().span('write'):
+
+            with connection:
+                connection.execute('DELETE FROM developers')
+                self._insertRecords(connection, records.items())
+
+            self._resetIndexes()
+
+        return len(records), errors
+
+    #
+    ## @brief Close the connection, it is opened again on access.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Upgrade schema of a database of the first schema version in one transaction, the table of the indexes is created, see INDEX_SCHEMA.
+    #
+    #  @param connection [ sqlite3.Connection | None | in  ] - Connection.
+    #
+    #  @exception sqlite3.Error - If database couldn't be upgraded, such as a read-only database.
+    #
+    #  @return None - None.
+    @staticmethod
+    def upgradeSchema(connection):
+
+        try:
+            connection.executescript('BEGIN IMMEDIATE; {} PRAGMA user_version = {}; COMMIT;'.format(INDEX_SCHEMA, SCHEMA_VERSION))
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+
+    #
+    ## @brief Create schema of a new database.
+    #
+    #  Full text search table is kept in sync with the developers table by triggers. It isn't created if
+    #  the SQLite library doesn't support FTS5 with trigram tokenizer.
+    #
+    #  @param connection [ sqlite3.Connection | None | in  ] - Connection.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def createSchema(connection):
+
+        ftsColumns = ', '.join(COLUMNS[x] for x in mDeveloper.searchLib.FIELDS)
+        newColumns = ', '.join('new.{}'.format(COLUMNS[x]) for x in mDeveloper.searchLib.FIELDS)
+        oldColumns = ', '.join('old.{}'.format(COLUMNS[x]) for x in mDeveloper.searchLib.FIELDS)
+
+        with connection:
+
+            connection.executescript('CREATE TABLE developers (moduleName TEXT PRIMARY KEY, {}, emailKey TEXT);'
+                                     'CREATE INDEX developers_userName ON developers (userName);'
+                                     'CREATE INDEX developers_emailKey ON developers (emailKey);'.format(', '.join(COLUMNS.values())))
+
+            connection.executescript(INDEX_SCHEMA)
+
+            try:
+                connection.execute("CREATE VIRTUAL TABLE developers_fts USING fts5({}, content='developers', content_rowid='rowid', "
+                                   "tokenize='trigram')".format(ftsColumns))
+            except sqlite3.OperationalError:
+                pass
+            else:
+                connection.executescript('CREATE TRIGGER developers_ai AFTER INSERT ON developers BEGIN '
+                                         'INSERT INTO developers_fts (rowid, {0}) VALUES (new.rowid, {1}); END;'
+                                         'CREATE TRIGGER developers_ad AFTER DELETE ON developers BEGIN '
+                                         "INSERT INTO developers_fts (developers_fts, rowid, {0}) VALUES ('delete', old.rowid, {2}); END;"
+                                         'CREATE TRIGGER developers_au AFTER UPDATE ON developers BEGIN '
+                                         "INSERT INTO developers_fts (developers_fts, rowid, {0}) VALUES ('delete', old.rowid, {2}); "
+                                         'INSERT INTO developers_fts (rowid, {0}) VALUES (new.rowid, {1}); END;'.format(ftsColumns, newColumns, oldColumns))
+
+            connection.execute('PRAGMA user_version = {}'.format(SCHEMA_VERSION))
@@ -0,0 +1,231 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/statsLib.py @brief [ FILE   ] - Statistics module.
+## @package mDeveloper.statsLib    @brief [ MODULE ] - Statistics module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import time
+import threading
+import collections
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class to measure a span, it is used as a context manager, see mDeveloper.statsLib.Stats.span.
+class Span(object):
+
+    __slots__ = ('_stats', '_name', '_startTime')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param stats [ mDeveloper.statsLib.Stats | None | in  ] - Stats to record the span into.
+    #  @param name  [ str                       | None | in  ] - Name of the span, such as scan.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, stats, name):
+
+        ## [ mDeveloper.statsLib.Stats ] - Stats.
+        self._stats     = stats
+
+        ## [ str ] - Name.
+        self._name      = name
+
+        ## [ float ] - Start time.
+        self._startTime = None
+
+    #
+    ## @brief Start the span.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.statsLib.Span - Span.
+    def __enter__(self):
+
+        self._startTime = time.perf_counter()
+
+        return self
+
+    #
+    ## @brief Stop the span and record it.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+
+        self._stats.addSpan(self._name, time.perf_counter() - self._startTime)
+
+        return False
+
+#
+## @brief [ CLASS ] - Class to collect timing spans and counters of the hot paths.
+#
+#  Spans are recorded per name as number of calls and total time, counters are plain integers.
+#  Both of them are cheap enough to be always enabled, a process-wide instance can be obtained from
+#  getInstance method. Updates are guarded by a lock, since worker pools and background refreshes
+#  record into the same instance concurrently.
+#
+#  Span names used by mDeveloper are: scan, read, import, validate, index and render.
+class Stats(object):
+
+    ## [ mDeveloper.statsLib.Stats ] - Process-wide instance, see getInstance method.
+    _instance     = None
+
+    ## [ threading.Lock ] - Lock of the creation of the process-wide instance.
+    _instanceLock = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ collections.OrderedDict ] - Span names as keys and [number of calls, total time in seconds] lists as values.
+        self._spans    = collections.OrderedDict()
+
+        ## [ collections.OrderedDict ] - Counter names as keys and values as values.
+        self._counters = collections.OrderedDict()
+
+        ## [ threading.Lock ] - Lock of the spans and the counters.
+        self._lock     = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a span with given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the span, such as scan.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.statsLib.Span - Span, which is used as a context manager.
+    def span(self, name):
+
+        return Span(self, name)
+
+    #
+    ## @brief Record a span.
+    #
+    #  @param name        [ str   | None | in  ] - Name of the span, such as scan.
+    #  @param elapsedTime [ float | None | in  ] - Elapsed time in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addSpan(self, name, elapsedTime):
+
+        with self._lock:
+
+            span = self._spans.get(name)
+            if span is None:
+                span = self._spans[name] = [0, 0.0]
+
+            span[0] += 1
+            span[1] += elapsedTime
+
+    #
+    ## @brief Increment given counter.
+    #
+    #  @param name  [ str | None | in  ] - Name of the counter, such as cache.hit.
+    #  @param value [ int | 1    | in  ] - Value to add.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def increment(self, name, value=1):
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    #
+    ## @brief Get spans.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Span names as keys and dict instances with count and time keys as values, in the order they are first recorded.
+    def getSpans(self):
+
+        with self._lock:
+            return collections.OrderedDict((x, {'count':y[0], 'time':y[1]}) for x, y in self._spans.items())
+
+    #
+    ## @brief Get counters.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Counter names as keys and values as values, in the order they are first incremented.
+    def getCounters(self):
+
+        with self._lock:
+            return collections.OrderedDict(self._counters)
+
+    #
+    ## @brief Clear all spans and counters.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def reset(self):
+
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get process-wide instance.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.statsLib.Stats - Stats.
+    @staticmethod
+    def getInstance():
+
+        if Stats._instance is None:
+            with Stats._instanceLock:
+                if Stats._instance is None:
+                    Stats._instance = Stats()
+
+        return Stats._instance
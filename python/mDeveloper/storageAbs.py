@@ -0,0 +1,407 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/storageAbs.py @brief [ FILE   ] - Developer storage abstract module.
+## @package mDeveloper.storageAbs    @brief [ MODULE ] - Developer storage abstract module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import collections
+
+from   types import ModuleType
+
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ ABSTRACT CLASS ] - Class to store developer records.
+#
+#  mDeveloper.developerLib.Developer operates on the process-wide storage, see
+#  mDeveloper.developerLib.DeveloperRegistry.getInstance. Developer modules directory,
+#  mDeveloper.developerLib.DeveloperRegistry, is the default storage and
+#  mDeveloper.sqliteStorageLib.SQLiteStorage is an alternative one.
+class Storage(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief List developer module names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Developer module names, sorted.
+    def listModules(self):
+
+        raise NotImplementedError('{}.listModules is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Check whether developer module with given name exists.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasModule(self, moduleName):
+
+        raise NotImplementedError('{}.hasModule is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Get record of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record, None if developer module doesn't exist or it is not valid.
+    def getRecord(self, moduleName):
+
+        raise NotImplementedError('{}.getRecord is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Get validated record of given developer module.
+    #
+    #  @param moduleName [ str | None | in  ] - Developer module name, such as sonerLib.
+    #
+    #  @exception ImportError - If developer module doesn't exist.
+    #  @exception Exception   - Validation error of the developer module.
+    #
+    #  @return mDeveloper.developerLib.DeveloperRecord - Record.
+    def getValidatedRecord(self, moduleName):
+
+        raise NotImplementedError('{}.getValidatedRecord is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Load all valid records.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read developer modules with, if storage reads any.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Developer module names as keys and mDeveloper.developerLib.DeveloperRecord instances as values, sorted by module name.
+    #  @return collections.OrderedDict - Developer module names as keys and validation exceptions as values, sorted by module name.
+    def loadRecords(self, workers=None, processes=False):
+
+        raise NotImplementedError('{}.loadRecords is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Iterate over the valid records lazily.
+    #
+    #  @param errors [ dict | None | out ] - Developer module names as keys and validation exceptions as values are stored in given dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Developer module name and mDeveloper.developerLib.DeveloperRecord pairs, sorted by developer module name.
+    def iterRecords(self, errors=None):
+
+        raise NotImplementedError('{}.iterRecords is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Get developer module name of given user name.
+    #
+    #  @param userName [ str | None | in  ] - Value of USERNAME attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given user name.
+    def getModuleByUserName(self, userName):
+
+        raise NotImplementedError('{}.getModuleByUserName is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Get developer module name of given e-mail address, case insensitive.
+    #
+    #  @param email [ str | None | in  ] - Value of EMAIL attribute of the developer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Developer module name, None if there is no developer with given e-mail address.
+    def getModuleByEmail(self, email):
+
+        raise NotImplementedError('{}.getModuleByEmail is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Resolve given users to developer module names, see mDeveloper.developerLib.DeveloperRegistry.resolveMany.
+    #
+    #  Users are resolved one by one by using hasModule, getModuleByEmail and getModuleByUserName methods.
+    #
+    #  @param users [ iterable of str, module | None | in  ] - User names, e-mail addresses, developer module names or developer modules.
+    #
+    #  @exception N/A
+    #
+    #  @return collections.OrderedDict - Given users as keys in the given order and developer module names as values, None for the ones which can't be resolved.
+    def resolveMany(self, users):
+
+        suffix = mMecoPackage.enumLib.PackagePythonFileSuffix.kLib
+
+        result = collections.OrderedDict()
+
+        for user in users:
+
+            if user in result:
+                continue
+
+            moduleName = None
+
+            if isinstance(user, ModuleType):
+                moduleName = user.__name__.split('.')[-1]
+
+            elif not isinstance(user, str) or not user:
+                pass
+
+            elif '@' in user:
+                moduleName = self.getModuleByEmail(user)
+
+            elif self.hasModule(user):
+                moduleName = user
+
+            elif self.hasModule('{}{}'.format(user, suffix)):
+                moduleName = '{}{}'.format(user, suffix)
+
+            else:
+                moduleName = self.getModuleByUserName(user)
+
+            result[user] = moduleName if moduleName and self.hasModule(moduleName) else None
+
+        return result
+
+    #
+    ## @brief Search developer records, results must be the same as mDeveloper.searchLib.SearchIndex.search.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword, search is case insensitive.
+    #  @param fields  [ list of str | None | in  ] - Fields to search in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit   [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def search(self, keyword, fields=None, limit=None):
+
+        raise NotImplementedError('{}.search is not implemented.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Get fuzzy index of the records, see mDeveloper.fuzzyLib.FuzzyIndex.
+    #
+    #  Index is built from iterRecords method once and it is kept afterwards, storages whose records change reset it.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.fuzzyLib.FuzzyIndex - Fuzzy index.
+    def getFuzzyIndex(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.fuzzyLib
+
+        fuzzyIndex = getattr(self, '_fuzzyIndex', None)
+
+        if fuzzyIndex is None:
+            fuzzyIndex = self._fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex(self.iterRecords())
+
+        return fuzzyIndex
+
+    #
+    ## @brief Search developer records by edit distance, see mDeveloper.fuzzyLib.FuzzyIndex.search.
+    #
+    #  @param keyword     [ str | None | in  ] - Keyword.
+    #  @param maxDistance [ int | None | in  ] - Maximum edit distance, mDeveloper.fuzzyLib.DEFAULT_MAX_DISTANCE is used if None given.
+    #  @param limit       [ int | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Developer module name and distance pairs, sorted by distance and module name in ascending order.
+    def fuzzySearch(self, keyword, maxDistance=None, limit=None):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.fuzzyLib
+
+        maxDistance = mDeveloper.fuzzyLib.DEFAULT_MAX_DISTANCE if maxDistance is None else maxDistance
+
+        return self.getFuzzyIndex().search(keyword, maxDistance=maxDistance, limit=limit)
+
+    #
+    ## @brief Get user names of the developers whose user name or name is close to given user, so that typos can be pointed out.
+    #
+    #  @param user  [ str | None | in  ] - User name, e-mail address or developer module name.
+    #  @param limit [ int | None | in  ] - Maximum number of suggestions, mDeveloper.fuzzyLib.SUGGESTION_COUNT is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - User names, closest ones first.
+    def getSuggestions(self, user, limit=None):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.fuzzyLib
+
+        if not isinstance(user, str):
+            return []
+
+        suffix  = mMecoPackage.enumLib.PackagePythonFileSuffix.kLib
+        keyword = user.split('@')[0]
+
+        if keyword.endswith(suffix) and len(keyword) > len(suffix):
+            keyword = keyword[:-len(suffix)]
+
+        suggestions = []
+
+        for moduleName, distance in self.fuzzySearch(keyword, maxDistance=mDeveloper.fuzzyLib.FuzzyIndex.getSuggestionDistance(keyword)):
+
+            record = self.getRecord(moduleName)
+
+            if record is not None and isinstance(record.userName, str) and record.userName not in suggestions:
+                suggestions.append(record.userName)
+
+            if len(suggestions) == (mDeveloper.fuzzyLib.SUGGESTION_COUNT if limit is None else limit):
+                break
+
+        return suggestions
+
+    #
+    ## @brief Get facet index of the records, see mDeveloper.facetLib.FacetIndex.
+    #
+    #  Index is built from iterRecords method once and it is kept afterwards, storages whose records change reset it.
+    #
+    #  @exception N/A
+    #
+    #  @return mDeveloper.facetLib.FacetIndex - Facet index.
+    def getFacetIndex(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.facetLib
+
+        facetIndex = getattr(self, '_facetIndex', None)
+
+        if facetIndex is None:
+            facetIndex = self._facetIndex = mDeveloper.facetLib.FacetIndex(self.iterRecords())
+
+        return facetIndex
+
+    #
+    ## @brief Query developer records with a keyword and field terms, such as soner site:Headquarter position:"Lead*".
+    #
+    #  Field terms, see mDeveloper.facetLib.FacetIndex.parseQuery, are answered by the facet index and the keyword
+    #  by search method. Query without field terms is the same as search method.
+    #
+    #  @param query  [ str         | None | in  ] - Query.
+    #  @param fields [ list of str | None | in  ] - Fields to search the keyword in, such as USERNAME, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #  @param limit  [ int         | None | in  ] - Maximum number of results, all results are returned if None given.
+    #
+    #  @exception ValueError - If a field is not searchable or a field term has no value.
+    #
+    #  @return list of tuple - Developer module name and score pairs, sorted by score in descending and module name in ascending order.
+    def query(self, query, fields=None, limit=None):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.facetLib
+
+        keyword, terms = mDeveloper.facetLib.FacetIndex.parseQuery(query)
+
+        if not terms:
+            return self.search(keyword, fields=fields, limit=limit)
+
+        moduleNames = self.getFacetIndex().match(terms)
+
+        if not keyword:
+            results = [(x, 0) for x in moduleNames]
+        else:
+            moduleNames = set(moduleNames)
+            results     = [x for x in self.search(keyword, fields=fields) if x[0] in moduleNames]
+
+        return results if limit is None else results[:limit]
+
+    #
+    ## @brief Count developer records by site and position, see mDeveloper.facetLib.FacetIndex.getCounts.
+    #
+    #  @param query  [ str         | None | in  ] - Query to count the records of, see query method, all records are counted if None given.
+    #  @param fields [ list of str | None | in  ] - Fields to search the keyword of the query in, all mDeveloper.searchLib.FIELDS are searched if None given.
+    #
+    #  @exception ValueError - If a field is not searchable or a field term has no value.
+    #
+    #  @return collections.OrderedDict - Fields as keys and list of value and count pairs, sorted by count in descending and value in ascending order, as values.
+    def getFacetCounts(self, query=None, fields=None):
+
+        moduleNames = [x for x, y in self.query(query, fields=fields)] if query else None
+
+        return self.getFacetIndex().getCounts(moduleNames=moduleNames)
+
+    #
+    ## @brief Get batch matcher of the records, see mDeveloper.matcherLib.BatchMatcher.
+    #
+    #  Matcher is built from iterRecords method once and it is kept afterwards, storages whose records change reset it.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #
+    #  @return mDeveloper.matcherLib.BatchMatcher - Batch matcher.
+    def getBatchMatcher(self):
+
+        # Imported on demand to keep start-up time of the commands low
+        import mDeveloper.matcherLib
+
+        batchMatcher = getattr(self, '_batchMatcher', None)
+
+        if batchMatcher is None:
+            batchMatcher = self._batchMatcher = mDeveloper.matcherLib.BatchMatcher(self.iterRecords())
+
+        return batchMatcher
+
+    #
+    ## @brief Match many names, user names or e-mail addresses at once, see mDeveloper.matcherLib.BatchMatcher.match.
+    #
+    #  @param queries [ list of str | None  | in  ] - Queries.
+    #  @param exact   [ bool        | False | in  ] - Whether values must be equal to the queries instead of starting with them.
+    #  @param fields  [ list of str | None  | in  ] - Fields to match, all mDeveloper.matcherLib.FIELDS are matched if None given.
+    #
+    #  @exception ImportError - If NumPy is not installed.
+    #  @exception ValueError  - If a field is not matched.
+    #
+    #  @return mDeveloper.matcherLib.MatchResult - Result.
+    def matchMany(self, queries, exact=False, fields=None):
+
+        return self.getBatchMatcher().match(queries, exact=exact, fields=fields)
+
+    #
+    ## @brief Check whether records are available without reading developer modules one by one.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isLoaded(self):
+
+        return True
+
+    #
+    ## @brief Read the developer modules which have changed, storages which don't read developer modules have nothing to refresh.
+    #
+    #  @param workers   [ int  | None  | in  ] - Number of workers to read developer modules with, if storage reads any.
+    #  @param processes [ bool | False | in  ] - Whether to use a process pool instead of a thread pool.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether any developer module has changed.
+    def refresh(self, workers=None, processes=False):
+
+        return False
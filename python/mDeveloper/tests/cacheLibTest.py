@@ -0,0 +1,195 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/cacheLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.cacheLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import array
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = 'Name {0}'
+POSITION = 'Position'
+EMAIL    = '{0}@example.com'
+SITE     = 'Headquarter'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'url':URL}}
+"""
+
+class RegistryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        for userName in ['alice', 'bob']:
+            self._writeDeveloperModule(userName)
+
+        for fileName in ['__init__.py', 'aliceTest.py', 'notes.txt']:
+            open(os.path.join(self._directory, fileName), 'w').close()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writeDeveloperModule(self, userName, content=DEVELOPER_MODULE_CONTENT):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(content.format(userName))
+
+    def test_listModules(self):
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory)
+
+        self.assertEqual(_registryCache.listModules(), ['aliceLib', 'bobLib'])
+
+        self.assertTrue(os.path.isfile(_registryCache.cacheFile()))
+
+    def test_load(self):
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory)
+
+        records = _registryCache.load()['records']
+        self.assertEqual(records['aliceLib']['EMAIL'], 'alice@example.com')
+        self.assertEqual(records['aliceLib']['INFO']['userName'], 'alice')
+        self.assertEqual(_registryCache.extractCount(), 2)
+
+        _registryCache.load()
+        self.assertEqual(_registryCache.extractCount(), 0)
+
+        self._writeDeveloperModule('bob', DEVELOPER_MODULE_CONTENT.replace('Position', 'Lead Position'))
+        os.utime(os.path.join(self._directory, 'bobLib.py'), ns=(0, 0))
+
+        records = _registryCache.load()['records']
+        self.assertEqual(records['bobLib']['POSITION'], 'Lead Position')
+        self.assertEqual(_registryCache.extractCount(), 1)
+
+        os.remove(os.path.join(self._directory, 'aliceLib.py'))
+        self.assertEqual(_registryCache.listModules(), ['bobLib'])
+
+    def test_loadWorkers(self):
+
+        for userName in ['carol', 'dave', 'erin']:
+            self._writeDeveloperModule(userName)
+
+        expected = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=tempfile.mkdtemp(dir=self._cacheDirectory)).getRecords()
+
+        for processes in [False, True]:
+
+            _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=tempfile.mkdtemp(dir=self._cacheDirectory))
+
+            self.assertEqual(_registryCache.load(workers=2, processes=processes)['records'], expected)
+            self.assertEqual(_registryCache.extractCount(), 5)
+
+    def test_loadValidate(self):
+
+        validated = []
+
+        def validate(moduleName, record):
+            validated.append(moduleName)
+            return moduleName != 'bobLib'
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory)
+
+        self.assertEqual(_registryCache.load(validate=validate)['valid'], ['aliceLib'])
+        self.assertEqual(sorted(validated), ['aliceLib', 'bobLib'])
+
+        # Validation results are cached along with the records, only changed records are validated again
+        del validated[:]
+
+        self._writeDeveloperModule('carol')
+
+        self.assertEqual(mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory).load(validate=validate)['valid'],
+                         ['aliceLib', 'carolLib'])
+        self.assertEqual(validated, ['carolLib'])
+
+    def test_sections(self):
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache
+
+        content = _registryCache.joinSections(b'MDEVTEST', 1, [b'abc', b'', _registryCache.getSectionOf(array.array('I', [1, 2]))])
+
+        sections = _registryCache.splitSections(content, b'MDEVTEST', 1)
+        self.assertEqual(bytes(sections[0]), b'abc')
+        self.assertEqual(bytes(sections[1]), b'')
+        self.assertEqual(_registryCache.getArrayOf(sections[2]).tolist(), [1, 2])
+
+        self.assertEqual(_registryCache.splitSections(content, b'MDEVTEST', 2), None)
+        self.assertEqual(_registryCache.splitSections(content[:-1], b'MDEVTEST', 1), None)
+
+    def test_extractRecord(self):
+
+        self._writeDeveloperModule('broken', 'USERNAME = ')
+
+        records = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory).getRecords()
+        self.assertEqual(records['brokenLib'], None)
+
+    def test_invalidate(self):
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory)
+        _registryCache.load()
+
+        self.assertTrue(_registryCache.invalidate())
+        self.assertFalse(os.path.isfile(_registryCache.cacheFile()))
+        self.assertEqual(os.listdir(self._cacheDirectory), [])
+
+    def test_writeFileAtomically(self):
+
+        filePath = os.path.join(self._cacheDirectory, 'cache', 'data.json')
+        umask    = os.umask(0o022)
+
+        try:
+            mDeveloper.cacheLib.RegistryCache._fileMode = None
+
+            self.assertTrue(mDeveloper.cacheLib.RegistryCache.writeFileAtomically(filePath, b'{}'))
+            self.assertEqual(os.stat(filePath).st_mode & 0o777, 0o644)
+            self.assertEqual(os.listdir(os.path.dirname(filePath)), ['data.json'])
+        finally:
+            os.umask(umask)
+            mDeveloper.cacheLib.RegistryCache._fileMode = None
+
+        with open(filePath, 'rb') as _file:
+            self.assertEqual(_file.read(), b'{}')
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
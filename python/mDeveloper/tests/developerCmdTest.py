@@ -0,0 +1,161 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/developerCmdTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.developerCmdTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+import mDeveloper.searchLib
+import mDeveloper.developerCmd
+import mDeveloper.formatterLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ int ] - Maximum cumulative import time of mDeveloper.developerCmd in microseconds, as reported by -X importtime.
+IMPORT_TIME_BUDGET = 25000
+
+## [ list of str ] - Modules which must not be imported before the arguments of a command are parsed.
+DEFERRED_MODULES   = ['mCore.displayLib',
+                      'mDeveloper.cacheLib',
+                      'mDeveloper.searchLib',
+                      'mDeveloper.developerLib',
+                      'mDeveloper.formatterLib',
+                      'mDeveloper.validatorLib',
+                      'concurrent.futures',
+                      'tempfile',
+                      'pickle',
+                      'csv',
+                      'cProfile']
+
+class DeveloperCmdTest(unittest.TestCase):
+
+    def _runPython(self, arguments, environment=None):
+
+        environment = dict(os.environ if environment is None else environment)
+        environment['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+        return subprocess.run([sys.executable] + arguments,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              env=environment,
+                              universal_newlines=True)
+
+    def test_import(self):
+
+        code = ("import sys;import mDeveloper.developerCmd\n"
+                "print(','.join(x for x in {} if x in sys.modules))").format(DEFERRED_MODULES)
+
+        process = self._runPython(['-c', code])
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertEqual(process.stdout.splitlines()[-1], '')
+
+    def test_importTime(self):
+
+        importTimes = []
+
+        # Byte code files are written, otherwise each run would compile the modules
+        environment = dict(os.environ)
+        environment.pop('PYTHONDONTWRITEBYTECODE', None)
+
+        # Fastest run is compared, so that a busy machine doesn't fail the test, first run may compile the byte code files
+        for _ in range(5):
+
+            process = self._runPython(['-X', 'importtime', '-c', 'import mDeveloper.developerCmd'], environment=environment)
+
+            for line in process.stderr.splitlines():
+                fields = [x.strip() for x in line.split('|')]
+                if len(fields) == 3 and fields[2] == 'mDeveloper.developerCmd':
+                    importTimes.append(int(fields[1]))
+
+        self.assertTrue(importTimes)
+        self.assertTrue(min(importTimes) < IMPORT_TIME_BUDGET,
+                        'Importing mDeveloper.developerCmd took {} us, budget is {} us.'.format(min(importTimes), IMPORT_TIME_BUDGET))
+
+    def test_choices(self):
+
+        # Choices are listed in the command module, so that parsing the arguments doesn't import the libraries
+        self.assertEqual(mDeveloper.developerCmd.SEARCH_FIELDS, [x.lower() for x in mDeveloper.searchLib.FIELDS])
+        self.assertEqual(mDeveloper.developerCmd.OUTPUT_FORMATS, ['text'] + mDeveloper.formatterLib.FORMATS)
+
+    def test_help(self):
+
+        for command in ['listDevelopers', 'search', 'validate']:
+
+            code = ("import sys;sys.argv=['mdeveloper', '--help'];import mDeveloper.developerCmd\n"
+                    "try:\n    mDeveloper.developerCmd.{}()\nexcept SystemExit:\n    pass\n"
+                    "print(','.join(x for x in {} if x in sys.modules))").format(command, DEFERRED_MODULES)
+
+            process = self._runPython(['-c', code])
+
+            self.assertEqual(process.returncode, 0, process.stderr)
+            self.assertEqual(process.stdout.splitlines()[-1], '')
+
+    def test_format(self):
+
+        code = ("import sys;sys.argv=['mdeveloper-search', 'soner', '--no-server', '--format', '{}', '--fields', 'username,email']\n"
+                "import mDeveloper.developerCmd;mDeveloper.developerCmd.search()")
+
+        process = self._runPython(['-c', code.format('ndjson')])
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertEqual([json.loads(x) for x in process.stdout.splitlines()], [{'userName':'soner', 'email':'safak@safakoner.com'}])
+
+        process = self._runPython(['-c', code.format('csv')])
+
+        self.assertEqual(process.stdout.splitlines(), ['userName,email', 'soner,safak@safakoner.com'])
+
+        process = self._runPython(['-c', code.format('json').replace('username,email', 'info')])
+
+        self.assertEqual(process.returncode, 2)
+
+    def test_listDevelopers(self):
+
+        code = ("import sys;sys.argv=['mdeveloper-list', '--no-server', '--format', 'ndjson', '--fields', 'username'] + {!r}\n"
+                "import mDeveloper.developerCmd;mDeveloper.developerCmd.listDevelopers()")
+
+        # Developers are streamed with and without a limit
+        for arguments in [[], ['--jobs', '2'], ['--limit', '1']]:
+
+            process = self._runPython(['-c', code.format(arguments)])
+
+            self.assertEqual(process.returncode, 0, process.stderr)
+            self.assertEqual([json.loads(x) for x in process.stdout.splitlines()], [{'userName':'soner'}])
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
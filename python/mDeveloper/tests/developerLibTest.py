@@ -25,9 +25,15 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import os
 import types
+import shutil
+import tempfile
+import threading
 import unittest
 
+import mDeveloper.searchLib
+import mDeveloper.matcherLib
 import mDeveloper.developerLib
 
 
@@ -35,6 +41,16 @@ import mDeveloper.developerLib
 #-----------------------------------------------------------------------------------------------------
 # CODE
 #-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = 'Name {0}'
+POSITION = 'Position'
+EMAIL    = '{0}@example.com'
+SITE     = 'Headquarter'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'url':URL}}
+"""
+
 class DeveloperTest(unittest.TestCase):
 
     def test_setDeveloper(self):
@@ -45,6 +61,16 @@ class DeveloperTest(unittest.TestCase):
 
         self.assertRaises(ValueError, _developer.setDeveloper, 'user')
 
+    def test_setDeveloperRecord(self):
+
+        record     = mDeveloper.developerLib.DeveloperRecord('alice', 'Alice', 'Position', 'alice@example.com', 'Headquarter', '')
+        _developer = mDeveloper.developerLib.Developer(record)
+
+        self.assertTrue(_developer.record() is record)
+        self.assertEqual(_developer.email(), 'alice@example.com')
+
+        self.assertFalse(hasattr(_developer, '__dict__'))
+
     def test_getDeveloperModule(self):
 
         self.assertEqual(type(mDeveloper.developerLib.Developer.getDeveloperModule('sonerLib')), types.ModuleType)
@@ -63,12 +89,368 @@ class DeveloperTest(unittest.TestCase):
 
         self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('user'), None)
 
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('sonerLib'), 'sonerLib')
+
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('Safak@SafakOner.com'), 'sonerLib')
+
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('soner@example.com'), None)
+
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper(mDeveloper.developerLib.Developer.getDeveloperModule('sonerLib')), 'sonerLib')
+
     def test_listDeveloperModules(self):
 
         _sonerLib = mDeveloper.developerLib.Developer.getDeveloperModule('sonerLib')
 
         self.assertTrue(_sonerLib in mDeveloper.developerLib.Developer.listDeveloperModules())
 
+    def test_search(self):
+
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.search('SONER', fields=['USERNAME'])], ['soner'])
+
+        self.assertEqual(mDeveloper.developerLib.Developer.search('soner', limit=0), [])
+
+    def test_iterSearch(self):
+
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.iterSearch('oner', fields=['USERNAME'])], ['soner'])
+
+        self.assertRaises(ValueError, list, mDeveloper.developerLib.Developer.iterSearch('soner', fields=['INFO']))
+
+    def test_iterDevelopers(self):
+
+        self.assertTrue('soner' in [x.userName() for x in mDeveloper.developerLib.Developer.iterDevelopers()])
+
+    def test_listDevelopers(self):
+
+        self.assertTrue('soner' in [x.userName() for x in mDeveloper.developerLib.Developer.listDevelopers()])
+
+class DeveloperRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        for userName in ['alice', 'bob']:
+            self._writeDeveloperModule(userName)
+
+        self._registry = mDeveloper.developerLib.DeveloperRegistry(directory=self._directory,
+                                                                   cacheDirectory=self._cacheDirectory,
+                                                                   negativeCacheSize=2)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writeDeveloperModule(self, userName, content=DEVELOPER_MODULE_CONTENT):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(content.format(userName))
+
+    def test_listModules(self):
+
+        self.assertEqual(self._registry.listModules(), ['aliceLib', 'bobLib'])
+
+    def test_hasModule(self):
+
+        self.assertTrue(self._registry.hasModule('aliceLib'))
+
+        self.assertFalse(self._registry.hasModule('carolLib'))
+        self.assertFalse(self._registry.hasModule('carolLib'))
+
+        # Negative cache is cleared when a developer module is added and the registry is refreshed
+        self._writeDeveloperModule('carol')
+        self.assertTrue(self._registry.refresh())
+        self.assertTrue(self._registry.hasModule('carolLib'))
+
+        self.assertFalse(self._registry.refresh())
+
+    def test_getValidatedRecord(self):
+
+        record = self._registry.getValidatedRecord('aliceLib')
+        self.assertTrue(isinstance(record, mDeveloper.developerLib.DeveloperRecord))
+        self.assertEqual(record.name, 'Name alice')
+
+        # Values are shared with the columns of the table
+        self.assertTrue(self._registry.getValidatedRecord('aliceLib').name is record.name)
+
+        self._writeDeveloperModule('carol', DEVELOPER_MODULE_CONTENT.replace("POSITION = 'Position'", "POSITION = ''"))
+        self._registry.refresh()
+        self.assertRaises(ValueError, self._registry.getValidatedRecord, 'carolLib')
+
+    def test_loadRecords(self):
+
+        self._writeDeveloperModule('carol', DEVELOPER_MODULE_CONTENT.replace("POSITION = 'Position'", "POSITION = ''"))
+        self._writeDeveloperModule('dave', 'USERNAME = ')
+
+        records, errors = self._registry.loadRecords(workers=2)
+
+        self.assertEqual(list(records.keys()), ['aliceLib', 'bobLib'])
+        self.assertEqual(list(errors.keys()), ['carolLib', 'daveLib'])
+        self.assertTrue(isinstance(errors['carolLib'], ValueError))
+        self.assertTrue(isinstance(errors['daveLib'], SyntaxError))
+
+        self.assertEqual(mDeveloper.developerLib.Developer(records['aliceLib']).email(), 'alice@example.com')
+
+    def test_iterRecords(self):
+
+        self._writeDeveloperModule('carol', 'USERNAME = ')
+
+        errors     = {}
+        generator  = self._registry.iterRecords(errors=errors)
+
+        self.assertEqual(next(generator)[0], 'aliceLib')
+        self.assertFalse(self._registry.isLoaded())
+
+        self.assertEqual([x[0] for x in generator], ['bobLib'])
+        self.assertEqual(list(errors.keys()), ['carolLib'])
+
+        self._registry.refresh()
+
+        errors = {}
+        self.assertEqual([x[0] for x in self._registry.iterRecords(errors=errors)], ['aliceLib', 'bobLib'])
+        self.assertEqual(list(errors.keys()), ['carolLib'])
+
+    def test_getModuleByUserName(self):
+
+        self.assertEqual(self._registry.getModuleByUserName('bob'), 'bobLib')
+
+        self.assertEqual(self._registry.getModuleByUserName('carol'), None)
+
+    def test_getModuleByEmail(self):
+
+        self.assertEqual(self._registry.getModuleByEmail('Bob@Example.com'), 'bobLib')
+
+        self.assertEqual(self._registry.getModuleByEmail('carol@example.com'), None)
+
+    def test_getSearchIndex(self):
+
+        self.assertEqual(self._registry.getSearchIndex().search('bob')[0][0], 'bobLib')
+
+        self.assertEqual(len([x for x in os.listdir(self._cacheDirectory) if x.endswith(mDeveloper.searchLib.INDEX_FILE)]), 1)
+
+        self._writeDeveloperModule('bobby')
+        self._registry.refresh()
+        self.assertEqual([x[0] for x in self._registry.getSearchIndex().search('bob')], ['bobLib', 'bobbyLib'])
+
+    def test_getIndexesOfMemoized(self):
+
+        # Developer module which couldn't be imported while the registry is loaded is memoized once it is imported
+        flagFile = os.path.join(self._cacheDirectory, 'ready')
+
+        self._writeDeveloperModule('carol', 'import os\nassert os.path.isfile({!r})\n'.format(flagFile) + DEVELOPER_MODULE_CONTENT)
+        self._registry.refresh()
+
+        open(flagFile, 'w').close()
+
+        self.assertEqual(self._registry.getFuzzyIndex().search('carol', maxDistance=0), [])
+        self.assertEqual(self._registry.getFacetIndex().getCounts()['SITE'], [('Headquarter', 2)])
+
+        version = self._registry.getSnapshot().version()
+        self.assertEqual(version, self._registry.getSnapshot().signature())
+
+        self._registry.getValidatedRecord('carolLib')
+        self.assertNotEqual(self._registry.getSnapshot().version(), version)
+
+        # Index files saved before are not used for the snapshot with the memoized record
+        self.assertEqual(self._registry.getFuzzyIndex().search('carol', maxDistance=0), [('carolLib', 0)])
+        self.assertEqual(self._registry.getFacetIndex().getCounts()['SITE'], [('Headquarter', 3)])
+
+    def test_query(self):
+
+        self._writeDeveloperModule('carol', DEVELOPER_MODULE_CONTENT.replace("'Headquarter'", "'London'").replace("'url':URL", "'site':SITE, 'url':URL"))
+        self._registry.refresh()
+
+        self.assertEqual(self._registry.query('site:headquarter'), [('aliceLib', 0), ('bobLib', 0)])
+        self.assertEqual([x[0] for x in self._registry.query('bob site:Headquarter')], ['bobLib'])
+        self.assertEqual(self._registry.query('bob site:London'), [])
+        self.assertEqual(self._registry.query('site:"Head*" position:position', limit=1), [('aliceLib', 0)])
+        self.assertEqual(self._registry.query('bob'), self._registry.search('bob'))
+
+        counts = self._registry.getFacetCounts()
+        self.assertEqual(counts['SITE'], [('Headquarter', 2), ('London', 1)])
+        self.assertEqual(counts['POSITION'], [('Position', 3)])
+
+        self.assertEqual(self._registry.getFacetCounts(query='carol')['SITE'], [('London', 1)])
+
+    @unittest.skipUnless(mDeveloper.matcherLib.BatchMatcher.isAvailable(), 'NumPy is not installed')
+    def test_matchMany(self):
+
+        self.assertEqual(self._registry.matchMany(['ali', 'Bob@Example.com', 'name']).getModuleNames(), [['aliceLib'], ['bobLib'], ['aliceLib', 'bobLib']])
+
+        self._writeDeveloperModule('alina')
+        self._registry.refresh()
+        self.assertEqual(self._registry.matchMany(['ali']).getModuleNames(), [['aliceLib', 'alinaLib']])
+
+    def test_resolveMany(self):
+
+        with open(os.path.join(self._directory, 'daveLib.py'), 'w') as moduleFile:
+            moduleFile.write(DEVELOPER_MODULE_CONTENT.format('david'))
+
+        self._registry.refresh()
+
+        result = self._registry.resolveMany(['alice', 'Bob@Example.com', 'aliceLib', 'david', 'carol', 'alice@other.com', 'alice', None])
+
+        self.assertEqual(list(result.items()), [('alice',           'aliceLib'),
+                                                ('Bob@Example.com', 'bobLib'),
+                                                ('aliceLib',        'aliceLib'),
+                                                ('david',           'daveLib'),
+                                                ('carol',           None),
+                                                ('alice@other.com', None),
+                                                (None,              None)])
+
+    def test_getTable(self):
+
+        table = self._registry.getTable()
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.moduleNames(), ['aliceLib', 'bobLib'])
+        self.assertEqual(table.getColumn('USERNAME'), ['alice', 'bob'])
+        self.assertEqual(table.getRecord(table.getRow('bobLib')).email, 'bob@example.com')
+        self.assertEqual(table.getRow('carolLib'), None)
+
+        # Existing rows are overwritten
+        attributes = dict(zip(mDeveloper.developerLib.RECORD_ATTRIBUTES, table.getRecord(1)))
+        attributes['NAME'] = 'Bob'
+
+        self.assertEqual(table.addRecord('bobLib', attributes), 1)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.getRecord(1).name, 'Bob')
+        self.assertEqual(table.getRecord(1).get('NAME'), 'Bob')
+
+    def test_update(self):
+
+        self.assertEqual(self._registry.update(), ([], [], []))
+
+        with open(os.path.join(self._directory, 'aaronLib.py'), 'w') as moduleFile:
+            moduleFile.write(DEVELOPER_MODULE_CONTENT.format('bob'))
+
+        self._writeDeveloperModule('carol', 'USERNAME = ')
+
+        self.assertEqual(self._registry.update(), (['aaronLib', 'carolLib'], [], []))
+        self.assertEqual(self._registry.listModules(), ['aaronLib', 'aliceLib', 'bobLib', 'carolLib'])
+        self.assertEqual(self._registry.getModuleByUserName('bob'), 'aaronLib')
+        self.assertRaises(SyntaxError, self._registry.getValidatedRecord, 'carolLib')
+
+        # Index falls back to the other developer module with the same user name
+        os.remove(os.path.join(self._directory, 'aaronLib.py'))
+
+        self.assertEqual(self._registry.update(), ([], [], ['aaronLib']))
+        self.assertEqual(self._registry.getModuleByUserName('bob'), 'bobLib')
+        self.assertEqual(self._registry.getModuleByEmail('bob@example.com'), 'bobLib')
+        self.assertEqual(len(self._registry.getTable()), 2)
+
+        # Incremental update ends up in the same state as a full refresh
+        self.assertFalse(self._registry.refresh())
+
+    def test_getSnapshot(self):
+
+        snapshot = self._registry.getSnapshot()
+
+        self._writeDeveloperModule('carol')
+        self.assertEqual(self._registry.update(), (['carolLib'], [], []))
+
+        # Changes are made to a new snapshot, readers of the previous one aren't affected
+        self.assertFalse(self._registry.getSnapshot() is snapshot)
+        self.assertEqual(snapshot.moduleNames(), ['aliceLib', 'bobLib'])
+        self.assertEqual(snapshot.userNameIndex().get('carol'), None)
+        self.assertEqual(self._registry.getSnapshot().userNameIndex().get('carol'), 'carolLib')
+
+    def test_refreshInBackground(self):
+
+        started = threading.Event()
+        release = threading.Event()
+
+        class _Registry(mDeveloper.developerLib.DeveloperRegistry):
+
+            def _refresh(self, workers=None, processes=False):
+
+                started.set()
+                release.wait()
+
+                return mDeveloper.developerLib.DeveloperRegistry._refresh(self, workers=workers, processes=processes)
+
+        _registry = _Registry(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+        thread = _registry.refreshInBackground()
+        started.wait()
+
+        # Only one refresh is in flight at a time
+        self.assertEqual(_registry.refreshInBackground(), None)
+        self.assertFalse(_registry.isLoaded())
+
+        release.set()
+        thread.join()
+
+        self.assertEqual(_registry.listModules(), ['aliceLib', 'bobLib'])
+
+        # Lock is released once the refresh is done, thread is joined before tearDown removes the directories
+        thread = _registry.refreshInBackground()
+
+        self.assertNotEqual(thread, None)
+        thread.join()
+
+        self.assertEqual(_registry.listModules(), ['aliceLib', 'bobLib'])
+
+    def test_threads(self):
+
+        self._registry.listModules()
+
+        errors = []
+        done   = threading.Event()
+
+        def read():
+
+            try:
+                while not done.is_set():
+
+                    snapshot = self._registry.getSnapshot()
+
+                    # Snapshot is consistent while it is being replaced
+                    for moduleName in snapshot.moduleNames():
+                        rowId = snapshot.rows()[moduleName]
+                        assert snapshot.table().getRecord(rowId).userName + 'Lib' == moduleName
+                        assert snapshot.userNameIndex()[moduleName[:-3]] == moduleName
+
+                    self._registry.hasModule('aliceLib')
+                    self._registry.search('ali')
+
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=read) for x in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for index in range(20):
+
+            userName = 'user{}'.format(index)
+
+            self._writeDeveloperModule(userName)
+            self.assertEqual(self._registry.update()[0], ['{}Lib'.format(userName)])
+
+            if index % 2:
+                os.remove(os.path.join(self._directory, '{}Lib.py'.format(userName)))
+                self._registry.refresh()
+
+        done.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self._registry.listModules()), 12)
+
+    def test_ttl(self):
+
+        _registry = mDeveloper.developerLib.DeveloperRegistry(directory=self._directory,
+                                                              cacheDirectory=self._cacheDirectory,
+                                                              ttl=0)
+
+        self.assertEqual(_registry.listModules(), ['aliceLib', 'bobLib'])
+
+        self._writeDeveloperModule('carol')
+        self.assertEqual(_registry.listModules(), ['aliceLib', 'bobLib', 'carolLib'])
+
 
 #
 #-----------------------------------------------------------------------------------------------------
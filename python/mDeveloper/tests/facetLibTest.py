@@ -0,0 +1,131 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/facetLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.facetLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.facetLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+RECORDS = {'aliceLib' : {'USERNAME':'alice', 'NAME':'Alice', 'EMAIL':'alice@example.com', 'POSITION':'Lead Engineer',   'SITE':'Headquarter', 'URL':''},
+           'bobLib'   : {'USERNAME':'bob',   'NAME':'Bob',   'EMAIL':'bob@example.com',   'POSITION':'Engineer',        'SITE':'London',      'URL':''},
+           'carolLib' : {'USERNAME':'carol', 'NAME':'Carol', 'EMAIL':'carol@other.com',   'POSITION':'Lead TD',         'SITE':'london',      'URL':''},
+           'daveLib'  : {'USERNAME':'dave',  'NAME':'Dave',  'EMAIL':'dave@example.com',  'POSITION':'Engineer',        'SITE':'Headquarter', 'URL':''}}
+
+class FacetIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._facetIndex = mDeveloper.facetLib.FacetIndex((x, mDeveloper.developerLib.DeveloperRecord.fromAttributes(y)) for x, y in sorted(RECORDS.items()))
+
+    def test_parseQuery(self):
+
+        self.assertEqual(mDeveloper.facetLib.FacetIndex.parseQuery('soner'), ('soner', []))
+
+        self.assertEqual(mDeveloper.facetLib.FacetIndex.parseQuery('Site:Headquarter  soner position:"Lead *" oner'),
+                         ('soner oner', [('SITE', 'Headquarter'), ('POSITION', 'Lead *')]))
+
+        self.assertEqual(mDeveloper.facetLib.FacetIndex.parseQuery('url:http://example.com'), ('url:http://example.com', []))
+
+        self.assertRaises(ValueError, mDeveloper.facetLib.FacetIndex.parseQuery, 'site: london')
+
+    def test_joinArguments(self):
+
+        self.assertEqual(mDeveloper.facetLib.FacetIndex.joinArguments(['soner', 'position:Lead TD', 'site:London']), 'soner position:"Lead TD" site:London')
+
+        self.assertEqual(mDeveloper.facetLib.FacetIndex.joinArguments(['Safak Oner']), 'Safak Oner')
+
+    def test_match(self):
+
+        self.assertEqual(self._facetIndex.match([('SITE', 'LONDON')]), ['bobLib', 'carolLib'])
+
+        self.assertEqual(self._facetIndex.match([('SITE', 'london'), ('POSITION', 'Lead*')]), ['carolLib'])
+
+        self.assertEqual(self._facetIndex.match([('SITE', 'london'), ('SITE', 'headquarter'), ('POSITION', 'engineer')]), ['bobLib', 'daveLib'])
+
+        self.assertEqual(self._facetIndex.match([('EMAIL', '*@example.com'), ('POSITION', 'Lead*')]), ['aliceLib'])
+
+        self.assertEqual(self._facetIndex.match([('SITE', 'Paris')]), [])
+
+        self.assertRaises(ValueError, self._facetIndex.match, [('URL', '')])
+
+    def test_getCounts(self):
+
+        counts = self._facetIndex.getCounts()
+
+        self.assertEqual(list(counts.keys()), ['SITE', 'POSITION'])
+        self.assertEqual(counts['SITE'], [('Headquarter', 2), ('London', 2)])
+        self.assertEqual(counts['POSITION'], [('Engineer', 2), ('Lead Engineer', 1), ('Lead TD', 1)])
+
+        counts = self._facetIndex.getCounts(fields=['POSITION'], moduleNames=['aliceLib', 'daveLib'])
+
+        self.assertEqual(list(counts.items()), [('POSITION', [('Engineer', 1), ('Lead Engineer', 1)])])
+
+        self.assertRaises(ValueError, self._facetIndex.getCounts, fields=['NAME'])
+
+    def test_saveLoad(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            indexFile = os.path.join(directory, mDeveloper.facetLib.INDEX_FILE)
+
+            self.assertTrue(self._facetIndex.save(indexFile, 'signature'))
+
+            self.assertEqual(mDeveloper.facetLib.FacetIndex.load(indexFile, 'signature').getCounts(), self._facetIndex.getCounts())
+
+            self.assertEqual(mDeveloper.facetLib.FacetIndex.load(indexFile, 'other'), None)
+
+            # Index files are JSON, so that a pickle planted into a shared cache directory is never loaded
+            with open(indexFile, 'r') as _indexFile:
+                self.assertEqual(json.load(_indexFile)['signature'], 'signature')
+
+            with open(indexFile, 'wb') as _indexFile:
+                _indexFile.write(pickle.dumps({'version':mDeveloper.facetLib.INDEX_VERSION, 'signature':'signature', 'index':self._facetIndex}))
+
+            self.assertEqual(mDeveloper.facetLib.FacetIndex.load(indexFile, 'signature'), None)
+
+        finally:
+            shutil.rmtree(directory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,117 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/formatterLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.formatterLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import json
+import collections
+import unittest
+
+import mDeveloper.developerLib
+import mDeveloper.formatterLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class RecordWriterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._records = [mDeveloper.developerLib.DeveloperRecord('alice', 'Alice, A', 'TD', 'alice@example.com', 'London', ''),
+                         mDeveloper.developerLib.Developer(mDeveloper.developerLib.DeveloperRecord('bob', 'Bob "B"', 'TD', 'bob@example.com', 'Paris', 'url')),
+                         {'userName':'carol', 'name':'Carol', 'position':'TD', 'email':'carol@example.com', 'site':'Paris', 'url':''}]
+
+    def _write(self, formatName, fields=None, bufferSize=mDeveloper.formatterLib.BUFFER_SIZE):
+
+        stream  = io.StringIO()
+        _writer = mDeveloper.formatterLib.RecordWriter(stream, formatName, fields=fields, bufferSize=bufferSize)
+
+        self.assertEqual(_writer.writeAll(self._records), 3)
+        _writer.close()
+
+        return stream.getvalue()
+
+    def test_json(self):
+
+        data = json.loads(self._write('json'))
+
+        self.assertEqual([x['userName'] for x in data], ['alice', 'bob', 'carol'])
+        self.assertEqual(data[1]['name'], 'Bob "B"')
+        self.assertEqual(sorted(data[0].keys()), sorted(mDeveloper.developerLib.DeveloperRecord._fields))
+
+        stream = io.StringIO()
+        mDeveloper.formatterLib.RecordWriter(stream, 'json').close()
+        self.assertEqual(json.loads(stream.getvalue()), [])
+
+    def test_ndjson(self):
+
+        lines = self._write('ndjson', fields=['EMAIL', 'USERNAME'], bufferSize=1).splitlines()
+
+        self.assertEqual([json.loads(x) for x in lines], [{'email':'alice@example.com', 'userName':'alice'},
+                                                          {'email':'bob@example.com',   'userName':'bob'},
+                                                          {'email':'carol@example.com', 'userName':'carol'}])
+
+    def test_csv(self):
+
+        self.assertEqual(self._write('csv', fields=['USERNAME', 'NAME']).splitlines(), ['userName,name',
+                                                                                         'alice,"Alice, A"',
+                                                                                         'bob,"Bob ""B"""',
+                                                                                         'carol,Carol'])
+
+    def test_writeCounts(self):
+
+        counts = collections.OrderedDict([('SITE', [('Paris', 2), ('London', 1)]), ('POSITION', [('TD', 3)])])
+
+        stream = io.StringIO()
+        mDeveloper.formatterLib.RecordWriter.writeCounts(stream, 'json', counts)
+        self.assertEqual(json.loads(stream.getvalue()), {'site':{'Paris':2, 'London':1}, 'position':{'TD':3}})
+
+        stream = io.StringIO()
+        mDeveloper.formatterLib.RecordWriter.writeCounts(stream, 'ndjson', counts)
+        self.assertEqual([json.loads(x) for x in stream.getvalue().splitlines()][1], {'field':'site', 'value':'London', 'count':1})
+
+        stream = io.StringIO()
+        mDeveloper.formatterLib.RecordWriter.writeCounts(stream, 'csv', counts)
+        self.assertEqual(stream.getvalue(), 'field,value,count\nsite,Paris,2\nsite,London,1\nposition,TD,3\n')
+
+    def test_parseFields(self):
+
+        self.assertEqual(mDeveloper.formatterLib.RecordWriter.parseFields('username, Email'), ['USERNAME', 'EMAIL'])
+        self.assertEqual(mDeveloper.formatterLib.RecordWriter.parseFields(None), None)
+
+        self.assertRaises(ValueError, mDeveloper.formatterLib.RecordWriter.parseFields, 'info')
+        self.assertRaises(ValueError, mDeveloper.formatterLib.RecordWriter, io.StringIO(), 'xml')
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
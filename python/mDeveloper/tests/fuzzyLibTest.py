@@ -0,0 +1,178 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/fuzzyLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.fuzzyLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import random
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.cacheLib
+import mDeveloper.fuzzyLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+RECORDS = {'aliceLib' : {'USERNAME':'alice', 'NAME':'Alice Smith', 'EMAIL':'alice@example.com', 'POSITION':'Engineer', 'SITE':'Headquarter', 'URL':''},
+           'bobLib'   : {'USERNAME':'bob',   'NAME':'Bob Alison',  'EMAIL':'bob@example.com',   'POSITION':'Engineer', 'SITE':'London',      'URL':''},
+           'sonerLib' : {'USERNAME':'soner', 'NAME':'Şafak Öner',  'EMAIL':'so@example.com',    'POSITION':'Engineer', 'SITE':'London',      'URL':''}}
+
+def getLevenshteinDistance(value, otherValue):
+
+    previousRow = list(range(len(otherValue) + 1))
+
+    for index, character in enumerate(value, 1):
+
+        row = [index]
+
+        for otherIndex, otherCharacter in enumerate(otherValue, 1):
+            row.append(min(previousRow[otherIndex] + 1, row[otherIndex - 1] + 1, previousRow[otherIndex - 1] + (character != otherCharacter)))
+
+        previousRow = row
+
+    return previousRow[-1]
+
+class BKTreeTest(unittest.TestCase):
+
+    def setUp(self):
+
+        _random = random.Random(0)
+
+        self._terms = sorted(set(''.join(_random.choice('abcde') for _ in range(_random.randint(0, 8))) for _ in range(500)))
+
+        self._tree = mDeveloper.fuzzyLib.BKTree()
+        for term in self._terms:
+            self._tree.add(term, term.upper())
+
+    def test_getDistance(self):
+
+        for value in self._terms[:50]:
+            for otherValue in self._terms:
+                self.assertEqual(mDeveloper.fuzzyLib.BKTree.getDistance(value, otherValue), getLevenshteinDistance(value, otherValue))
+
+        self.assertEqual(mDeveloper.fuzzyLib.BKTree.getDistance('safk', 'safak'), 1)
+        self.assertEqual(mDeveloper.fuzzyLib.BKTree.getDistance('', 'safak'), 5)
+
+    def test_find(self):
+
+        self.assertEqual(len(self._tree), len(self._terms))
+
+        for query in ['', 'abc', 'eeee', 'abcdeabc']:
+            for maxDistance in range(3):
+
+                expected = sorted((getLevenshteinDistance(query, x), x, [x.upper()]) for x in self._terms if getLevenshteinDistance(query, x) <= maxDistance)
+
+                self.assertEqual(self._tree.find(query, maxDistance), expected)
+
+        # Most of the tree is skipped
+        self._tree.find('abcd', 1)
+        self.assertTrue(self._tree.comparisons() < len(self._terms))
+
+    def test_sections(self):
+
+        sections = self._tree.getSections()
+        _tree    = mDeveloper.fuzzyLib.BKTree.fromSections(sections)
+
+        self.assertEqual(_tree.terms(), self._terms)
+        self.assertEqual(_tree.find('abc', 2), self._tree.find('abc', 2))
+
+        # A child which is not a node of the tree is refused
+        indexes = mDeveloper.cacheLib.RegistryCache.getArrayOf(sections[4])
+        indexes[0] = len(self._terms)
+
+        with self.assertRaises(ValueError):
+            mDeveloper.fuzzyLib.BKTree.fromSections(sections[:4] + [mDeveloper.cacheLib.RegistryCache.getSectionOf(indexes)] + sections[5:])
+
+class FuzzyIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex((x, mDeveloper.developerLib.DeveloperRecord.fromAttributes(y)) for x, y in RECORDS.items())
+
+    def test_normalize(self):
+
+        self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.normalize('  Şafak   ÖNER '), 'safak oner')
+        self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.normalize(None), '')
+
+    def test_search(self):
+
+        self.assertEqual(self._fuzzyIndex.search('safk'), [('sonerLib', 1)])
+        self.assertEqual(self._fuzzyIndex.search('SAFAK ONER', maxDistance=0), [('sonerLib', 0)])
+        self.assertEqual(self._fuzzyIndex.search('alison', maxDistance=0), [('bobLib', 0)])
+        self.assertEqual(self._fuzzyIndex.search('alise', maxDistance=1), [('aliceLib', 1)])
+        self.assertEqual(self._fuzzyIndex.search('alise', maxDistance=2), [('aliceLib', 1), ('bobLib', 2)])
+        self.assertEqual(self._fuzzyIndex.search('alise', maxDistance=2, limit=1), [('aliceLib', 1)])
+        self.assertEqual(self._fuzzyIndex.search(' '), [])
+
+    def test_saveLoad(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            indexFile = os.path.join(directory, mDeveloper.fuzzyLib.INDEX_FILE)
+
+            self.assertTrue(self._fuzzyIndex.save(indexFile, 'signature'))
+
+            self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.load(indexFile, 'signature').search('sonr'), self._fuzzyIndex.search('sonr'))
+            self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.load(indexFile, 'signature').tree().getSections(), self._fuzzyIndex.tree().getSections())
+
+            self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.load(indexFile, 'other'), None)
+
+            # Index files are binary, so that a pickle planted into a shared cache directory is never loaded
+            with open(indexFile, 'rb') as _indexFile:
+                content = _indexFile.read()
+
+            self.assertTrue(content.startswith(mDeveloper.fuzzyLib.INDEX_MAGIC))
+            self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.fromBytes(content[:-1]), None)
+
+            # Terms can be added into a loaded tree
+            _fuzzyIndex = mDeveloper.fuzzyLib.FuzzyIndex.fromBytes(content)
+            _fuzzyIndex.tree().add('safok', 'otherLib')
+
+            self.assertEqual(_fuzzyIndex.search('safak', maxDistance=1), [('sonerLib', 0), ('otherLib', 1)])
+            self.assertEqual(len(_fuzzyIndex.tree()), len(self._fuzzyIndex.tree()) + 1)
+
+            with open(indexFile, 'wb') as _indexFile:
+                _indexFile.write(pickle.dumps({'version':mDeveloper.fuzzyLib.INDEX_VERSION, 'signature':'signature', 'index':self._fuzzyIndex}))
+
+            self.assertEqual(mDeveloper.fuzzyLib.FuzzyIndex.load(indexFile, 'signature'), None)
+
+        finally:
+            shutil.rmtree(directory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,179 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/importerLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.importerLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.cacheLib
+import mDeveloper.importerLib
+import mDeveloper.developerLib
+import mDeveloper.sqliteStorageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+CSV_CONTENT = """userName,name,position,email,site,url,phone
+alice,Alice O'Neil,Lead Engineer,alice@example.com,London,,123
+bob,Bob,Engineer,bob@example.com,,https://bob.example.com,
+,Nobody,Engineer,nobody@example.com,London,,
+carol,"Carol
+Smith",Engineer,,London,,
+alice,Alice,Engineer,alice2@example.com,London,,
+bad-name,Bad,Engineer,bad@example.com,London,,
+"""
+
+LDIF_CONTENT = """version: 1
+
+# Alice
+dn: uid=alice,ou=people,dc=example,dc=com
+objectClass: inetOrgPerson
+uid: alice
+cn: Alice
+displayName:: QWxpY2Ugw5ZuZXI=
+title: Lead
+  Engineer
+mail: alice@example.com
+l: London
+labeledURI: https://alice.example.com Home page
+
+dn: uid=bob,ou=people,dc=example,dc=com
+changetype: delete
+
+dn: uid=dave,ou=people,dc=example,dc=com
+uid: dave
+cn: Dave
+title: Engineer
+mail: dave@example.com
+"""
+
+class DeveloperImporterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def test_readCSV(self):
+
+        rows = list(mDeveloper.importerLib.DeveloperImporter.readCSV(io.StringIO(CSV_CONTENT)))
+
+        self.assertEqual([x[0] for x in rows], [2, 3, 4, 5, 7, 8])
+        self.assertEqual(rows[0][1]['phone'], '123')
+        self.assertEqual(rows[3][1]['name'], 'Carol\nSmith')
+
+        with self.assertRaises(ValueError):
+            list(mDeveloper.importerLib.DeveloperImporter.readCSV(io.StringIO('name,email\nAlice,alice@example.com\n')))
+
+    def test_readLDIF(self):
+
+        entries = list(mDeveloper.importerLib.DeveloperImporter.readLDIF(io.StringIO(LDIF_CONTENT)))
+
+        self.assertEqual([x[0] for x in entries], [4, 15, 18])
+
+        self.assertEqual(entries[0][1]['displayname'], u'Alice Öner')
+        self.assertEqual(entries[0][1]['title'], 'Lead Engineer')
+        self.assertIsNone(entries[0][2])
+
+        self.assertIsInstance(entries[1][2], ValueError)
+
+    def test_importCSV(self):
+
+        _importer = mDeveloper.importerLib.DeveloperImporter(directory=self._directory,
+                                                             cacheDirectory=self._cacheDirectory,
+                                                             defaults={'SITE':'Headquarter'})
+
+        count, errors = _importer.importStream(io.StringIO(CSV_CONTENT), 'csv')
+
+        self.assertEqual(count, 2)
+        self.assertEqual(list(errors.keys()), [4, 5, 7, 8])
+        self.assertEqual(sorted(os.listdir(self._directory)), ['aliceLib.py', 'bobLib.py'])
+
+        # Developer modules are created like the ones written by hand, not with the 0600 permissions of temporary files
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertEqual(os.stat(os.path.join(self._directory, 'aliceLib.py')).st_mode & 0o777, 0o666 & ~umask)
+
+        # Registry cache is written once all the developer modules are written
+        _registryCache = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._cacheDirectory)
+        _registryCache.load()
+        self.assertEqual(_registryCache.extractCount(), 0)
+
+        _registry = mDeveloper.developerLib.DeveloperRegistry(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+        records, errors = _registry.loadRecords()
+
+        self.assertEqual(errors, {})
+        self.assertEqual(records['aliceLib'].name, "Alice O'Neil")
+        self.assertEqual(records['bobLib'].site, 'Headquarter')
+        self.assertEqual(records['bobLib'].url, 'https://bob.example.com')
+
+        count, errors = _importer.importStream(io.StringIO(CSV_CONTENT), 'csv')
+
+        self.assertEqual(count, 0)
+        self.assertIsInstance(errors[2], ValueError)
+
+    def test_importLDIF(self):
+
+        _storage  = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.join(self._directory, 'developers.db'), create=True)
+        _importer = mDeveloper.importerLib.DeveloperImporter(storage=_storage, defaults={'SITE':'Headquarter'}, batchSize=1)
+
+        try:
+            count, errors = _importer.importStream(io.StringIO(LDIF_CONTENT), 'ldif', dryRun=True)
+
+            self.assertEqual(count, 2)
+            self.assertEqual(list(errors.keys()), [15])
+            self.assertEqual(_storage.listModules(), [])
+
+            count, errors = _importer.importStream(io.StringIO(LDIF_CONTENT), 'ldif')
+
+            self.assertEqual(count, 2)
+            self.assertEqual(_storage.listModules(), ['aliceLib', 'daveLib'])
+            self.assertEqual(_storage.getRecord('aliceLib').name, u'Alice Öner')
+            self.assertEqual(_storage.getRecord('aliceLib').url, 'https://alice.example.com')
+            self.assertEqual(_storage.getRecord('daveLib').site, 'Headquarter')
+
+        finally:
+            _storage.close()
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
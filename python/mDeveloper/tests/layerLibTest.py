@@ -0,0 +1,220 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/layerLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.layerLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.fuzzyLib
+import mDeveloper.layerLib
+import mDeveloper.developerLib
+import mDeveloper.tests.sqliteStorageLibTest
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = '{1}'
+POSITION = 'Developer'
+EMAIL    = '{0}@example.com'
+SITE     = '{2}'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'site':SITE, 'url':URL}}
+"""
+
+#
+## @brief Writes given developer module.
+def writeDeveloperModule(directory, moduleName, userName, name, site):
+
+    with open(os.path.join(directory, '{}.py'.format(moduleName)), 'w') as moduleFile:
+        moduleFile.write(DEVELOPER_MODULE_CONTENT.format(userName, name, site))
+
+class LayeredRegistryParityTest(mDeveloper.tests.sqliteStorageLibTest.StorageParityTests, unittest.TestCase):
+
+    def createStorage(self):
+
+        self._siteDirectory   = tempfile.mkdtemp()
+        self._studioDirectory = tempfile.mkdtemp()
+
+        # Records are split over the roots, the ones of the studio root are shadowed
+        os.rename(os.path.join(self._directory, 'daveLib.py'), os.path.join(self._siteDirectory, 'daveLib.py'))
+
+        writeDeveloperModule(self._studioDirectory, 'aliceLib', 'alice', 'Studio Alice', 'Studio')
+        writeDeveloperModule(self._studioDirectory, 'daveLib',  'dave',  'Studio Dave',  'Studio')
+
+        return mDeveloper.layerLib.LayeredRegistry([self._directory, self._siteDirectory, self._studioDirectory], cacheDirectory=self._cacheDirectory)
+
+    def tearDown(self):
+
+        mDeveloper.tests.sqliteStorageLibTest.StorageParityTests.tearDown(self)
+
+        shutil.rmtree(self._siteDirectory)
+        shutil.rmtree(self._studioDirectory)
+
+class LayeredRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._projectDirectory = tempfile.mkdtemp()
+        self._studioDirectory  = tempfile.mkdtemp()
+        self._cacheDirectory   = tempfile.mkdtemp()
+
+        writeDeveloperModule(self._studioDirectory, 'aliceLib', 'alice', 'Alice',       'Studio')
+        writeDeveloperModule(self._studioDirectory, 'jdoeLib',  'jdoe',  'John Doe',    'Studio')
+        writeDeveloperModule(self._studioDirectory, 'zoeLib',   'zoe',   'Zoe',         'Studio')
+
+        writeDeveloperModule(self._projectDirectory, 'aliceLib', 'alice', 'Alice Smith', 'Project')
+        writeDeveloperModule(self._projectDirectory, 'johnLib',  'jdoe',  'John',        'Project')
+
+        with open(os.path.join(self._projectDirectory, 'zoeLib.py'), 'w') as moduleFile:
+            moduleFile.write("USERNAME = 'zoe'\n")
+
+        self._registry = mDeveloper.layerLib.LayeredRegistry([self._projectDirectory, self._studioDirectory], cacheDirectory=self._cacheDirectory)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._projectDirectory)
+        shutil.rmtree(self._studioDirectory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def test_precedence(self):
+
+        self.assertEqual(self._registry.listModules(), ['aliceLib', 'jdoeLib', 'johnLib', 'zoeLib'])
+
+        self.assertEqual(self._registry.getRecord('aliceLib').site, 'Project')
+        self.assertEqual(self._registry.getDirectoryOf('aliceLib'), self._projectDirectory)
+        self.assertEqual(self._registry.getDirectoryOf('jdoeLib'), self._studioDirectory)
+
+        # User name of the project root wins
+        self.assertEqual(self._registry.getModuleByUserName('jdoe'), 'johnLib')
+        self.assertEqual(self._registry.getModuleByEmail('ALICE@example.com'), 'aliceLib')
+
+        # Score is the one of the project root, where the name matches too
+        self.assertEqual(self._registry.search('alice'), self._registry.getRegistry(self._projectDirectory).search('alice'))
+        self.assertEqual(self._registry.query('site:studio'), [('jdoeLib', 0)])
+
+    def test_shadowedInvalidModule(self):
+
+        self.assertIsNone(self._registry.getRecord('zoeLib'))
+        self.assertRaises(NameError, self._registry.getValidatedRecord, 'zoeLib')
+        self.assertRaises(ImportError, self._registry.getValidatedRecord, 'carolLib')
+
+        records, errors = self._registry.loadRecords()
+
+        self.assertEqual(list(records.keys()), ['aliceLib', 'jdoeLib', 'johnLib'])
+        self.assertEqual(list(errors.keys()), ['zoeLib'])
+
+    def test_iterRecords(self):
+
+        errors  = {}
+        records = list(self._registry.iterRecords(errors=errors))
+
+        self.assertFalse(self._registry.isLoaded())
+        self.assertEqual([(x, y.site) for x, y in records], [('aliceLib', 'Project'), ('jdoeLib', 'Studio'), ('johnLib', 'Project')])
+        self.assertEqual(list(errors.keys()), ['zoeLib'])
+
+    def test_fuzzySearch(self):
+
+        # Fuzzy index of each root is used, results are the same as the ones of the fuzzy index of all roots
+        for keyword in ['alise', 'jon', 'smth', 'zoe']:
+            self.assertEqual(self._registry.fuzzySearch(keyword), self._registry.getFuzzyIndex().search(keyword))
+
+        # Developer module of the studio root is shadowed by the invalid one of the project root
+        self.assertNotIn('zoeLib', [x[0] for x in self._registry.fuzzySearch('zoe')])
+        self.assertEqual(self._registry.fuzzySearch('alise', limit=1), [('aliceLib', 1)])
+        self.assertEqual(len([x for x in os.listdir(self._cacheDirectory) if x.endswith(mDeveloper.fuzzyLib.INDEX_FILE)]), 2)
+
+    def test_update(self):
+
+        studioRegistry = self._registry.getRegistry(self._studioDirectory)
+
+        self._registry.listModules()
+        self._registry.search('alice')
+
+        studioSnapshot = studioRegistry.getSnapshot()
+
+        writeDeveloperModule(self._projectDirectory, 'jdoeLib', 'jdoe', 'John Doe', 'Project')
+        writeDeveloperModule(self._projectDirectory, 'maxLib',  'max',  'Max',      'Project')
+
+        self.assertEqual(self._registry.update(), (['maxLib'], ['jdoeLib'], []))
+        self.assertEqual(self._registry.getRecord('jdoeLib').site, 'Project')
+
+        # Studio root is neither scanned again nor indexed again
+        self.assertIs(studioRegistry.getSnapshot(), studioSnapshot)
+        self.assertIsNotNone(studioSnapshot.searchIndex())
+
+        os.remove(os.path.join(self._projectDirectory, 'jdoeLib.py'))
+        os.remove(os.path.join(self._projectDirectory, 'maxLib.py'))
+
+        self.assertEqual(self._registry.update(), ([], ['jdoeLib'], ['maxLib']))
+        self.assertEqual(self._registry.getRecord('jdoeLib').site, 'Studio')
+
+    def test_searchPath(self):
+
+        previousInstance = mDeveloper.developerLib.DeveloperRegistry._instance
+        previousPath     = os.environ.get(mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE)
+        previousDatabase = os.environ.pop(mDeveloper.developerLib.DATABASE_ENVIRONMENT_VARIABLE, None)
+
+        try:
+            os.environ[mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE] = os.pathsep.join([self._projectDirectory, '', self._studioDirectory])
+
+            mDeveloper.developerLib.DeveloperRegistry.setInstance(None)
+
+            self.assertEqual(mDeveloper.developerLib.Developer.getSearchPath(), [self._projectDirectory, self._studioDirectory])
+            self.assertEqual(mDeveloper.developerLib.Developer('alice').site(), 'Project')
+            self.assertEqual(mDeveloper.developerLib.Developer.getDeveloperModule('jdoe').SITE, 'Studio')
+
+            mDeveloper.developerLib.Developer.setSearchPath([self._studioDirectory], cacheDirectory=self._cacheDirectory)
+
+            self.assertEqual(mDeveloper.developerLib.Developer.getSearchPath(), [self._studioDirectory])
+            self.assertEqual(mDeveloper.developerLib.Developer('alice').site(), 'Studio')
+
+            self.assertRaises(ValueError, mDeveloper.developerLib.Developer.setSearchPath, [])
+
+        finally:
+            mDeveloper.developerLib.DeveloperRegistry.setInstance(previousInstance)
+
+            if previousPath is None:
+                os.environ.pop(mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE, None)
+            else:
+                os.environ[mDeveloper.developerLib.PATH_ENVIRONMENT_VARIABLE] = previousPath
+
+            if previousDatabase is not None:
+                os.environ[mDeveloper.developerLib.DATABASE_ENVIRONMENT_VARIABLE] = previousDatabase
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,95 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/matcherLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.matcherLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mDeveloper.fuzzyLib
+import mDeveloper.matcherLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+RECORDS = {'aliceLib' : {'USERNAME':'alice', 'NAME':'Alice Smith', 'EMAIL':'alice@example.com', 'POSITION':'Engineer', 'SITE':'Headquarter', 'URL':''},
+           'alLib'    : {'USERNAME':'al',    'NAME':'Al Jones',    'EMAIL':'al@other.com',      'POSITION':'Engineer', 'SITE':'London',      'URL':''},
+           'bobLib'   : {'USERNAME':'bob',   'NAME':'Bob Alison',  'EMAIL':'bob@example.com',   'POSITION':'Engineer', 'SITE':'London',      'URL':''},
+           'sonerLib' : {'USERNAME':'soner', 'NAME':'Şafak Öner',  'EMAIL':'so@example.com',    'POSITION':'Engineer', 'SITE':'London',      'URL':''}}
+
+@unittest.skipUnless(mDeveloper.matcherLib.BatchMatcher.isAvailable(), 'NumPy is not installed')
+class BatchMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._batchMatcher = mDeveloper.matcherLib.BatchMatcher((x, mDeveloper.developerLib.DeveloperRecord.fromAttributes(y)) for x, y in sorted(RECORDS.items()))
+
+    def test_match(self):
+
+        queries = ['AL', 'alice@example.com', 'safak', 'bob@', '', 'x' * 100, 'carol']
+
+        result = self._batchMatcher.match(queries)
+
+        self.assertEqual(result.getModuleNames(), [['alLib', 'aliceLib'], ['aliceLib'], ['sonerLib'], ['bobLib'], [], [], []])
+
+        # Prefix of the user names of al and alice and the names of Al Jones and Alice Smith, the e-mail address of al and alice
+        self.assertEqual(result.getCounts()[0].tolist(), [2, 2, 2])
+
+        matrix = result.getMatrix()
+        self.assertEqual(matrix.shape, (len(queries), len(RECORDS)))
+        self.assertEqual(matrix.sum(), 5)
+        self.assertTrue(matrix[2, self._batchMatcher.moduleNames().index('sonerLib')])
+
+    def test_matchExact(self):
+
+        result = self._batchMatcher.match(['al', 'Safak Oner', 'alice@example'], exact=True)
+
+        self.assertEqual(result.getModuleNames(), [['alLib'], ['sonerLib'], []])
+
+        result = self._batchMatcher.match(['al', 'bob'], exact=True, fields=['EMAIL'])
+
+        self.assertEqual(result.getModuleNames(), [[], []])
+
+        self.assertRaises(ValueError, self._batchMatcher.match, ['al'], fields=['SITE'])
+
+    def test_matchLoop(self):
+
+        queries  = ['a', 'al', 'b', 's', 'so', 'safak o', 'bob alison', 'z']
+        result   = self._batchMatcher.match(queries).getModuleNames()
+        expected = [sorted(x for x, y in RECORDS.items() if any(mDeveloper.fuzzyLib.FuzzyIndex.normalize(y[z]).startswith(query)
+                                                                for z in mDeveloper.matcherLib.FIELDS)) for query in queries]
+
+        self.assertEqual(result, expected)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
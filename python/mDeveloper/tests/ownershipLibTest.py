@@ -0,0 +1,135 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/ownershipLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.ownershipLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.ownershipLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+PACKAGE_INFO_CONTENT = """
+import os
+
+NAME               = '{0}'
+DEVELOPERS         = {1}
+DEPENDENT_PACKAGES = []
+ROOT               = os.path.dirname(__file__)
+"""
+
+class OwnershipIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._packageRoot    = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        self._writePackageInfo('mCore',      ['alice@example.com', 'bob@example.com'])
+        self._writePackageInfo('mDeveloper', ['Alice@Example.com'])
+
+        self._ownershipIndex = mDeveloper.ownershipLib.OwnershipIndex(packageRoots=[self._packageRoot],
+                                                                      cacheDirectory=self._cacheDirectory)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._packageRoot)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writePackageInfo(self, packageName, developers):
+
+        directory = os.path.join(self._packageRoot, packageName, 'python', packageName)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        filePath = os.path.join(directory, 'packageInfoLib.py')
+
+        with open(filePath, 'w') as packageInfoFile:
+            packageInfoFile.write(PACKAGE_INFO_CONTENT.format(packageName, developers))
+
+        # Make sure modification time changes on file systems with coarse resolution
+        stat = os.stat(filePath)
+        os.utime(filePath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test_getPackages(self):
+
+        self.assertEqual(self._ownershipIndex.getPackages('alice@example.com'), ['mCore', 'mDeveloper'])
+        self.assertEqual(self._ownershipIndex.getPackages('BOB@example.com'), ['mCore'])
+        self.assertEqual(self._ownershipIndex.getPackages('carol@example.com'), [])
+
+    def test_getDevelopers(self):
+
+        self.assertEqual(self._ownershipIndex.getDevelopers('mCore'), ['alice@example.com', 'bob@example.com'])
+        self.assertEqual(self._ownershipIndex.getDevelopers('mUnknown'), None)
+
+        self.assertEqual(self._ownershipIndex.listPackages(), ['mCore', 'mDeveloper'])
+
+    def test_update(self):
+
+        self.assertEqual(self._ownershipIndex.listPackages(), ['mCore', 'mDeveloper'])
+        self.assertEqual(self._ownershipIndex.readCount(), 2)
+
+        self.assertFalse(self._ownershipIndex.update())
+        self.assertEqual(self._ownershipIndex.readCount(), 0)
+
+        self._writePackageInfo('mDeveloper', ['bob@example.com'])
+        self.assertTrue(self._ownershipIndex.update())
+        self.assertEqual(self._ownershipIndex.readCount(), 1)
+        self.assertEqual(self._ownershipIndex.getPackages('bob@example.com'), ['mCore', 'mDeveloper'])
+
+        # Cache file is used by new instances
+        _ownershipIndex = mDeveloper.ownershipLib.OwnershipIndex(packageRoots=[self._packageRoot],
+                                                                 cacheDirectory=self._cacheDirectory)
+
+        self.assertFalse(_ownershipIndex.update())
+        self.assertEqual(_ownershipIndex.readCount(), 0)
+        self.assertEqual(_ownershipIndex.getPackages('alice@example.com'), ['mCore'])
+
+        shutil.rmtree(os.path.join(self._packageRoot, 'mCore'))
+        self.assertTrue(_ownershipIndex.update())
+        self.assertEqual(_ownershipIndex.listPackages(), ['mDeveloper'])
+
+    def test_packageRoot(self):
+
+        # Package itself can be a package root
+        _ownershipIndex = mDeveloper.ownershipLib.OwnershipIndex(packageRoots=[os.path.join(self._packageRoot, 'mCore')],
+                                                                 cacheDirectory=self._cacheDirectory)
+
+        self.assertEqual(_ownershipIndex.listPackages(), ['mCore'])
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,176 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/packLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.packLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.packLib
+import mDeveloper.fuzzyLib
+import mDeveloper.developerLib
+import mDeveloper.tests.sqliteStorageLibTest
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PackedRegistryParityTest(mDeveloper.tests.sqliteStorageLibTest.StorageParityTests, unittest.TestCase):
+
+    def createStorage(self):
+
+        packPath = os.path.join(self._cacheDirectory, 'developers.pack')
+
+        mDeveloper.packLib.PackedRegistry.write(directory=self._directory, packPath=packPath, cacheDirectory=self._cacheDirectory)
+
+        return mDeveloper.packLib.PackedRegistry.load(directory=self._directory, packPath=packPath)
+
+    def tearDown(self):
+
+        mDeveloper.developerLib.DeveloperRegistry.getInstance().close()
+
+        mDeveloper.tests.sqliteStorageLibTest.StorageParityTests.tearDown(self)
+
+class PackedRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._root      = tempfile.mkdtemp()
+        self._directory = os.path.join(self._root, 'developers')
+
+        os.mkdir(self._directory)
+
+        for moduleName, userName in [('aliceLib', 'alice'), ('bobLib', 'bob'), ('robertLib', 'bob'), ('zoeLib', 'zoë')]:
+            self._writeDeveloperModule(moduleName, userName)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._root)
+
+    def _writeDeveloperModule(self, moduleName, userName, name=None):
+
+        with open(os.path.join(self._directory, '{}.py'.format(moduleName)), 'w', encoding='utf-8') as moduleFile:
+            moduleFile.write(mDeveloper.tests.sqliteStorageLibTest.DEVELOPER_MODULE_CONTENT.format(userName, 'Position'))
+            if name is not None:
+                moduleFile.write('NAME = {}\n'.format(name))
+
+    def _write(self):
+
+        return mDeveloper.packLib.PackedRegistry.write(directory=self._directory, cacheDirectory=self._root)
+
+    def test_write(self):
+
+        count, errors = self._write()
+
+        self.assertEqual((count, dict(errors)), (4, {}))
+        self.assertEqual(mDeveloper.packLib.PackedRegistry.getPackPathOf(self._directory), '{}.pack'.format(self._directory))
+
+        _packedRegistry = mDeveloper.packLib.PackedRegistry.load(directory=self._directory)
+
+        self.assertEqual(_packedRegistry.listModules(), ['aliceLib', 'bobLib', 'robertLib', 'zoeLib'])
+        self.assertTrue(_packedRegistry.hasModule('zoeLib'))
+        self.assertFalse(_packedRegistry.hasModule('carolLib'))
+        self.assertFalse(_packedRegistry.hasModule('zzzLib'))
+
+        # Developer module with the smallest name wins like in the registry
+        self.assertEqual(_packedRegistry.getModuleByUserName('bob'), 'bobLib')
+        self.assertEqual(_packedRegistry.getModuleByUserName('zoë'), 'zoeLib')
+        self.assertEqual(_packedRegistry.getModuleByEmail('ZOË@example.com'), 'zoeLib')
+        self.assertEqual(_packedRegistry.getRecord('zoeLib').name, 'Name zoë')
+
+        # Search index is packed, so that searching doesn't decode all the records
+        self.assertNotEqual(_packedRegistry.getSearchIndex(), None)
+        self.assertEqual([x[0] for x in _packedRegistry.search('bob')], ['bobLib', 'robertLib'])
+
+        # Fuzzy index is packed as well, so that suggestions don't build it again in each process
+        self.assertNotEqual(_packedRegistry._fuzzySize, 0)
+        self.assertEqual(_packedRegistry.getFuzzyIndex().tree().terms(), mDeveloper.fuzzyLib.FuzzyIndex(_packedRegistry.iterRecords()).tree().terms())
+        self.assertEqual(_packedRegistry.fuzzySearch('bobb', maxDistance=1), [('bobLib', 1), ('robertLib', 1)])
+
+        _packedRegistry.close()
+
+        # Pack file is readable by the other users
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertEqual(os.stat(mDeveloper.packLib.PackedRegistry.getPackPathOf(self._directory)).st_mode & 0o777, 0o666 & ~umask)
+
+    def test_load(self):
+
+        self.assertEqual(mDeveloper.packLib.PackedRegistry.load(directory=self._directory), None)
+
+        self._write()
+
+        _packedRegistry = mDeveloper.packLib.PackedRegistry.load(directory=self._directory)
+        self.assertNotEqual(_packedRegistry, None)
+        _packedRegistry.close()
+
+        # Pack file is stale once a developer module is added
+        self._writeDeveloperModule('carolLib', 'carol')
+        os.utime(self._directory, ns=(0, 0))
+
+        self.assertEqual(mDeveloper.packLib.PackedRegistry.load(directory=self._directory), None)
+
+        # Developer modules edited in place aren't stat'ed on load, pack file must be written again
+        self._write()
+
+        directoryMTime = os.stat(self._directory).st_mtime_ns
+        self._writeDeveloperModule('carolLib', 'carol', name='\'Caroline\'')
+        os.utime(self._directory, ns=(directoryMTime, directoryMTime))
+
+        _packedRegistry = mDeveloper.packLib.PackedRegistry.load(directory=self._directory)
+        self.assertEqual(_packedRegistry.getRecord('carolLib').name, 'Name carol')
+        _packedRegistry.close()
+
+        self._write()
+
+        _packedRegistry = mDeveloper.packLib.PackedRegistry.load(directory=self._directory)
+        self.assertEqual(_packedRegistry.getRecord('carolLib').name, 'Caroline')
+        _packedRegistry.close()
+
+        with open(mDeveloper.packLib.PackedRegistry.getPackPathOf(self._directory), 'wb') as packFile:
+            packFile.write(b'developers')
+
+        self.assertEqual(mDeveloper.packLib.PackedRegistry.load(directory=self._directory), None)
+
+    def test_writeErrors(self):
+
+        self._writeDeveloperModule('carolLib', 'carol', name='42')
+
+        count, errors = self._write()
+
+        self.assertEqual(count, 4)
+        self.assertEqual(list(errors.keys()), ['carolLib'])
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,98 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/readerLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.readerLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import unittest
+
+import mDeveloper.readerLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class DeveloperModuleReaderTest(unittest.TestCase):
+
+    def test_readSource(self):
+
+        record = mDeveloper.readerLib.DeveloperModuleReader.readSource("""
+'''Docstring.'''
+USERNAME = 'alice'
+NAME     = 'Alice'
+EMAIL    = 'alice@example.com'
+VERSION  = (1, -2)
+INFO     = {'userName':USERNAME, 'name':NAME, 'email':EMAIL}
+""")
+
+        self.assertEqual(record, {'USERNAME' : 'alice',
+                                  'NAME'     : 'Alice',
+                                  'EMAIL'    : 'alice@example.com',
+                                  'INFO'     : {'userName':'alice', 'name':'Alice', 'email':'alice@example.com'}})
+
+        self.assertEqual(mDeveloper.readerLib.DeveloperModuleReader.readSource("import os\nUSERNAME = 'alice'"), None)
+
+        self.assertEqual(mDeveloper.readerLib.DeveloperModuleReader.readSource("USERNAME = 'alice'.upper()"), None)
+
+        self.assertEqual(mDeveloper.readerLib.DeveloperModuleReader.readSource("NAME = UNDEFINED"), None)
+
+        self.assertRaises(SyntaxError, mDeveloper.readerLib.DeveloperModuleReader.readSource, 'USERNAME = ')
+
+    def test_readConstants(self):
+
+        source = "import os\nNAME = 'mCore'\nROOT = os.getcwd()\nDEVELOPERS = [NAME]\nPATH = ROOT"
+
+        self.assertEqual(mDeveloper.readerLib.DeveloperModuleReader.readConstants(source), None)
+
+        self.assertEqual(mDeveloper.readerLib.DeveloperModuleReader.readConstants(source, strict=False), {'NAME':'mCore', 'DEVELOPERS':['mCore']})
+
+    def test_readFile(self):
+
+        sonerLibFile = os.path.join(mDeveloper.developerLib.Developer.getDevelopersDirectory(), 'sonerLib.py')
+
+        record = mDeveloper.readerLib.DeveloperModuleReader.readFile(sonerLibFile)
+
+        self.assertEqual(record['USERNAME'], 'soner')
+        self.assertEqual(record['INFO']['email'], record['EMAIL'])
+
+    def test_readFileDoesNotImport(self):
+
+        sys.modules.pop('mDeveloper.developers.sonerLib', None)
+
+        mDeveloper.readerLib.DeveloperModuleReader.readFile(os.path.join(mDeveloper.developerLib.Developer.getDevelopersDirectory(), 'sonerLib.py'))
+
+        self.assertFalse('mDeveloper.developers.sonerLib' in sys.modules)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
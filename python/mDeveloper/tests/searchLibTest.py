@@ -0,0 +1,139 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/searchLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.searchLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.searchLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+RECORDS = {'aliceLib' : {'USERNAME':'alice', 'NAME':'Alice Smith',  'EMAIL':'alice@example.com', 'POSITION':'Lead Engineer', 'SITE':'Headquarter', 'URL':''},
+           'bobLib'   : {'USERNAME':'bob',   'NAME':'Bob Alison',   'EMAIL':'bob@example.com',   'POSITION':'Engineer',      'SITE':'London',      'URL':''},
+           'carolLib' : {'USERNAME':'carol', 'NAME':'Carol Jones',  'EMAIL':'cj@example.com',    'POSITION':'Artist',        'SITE':'London',      'URL':''},
+           'brokenLib': None}
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        table = mDeveloper.developerLib.DeveloperTable()
+        for moduleName in sorted(RECORDS.keys()):
+            if RECORDS[moduleName]:
+                table.addRecord(moduleName, RECORDS[moduleName])
+
+        self._searchIndex = mDeveloper.searchLib.SearchIndex(table)
+
+    def test_search(self):
+
+        self.assertEqual([x[0] for x in self._searchIndex.search('ali')], ['aliceLib', 'bobLib'])
+
+        self.assertEqual([x[0] for x in self._searchIndex.search('ENGINEER')], ['bobLib', 'aliceLib'])
+
+        self.assertEqual([x[0] for x in self._searchIndex.search('london', fields=['SITE'])], ['bobLib', 'carolLib'])
+
+        self.assertEqual(self._searchIndex.search('alice', fields=['SITE']), [])
+
+        self.assertEqual(self._searchIndex.search('xyz'), [])
+
+    def test_searchShortKeyword(self):
+
+        self.assertEqual([x[0] for x in self._searchIndex.search('cj')], ['carolLib'])
+
+    def test_searchLimit(self):
+
+        self.assertEqual(self._searchIndex.search('example', limit=2), self._searchIndex.search('example')[:2])
+
+        self.assertEqual(len(self._searchIndex.search('example', limit=1)), 1)
+
+    def test_searchMatchesLinearScan(self):
+
+        for keyword in ['a', 'al', 'lon', 'son', 'example.com', 'ead eng']:
+
+            expected = sorted(x for x, record in RECORDS.items() if record and any(keyword in record[field].lower() for field in mDeveloper.searchLib.FIELDS))
+
+            self.assertEqual(sorted(x[0] for x in self._searchIndex.search(keyword)), expected)
+
+    def test_searchInvalidField(self):
+
+        self.assertRaises(ValueError, self._searchIndex.search, 'alice', fields=['INFO'])
+
+    def test_saveLoad(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            indexFile = os.path.join(directory, mDeveloper.searchLib.INDEX_FILE)
+
+            self.assertTrue(self._searchIndex.save(indexFile, 'signature'))
+
+            self.assertEqual(mDeveloper.searchLib.SearchIndex.load(indexFile, 'signature').search('ali'), self._searchIndex.search('ali'))
+
+            self.assertEqual(mDeveloper.searchLib.SearchIndex.load(indexFile, 'other'), None)
+
+            # Removed records and updates of a loaded index are kept
+            _searchIndex = mDeveloper.searchLib.SearchIndex.load(indexFile, 'signature')
+            _searchIndex.updateRecord(0, None, None)
+            _searchIndex.updateRecord(3, 'daveLib', {'USERNAME':'dave', 'NAME':'Dave Alison'})
+
+            self.assertTrue(_searchIndex.save(indexFile, 'signature'))
+            self.assertEqual([x[0] for x in mDeveloper.searchLib.SearchIndex.load(indexFile, 'signature').search('alis')], ['bobLib', 'daveLib'])
+
+            # Index files are binary, so that a pickle planted into a shared cache directory is never loaded
+            with open(indexFile, 'rb') as _indexFile:
+                content = _indexFile.read()
+
+            self.assertTrue(content.startswith(mDeveloper.searchLib.INDEX_MAGIC))
+            self.assertEqual(mDeveloper.searchLib.SearchIndex.fromBytes(content[:-1]), None)
+
+            with open(indexFile, 'wb') as _indexFile:
+                _indexFile.write(pickle.dumps({'version':mDeveloper.searchLib.INDEX_VERSION, 'signature':'signature', 'index':self._searchIndex}))
+
+            self.assertEqual(mDeveloper.searchLib.SearchIndex.load(indexFile, 'signature'), None)
+
+            # Values with null characters can't be joined, index is rebuilt instead
+            _searchIndex.updateRecord(4, 'erinLib', {'USERNAME':'erin\0'})
+            self.assertFalse(_searchIndex.save(indexFile, 'signature'))
+
+        finally:
+            shutil.rmtree(directory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,295 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/serverLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.serverLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import stat
+import time
+import shutil
+import socket
+import tempfile
+import unittest
+import threading
+
+import mDeveloper.clientLib
+import mDeveloper.serverLib
+import mDeveloper.developerLib
+
+import mDeveloper.tests.developerLibTest
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are not supported')
+class DeveloperServerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        for userName in ['alice', 'bob']:
+            self._writeDeveloperModule(userName)
+
+        self._registry = mDeveloper.developerLib.DeveloperRegistry.getInstance()
+
+        self._server   = mDeveloper.serverLib.DeveloperServer(directory=self._directory,
+                                                              cacheDirectory=self._cacheDirectory,
+                                                              socketPath=os.path.join(self._cacheDirectory, 'server.sock'),
+                                                              pollInterval=0.05)
+
+        self._thread   = threading.Thread(target=self._server.serve)
+        self._thread.start()
+
+        self._client   = mDeveloper.clientLib.DeveloperClient(socketPath=self._server.socketPath())
+
+        for _ in range(100):
+            if self._client.isRunning():
+                break
+            time.sleep(0.01)
+
+    def tearDown(self):
+
+        self._server.shutdown()
+        self._thread.join()
+
+        mDeveloper.developerLib.DeveloperRegistry.setInstance(self._registry)
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writeDeveloperModule(self, userName):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(mDeveloper.tests.developerLibTest.DEVELOPER_MODULE_CONTENT.format(userName))
+
+    def test_listDevelopers(self):
+
+        result = self._client.listDevelopers(detail=True)
+
+        self.assertEqual([x['userName'] for x in result['records']], ['alice', 'bob'])
+        self.assertTrue('bob@example.com' in result['records'][1]['text'])
+
+        self.assertEqual(len(self._client.listDevelopers(limit=1)['records']), 1)
+
+    def test_search(self):
+
+        self.assertEqual([x['userName'] for x in self._client.search('bob')['records']], ['bob'])
+
+        self.assertRaises(ValueError, self._client.search, 'bob', fields=['INFO'])
+
+        self.assertEqual([x['userName'] for x in self._client.search('site:Headquarter')['records']], ['alice', 'bob'])
+
+    def test_getFacetCounts(self):
+
+        self.assertEqual(self._client.getFacetCounts()['facets'], {'SITE':[['Headquarter', 2]], 'POSITION':[['Position', 2]]})
+
+        self.assertEqual(self._client.getFacetCounts(query='alice')['facets']['SITE'], [['Headquarter', 1]])
+
+    def test_isDeveloper(self):
+
+        self.assertEqual(self._client.isDeveloper('alice'), 'aliceLib')
+
+        self.assertEqual(self._client.isDeveloper('carol'), None)
+
+    def test_reload(self):
+
+        self._writeDeveloperModule('carol')
+
+        for _ in range(100):
+            if self._client.isDeveloper('carol'):
+                break
+            time.sleep(0.02)
+
+        self.assertEqual(self._client.isDeveloper('carol'), 'carolLib')
+
+    def test_servesSource(self):
+
+        self.assertTrue(self._client.servesSource({'storage':'directory', 'layers':[self._directory]}))
+
+        self.assertFalse(self._client.servesSource({'storage':'directory', 'layers':[self._cacheDirectory]}))
+        self.assertFalse(self._client.servesSource({'storage':'directory', 'layers':[self._directory, self._cacheDirectory]}))
+        self.assertFalse(self._client.servesSource({'storage':'database', 'layers':[self._directory]}))
+
+    def test_source(self):
+
+        # Source is checked by the server in the same request
+        _client = mDeveloper.clientLib.DeveloperClient(socketPath=self._server.socketPath(), source={'storage':'directory', 'layers':[self._directory]})
+        self.assertEqual(_client.isDeveloper('alice'), 'aliceLib')
+
+        _client = mDeveloper.clientLib.DeveloperClient(socketPath=self._server.socketPath(), source={'storage':'directory', 'layers':[self._cacheDirectory]})
+        self.assertRaises(ValueError, _client.isDeveloper, 'alice')
+
+        _client = mDeveloper.clientLib.DeveloperClient(socketPath=self._server.socketPath(), source={'storage':'database', 'layers':[self._directory]})
+        self.assertRaises(ValueError, _client.isDeveloper, 'alice')
+
+    def test_unsafeSocket(self):
+
+        # Socket in a directory which is writable by the other users could be replaced by them
+        os.chmod(self._cacheDirectory, 0o777)
+
+        try:
+            self.assertRaises(OSError, self._client.isDeveloper, 'alice')
+        finally:
+            os.chmod(self._cacheDirectory, 0o700)
+
+        self.assertEqual(self._client.isDeveloper('alice'), 'aliceLib')
+
+    @unittest.skipUnless(hasattr(os, 'getuid') and os.getuid() == 0, 'Socket can be given to another user only by root')
+    def test_socketOwner(self):
+
+        os.chown(self._server.socketPath(), 1, -1)
+
+        try:
+            self.assertRaises(OSError, self._client.isDeveloper, 'alice')
+        finally:
+            os.chown(self._server.socketPath(), 0, -1)
+
+    def test_getDefaultSocketPath(self):
+
+        environment = {x:os.environ.pop(x, None) for x in [mDeveloper.clientLib.SOCKET_ENVIRONMENT_VARIABLE, 'XDG_RUNTIME_DIR']}
+
+        try:
+            # Socket isn't created in /tmp itself, which is writable by everyone
+            socketPath = mDeveloper.clientLib.DeveloperClient.getDefaultSocketPath()
+            self.assertEqual(os.path.dirname(socketPath), os.path.join('/tmp', 'mdeveloper-{}'.format(os.getuid())))
+
+            os.environ['XDG_RUNTIME_DIR'] = self._cacheDirectory
+            self.assertEqual(os.path.dirname(mDeveloper.clientLib.DeveloperClient.getDefaultSocketPath()), self._cacheDirectory)
+        finally:
+            for name, value in environment.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    def test_getLocalSource(self):
+
+        environment = {x:os.environ.pop(x, None) for x in [mDeveloper.clientLib.DATABASE_ENVIRONMENT_VARIABLE,
+                                                           mDeveloper.clientLib.PATH_ENVIRONMENT_VARIABLE]}
+
+        try:
+            self.assertEqual(mDeveloper.clientLib.DeveloperClient.getLocalSource(),
+                             {'storage':'directory', 'layers':[os.path.join(os.path.dirname(mDeveloper.clientLib.__file__), 'developers')]})
+
+            os.environ[mDeveloper.clientLib.PATH_ENVIRONMENT_VARIABLE] = os.pathsep.join([self._directory, self._cacheDirectory, self._directory])
+            self.assertEqual(mDeveloper.clientLib.DeveloperClient.getLocalSource(),
+                             {'storage':'directory', 'layers':[self._directory, self._cacheDirectory]})
+
+            os.environ[mDeveloper.clientLib.DATABASE_ENVIRONMENT_VARIABLE] = os.path.join(self._cacheDirectory, 'developers.db')
+            self.assertEqual(mDeveloper.clientLib.DeveloperClient.getLocalSource(),
+                             {'storage':'database', 'layers':[os.path.join(self._cacheDirectory, 'developers.db')]})
+        finally:
+            for name, value in environment.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    def test_unknownCommand(self):
+
+        self.assertRaises(ValueError, self._client.request, 'unknown')
+
+    def test_invalidResponse(self):
+
+        socketPath = os.path.join(self._cacheDirectory, 'invalid.sock')
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+
+            _socket.bind(socketPath)
+            _socket.listen(2)
+
+            def respond():
+                for response in [b'{"result": [1, 2\n', b'[1, 2]\n']:
+                    connection = _socket.accept()[0]
+                    connection.recv(65536)
+                    connection.sendall(response)
+                    connection.close()
+
+            thread = threading.Thread(target=respond)
+            thread.start()
+
+            _client = mDeveloper.clientLib.DeveloperClient(socketPath=socketPath)
+
+            self.assertRaises(OSError, _client.request, 'ping')
+            self.assertRaises(OSError, _client.request, 'ping')
+
+            thread.join()
+
+    def test_socketPermissions(self):
+
+        self.assertTrue(stat.S_ISSOCK(os.lstat(self._server.socketPath()).st_mode))
+        self.assertEqual(os.lstat(self._server.socketPath()).st_mode & 0o077, 0)
+
+    def test_idleConnection(self):
+
+        timeout = mDeveloper.serverLib._RequestHandler.timeout
+        mDeveloper.serverLib._RequestHandler.timeout = 0.1
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+                _socket.connect(self._server.socketPath())
+                self.assertEqual(self._client.isDeveloper('alice'), 'aliceLib')
+        finally:
+            mDeveloper.serverLib._RequestHandler.timeout = timeout
+
+    def test_removeStaleSocket(self):
+
+        socketPath = os.path.join(self._cacheDirectory, 'stale.sock')
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+            _socket.bind(socketPath)
+
+        server = mDeveloper.serverLib.DeveloperServer(directory=self._directory, cacheDirectory=self._cacheDirectory, socketPath=socketPath)
+        server._removeStaleSocket()
+        self.assertFalse(os.path.exists(socketPath))
+
+        with open(socketPath, 'w') as socketFile:
+            socketFile.write('data')
+
+        self.assertRaises(RuntimeError, server._removeStaleSocket)
+        self.assertTrue(os.path.isfile(socketPath))
+
+        server = mDeveloper.serverLib.DeveloperServer(directory=self._directory, cacheDirectory=self._cacheDirectory, socketPath=self._server.socketPath())
+        self.assertRaises(RuntimeError, server._removeStaleSocket)
+
+    def test_notRunning(self):
+
+        _client = mDeveloper.clientLib.DeveloperClient(socketPath=os.path.join(self._cacheDirectory, 'missing.sock'))
+
+        self.assertFalse(_client.isRunning())
+        self.assertRaises(OSError, _client.isDeveloper, 'alice')
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
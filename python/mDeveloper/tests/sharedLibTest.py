@@ -0,0 +1,293 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/sharedLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.sharedLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+import mDeveloper.cacheLib
+import mDeveloper.sharedLib
+import mDeveloper.developerLib
+import mDeveloper.tests.sqliteStorageLibTest
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class SharedRegistryParityTest(mDeveloper.tests.sqliteStorageLibTest.StorageParityTests, unittest.TestCase):
+
+    def createStorage(self):
+
+        return mDeveloper.sharedLib.SharedRegistry.attach(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+    def tearDown(self):
+
+        mDeveloper.developerLib.DeveloperRegistry.getInstance().close()
+        mDeveloper.sharedLib.SharedRegistry.remove(self._directory)
+
+        mDeveloper.tests.sqliteStorageLibTest.StorageParityTests.tearDown(self)
+
+class SharedRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._root      = tempfile.mkdtemp()
+        self._directory = os.path.join(self._root, 'developers')
+
+        os.mkdir(self._directory)
+
+        for userName in ['alice', 'bob']:
+            self._writeDeveloperModule(userName)
+
+        self._orphanNames = []
+
+    def tearDown(self):
+
+        mDeveloper.sharedLib.SharedRegistry.remove(self._directory)
+
+        for name in self._orphanNames:
+            try:
+                sharedMemory = mDeveloper.sharedLib.SharedRegistry.openSharedMemory(name)
+            except OSError:
+                continue
+
+            sharedMemory.close()
+            mDeveloper.sharedLib.SharedRegistry.unlinkSharedMemory(sharedMemory)
+
+        shutil.rmtree(self._root)
+
+    def _writeDeveloperModule(self, userName, position='Position'):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(mDeveloper.tests.sqliteStorageLibTest.DEVELOPER_MODULE_CONTENT.format(userName, position))
+
+    def _createOrphan(self):
+
+        # Snapshot of a publisher which crashed before it is complete
+        sharedMemory = mDeveloper.sharedLib.SharedRegistry.openSharedMemory(mDeveloper.sharedLib.SharedRegistry.getSnapshotName(), create=True, size=128)
+        sharedMemory.close()
+
+        self._orphanNames.append(sharedMemory.name)
+
+        return sharedMemory.name
+
+    def _attach(self, publish=True):
+
+        return mDeveloper.sharedLib.SharedRegistry.attach(directory=self._directory, cacheDirectory=self._root, publish=publish)
+
+    def test_attach(self):
+
+        self.assertEqual(self._attach(publish=False), None)
+
+        _publishedRegistry = self._attach()
+        _attachedRegistry  = self._attach(publish=False)
+
+        self.assertEqual(_attachedRegistry.name(), _publishedRegistry.name())
+        self.assertEqual(_attachedRegistry.listModules(), ['aliceLib', 'bobLib'])
+        self.assertEqual(_attachedRegistry.getModuleByUserName('bob'), 'bobLib')
+
+        # Snapshot is read-only
+        with self.assertRaises(TypeError):
+            _attachedRegistry._buffer[0] = 0
+
+        _attachedRegistry.close()
+        _publishedRegistry.close()
+
+    def test_attachFromProcess(self):
+
+        _sharedRegistry = self._attach()
+
+        code = ('import mDeveloper.sharedLib;'
+                '_sharedRegistry = mDeveloper.sharedLib.SharedRegistry.attach(directory={!r}, publish=False);'
+                'print(_sharedRegistry.getModuleByEmail("ALICE@example.com"))').format(self._directory)
+
+        output = subprocess.check_output([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
+        self.assertEqual(output.decode().strip(), 'aliceLib')
+
+        # Snapshot outlives the processes which attached to it
+        _attachedRegistry = self._attach(publish=False)
+        self.assertNotEqual(_attachedRegistry, None)
+
+        _attachedRegistry.close()
+        _sharedRegistry.close()
+
+    def test_replace(self):
+
+        _previousRegistry = self._attach()
+
+        self._writeDeveloperModule('carol')
+        os.utime(self._directory, ns=(0, 0))
+
+        self.assertEqual(self._attach(publish=False), None)
+
+        _sharedRegistry = self._attach()
+
+        self.assertNotEqual(_sharedRegistry.name(), _previousRegistry.name())
+        self.assertEqual(_sharedRegistry.listModules(), ['aliceLib', 'bobLib', 'carolLib'])
+
+        # Previous snapshot is unlinked, but it is still usable by the processes attached to it
+        with self.assertRaises(FileNotFoundError):
+            mDeveloper.sharedLib.SharedRegistry.openSharedMemory(_previousRegistry.name())
+
+        self.assertEqual(_previousRegistry.listModules(), ['aliceLib', 'bobLib'])
+
+        _previousRegistry.close()
+        _sharedRegistry.close()
+
+    def test_replaceEdited(self):
+
+        _previousRegistry = self._attach()
+
+        # Editing a developer module in place doesn't change the stamp of the directory, snapshot is published explicitly
+        directoryMTime = os.stat(self._directory).st_mtime_ns
+        self._writeDeveloperModule('bob', position='Senior Position')
+        os.utime(self._directory, ns=(directoryMTime, directoryMTime))
+
+        _sharedRegistry = self._attach(publish=False)
+        self.assertEqual(_sharedRegistry.name(), _previousRegistry.name())
+        _sharedRegistry.close()
+
+        mDeveloper.sharedLib.SharedRegistry.publish(directory=self._directory, cacheDirectory=self._root).close()
+
+        _sharedRegistry = self._attach(publish=False)
+
+        self.assertNotEqual(_sharedRegistry.name(), _previousRegistry.name())
+        self.assertEqual(_sharedRegistry.getRecord('bobLib').position, 'Senior Position')
+
+        _previousRegistry.close()
+        _sharedRegistry.close()
+
+    def test_invalidPointer(self):
+
+        # Pointer to a snapshot which doesn't exist or isn't complete is ignored and a new snapshot is published
+        for name in [mDeveloper.sharedLib.SharedRegistry.getSnapshotName(), self._createOrphan()]:
+
+            mDeveloper.sharedLib.SharedRegistry.replacePrevious(self._directory, name)
+
+            self.assertEqual(self._attach(publish=False), None)
+
+            _sharedRegistry = self._attach()
+            self.assertEqual(mDeveloper.sharedLib.SharedRegistry.readPointer(self._directory), _sharedRegistry.name())
+            _sharedRegistry.close()
+
+    def test_pointer(self):
+
+        name    = mDeveloper.sharedLib.SharedRegistry.getSnapshotName()
+        content = mDeveloper.sharedLib.SharedRegistry.getPointerContent(name)
+
+        self.assertEqual(len(content), mDeveloper.sharedLib.POINTER_SIZE)
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.parsePointer(content), name)
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.parsePointer(bytes(mDeveloper.sharedLib.POINTER_SIZE)), '')
+
+        # Truncated pointer and the one which is being written are rejected
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.parsePointer(content[:-1]), None)
+
+        tornContent = mDeveloper.sharedLib.SharedRegistry.getPointerContent(mDeveloper.sharedLib.SharedRegistry.getSnapshotName())[:16] + content[16:]
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.parsePointer(tornContent), None)
+
+    def test_tornPointer(self):
+
+        _sharedRegistry = self._attach()
+        _sharedRegistry.close()
+
+        # Snapshot the pointer referred to is not unlinked once the pointer is corrupted
+        self._orphanNames.append(_sharedRegistry.name())
+
+        pointer = mDeveloper.sharedLib.SharedRegistry.openSharedMemory(mDeveloper.sharedLib.SharedRegistry.getPointerName(self._directory))
+        pointer.buf[len(mDeveloper.sharedLib.SNAPSHOT_PREFIX)] ^= 0xff
+        pointer.close()
+
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.readPointer(self._directory), None)
+        self.assertEqual(self._attach(publish=False), None)
+
+        _sharedRegistry = self._attach()
+        self.assertEqual(mDeveloper.sharedLib.SharedRegistry.readPointer(self._directory), _sharedRegistry.name())
+        _sharedRegistry.close()
+
+    def test_concurrentPublish(self):
+
+        code = ('import mDeveloper.sharedLib;'
+                '_sharedRegistry = mDeveloper.sharedLib.SharedRegistry.attach(directory={!r}, cacheDirectory={!r});'
+                'print(_sharedRegistry.name())').format(self._directory, self._root)
+
+        processes = [subprocess.Popen([sys.executable, '-c', code],
+                                      stdout=subprocess.PIPE,
+                                      env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))) for _ in range(4)]
+
+        names = set(x.communicate()[0].decode().strip() for x in processes)
+
+        # Processes which miss the snapshot at once wait for the one which publishes it
+        self.assertEqual(len(names), 1)
+        self.assertEqual(names, set([mDeveloper.sharedLib.SharedRegistry.readPointer(self._directory)]))
+
+        lockPath = mDeveloper.cacheLib.RegistryCache(self._directory, cacheDirectory=self._root).getCacheFileOf('shared.lock')
+        self.assertTrue(os.path.isfile(lockPath))
+
+    @unittest.skipUnless(os.path.isdir(mDeveloper.sharedLib.SHARED_MEMORY_DIRECTORY), 'Shared memory is not listed in a directory')
+    def test_cleanup(self):
+
+        _sharedRegistry = self._attach()
+
+        orphanName    = self._createOrphan()
+        newOrphanName = self._createOrphan()
+
+        orphanPath = os.path.join(mDeveloper.sharedLib.SHARED_MEMORY_DIRECTORY, orphanName)
+        os.utime(orphanPath, (0, 0))
+
+        self.assertTrue(orphanName in mDeveloper.sharedLib.SharedRegistry.cleanup())
+
+        # Latest snapshot and the snapshots which may be being published are kept
+        self.assertFalse(os.path.exists(orphanPath))
+        self.assertTrue(os.path.exists(os.path.join(mDeveloper.sharedLib.SHARED_MEMORY_DIRECTORY, newOrphanName)))
+        self.assertNotEqual(self._attach(publish=False), None)
+
+        self.assertTrue(newOrphanName in mDeveloper.sharedLib.SharedRegistry.cleanup(age=0))
+
+        _sharedRegistry.close()
+
+    def test_remove(self):
+
+        self.assertFalse(mDeveloper.sharedLib.SharedRegistry.remove(self._directory))
+
+        self._attach().close()
+
+        self.assertTrue(mDeveloper.sharedLib.SharedRegistry.remove(self._directory))
+        self.assertEqual(self._attach(publish=False), None)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,342 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/sqliteStorageLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.sqliteStorageLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import mDeveloper.statsLib
+import mDeveloper.developerLib
+import mDeveloper.sqliteStorageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = 'Name {0}'
+POSITION = '{1}'
+EMAIL    = '{0}@example.com'
+SITE     = 'Headquarter'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'url':URL}}
+"""
+
+## [ list of tuple ] - Developer module name, user name and position of the valid developer modules.
+DEVELOPERS = [('aliceLib', 'alice', 'Pipeline TD'),
+              ('bobLib',   'bob',   'Developer'),
+              ('bobbyLib', 'bobby', 'Bob Developer'),
+              ('daveLib',  'david', 'Pipeline Developer')]
+
+#
+## @brief Tests which are run against every storage through mDeveloper.developerLib.Developer, results must be the same.
+class StorageParityTests(object):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        for moduleName, userName, position in DEVELOPERS:
+            with open(os.path.join(self._directory, '{}.py'.format(moduleName)), 'w') as moduleFile:
+                moduleFile.write(DEVELOPER_MODULE_CONTENT.format(userName, position))
+
+        self._previousInstance = mDeveloper.developerLib.DeveloperRegistry._instance
+
+        mDeveloper.developerLib.DeveloperRegistry.setInstance(self.createStorage())
+
+    def tearDown(self):
+
+        mDeveloper.developerLib.DeveloperRegistry.setInstance(self._previousInstance)
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def createStorage(self):
+
+        raise NotImplementedError
+
+    def test_listDevelopersAsStr(self):
+
+        self.assertEqual(mDeveloper.developerLib.Developer.listDevelopersAsStr(), ['aliceLib', 'bobLib', 'bobbyLib', 'daveLib'])
+
+    def test_isDeveloper(self):
+
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('alice'), 'aliceLib')
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('bobLib'), 'bobLib')
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('David@Example.com'), 'daveLib')
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('carol'), None)
+        self.assertEqual(mDeveloper.developerLib.Developer.isDeveloper('erin@example.com'), None)
+
+    def test_setDeveloper(self):
+
+        _developer = mDeveloper.developerLib.Developer('alice')
+
+        self.assertEqual(_developer.email(), 'alice@example.com')
+        self.assertEqual(_developer.position(), 'Pipeline TD')
+
+        self.assertRaises(ValueError, _developer.setDeveloper, 'carol')
+
+    def test_resolveMany(self):
+
+        result = mDeveloper.developerLib.Developer.resolveMany(['david', 'Bob@Example.com', 'aliceLib', 'carol', None])
+
+        self.assertEqual(list(result.values()), ['daveLib', 'bobLib', 'aliceLib', None, None])
+
+    def test_search(self):
+
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.search('bob')], ['bob', 'bobby'])
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.search('DEVELOPER', fields=['POSITION'])], ['bob', 'bobby', 'david'])
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.search('td', fields=['POSITION'])], ['alice'])
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.search('name', limit=2)], ['alice', 'bob'])
+        self.assertEqual(mDeveloper.developerLib.Developer.search('carol'), [])
+
+        self.assertRaises(ValueError, mDeveloper.developerLib.Developer.search, 'bob', fields=['INFO'])
+
+    def test_searchScores(self):
+
+        _storage = mDeveloper.developerLib.DeveloperRegistry.getInstance()
+
+        self.assertEqual(_storage.search('bob'), [('bobLib', 25), ('bobbyLib', 22)])
+        self.assertEqual(_storage.search('e', fields=['USERNAME']), [('aliceLib', 5)])
+
+    def test_iterSearch(self):
+
+        mDeveloper.developerLib.Developer.listDevelopersAsStr()
+
+        self.assertEqual([x.userName() for x in mDeveloper.developerLib.Developer.iterSearch('pipeline')], ['alice', 'david'])
+
+    def test_loadDevelopers(self):
+
+        developers = mDeveloper.developerLib.Developer.loadDevelopers()[0]
+
+        self.assertEqual([x.userName() for x in developers], ['alice', 'bob', 'bobby', 'david'])
+
+    def test_iterDevelopers(self):
+
+        self.assertEqual([x.name() for x in mDeveloper.developerLib.Developer.iterDevelopers()], ['Name alice', 'Name bob', 'Name bobby', 'Name david'])
+
+class DeveloperRegistryParityTest(StorageParityTests, unittest.TestCase):
+
+    def createStorage(self):
+
+        return mDeveloper.developerLib.DeveloperRegistry(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+class SQLiteStorageParityTest(StorageParityTests, unittest.TestCase):
+
+    def createStorage(self):
+
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.join(self._cacheDirectory, 'developers.db'), create=True)
+        _storage.importDirectory(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+        return _storage
+
+    def tearDown(self):
+
+        mDeveloper.developerLib.DeveloperRegistry.getInstance().close()
+
+        StorageParityTests.tearDown(self)
+
+class FailingStorage(mDeveloper.sqliteStorageLib.SQLiteStorage):
+
+    def _insertRecords(self, connection, records):
+
+        mDeveloper.sqliteStorageLib.SQLiteStorage._insertRecords(self, connection, records)
+
+        raise sqlite3.IntegrityError('Records could not be inserted.')
+
+class SQLiteStorageTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+        self._storage   = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.join(self._directory, 'developers.db'), create=True)
+
+    def tearDown(self):
+
+        self._storage.close()
+
+        shutil.rmtree(self._directory)
+
+    def _getRecord(self, userName, name):
+
+        return mDeveloper.developerLib.DeveloperRecord(userName, name, 'Position', '{}@example.com'.format(userName), 'Headquarter', '')
+
+    def test_importDirectory(self):
+
+        for moduleName, userName, position in DEVELOPERS + [('carolLib', 'carol', '')]:
+            with open(os.path.join(self._directory, '{}.py'.format(moduleName)), 'w') as moduleFile:
+                moduleFile.write(DEVELOPER_MODULE_CONTENT.format(userName, position))
+
+        count, errors = self._storage.importDirectory(directory=self._directory, cacheDirectory=self._directory)
+
+        self.assertEqual(count, 4)
+        self.assertEqual(list(errors.keys()), ['carolLib'])
+
+        # Existing records are replaced
+        os.remove(os.path.join(self._directory, 'bobbyLib.py'))
+
+        self.assertEqual(self._storage.importDirectory(directory=self._directory, cacheDirectory=self._directory)[0], 3)
+        self.assertEqual(self._storage.listModules(), ['aliceLib', 'bobLib', 'daveLib'])
+
+        # Existing records are deleted in the transaction of the import, a failing import leaves them in place
+        os.remove(os.path.join(self._directory, 'bobLib.py'))
+
+        _storage = FailingStorage(self._storage.databasePath())
+
+        self.assertRaises(sqlite3.IntegrityError, _storage.importDirectory, directory=self._directory, cacheDirectory=self._directory)
+        self.assertEqual(_storage.listModules(), ['aliceLib', 'bobLib', 'daveLib'])
+
+        _storage.close()
+
+    def test_addRecords(self):
+
+        self.assertEqual(self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alice'))]), 1)
+        self.assertEqual(self._storage.search('alice', fields=['NAME']), [('aliceLib', 12)])
+
+        # Full text search table follows updates and removals
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alicia'))])
+        self.assertEqual(self._storage.search('alicia'), [('aliceLib', 12)])
+        self.assertEqual(self._storage.search('alice', fields=['NAME']), [])
+
+        self._storage.removeRecords(['aliceLib'])
+        self.assertEqual(self._storage.search('alice'), [])
+        self.assertFalse(self._storage.hasModule('aliceLib'))
+
+    def test_getValidatedRecord(self):
+
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alice'))])
+
+        self.assertEqual(self._storage.getValidatedRecord('aliceLib').name, 'Alice')
+        self.assertEqual(self._storage.getRecord('bobLib'), None)
+
+        self.assertRaises(ImportError, self._storage.getValidatedRecord, 'bobLib')
+
+    def test_schema(self):
+
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alice'))])
+        self._storage.close()
+
+        # Database is reopened without being recreated
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(self._storage.databasePath())
+
+        self.assertEqual(_storage.listModules(), ['aliceLib'])
+        self.assertTrue(_storage.hasFullTextSearch())
+
+        _storage.close()
+
+        # Database of another schema version is refused instead of being dropped
+        connection = sqlite3.connect(self._storage.databasePath())
+        connection.execute('PRAGMA user_version = {}'.format(mDeveloper.sqliteStorageLib.SCHEMA_VERSION + 1))
+        connection.close()
+
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(self._storage.databasePath())
+
+        self.assertRaises(sqlite3.DatabaseError, _storage.listModules)
+
+        connection = sqlite3.connect(self._storage.databasePath())
+        self.assertEqual(connection.execute('SELECT moduleName FROM developers').fetchall(), [('aliceLib',)])
+        connection.close()
+
+    def test_upgradeSchema(self):
+
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alice'))])
+        self._storage.close()
+
+        # Database of the first schema version didn't have the table of the indexes
+        connection = sqlite3.connect(self._storage.databasePath())
+        connection.executescript('DROP TRIGGER developer_indexes_ai; DROP TRIGGER developer_indexes_ad; DROP TRIGGER developer_indexes_au;'
+                                 'DROP TABLE developer_indexes; PRAGMA user_version = 1;')
+        connection.close()
+
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(self._storage.databasePath())
+
+        self.assertEqual(_storage.listModules(), ['aliceLib'])
+        self.assertEqual(_storage.fuzzySearch('alise', maxDistance=1), [('aliceLib', 1)])
+        self.assertEqual(_storage._connect().execute('PRAGMA user_version').fetchone()[0], mDeveloper.sqliteStorageLib.SCHEMA_VERSION)
+
+        _storage.close()
+
+    def test_fuzzyIndex(self):
+
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alice')), ('bobLib', self._getRecord('bob', 'Bob'))])
+
+        self.assertEqual(self._storage.fuzzySearch('alise', maxDistance=1), [('aliceLib', 1)])
+
+        # Fuzzy index is stored in the database, so that other processes load it instead of building it
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(self._storage.databasePath())
+
+        _stats = mDeveloper.statsLib.Stats.getInstance()
+        _stats.reset()
+
+        self.assertEqual(_storage.fuzzySearch('alise', maxDistance=1), [('aliceLib', 1)])
+        self.assertEqual(_stats.getCounters().get('fuzzyIndex.hit'), 1)
+
+        # Changing the records deletes the stored index in the same transaction
+        self._storage.addRecords([('aliceLib', self._getRecord('alice', 'Alicia'))])
+
+        _otherStorage = mDeveloper.sqliteStorageLib.SQLiteStorage(self._storage.databasePath())
+        self.assertEqual(_otherStorage.fuzzySearch('alicio', maxDistance=1), [('aliceLib', 1)])
+        _otherStorage.close()
+
+        # Index built from the records of a previous data version is not stored
+        connection  = _storage._connect()
+        dataVersion = connection.execute('PRAGMA data_version').fetchone()[0]
+
+        self._storage.removeRecords(['bobLib'])
+
+        self.assertFalse(_storage._storeIndex(connection, 'fuzzy', b'index', dataVersion))
+        self.assertEqual(connection.execute('SELECT COUNT(*) FROM developer_indexes').fetchone()[0], 0)
+
+        _storage.close()
+
+    def test_missingDatabase(self):
+
+        databasePath = os.path.join(self._directory, 'developers_typo.db')
+
+        # Database which doesn't exist is created only if it is requested
+        self.assertRaises(sqlite3.OperationalError, mDeveloper.sqliteStorageLib.SQLiteStorage(databasePath).listModules)
+        self.assertFalse(os.path.exists(databasePath))
+
+        # Files which are not developer databases are refused
+        with open(databasePath, 'w') as databaseFile:
+            databaseFile.write('developers')
+
+        self.assertRaises(sqlite3.DatabaseError, mDeveloper.sqliteStorageLib.SQLiteStorage(databasePath, create=True).listModules)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
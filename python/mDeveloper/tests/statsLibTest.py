@@ -0,0 +1,120 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/statsLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.statsLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import shutil
+import tempfile
+import unittest
+import threading
+
+import mDeveloper.statsLib
+import mDeveloper.developerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class StatsTest(unittest.TestCase):
+
+    def test_span(self):
+
+        _stats = mDeveloper.statsLib.Stats()
+
+        for _ in range(2):
+            with _stats.span('scan'):
+                pass
+
+        try:
+            with _stats.span('import'):
+                raise ValueError()
+        except ValueError:
+            pass
+
+        spans = _stats.getSpans()
+
+        self.assertEqual(list(spans.keys()), ['scan', 'import'])
+        self.assertEqual(spans['scan']['count'], 2)
+        self.assertTrue(spans['scan']['time'] >= 0.0)
+
+        _stats.reset()
+        self.assertEqual(_stats.getSpans(), {})
+
+    def test_increment(self):
+
+        _stats = mDeveloper.statsLib.Stats()
+
+        _stats.increment('cache.hit')
+        _stats.increment('cache.hit', 2)
+
+        self.assertEqual(_stats.getCounters(), {'cache.hit':3})
+
+    def test_concurrentUpdates(self):
+
+        _stats = mDeveloper.statsLib.Stats()
+
+        def record():
+            for _ in range(10000):
+                _stats.increment('cache.hit')
+                _stats.addSpan('scan', 0.0)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(_stats.getCounters(), {'cache.hit':80000})
+        self.assertEqual(_stats.getSpans()['scan']['count'], 80000)
+
+    def test_registry(self):
+
+        directory      = mDeveloper.developerLib.Developer.getDevelopersDirectory()
+        cacheDirectory = tempfile.mkdtemp()
+
+        try:
+            _stats = mDeveloper.statsLib.Stats.getInstance()
+            _stats.reset()
+
+            _registry = mDeveloper.developerLib.DeveloperRegistry(directory=directory, cacheDirectory=cacheDirectory)
+            _registry.hasModule('userLib')
+            _registry.hasModule('userLib')
+
+            self.assertTrue(set(['scan', 'read', 'import', 'validate']).issubset(_stats.getSpans().keys()))
+            self.assertEqual(_stats.getCounters()['negativeCache.hit'], 1)
+            self.assertTrue(_stats.getCounters()['cache.miss'] > 0)
+
+        finally:
+            shutil.rmtree(cacheDirectory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
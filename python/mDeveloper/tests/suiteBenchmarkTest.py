@@ -0,0 +1,79 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/suiteBenchmarkTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.suiteBenchmarkTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.benchmarks.suiteBenchmark
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+BASELINE = {'100'  : {'isDeveloper':{'cold':0.010, 'warm':0.0001}},
+            '1000' : {'isDeveloper':{'cold':0.100, 'warm':0.0010}}}
+
+class SuiteBenchmarkTest(unittest.TestCase):
+
+    def test_compareResults(self):
+
+        results = {'100'  : {'isDeveloper':{'cold':0.012, 'warm':0.0004}},
+                   '1000' : {'isDeveloper':{'cold':0.200, 'warm':0.0010}, 'searchCmd':{'cold':1.0, 'warm':1.0}}}
+
+        # Warm timings below the minimum time and operations without a baseline are not compared
+        self.assertEqual(mDeveloper.benchmarks.suiteBenchmark.compareResults(results, BASELINE, threshold=0.25),
+                         [(1000, 'isDeveloper', 'cold', 0.100, 0.200)])
+
+        self.assertEqual(mDeveloper.benchmarks.suiteBenchmark.compareResults(results, BASELINE, threshold=1.5), [])
+
+    def test_run(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            filePath = os.path.join(directory, 'results.json')
+
+            results = {'10' : mDeveloper.benchmarks.suiteBenchmark.run(10, operations=['isDeveloper', 'listDevelopersAsStr'], repeat=1)}
+            mDeveloper.benchmarks.suiteBenchmark.writeResults(filePath, results)
+
+            self.assertEqual(sorted(results['10'].keys()), ['isDeveloper', 'listDevelopersAsStr'])
+            self.assertEqual(mDeveloper.benchmarks.suiteBenchmark.readResults(filePath), results)
+
+        finally:
+            shutil.rmtree(directory)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,128 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/validatorLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.validatorLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mDeveloper.validatorLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = 'Name {0}'
+POSITION = 'Position'
+EMAIL    = '{0}@example.com'
+SITE     = 'Headquarter'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'url':URL}}
+"""
+
+class DeveloperModuleValidatorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        for userName in ['alice', 'bob']:
+            self._writeDeveloperModule(userName)
+
+        self._validator = mDeveloper.validatorLib.DeveloperModuleValidator(directory=self._directory, cacheDirectory=self._cacheDirectory)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writeDeveloperModule(self, userName, content=DEVELOPER_MODULE_CONTENT):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(content.format(userName))
+
+    def test_validate(self):
+
+        self.assertTrue(self._validator.validate())
+        self.assertEqual(self._validator.validated(), ['aliceLib', 'bobLib'])
+        self.assertEqual(self._validator.skipped(), [])
+
+        self.assertTrue(self._validator.validate())
+        self.assertEqual(self._validator.validated(), [])
+        self.assertEqual(self._validator.skipped(), ['aliceLib', 'bobLib'])
+
+        self.assertTrue(self._validator.validate(force=True))
+        self.assertEqual(self._validator.validated(), ['aliceLib', 'bobLib'])
+
+    def test_validateInvalid(self):
+
+        self._writeDeveloperModule('carol', DEVELOPER_MODULE_CONTENT.replace("'url':URL", ''))
+        self._writeDeveloperModule('dave', DEVELOPER_MODULE_CONTENT.replace("SITE     = 'Headquarter'\n", ''))
+
+        for i in range(2):
+
+            self.assertFalse(self._validator.validate())
+            self.assertEqual(self._validator.validated(), ['carolLib', 'daveLib'] if i else ['aliceLib', 'bobLib', 'carolLib', 'daveLib'])
+            self.assertTrue(isinstance(self._validator.errors()['carolLib'], AttributeError))
+            self.assertTrue(isinstance(self._validator.errors()['daveLib'], NameError))
+
+    def test_validateContentHash(self):
+
+        self._validator.validate()
+
+        # Same content with a different modification time is skipped after hashing
+        os.utime(os.path.join(self._directory, 'aliceLib.py'), ns=(0, 0))
+
+        self.assertTrue(self._validator.validate())
+        self.assertEqual(self._validator.validated(), [])
+
+        self._writeDeveloperModule('alice', DEVELOPER_MODULE_CONTENT.replace("POSITION = 'Position'", "POSITION = ''"))
+
+        self.assertFalse(self._validator.validate())
+        self.assertEqual(self._validator.validated(), ['aliceLib'])
+
+    def test_reset(self):
+
+        self._validator.validate()
+
+        self.assertTrue(self._validator.reset())
+
+        self._validator.validate()
+        self.assertEqual(self._validator.validated(), ['aliceLib', 'bobLib'])
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
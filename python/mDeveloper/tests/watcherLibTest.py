@@ -0,0 +1,152 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/tests/watcherLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mDeveloper.tests.watcherLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mDeveloper.statsLib
+import mDeveloper.watcherLib
+import mDeveloper.developerLib
+import mDeveloper.sqliteStorageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+DEVELOPER_MODULE_CONTENT = """
+USERNAME = '{0}'
+NAME     = '{1}'
+POSITION = 'Position'
+EMAIL    = '{0}@example.com'
+SITE     = 'Headquarter'
+URL      = ''
+INFO     = {{'userName':USERNAME, 'name':NAME, 'position':POSITION, 'email':EMAIL, 'url':URL}}
+"""
+
+class DeveloperWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp()
+        self._cacheDirectory = tempfile.mkdtemp()
+
+        self._writeDeveloperModule('alice', 'Alice')
+        self._writeDeveloperModule('bob',   'Bob')
+
+        self._registry = mDeveloper.developerLib.DeveloperRegistry(directory=self._directory, cacheDirectory=self._cacheDirectory)
+        self._watcher  = mDeveloper.watcherLib.DeveloperWatcher(registry=self._registry, pollInterval=0.05)
+        self._changes  = []
+
+        self._watcher.subscribe(lambda *args: self._changes.append(args))
+
+    def tearDown(self):
+
+        self._watcher.stop()
+
+        shutil.rmtree(self._directory)
+        shutil.rmtree(self._cacheDirectory)
+
+    def _writeDeveloperModule(self, userName, name):
+
+        with open(os.path.join(self._directory, '{}Lib.py'.format(userName)), 'w') as moduleFile:
+            moduleFile.write(DEVELOPER_MODULE_CONTENT.format(userName, name))
+
+    def test_check(self):
+
+        self.assertFalse(self._watcher.check())
+
+        searchIndex = self._registry.getSearchIndex()
+        indexMisses = mDeveloper.statsLib.Stats.getInstance().getCounters().get('index.miss')
+
+        self._writeDeveloperModule('carol', 'Carol')
+        self._writeDeveloperModule('bob',   'Robert Bob')
+        os.remove(os.path.join(self._directory, 'aliceLib.py'))
+
+        self.assertTrue(self._watcher.check())
+        self.assertEqual(self._changes, [(['carolLib'], ['bobLib'], ['aliceLib'])])
+
+        self.assertEqual(self._registry.listModules(), ['bobLib', 'carolLib'])
+        self.assertEqual(self._registry.getRecord('bobLib').name, 'Robert Bob')
+        self.assertEqual(self._registry.getModuleByUserName('alice'), None)
+        self.assertEqual(self._registry.getModuleByEmail('Carol@Example.com'), 'carolLib')
+
+        # Search index is updated instead of being rebuilt, previous one stays as it is for the readers of the previous snapshot
+        self.assertEqual(mDeveloper.statsLib.Stats.getInstance().getCounters().get('index.miss'), indexMisses)
+        self.assertEqual([x[0] for x in searchIndex.search('alice')], ['aliceLib'])
+        self.assertEqual([x[0] for x in self._registry.search('robert')], ['bobLib'])
+        self.assertEqual(self._registry.search('alice'), [])
+        self.assertEqual([x[0] for x in self._registry.search('')], ['bobLib', 'carolLib'])
+
+        self.assertFalse(self._watcher.check())
+        self.assertEqual(len(self._changes), 1)
+
+    def test_subscribe(self):
+
+        callback = lambda *args: None
+
+        self.assertTrue(self._watcher.subscribe(callback))
+        self.assertFalse(self._watcher.subscribe(callback))
+
+        self.assertTrue(self._watcher.unsubscribe(callback))
+        self.assertFalse(self._watcher.unsubscribe(callback))
+
+    def test_start(self):
+
+        changed = threading.Event()
+
+        self._watcher.subscribe(lambda *args: changed.set())
+
+        self.assertTrue(self._watcher.start())
+        self.assertFalse(self._watcher.start())
+        self.assertTrue(self._watcher.isRunning())
+
+        self._writeDeveloperModule('carol', 'Carol')
+
+        self.assertTrue(changed.wait(5))
+        self.assertEqual(self._changes, [(['carolLib'], [], [])])
+
+        self.assertTrue(self._watcher.stop())
+        self.assertFalse(self._watcher.isRunning())
+
+    def test_storage(self):
+
+        _storage = mDeveloper.sqliteStorageLib.SQLiteStorage(os.path.join(self._cacheDirectory, 'developers.db'), create=True)
+
+        self.assertRaises(TypeError, mDeveloper.watcherLib.DeveloperWatcher, registry=_storage)
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
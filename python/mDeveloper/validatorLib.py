@@ -0,0 +1,273 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/validatorLib.py @brief [ FILE   ] - Developer module validator module.
+## @package mDeveloper.validatorLib    @brief [ MODULE ] - Developer module validator module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import hashlib
+import collections
+
+import mDeveloper.cacheLib
+import mDeveloper.readerLib
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the validation state file format, state files with a different version are ignored.
+STATE_VERSION = 1
+
+## [ str ] - Name of the validation state file, which is stored next to the registry cache file.
+STATE_FILE    = 'validation.json'
+
+#
+## @brief [ CLASS ] - Class to validate all developer modules of a developers directory in one batch.
+#
+#  Content hash of each valid developer module is recorded in a state file. Developer modules whose
+#  modification time and size haven't changed are skipped without being read, the ones whose content
+#  hash hasn't changed are skipped without being validated. Invalid developer modules are always validated.
+class DeveloperModuleValidator(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory      [ str | None | in  ] - Developers directory, default one is used if None given.
+    #  @param cacheDirectory [ str | None | in  ] - Directory of the state file, default cache directory is used if None given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory=None, cacheDirectory=None):
+
+        _registryCache = mDeveloper.cacheLib.RegistryCache(directory if directory else mDeveloper.developerLib.Developer.getDevelopersDirectory(),
+                                                           cacheDirectory=cacheDirectory)
+
+        ## [ str ] - Developers directory.
+        self._directory    = _registryCache.directory()
+
+        ## [ str ] - State file.
+        self._stateFile    = _registryCache.getCacheFileOf(STATE_FILE)
+
+        ## [ list of str ] - Developer modules validated during the last validation.
+        self._validated    = []
+
+        ## [ list of str ] - Developer modules skipped during the last validation.
+        self._skipped      = []
+
+        ## [ collections.OrderedDict ] - Developer modules as keys and exceptions as values of the last validation.
+        self._errors       = collections.OrderedDict()
+
+    #
+    ## @brief Read the state file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - File names of the valid developer modules as keys, dict instances with mtime, size and hash keys as values.
+    def _readState(self):
+
+        try:
+            with open(self._stateFile, 'r') as stateFile:
+                data = json.load(stateFile)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != STATE_VERSION or data.get('directory') != self._directory:
+            return {}
+
+        return data.get('files', {})
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def validated(self):
+
+        return self._validated
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def skipped(self):
+
+        return self._skipped
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def errors(self):
+
+        return self._errors
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Validate all developer modules.
+    #
+    #  Validated and skipped developer modules as well as the errors can be obtained from
+    #  validated, skipped and errors properties afterwards.
+    #
+    #  @param force [ bool | False | in  ] - Whether to validate all developer modules regardless of the state file.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether all developer modules are valid.
+    def validate(self, force=False):
+
+        self._validated = []
+        self._skipped   = []
+        self._errors    = collections.OrderedDict()
+
+        previousState = {} if force else self._readState()
+        state         = {}
+
+        files = mDeveloper.cacheLib.RegistryCache.scanDirectory(self._directory)[1]
+
+        for fileName in sorted(files.keys()):
+
+            moduleName  = os.path.splitext(fileName)[0]
+            filePath    = os.path.join(self._directory, fileName)
+            mTime, size = files[fileName]
+            fileState   = previousState.get(fileName)
+
+            if fileState and fileState['mtime'] == mTime and fileState['size'] == size:
+                state[fileName] = fileState
+                self._skipped.append(moduleName)
+                continue
+
+            try:
+                with open(filePath, 'rb') as moduleFile:
+                    content = moduleFile.read()
+            except (IOError, OSError) as error:
+                self._errors[moduleName] = error
+                continue
+
+            contentHash = hashlib.sha1(content).hexdigest()
+
+            if fileState and fileState['hash'] == contentHash:
+                state[fileName] = {'mtime':mTime, 'size':size, 'hash':contentHash}
+                self._skipped.append(moduleName)
+                continue
+
+            self._validated.append(moduleName)
+
+            try:
+                DeveloperModuleValidator.validateSource(content, filePath)
+            except Exception as error:
+                self._errors[moduleName] = error
+                continue
+
+            state[fileName] = {'mtime':mTime, 'size':size, 'hash':contentHash}
+
+        if state != previousState:
+            content = json.dumps({'version'   : STATE_VERSION,
+                                  'directory' : self._directory,
+                                  'files'     : state}, sort_keys=True).encode('utf-8')
+
+            mDeveloper.cacheLib.RegistryCache.writeFileAtomically(self._stateFile, content)
+
+        return not self._errors
+
+    #
+    ## @brief Delete the state file, so that all developer modules are validated next time.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def reset(self):
+
+        try:
+            os.remove(self._stateFile)
+        except OSError:
+            return False
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Validate given developer module source code.
+    #
+    #  Source code is read statically, developer module is executed only if its attributes are not literals.
+    #
+    #  @param content  [ bytes | None | in  ] - Source code of the developer module.
+    #  @param filePath [ str   | None | in  ] - Absolute path of the developer module file.
+    #
+    #  @exception SyntaxError    - If source code is not valid.
+    #  @exception Exception      - Any exception raised by the developer module if it couldn't be read statically.
+    #  @exception NameError      - If developer module doesn't have all the attributes.
+    #  @exception ValueError     - If an attribute ID empty and this attribute is not person website URL.
+    #  @exception AttributeError - If INFO dictionary doesn't match with attributes in developer module.
+    #
+    #  @return dict - Record.
+    @staticmethod
+    def validateSource(content, filePath):
+
+        record = mDeveloper.readerLib.DeveloperModuleReader.readSource(content, filePath)
+        if record is None:
+            record = mDeveloper.cacheLib.RegistryCache.getModuleRecord(mDeveloper.cacheLib.RegistryCache.importModule(filePath))
+
+        moduleName = os.path.splitext(os.path.basename(filePath))[0]
+
+        mDeveloper.developerLib.Developer.validateDeveloperAttributes(record, 'mDeveloper.developers.{}'.format(moduleName))
+
+        return record
@@ -0,0 +1,356 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mDeveloper/watcherLib.py @brief [ FILE   ] - Developers directory watcher module.
+## @package mDeveloper.watcherLib    @brief [ MODULE ] - Developers directory watcher module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import select
+import threading
+
+import mDeveloper.developerLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ float ] - Default interval in seconds the developers directory is checked for changes in.
+POLL_INTERVAL  = 2.0
+
+## [ float ] - Time in seconds to wait for more events after an inotify event, so that bursts of events are applied at once.
+SETTLE_TIME    = 0.05
+
+## [ int ] - Inotify events to watch, IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE, IN_DELETE_SELF and IN_MOVE_SELF.
+INOTIFY_EVENTS = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400 | 0x800
+
+#
+## @brief [ CLASS ] - Class to keep a registry up to date with its developers directory in long-running applications.
+#
+#  Changes are found by scanning the developers directory with os.scandir and they are applied to the registry
+#  incrementally, see mDeveloper.developerLib.DeveloperRegistry.update. Subscribed callbacks are called with
+#  the developer module names which have been added, modified and removed.
+#
+#  Watcher can be driven by the host application by calling check method, from an idle callback for instance,
+#  or it can run on a background thread, see start method. Background thread waits on inotify where it is
+#  available, so that changes are applied as soon as they happen, and polls the directory otherwise.
+#  Directory is polled on inotify too, which doesn't report changes made on other hosts to network storage.
+#
+#  @code
+#  _watcher = mDeveloper.watcherLib.DeveloperWatcher()
+#  _watcher.subscribe(lambda added, modified, removed: print(added, modified, removed))
+#  _watcher.start()
+#  @endcode
+class DeveloperWatcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param registry     [ mDeveloper.developerLib.DeveloperRegistry | None          | in  ] - Registry, process-wide one is used if None given.
+    #  @param pollInterval [ float                                     | POLL_INTERVAL | in  ] - Interval in seconds the developers directory is checked for changes in.
+    #  @param useInotify   [ bool                                      | True          | in  ] - Whether to wait on inotify where it is available.
+    #
+    #  @exception TypeError - If given registry, or the process-wide storage, is not a mDeveloper.developerLib.DeveloperRegistry.
+    #
+    #  @return None - None.
+    def __init__(self, registry=None, pollInterval=POLL_INTERVAL, useInotify=True):
+
+        registry = registry if registry else mDeveloper.developerLib.DeveloperRegistry.getInstance()
+        if not isinstance(registry, mDeveloper.developerLib.DeveloperRegistry):
+            raise TypeError('Only developers directories can be watched, {} is given.'.format(type(registry).__name__))
+
+        ## [ mDeveloper.developerLib.DeveloperRegistry ] - Registry.
+        self._registry     = registry
+
+        ## [ float ] - Poll interval in seconds.
+        self._pollInterval = pollInterval
+
+        ## [ bool ] - Whether to wait on inotify where it is available.
+        self._useInotify   = useInotify
+
+        ## [ list of callable ] - Subscribed callbacks.
+        self._callbacks    = []
+
+        ## [ threading.Lock ] - Lock, which serializes the checks of the background thread and the host application.
+        self._lock         = threading.Lock()
+
+        ## [ threading.Event ] - Event, which is set to stop the background thread.
+        self._stopEvent    = threading.Event()
+
+        ## [ threading.Thread ] - Background thread.
+        self._thread       = None
+
+        ## [ int ] - Inotify file descriptor, None if inotify is not used.
+        self._inotifyFile  = None
+
+    #
+    ## @brief Run the background thread.
+    #
+    #  Exceptions raised by the callbacks are ignored, so that the thread keeps running.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _run(self):
+
+        while not self._stopEvent.is_set():
+
+            self._wait()
+
+            if self._stopEvent.is_set():
+                break
+
+            try:
+                self.check()
+            except Exception:
+                pass
+
+    #
+    ## @brief Wait until an inotify event is received or the poll interval elapses.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _wait(self):
+
+        if self._inotifyFile is None:
+            self._stopEvent.wait(self._pollInterval)
+            return
+
+        try:
+            readyList = select.select([self._inotifyFile], [], [], self._pollInterval)[0]
+        except (OSError, ValueError):
+            self._stopEvent.wait(self._pollInterval)
+            return
+
+        if not readyList:
+            return
+
+        self._stopEvent.wait(SETTLE_TIME)
+
+        # Events are only used to wake up, changes are found by scanning the directory
+        try:
+            while os.read(self._inotifyFile, 65536):
+                pass
+        except OSError:
+            pass
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def registry(self):
+
+        return self._registry
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def pollInterval(self):
+
+        return self._pollInterval
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Subscribe given callback to the changes.
+    #
+    #  Callback is called with three lists of developer module names, the ones which have been added, modified and
+    #  removed. Callbacks are called on the background thread if the watcher is started, see start method.
+    #
+    #  @param callback [ callable | None | in  ] - Callback.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the callback has been subscribed, False if it is already subscribed.
+    def subscribe(self, callback):
+
+        if callback in self._callbacks:
+            return False
+
+        self._callbacks.append(callback)
+
+        return True
+
+    #
+    ## @brief Unsubscribe given callback.
+    #
+    #  @param callback [ callable | None | in  ] - Callback.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the callback has been unsubscribed, False if it isn't subscribed.
+    def unsubscribe(self, callback):
+
+        if callback not in self._callbacks:
+            return False
+
+        self._callbacks.remove(callback)
+
+        return True
+
+    #
+    ## @brief Check the developers directory, apply the changes to the registry and call the callbacks.
+    #
+    #  @exception Exception - Any exception raised by the callbacks.
+    #
+    #  @return bool - Whether the developers directory has changed.
+    def check(self):
+
+        with self._lock:
+
+            added, modified, removed = self._registry.update()
+
+            if not added and not modified and not removed:
+                return False
+
+            for callback in list(self._callbacks):
+                callback(added, modified, removed)
+
+        return True
+
+    #
+    ## @brief Check whether the background thread is running.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isRunning(self):
+
+        return self._thread is not None and self._thread.is_alive()
+
+    #
+    ## @brief Check whether the background thread waits on inotify.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def usesInotify(self):
+
+        return self._inotifyFile is not None
+
+    #
+    ## @brief Start watching the developers directory on a background thread, registry is loaded first if it isn't loaded yet.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the watcher has been started, False if it is already running.
+    def start(self):
+
+        if self.isRunning():
+            return False
+
+        with self._lock:
+            self._registry.update()
+
+        if self._useInotify:
+            self._inotifyFile = DeveloperWatcher.openInotify(self._registry.directory())
+
+        self._stopEvent.clear()
+
+        self._thread = threading.Thread(target=self._run, name='mDeveloperWatcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+        return True
+
+    #
+    ## @brief Stop the background thread and wait for it to finish.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the watcher has been stopped, False if it isn't running.
+    def stop(self):
+
+        if not self.isRunning():
+            return False
+
+        self._stopEvent.set()
+        self._thread.join()
+        self._thread = None
+
+        if self._inotifyFile is not None:
+            os.close(self._inotifyFile)
+            self._inotifyFile = None
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Open a non-blocking inotify file descriptor watching given directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return int - File descriptor, None if inotify is not available.
+    @staticmethod
+    def openInotify(directory):
+
+        if not sys.platform.startswith('linux'):
+            return None
+
+        # Imported on demand, inotify is only used on Linux
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+            inotifyFile = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if inotifyFile < 0:
+                return None
+
+            if libc.inotify_add_watch(inotifyFile, os.fsencode(directory), INOTIFY_EVENTS) < 0:
+                os.close(inotifyFile)
+                return None
+
+        except (OSError, AttributeError):
+            return None
+
+        return inotifyFile